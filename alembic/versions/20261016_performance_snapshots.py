@@ -0,0 +1,50 @@
+"""performance_snapshots: per-bot equity/PnL/exposure rollups
+
+Revision ID: performance_snapshots
+Revises: v2_multi_strategy
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "performance_snapshots"
+down_revision: Union[str, None] = "v2_multi_strategy"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "performance_snapshots",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("bot_name", sa.String(length=100), nullable=False),
+        sa.Column("resolution", sa.String(length=3), nullable=False),
+        sa.Column("bucket", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("equity", sa.DECIMAL(precision=20, scale=8), nullable=False),
+        sa.Column("equity_high", sa.DECIMAL(precision=20, scale=8), nullable=False),
+        sa.Column("equity_low", sa.DECIMAL(precision=20, scale=8), nullable=False),
+        sa.Column("realized_pnl", sa.DECIMAL(precision=20, scale=8), nullable=False),
+        sa.Column("unrealized_pnl", sa.DECIMAL(precision=20, scale=8), nullable=False),
+        sa.Column("exposure", sa.DECIMAL(precision=20, scale=8), nullable=False),
+        sa.Column("samples", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("bot_name", "resolution", "bucket", name="uq_perf_bot_res_bucket"),
+    )
+    op.create_index(
+        "idx_perf_resolution_bucket",
+        "performance_snapshots",
+        ["resolution", "bucket"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_perf_resolution_bucket", table_name="performance_snapshots")
+    op.drop_table("performance_snapshots")
@@ -1,5 +1,6 @@
 """Exchange API client modules"""
 
+from bot.api.batch_orders import OrderRequest, OrderResult, cancel_orders, create_orders
 from bot.api.exceptions import (
     AuthenticationError,
     ExchangeAPIError,
@@ -7,13 +8,40 @@ from bot.api.exceptions import (
     InsufficientFundsError,
     InvalidOrderError,
     NetworkError,
+    NotSupportedError,
     OrderError,
     RateLimitError,
 )
 from bot.api.exchange_client import ExchangeAPIClient
+from bot.api.exchange_stream import ExchangeStream
+from bot.api.http_transport import HttpTransport, TransportConfig
+from bot.api.market_data_hub import MarketDataFeed, MarketDataHub
+from bot.api.rate_limiter import (
+    Priority,
+    RateLimiter,
+    RateLimiterRegistry,
+    Route,
+    TokenBucket,
+    rate_limiters,
+)
 
 __all__ = [
     "ExchangeAPIClient",
+    "ExchangeStream",
+    "OrderRequest",
+    "OrderResult",
+    "create_orders",
+    "cancel_orders",
+    "MarketDataHub",
+    "MarketDataFeed",
+    "TokenBucket",
+    "RateLimiter",
+    "RateLimiterRegistry",
+    "Route",
+    "Priority",
+    "rate_limiters",
+    "HttpTransport",
+    "TransportConfig",
     "ExchangeAPIError",
     "RateLimitError",
     "AuthenticationError",
@@ -22,4 +50,5 @@ __all__ = [
     "NetworkError",
     "ExchangeNotAvailableError",
     "InvalidOrderError",
+    "NotSupportedError",
 ]
@@ -0,0 +1,141 @@
+"""
+Batch order placement and cancellation.
+
+Clients that set ``batch_orders = True`` (``ByBitDirectClient`` and
+``ExchangeAPIClient``) implement ``create_orders`` / ``cancel_orders``
+themselves, using native batch endpoints where the exchange has them. For
+any other client, ``create_orders`` / ``cancel_orders`` below fall back to
+per-order calls with bounded concurrency.
+
+Results always come back one per request, in request order, with
+per-order errors mapped to ``ExchangeAPIError`` subclasses instead of
+failing the whole batch.
+
+Usage:
+    requests = [OrderRequest("BTC/USDT", "buy", Decimal("0.001"), Decimal("60000"))]
+    for result in await create_orders(exchange, requests):
+        if result.ok:
+            register(result.order["id"])
+        else:
+            log(result.error)
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, TypeVar
+
+from bot.api.exceptions import ExchangeAPIError
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_CONCURRENCY = 5
+
+
+@dataclass
+class OrderRequest:
+    """One order in a batch."""
+
+    symbol: str
+    side: str
+    amount: Decimal
+    price: Decimal | None = None
+    order_type: str = "limit"
+    params: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class OrderResult:
+    """Outcome of one order (or cancellation) in a batch."""
+
+    order: dict[str, Any] | None = None
+    error: ExchangeAPIError | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def chunked(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """Yield consecutive slices of at most ``size`` items."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+async def gather_bounded(
+    items: Sequence[T],
+    fn: Callable[[T], Awaitable[R]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[R]:
+    """Run ``fn`` over ``items`` with at most ``concurrency`` in flight; keeps order."""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(item: T) -> R:
+        async with semaphore:
+            return await fn(item)
+
+    return list(await asyncio.gather(*(run(item) for item in items)))
+
+
+def _has_batch_api(exchange: Any) -> bool:
+    # Identity check so mocks (whose attributes are all truthy) use the fallback
+    return getattr(exchange, "batch_orders", False) is True
+
+
+def as_api_error(e: Exception) -> ExchangeAPIError:
+    return e if isinstance(e, ExchangeAPIError) else ExchangeAPIError(str(e))
+
+
+async def create_orders(
+    exchange: Any,
+    requests: Sequence[OrderRequest],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[OrderResult]:
+    """Place ``requests`` through the client's batch API or bounded per-order calls."""
+    if not requests:
+        return []
+    if _has_batch_api(exchange):
+        results: list[OrderResult] = await exchange.create_orders(requests, concurrency=concurrency)
+        return results
+
+    async def place(request: OrderRequest) -> OrderResult:
+        try:
+            order = await exchange.create_order(
+                symbol=request.symbol,
+                order_type=request.order_type,
+                side=request.side,
+                amount=float(request.amount),
+                price=float(request.price) if request.price is not None else None,
+                params=request.params or None,
+            )
+            return OrderResult(order=order)
+        except Exception as e:
+            return OrderResult(error=as_api_error(e))
+
+    return await gather_bounded(requests, place, concurrency)
+
+
+async def cancel_orders(
+    exchange: Any,
+    order_ids: Sequence[str],
+    symbol: str,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[OrderResult]:
+    """Cancel ``order_ids`` through the client's batch API or bounded per-order calls."""
+    if not order_ids:
+        return []
+    if _has_batch_api(exchange):
+        results: list[OrderResult] = await exchange.cancel_orders(
+            order_ids, symbol, concurrency=concurrency
+        )
+        return results
+
+    async def cancel(order_id: str) -> OrderResult:
+        try:
+            return OrderResult(order=await exchange.cancel_order(order_id, symbol))
+        except Exception as e:
+            return OrderResult(error=as_api_error(e))
+
+    return await gather_bounded(order_ids, cancel, concurrency)
@@ -8,12 +8,15 @@ Key features:
 - Proper signature construction for V5 API
 - Extended recvWindow (10000ms) for server time drift
 - UNIFIED account type for Demo Trading
+- Token-bucket rate limiting shared by every client on the same API key
+- Pooled keep-alive transport with DNS caching and per-phase latency histograms
 """
 
+import asyncio
 import hashlib
 import hmac
-import json
 import time
+from collections.abc import Sequence
 from decimal import Decimal
 from typing import Any, Literal
 
@@ -25,6 +28,12 @@ from tenacity import (
     wait_exponential,
 )
 
+from bot.api.batch_orders import (
+    OrderRequest,
+    OrderResult,
+    chunked,
+    gather_bounded,
+)
 from bot.api.exceptions import (
     AuthenticationError,
     ExchangeAPIError,
@@ -35,6 +44,8 @@ from bot.api.exceptions import (
     OrderError,
     RateLimitError,
 )
+from bot.api.http_transport import HttpTransport, RequestTiming, TransportConfig
+from bot.api.rate_limiter import RateLimiter, bybit_rate_limiter, rate_limiters
 from bot.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -84,12 +95,20 @@ class ByBitDirectClient:
         "1M": "M",
     }
 
+    # Implements create_orders / cancel_orders (see bot.api.batch_orders)
+    batch_orders = True
+
+    # Max orders per /v5/order/*-batch request by category
+    BATCH_LIMITS: dict[str, int] = {"spot": 10, "linear": 20}
+
     def __init__(
         self,
         api_key: str,
         api_secret: str,
         testnet: bool = False,
         market_type: Literal["spot", "linear"] = "spot",
+        rate_limiter: RateLimiter | None = None,
+        transport: TransportConfig | None = None,
     ) -> None:
         """
         Initialize ByBit Direct Client.
@@ -99,6 +118,8 @@ class ByBitDirectClient:
             api_secret: Production API secret
             testnet: If True, uses api-demo.bybit.com (Demo Trading)
             market_type: 'spot' for spot trading, 'linear' for futures
+            rate_limiter: Limiter to draw from (shared per API key if None)
+            transport: Connection pool, timeout and JSON codec settings
 
         Important:
             Demo Trading (testnet=True) ONLY supports 'linear' (futures), NOT 'spot'!
@@ -128,9 +149,19 @@ class ByBitDirectClient:
         # Extended receive window for server time drift
         self.recv_window = 10000  # 10 seconds (increased from 5s)
 
-        # Session for connection pooling
+        # Pooled session, created on initialize from the transport settings
+        self._transport = HttpTransport(transport)
         self._session: aiohttp.ClientSession | None = None
 
+        # HMAC state keyed with the secret once; copied per signature
+        self._hmac = hmac.new(api_secret.encode("utf-8"), digestmod=hashlib.sha256)
+        self._auth_headers = {
+            "X-BAPI-API-KEY": api_key,
+            "X-BAPI-SIGN-TYPE": "2",  # HMAC SHA256
+            "X-BAPI-RECV-WINDOW": str(self.recv_window),
+            "Content-Type": "application/json",
+        }
+
         # Markets cache (populated on initialize)
         self._markets: dict[str, Any] = {}
 
@@ -139,6 +170,12 @@ class ByBitDirectClient:
         self._error_count = 0
         self._initialized = False
 
+        # Token buckets shared with every client on this key and venue;
+        # tightened from X-Bapi-Limit-* response headers
+        self._limiter = rate_limiter or rate_limiters.get(
+            "bybit-demo" if testnet else "bybit", api_key, bybit_rate_limiter
+        )
+
         logger.info(
             "Initializing ByBit Direct Client",
             testnet=testnet,
@@ -155,10 +192,14 @@ class ByBitDirectClient:
     def markets(self) -> dict[str, Any]:
         return self._markets
 
+    @property
+    def transport(self) -> HttpTransport:
+        return self._transport
+
     async def initialize(self) -> None:
         """Initialize HTTP session and load markets."""
         if not self._session:
-            self._session = aiohttp.ClientSession()
+            self._session = self._transport.create_session()
 
         # Load markets into cache
         self._markets = await self.fetch_markets()
@@ -193,22 +234,16 @@ class ByBitDirectClient:
             Hex signature
         """
         payload = f"{timestamp}{self.api_key}{self.recv_window}{params_str}"
-        signature = hmac.new(
-            self.api_secret.encode("utf-8"),
-            payload.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
-        return signature
+        mac = self._hmac.copy()
+        mac.update(payload.encode("utf-8"))
+        return mac.hexdigest()
 
     def _build_headers(self, timestamp: int, signature: str) -> dict[str, str]:
         """Build request headers with authentication"""
         return {
-            "X-BAPI-API-KEY": self.api_key,
+            **self._auth_headers,
             "X-BAPI-TIMESTAMP": str(timestamp),
             "X-BAPI-SIGN": signature,
-            "X-BAPI-SIGN-TYPE": "2",  # HMAC SHA256
-            "X-BAPI-RECV-WINDOW": str(self.recv_window),
-            "Content-Type": "application/json",
         }
 
     async def _request(
@@ -217,6 +252,7 @@ class ByBitDirectClient:
         endpoint: str,
         params: dict[str, Any] | None = None,
         authenticated: bool = True,
+        full_response: bool = False,
     ) -> dict[str, Any]:
         """
         Make HTTP request to ByBit API.
@@ -226,6 +262,7 @@ class ByBitDirectClient:
             endpoint: API endpoint (e.g., '/v5/market/tickers')
             params: Request parameters
             authenticated: Whether request requires authentication
+            full_response: Return the whole payload (incl. retExtInfo) instead of ``result``
 
         Returns:
             Response data
@@ -235,7 +272,10 @@ class ByBitDirectClient:
         """
         if not self._session:
             raise ExchangeAPIError("Client not initialized")
+        if method not in ("GET", "POST"):
+            raise ExchangeAPIError(f"Unsupported method: {method}")
 
+        await self._limiter.acquire(endpoint)
         self._request_count += 1
         url = f"{self.base_url}{endpoint}"
         params = params or {}
@@ -243,18 +283,18 @@ class ByBitDirectClient:
         headers = {}
         params_str = ""
 
-        # Build query string for GET requests (authenticated or not)
-        if method == "GET" and params:
-            params_str = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
-            url = f"{url}?{params_str}" if params_str else url
+        if method == "GET":
+            # Build query string for GET requests (authenticated or not)
+            if params:
+                params_str = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+                url = f"{url}?{params_str}"
+        else:
+            # For POST: serialize the JSON body once and sign exactly those bytes
+            params_str = self._transport.codec.dumps(params)
+            headers = {"Content-Type": "application/json"}
 
         if authenticated:
             timestamp = int(time.time() * 1000)
-
-            if method == "POST":
-                # For POST: params as JSON body for signature
-                params_str = json.dumps(params) if params else ""
-
             signature = self._create_signature(timestamp, params_str)
             headers = self._build_headers(timestamp, signature)
 
@@ -268,17 +308,21 @@ class ByBitDirectClient:
                 authenticated=authenticated,
             )
 
+            timing = RequestTiming()
             if method == "GET":
-                async with self._session.get(url, headers=headers) as response:
-                    data = await response.json()
-            elif method == "POST":
-                async with self._session.post(url, json=params, headers=headers) as response:
-                    data = await response.json()
+                request = self._session.get(url, headers=headers, trace_request_ctx=timing)
             else:
-                raise ExchangeAPIError(f"Unsupported method: {method}")
+                request = self._session.post(
+                    url, data=params_str, headers=headers, trace_request_ctx=timing
+                )
+            async with request as response:
+                self._limiter.update_from_headers(endpoint, response.headers)
+                body = await response.read()
+            data = self._decode(body, endpoint, response.status)
+            self._transport.record(timing)
 
             # Check ByBit response code
-            ret_code = data.get("retCode")
+            ret_code: int = data.get("retCode", -1)
             ret_msg = data.get("retMsg", "Unknown error")
 
             if ret_code != 0:
@@ -290,15 +334,34 @@ class ByBitDirectClient:
                     ret_code=ret_code,
                     ret_msg=ret_msg,
                 )
-                raise self._map_error_code(ret_code, ret_msg)
+                error = self._map_error_code(ret_code, ret_msg)
+                if isinstance(error, RateLimitError):
+                    self._limiter.on_rate_limited(endpoint)
+                raise error
 
-            return data.get("result", {})
+            return data if full_response else data.get("result", {})
 
-        except aiohttp.ClientError as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError, TimeoutError) as e:
+            # asyncio.TimeoutError is only an alias of the builtin from Python 3.11
             self._error_count += 1
-            logger.error("Network error", endpoint=endpoint, error=str(e))
+            logger.error("Network error", endpoint=endpoint, error=str(e) or type(e).__name__)
             raise NetworkError(f"Network error: {e}") from e
 
+    def _decode(self, body: bytes, endpoint: str, status: int) -> dict[str, Any]:
+        """Decode a JSON response body, treating non-object replies as network errors."""
+        try:
+            data = self._transport.codec.loads(body)
+        except ValueError as e:
+            raise self._invalid_response(endpoint, status) from e
+        if not isinstance(data, dict):
+            raise self._invalid_response(endpoint, status)
+        return data
+
+    def _invalid_response(self, endpoint: str, status: int) -> NetworkError:
+        self._error_count += 1
+        logger.error("Invalid response body", endpoint=endpoint, status=status)
+        return NetworkError(f"Invalid response from {endpoint} (HTTP {status})")
+
     def _map_error_code(self, ret_code: int, ret_msg: str) -> ExchangeAPIError:
         """Map ByBit error codes to custom exceptions"""
         error_map = {
@@ -387,9 +450,50 @@ class ByBitDirectClient:
         )
 
         ticker_data = data.get("list", [{}])[0]
+        ticker = self._parse_ticker(symbol, ticker_data)
 
-        # Convert to CCXT-compatible format
-        ticker = {
+        logger.debug("Fetched ticker", symbol=symbol, last=ticker["last"])
+        return ticker
+
+    @retry(
+        retry=retry_if_exception_type((NetworkError, RateLimitError)),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+    )
+    async def fetch_tickers(self, symbols: list[str] | None = None) -> dict[str, dict[str, Any]]:
+        """
+        Fetch tickers for every market in the category with one request.
+
+        Args:
+            symbols: Symbols to return (all if None). Requested symbols keep
+                their spelling (e.g. 'BTC/USDT'); others use ByBit's ('BTCUSDT').
+
+        Returns:
+            Dict mapping symbol to CCXT-compatible ticker
+        """
+        data = await self._request(
+            "GET",
+            "/v5/market/tickers",
+            {"category": self.category},
+            authenticated=False,
+        )
+
+        wanted = {s.replace("/", ""): s for s in symbols} if symbols is not None else None
+        tickers: dict[str, dict[str, Any]] = {}
+        for ticker_data in data.get("list", []):
+            raw = ticker_data.get("symbol", "")
+            if wanted is None:
+                tickers[raw] = self._parse_ticker(raw, ticker_data)
+            elif raw in wanted:
+                tickers[wanted[raw]] = self._parse_ticker(wanted[raw], ticker_data)
+
+        logger.debug("Fetched tickers", count=len(tickers))
+        return tickers
+
+    @staticmethod
+    def _parse_ticker(symbol: str, ticker_data: dict[str, Any]) -> dict[str, Any]:
+        """Convert a ByBit ticker entry to CCXT-compatible format."""
+        return {
             "symbol": symbol,
             "last": float(ticker_data.get("lastPrice", "0")),
             "bid": float(ticker_data.get("bid1Price", "0")),
@@ -400,9 +504,6 @@ class ByBitDirectClient:
             "percentage": float(ticker_data.get("price24hPcnt", "0")) * 100,
         }
 
-        logger.debug("Fetched ticker", symbol=symbol, last=ticker["last"])
-        return ticker
-
     @retry(
         retry=retry_if_exception_type((NetworkError, RateLimitError)),
         stop=stop_after_attempt(3),
@@ -660,6 +761,153 @@ class ByBitDirectClient:
         else:
             raise ValueError(f"Unknown order type: {order_type}")
 
+    # =========================================================================
+    # Batch Orders
+    # =========================================================================
+
+    async def create_orders(
+        self,
+        requests: Sequence[OrderRequest],
+        concurrency: int = 2,
+    ) -> list[OrderResult]:
+        """
+        Place orders through /v5/order/create-batch.
+
+        Requests are chunked to the category's batch limit; chunks run with
+        at most ``concurrency`` in flight.
+
+        Returns:
+            One OrderResult per request, in request order.
+        """
+        size = self.BATCH_LIMITS.get(self.category, 10)
+        chunks = list(chunked(list(requests), size))
+        results = await gather_bounded(chunks, self._create_order_chunk, concurrency)
+        return [r for chunk in results for r in chunk]
+
+    async def _create_order_chunk(self, requests: Sequence[OrderRequest]) -> list[OrderResult]:
+        # A request that cannot be sent fails on its own, not the whole batch
+        results: list[OrderResult | None] = [None] * len(requests)
+        batch, positions = [], []
+        for i, req in enumerate(requests):
+            entry = {
+                "symbol": req.symbol.replace("/", ""),
+                "side": "Buy" if req.side.lower() == "buy" else "Sell",
+                "orderType": "Limit" if req.order_type.lower() == "limit" else "Market",
+                "qty": self._round_to_precision(req.symbol, req.amount, "amount"),
+                "positionIdx": 0,
+                **req.params,
+            }
+            if req.order_type.lower() == "limit":
+                if req.price is None:
+                    results[i] = OrderResult(error=OrderError("Price required for limit orders"))
+                    continue
+                entry["price"] = self._round_to_precision(req.symbol, req.price, "price")
+                entry["timeInForce"] = "GTC"
+            batch.append(entry)
+            positions.append(i)
+
+        if batch:
+            try:
+                data = await self._batch_request("/v5/order/create-batch", batch)
+            except ExchangeAPIError as e:
+                for i in positions:
+                    results[i] = OrderResult(error=e)
+            else:
+                items = data.get("result", {}).get("list", [])
+                errors = data.get("retExtInfo", {}).get("list", [])
+                for j, i in enumerate(positions):
+                    req = requests[i]
+                    error = self._batch_item_error(errors, j)
+                    if error is not None:
+                        results[i] = OrderResult(error=error)
+                        continue
+                    item = items[j] if j < len(items) else {}
+                    results[i] = OrderResult(
+                        order={
+                            "id": item.get("orderId", ""),
+                            "clientOrderId": item.get("orderLinkId", ""),
+                            "symbol": req.symbol,
+                            "type": req.order_type.lower(),
+                            "side": req.side.lower(),
+                            "price": float(req.price) if req.price is not None else None,
+                            "amount": float(req.amount),
+                        }
+                    )
+
+        done = [r for r in results if r is not None]
+        logger.info(
+            "Created batch orders",
+            count=len(requests),
+            failed=sum(1 for r in done if not r.ok),
+        )
+        return done
+
+    async def cancel_orders(
+        self,
+        order_ids: Sequence[str],
+        symbol: str,
+        concurrency: int = 2,
+    ) -> list[OrderResult]:
+        """
+        Cancel orders through /v5/order/cancel-batch.
+
+        Returns:
+            One OrderResult per order ID, in input order.
+        """
+        size = self.BATCH_LIMITS.get(self.category, 10)
+        chunks = list(chunked(list(order_ids), size))
+
+        async def cancel_chunk(ids: Sequence[str]) -> list[OrderResult]:
+            batch = [{"symbol": symbol.replace("/", ""), "orderId": oid} for oid in ids]
+            try:
+                data = await self._batch_request("/v5/order/cancel-batch", batch)
+            except ExchangeAPIError as e:
+                return [OrderResult(error=e) for _ in ids]
+            errors = data.get("retExtInfo", {}).get("list", [])
+            return [
+                (
+                    OrderResult(error=error)
+                    if (error := self._batch_item_error(errors, i)) is not None
+                    else OrderResult(order={"id": oid, "symbol": symbol, "status": "cancelled"})
+                )
+                for i, oid in enumerate(ids)
+            ]
+
+        results = await gather_bounded(chunks, cancel_chunk, concurrency)
+        flat = [r for chunk in results for r in chunk]
+        logger.info(
+            "Cancelled batch orders",
+            symbol=symbol,
+            count=len(flat),
+            failed=sum(1 for r in flat if not r.ok),
+        )
+        return flat
+
+    @retry(
+        retry=retry_if_exception_type((NetworkError, RateLimitError)),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+    )
+    async def _batch_request(self, endpoint: str, batch: list[dict[str, Any]]) -> dict[str, Any]:
+        return await self._request(
+            "POST",
+            endpoint,
+            {"category": self.category, "request": batch},
+            authenticated=True,
+            full_response=True,
+        )
+
+    def _batch_item_error(
+        self, errors: list[dict[str, Any]], index: int
+    ) -> ExchangeAPIError | None:
+        """Map a retExtInfo entry (code 0 = success) to an exception."""
+        if index >= len(errors):
+            return None
+        code = int(errors[index].get("code", 0) or 0)
+        if code == 0:
+            return None
+        return self._map_error_code(code, errors[index].get("msg", ""))
+
     def get_statistics(self) -> dict[str, Any]:
         """Get client statistics"""
         return {
@@ -671,6 +919,8 @@ class ByBitDirectClient:
             "error_rate": (
                 self._error_count / self._request_count if self._request_count > 0 else 0
             ),
+            "rate_limiter": self._limiter.get_stats(),
+            "transport": self._transport.get_stats(),
         }
 
     # =========================================================================
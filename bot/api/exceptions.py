@@ -47,3 +47,9 @@ class InvalidOrderError(ExchangeAPIError):
     """Raised when order parameters are invalid"""
 
     pass
+
+
+class NotSupportedError(ExchangeAPIError):
+    """Raised when the exchange does not support the requested endpoint"""
+
+    pass
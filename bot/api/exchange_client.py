@@ -2,17 +2,17 @@
 Exchange API Client v2.0 with CCXT wrapper.
 
 Improvements over v1.0:
-- Async rate limiting (non-blocking)
+- Shared, weight-aware token-bucket rate limiting (bot.api.rate_limiter)
 - OHLCV and order book fetching
 - WebSocket OHLCV/trades streaming
 - Connection health checks
-- Adaptive rate limiting
+- Rate limits tightened from exchange response headers
 - Enhanced statistics and error tracking
 """
 
-import asyncio
 import time
 from collections import deque
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any
@@ -26,6 +26,14 @@ from tenacity import (
     wait_exponential,
 )
 
+from bot.api.batch_orders import (
+    DEFAULT_CONCURRENCY,
+    OrderRequest,
+    OrderResult,
+    as_api_error,
+    chunked,
+    gather_bounded,
+)
 from bot.api.exceptions import (
     AuthenticationError,
     ExchangeAPIError,
@@ -33,9 +41,11 @@ from bot.api.exceptions import (
     InsufficientFundsError,
     InvalidOrderError,
     NetworkError,
+    NotSupportedError,
     OrderError,
     RateLimitError,
 )
+from bot.api.rate_limiter import RateLimiter, ccxt_rate_limiter, rate_limiters
 from bot.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -46,15 +56,21 @@ class ExchangeAPIClient:
     Wrapper around CCXT for unified exchange API access.
 
     Features:
-    - Rate limit handling with async backoff (non-blocking)
+    - Token-bucket rate limiting shared by all clients on the same API key,
+      with orders queued ahead of market data
     - Retry logic for transient failures
     - Comprehensive error handling and mapping
     - WebSocket support for real-time data (ticker, orders, OHLCV, trades)
     - Connection health checks
     - OHLCV and order book fetching
     - Enhanced statistics tracking
+    - Batch order placement/cancellation (native when ccxt supports it)
     """
 
+    # Implements create_orders / cancel_orders (see bot.api.batch_orders)
+    batch_orders = True
+    batch_size = 10
+
     def __init__(
         self,
         exchange_id: str,
@@ -65,6 +81,7 @@ class ExchangeAPIClient:
         rate_limit: bool = True,
         default_type: str = "spot",
         max_retries: int = 3,
+        rate_limiter: RateLimiter | None = None,
     ) -> None:
         self.exchange_id = exchange_id
         self._api_key = api_key
@@ -79,11 +96,10 @@ class ExchangeAPIClient:
         self._exchange: CCXTExchange | None = None
         self._ws_exchange: ccxtpro.Exchange | None = None
 
-        # Async rate limiting
-        self._rate_lock = asyncio.Lock()
-        self._last_request_time = 0.0
-        self._min_request_interval = 0.1  # 100ms default
-        self._adaptive_interval = 0.1  # Adjusts on rate limit hits
+        # Token buckets shared with every client on this API key
+        self._limiter: RateLimiter | None = rate_limiter
+        if self._limiter is None and rate_limit:
+            self._limiter = rate_limiters.get(exchange_id, api_key, ccxt_rate_limiter)
 
         # Statistics
         self._request_count = 0
@@ -119,11 +135,13 @@ class ExchangeAPIClient:
         """Initialize exchange REST and WebSocket connections."""
         try:
             exchange_class = getattr(ccxtpro, self.exchange_id)
+            # The shared limiter already paces requests; ccxt's own throttle would double-wait
+            ccxt_rate_limit = self._rate_limit and self._limiter is None
             config = {
                 "apiKey": self._api_key,
                 "secret": self._api_secret,
                 "password": self._password,
-                "enableRateLimit": self._rate_limit,
+                "enableRateLimit": ccxt_rate_limit,
                 "options": {
                     "defaultType": self._default_type,
                 },
@@ -138,7 +156,7 @@ class ExchangeAPIClient:
                 "apiKey": self._api_key,
                 "secret": self._api_secret,
                 "password": self._password,
-                "enableRateLimit": self._rate_limit,
+                "enableRateLimit": ccxt_rate_limit,
             }
             self._ws_exchange = exchange_class(ws_config)
             if self._sandbox:
@@ -193,40 +211,17 @@ class ExchangeAPIClient:
             return False
 
     # =========================================================================
-    # Rate Limiting (async, non-blocking)
+    # Rate Limiting
     # =========================================================================
 
-    async def _handle_rate_limit(self) -> None:
-        """Async rate limiting — does not block the event loop."""
-        if not self._rate_limit:
-            return
-
-        async with self._rate_lock:
-            current_time = time.monotonic()
-            elapsed = current_time - self._last_request_time
-
-            if elapsed < self._adaptive_interval:
-                await asyncio.sleep(self._adaptive_interval - elapsed)
-
-            self._last_request_time = time.monotonic()
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        return self._limiter
 
     def _on_rate_limit_hit(self) -> None:
-        """Adaptively increase interval on rate limit hits."""
+        """Count a rate limit rejection (the limiter backs off per endpoint)."""
         self._rate_limit_hits += 1
-        self._adaptive_interval = min(self._adaptive_interval * 1.5, 2.0)
-        logger.warning(
-            "Rate limit hit, increasing interval",
-            new_interval=self._adaptive_interval,
-            total_hits=self._rate_limit_hits,
-        )
-
-    def _on_request_success(self) -> None:
-        """Gradually reduce interval on success."""
-        if self._adaptive_interval > self._min_request_interval:
-            self._adaptive_interval = max(
-                self._adaptive_interval * 0.95,
-                self._min_request_interval,
-            )
+        logger.warning("Rate limit hit", total_hits=self._rate_limit_hits)
 
     # =========================================================================
     # Exception Mapping
@@ -253,6 +248,8 @@ class ExchangeAPIClient:
             return ExchangeNotAvailableError(f"Exchange not available: {e}")
         elif isinstance(e, ccxtpro.NetworkError):
             return NetworkError(f"Network error: {e}")
+        elif isinstance(e, ccxtpro.NotSupported):
+            return NotSupportedError(f"Not supported: {e}")
         else:
             return ExchangeAPIError(f"Exchange API error: {e}")
 
@@ -268,20 +265,37 @@ class ExchangeAPIClient:
             raise ExchangeAPIError("Exchange not initialized")
         return self._exchange
 
-    async def _tracked_request(self, coro: Any) -> Any:
-        """Execute a request with rate limiting, stats tracking, and latency measurement."""
-        await self._handle_rate_limit()
+    async def _tracked_request(self, endpoint: str, coro: Any) -> Any:
+        """Execute a request with rate limiting, stats tracking, and latency measurement.
+
+        Args:
+            endpoint: ccxt method name, used to pick the rate-limit bucket.
+            coro: The not-yet-awaited ccxt call.
+        """
+        if self._limiter is not None:
+            try:
+                await self._limiter.acquire(endpoint)
+            except BaseException:
+                coro.close()
+                raise
         self._request_count += 1
         start = time.monotonic()
         try:
             result = await coro
-            latency = (time.monotonic() - start) * 1000  # ms
-            self._latencies.append(latency)
-            self._on_request_success()
-            return result
         except Exception as e:
             self._error_count += 1
-            raise self._map_ccxt_exception(e) from e
+            error = self._map_ccxt_exception(e)
+            if isinstance(error, RateLimitError) and self._limiter is not None:
+                self._limiter.on_rate_limited(endpoint)
+            raise error from e
+        latency = (time.monotonic() - start) * 1000  # ms
+        self._latencies.append(latency)
+        if self._limiter is not None:
+            # Headers of the most recent response on this ccxt instance
+            self._limiter.update_from_headers(
+                endpoint, getattr(self._exchange, "last_response_headers", None)
+            )
+        return result
 
     # =========================================================================
     # Market Data
@@ -295,7 +309,7 @@ class ExchangeAPIClient:
     async def fetch_balance(self) -> dict[str, Any]:
         """Fetch account balance."""
         self._ensure_initialized()
-        return await self._tracked_request(self._ex.fetch_balance())
+        return await self._tracked_request("fetch_balance", self._ex.fetch_balance())
 
     @retry(
         retry=retry_if_exception_type((NetworkError, RateLimitError)),
@@ -305,7 +319,25 @@ class ExchangeAPIClient:
     async def fetch_ticker(self, symbol: str) -> dict[str, Any]:
         """Fetch ticker data for a symbol."""
         self._ensure_initialized()
-        return await self._tracked_request(self._ex.fetch_ticker(symbol))
+        return await self._tracked_request("fetch_ticker", self._ex.fetch_ticker(symbol))
+
+    @retry(
+        retry=retry_if_exception_type((NetworkError, RateLimitError)),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+    )
+    async def fetch_tickers(self, symbols: list[str] | None = None) -> dict[str, dict[str, Any]]:
+        """
+        Fetch tickers for many symbols in one request.
+
+        Args:
+            symbols: Symbols to fetch (all markets if None)
+
+        Returns:
+            Dict mapping symbol to ticker.
+        """
+        self._ensure_initialized()
+        return await self._tracked_request("fetch_tickers", self._ex.fetch_tickers(symbols))
 
     @retry(
         retry=retry_if_exception_type((NetworkError, RateLimitError)),
@@ -335,7 +367,8 @@ class ExchangeAPIClient:
         """
         self._ensure_initialized()
         return await self._tracked_request(
-            self._ex.fetch_ohlcv(symbol, timeframe, since=since, limit=limit, params=params or {})
+            "fetch_ohlcv",
+            self._ex.fetch_ohlcv(symbol, timeframe, since=since, limit=limit, params=params or {}),
         )
 
     @retry(
@@ -362,7 +395,7 @@ class ExchangeAPIClient:
         """
         self._ensure_initialized()
         return await self._tracked_request(
-            self._ex.fetch_order_book(symbol, limit=limit, params=params or {})
+            "fetch_order_book", self._ex.fetch_order_book(symbol, limit=limit, params=params or {})
         )
 
     @retry(
@@ -380,7 +413,8 @@ class ExchangeAPIClient:
         """Fetch recent trades for a symbol."""
         self._ensure_initialized()
         return await self._tracked_request(
-            self._ex.fetch_trades(symbol, since=since, limit=limit, params=params or {})
+            "fetch_trades",
+            self._ex.fetch_trades(symbol, since=since, limit=limit, params=params or {}),
         )
 
     # =========================================================================
@@ -430,13 +464,14 @@ class ExchangeAPIClient:
         self._ensure_initialized()
         try:
             result = await self._tracked_request(
+                "create_limit_order",
                 self._ex.create_limit_order(
                     symbol=symbol,
                     side=side,
                     amount=float(amount),
                     price=float(price),
                     params=params or {},
-                )
+                ),
             )
             logger.info(
                 "Created limit order",
@@ -468,12 +503,13 @@ class ExchangeAPIClient:
         self._ensure_initialized()
         try:
             result = await self._tracked_request(
+                "create_market_order",
                 self._ex.create_market_order(
                     symbol=symbol,
                     side=side,
                     amount=float(amount),
                     params=params or {},
-                )
+                ),
             )
             logger.info(
                 "Created market order",
@@ -500,7 +536,8 @@ class ExchangeAPIClient:
         self._ensure_initialized()
         try:
             result = await self._tracked_request(
-                self._ex.cancel_order(id=order_id, symbol=symbol, params=params or {})
+                "cancel_order",
+                self._ex.cancel_order(id=order_id, symbol=symbol, params=params or {}),
             )
             logger.info("Cancelled order", order_id=order_id, symbol=symbol)
             return result
@@ -518,7 +555,9 @@ class ExchangeAPIClient:
         """Cancel all open orders for a symbol."""
         self._ensure_initialized()
         try:
-            result = await self._tracked_request(self._ex.cancel_all_orders(symbol))
+            result = await self._tracked_request(
+                "cancel_all_orders", self._ex.cancel_all_orders(symbol)
+            )
             logger.info("All orders cancelled", symbol=symbol)
             return result
         except ExchangeAPIError:
@@ -526,6 +565,110 @@ class ExchangeAPIClient:
         except Exception as e:
             raise self._map_ccxt_exception(e) from e
 
+    # =========================================================================
+    # Batch Orders
+    # =========================================================================
+
+    async def create_orders(
+        self,
+        requests: Sequence[OrderRequest],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[OrderResult]:
+        """
+        Place several orders, one OrderResult per request in request order.
+
+        Uses ccxt ``create_orders`` in chunks of ``batch_size`` when the
+        exchange supports it, otherwise per-order calls with at most
+        ``concurrency`` in flight. Rate limiting applies per request either way.
+        """
+        self._ensure_initialized()
+        if not self._ex.has.get("createOrders"):
+
+            async def place(req: OrderRequest) -> OrderResult:
+                try:
+                    order = await self.create_order(
+                        req.symbol,
+                        req.order_type,
+                        req.side,
+                        float(req.amount),
+                        float(req.price) if req.price is not None else None,
+                        req.params or None,
+                    )
+                    return OrderResult(order=order)
+                except Exception as e:
+                    return OrderResult(error=as_api_error(e))
+
+            return await gather_bounded(requests, place, concurrency)
+
+        async def place_chunk(chunk: Sequence[OrderRequest]) -> list[OrderResult]:
+            batch = [
+                {
+                    "symbol": r.symbol,
+                    "type": r.order_type,
+                    "side": r.side,
+                    "amount": float(r.amount),
+                    "price": float(r.price) if r.price is not None else None,
+                    "params": r.params,
+                }
+                for r in chunk
+            ]
+            try:
+                orders = await self._tracked_request("create_orders", self._ex.create_orders(batch))
+            except ExchangeAPIError as e:
+                return [OrderResult(error=e) for _ in chunk]
+            return [self._batch_result(o) for o in orders]
+
+        chunks = list(chunked(list(requests), self.batch_size))
+        results = [r for c in await gather_bounded(chunks, place_chunk, concurrency) for r in c]
+        logger.info(
+            "Created batch orders",
+            count=len(results),
+            failed=sum(1 for r in results if not r.ok),
+        )
+        return results
+
+    async def cancel_orders(
+        self,
+        order_ids: Sequence[str],
+        symbol: str,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[OrderResult]:
+        """Cancel several orders, one OrderResult per ID in input order."""
+        self._ensure_initialized()
+        if not self._ex.has.get("cancelOrders"):
+
+            async def cancel(order_id: str) -> OrderResult:
+                try:
+                    return OrderResult(order=await self.cancel_order(order_id, symbol))
+                except Exception as e:
+                    return OrderResult(error=as_api_error(e))
+
+            return await gather_bounded(order_ids, cancel, concurrency)
+
+        async def cancel_chunk(ids: Sequence[str]) -> list[OrderResult]:
+            try:
+                orders = await self._tracked_request(
+                    "cancel_orders", self._ex.cancel_orders(list(ids), symbol)
+                )
+            except ExchangeAPIError as e:
+                return [OrderResult(error=e) for _ in ids]
+            if len(orders) != len(ids):
+                # Some exchanges only acknowledge the batch as a whole
+                return [OrderResult(order={"id": oid, "symbol": symbol}) for oid in ids]
+            return [self._batch_result(o) for o in orders]
+
+        chunks = list(chunked(list(order_ids), self.batch_size))
+        return [r for c in await gather_bounded(chunks, cancel_chunk, concurrency) for r in c]
+
+    @staticmethod
+    def _batch_result(order: dict[str, Any]) -> OrderResult:
+        """Per-order result of a ccxt batch call; rejected entries carry no id."""
+        if order.get("id") and order.get("status") != "rejected":
+            return OrderResult(order=order)
+        info = order.get("info") or {}
+        message = info.get("msg") or info.get("message") or str(info) or "rejected"
+        return OrderResult(error=OrderError(f"Batch order rejected: {message}"))
+
     @retry(
         retry=retry_if_exception_type((NetworkError, RateLimitError)),
         stop=stop_after_attempt(3),
@@ -537,7 +680,7 @@ class ExchangeAPIClient:
         """Fetch order details."""
         self._ensure_initialized()
         return await self._tracked_request(
-            self._ex.fetch_order(id=order_id, symbol=symbol, params=params or {})
+            "fetch_order", self._ex.fetch_order(id=order_id, symbol=symbol, params=params or {})
         )
 
     @retry(
@@ -551,7 +694,7 @@ class ExchangeAPIClient:
         """Fetch open orders."""
         self._ensure_initialized()
         return await self._tracked_request(
-            self._ex.fetch_open_orders(symbol=symbol, params=params or {})
+            "fetch_open_orders", self._ex.fetch_open_orders(symbol=symbol, params=params or {})
         )
 
     @retry(
@@ -569,9 +712,10 @@ class ExchangeAPIClient:
         """Fetch closed/completed orders."""
         self._ensure_initialized()
         return await self._tracked_request(
+            "fetch_closed_orders",
             self._ex.fetch_closed_orders(
                 symbol=symbol, since=since, limit=limit, params=params or {}
-            )
+            ),
         )
 
     @retry(
@@ -588,7 +732,7 @@ class ExchangeAPIClient:
         """Set leverage for a symbol (futures/margin)."""
         self._ensure_initialized()
         return await self._tracked_request(
-            self._ex.set_leverage(leverage, symbol, params=params or {})
+            "set_leverage", self._ex.set_leverage(leverage, symbol, params=params or {})
         )
 
     # =========================================================================
@@ -658,7 +802,7 @@ class ExchangeAPIClient:
                 self._error_count / self._request_count if self._request_count > 0 else 0.0
             ),
             "avg_latency_ms": round(avg_latency, 2),
-            "adaptive_interval": round(self._adaptive_interval, 4),
+            "rate_limiter": self._limiter.get_stats() if self._limiter is not None else None,
             "last_error": self._last_error,
             "last_error_time": self._last_error_time.isoformat() if self._last_error_time else None,
         }
@@ -0,0 +1,154 @@
+"""
+ExchangeStream — resilient loop around a ccxt.pro ``watch_*`` call.
+
+Repeatedly awaits a watch coroutine and pushes each update to a handler.
+Errors and silent periods longer than ``stale_after`` count as a gap: the
+stream is marked disconnected (so callers fall back to polling), retries
+with exponential backoff, and fires ``on_resume`` once updates flow again
+so the caller can reconcile anything missed during the gap.
+
+Usage:
+    stream = ExchangeStream(
+        "orders",
+        watch=lambda: client.watch_orders("BTC/USDT"),
+        on_update=handle_orders,
+        on_resume=reconcile,
+    )
+    await stream.start()
+    ...
+    if not stream.connected:
+        await poll_orders()
+    ...
+    await stream.stop()
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from bot.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ExchangeStream:
+    """Background watcher for one WebSocket subscription with gap detection."""
+
+    def __init__(
+        self,
+        name: str,
+        watch: Callable[[], Awaitable[Any]],
+        on_update: Callable[[Any], Awaitable[None]],
+        on_resume: Callable[[], Awaitable[None]] | None = None,
+        stale_after: float | None = None,
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 30.0,
+    ) -> None:
+        """
+        Args:
+            name: Label used in logs and status.
+            watch: Zero-arg coroutine factory returning the next update.
+            on_update: Handler awaited with every update.
+            on_resume: Awaited when updates resume after a gap.
+            stale_after: Seconds without an update before declaring a gap
+                (None for streams that may legitimately stay quiet).
+            retry_delay: Initial reconnect delay in seconds.
+            max_retry_delay: Cap for the exponential reconnect delay.
+        """
+        self.name = name
+        self._watch = watch
+        self._on_update = on_update
+        self._on_resume = on_resume
+        self._stale_after = stale_after
+        self._retry_delay = retry_delay
+        self._max_retry_delay = max_retry_delay
+
+        self._task: asyncio.Task | None = None
+        self._connected = False
+        self.updates = 0
+        self.gaps = 0
+        self.last_update_at: float | None = None
+        self.last_error: str | None = None
+
+    @property
+    def connected(self) -> bool:
+        """True while updates are flowing; False before the first update and during gaps."""
+        return self._connected
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.info("exchange_stream_started", stream=self.name)
+
+    async def stop(self) -> None:
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._connected = False
+        logger.info("exchange_stream_stopped", stream=self.name)
+
+    async def _run(self) -> None:
+        delay = self._retry_delay
+        while True:
+            try:
+                if self._stale_after:
+                    data = await asyncio.wait_for(self._watch(), self._stale_after)
+                else:
+                    data = await self._watch()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                reason = "stale" if isinstance(e, asyncio.TimeoutError) else str(e)
+                self._mark_gap(reason)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._max_retry_delay)
+                continue
+
+            delay = self._retry_delay
+            self.updates += 1
+            self.last_update_at = time.monotonic()
+
+            if not self._connected:
+                self._connected = True
+                if self.gaps and self._on_resume:
+                    logger.info("exchange_stream_resumed", stream=self.name, gaps=self.gaps)
+                    try:
+                        await self._on_resume()
+                    except Exception as e:
+                        logger.error(
+                            "exchange_stream_resume_failed", stream=self.name, error=str(e)
+                        )
+
+            try:
+                await self._on_update(data)
+            except Exception as e:
+                logger.error("exchange_stream_handler_failed", stream=self.name, error=str(e))
+
+    def _mark_gap(self, reason: str) -> None:
+        self.last_error = reason
+        if self._connected or not self.gaps:
+            self.gaps += 1
+            logger.warning("exchange_stream_gap", stream=self.name, reason=reason)
+        self._connected = False
+
+    def get_status(self) -> dict[str, Any]:
+        age = time.monotonic() - self.last_update_at if self.last_update_at else None
+        return {
+            "name": self.name,
+            "running": self.running,
+            "connected": self._connected,
+            "updates": self.updates,
+            "gaps": self.gaps,
+            "last_update_age": round(age, 3) if age is not None else None,
+            "last_error": self.last_error,
+        }
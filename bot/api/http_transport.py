@@ -0,0 +1,286 @@
+"""
+HTTP transport for the direct exchange clients.
+
+Builds a pooled aiohttp session (keep-alive, per-host connection limits, DNS
+cache, split timeouts) and records per-request latency histograms for three
+phases, measured from the start of the request:
+
+- connect: until a pooled connection is reused or a new one is established
+- ttfb:    until the response status line and headers arrive
+- total:   until the body has been read and decoded
+
+A faster JSON codec (orjson, then ujson) is used when installed; the stdlib
+``json`` module is the fallback.
+"""
+
+import json
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+
+from bot.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Histogram bucket upper bounds in milliseconds
+DEFAULT_LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    1,
+    2,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+)
+
+LATENCY_PHASES = ("connect", "ttfb", "total")
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """Pair of JSON encode/decode callables; ``dumps`` always returns str."""
+
+    name: str
+    dumps: Callable[[Any], str]
+    loads: Callable[[bytes | str], Any]
+
+
+def _stdlib_codec() -> JsonCodec:
+    return JsonCodec(
+        "stdlib",
+        lambda obj: json.dumps(obj, separators=(",", ":")),
+        json.loads,
+    )
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson
+
+    return JsonCodec("orjson", lambda obj: orjson.dumps(obj).decode(), orjson.loads)
+
+
+def _ujson_codec() -> JsonCodec:
+    import ujson
+
+    return JsonCodec("ujson", ujson.dumps, ujson.loads)
+
+
+_CODECS: dict[str, Callable[[], JsonCodec]] = {
+    "orjson": _orjson_codec,
+    "ujson": _ujson_codec,
+    "stdlib": _stdlib_codec,
+}
+
+
+def resolve_codec(name: str = "auto") -> JsonCodec:
+    """
+    Resolve a JSON codec by name.
+
+    Args:
+        name: 'auto' (fastest installed), 'orjson', 'ujson' or 'stdlib'
+
+    Returns:
+        The requested codec, or stdlib if its package is not installed
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    if name == "auto":
+        candidates = list(_CODECS)
+    elif name in _CODECS:
+        candidates = [name, "stdlib"]
+    else:
+        raise ValueError(f"Unknown JSON codec: {name}")
+
+    for candidate in candidates:
+        try:
+            return _CODECS[candidate]()
+        except ImportError:
+            if name != "auto":
+                logger.warning("json_codec_unavailable", codec=candidate, fallback="stdlib")
+    return _stdlib_codec()
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with interpolated percentiles."""
+
+    def __init__(self, buckets_ms: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS) -> None:
+        self._bounds = tuple(b / 1000 for b in sorted(buckets_ms))
+        self._counts = [0] * (len(self._bounds) + 1)
+        self.count = 0
+        self.sum_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self._counts[bisect_left(self._bounds, seconds)] += 1
+        self.count += 1
+        self.sum_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    @property
+    def avg_seconds(self) -> float:
+        return self.sum_seconds / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Estimate the q-quantile (0..1) in seconds, interpolating inside a bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self._counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                lower = self._bounds[i - 1] if i else 0.0
+                upper = self._bounds[i] if i < len(self._bounds) else self.max_seconds
+                estimate = lower + (upper - lower) * (rank - cumulative) / bucket_count
+                return min(estimate, self.max_seconds)
+            cumulative += bucket_count
+        return self.max_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "avg": round(self.avg_seconds, 6),
+            "max": round(self.max_seconds, 6),
+            "p50": round(self.percentile(0.50), 6),
+            "p90": round(self.percentile(0.90), 6),
+            "p99": round(self.percentile(0.99), 6),
+        }
+
+
+@dataclass
+class TransportConfig:
+    """Connection pool, timeout and codec settings for the direct HTTP clients."""
+
+    # Connection pool
+    limit: int = 100
+    limit_per_host: int = 32
+    keepalive_timeout: float = 30.0
+
+    # DNS cache (aiohttp's default TTL is 10s)
+    use_dns_cache: bool = True
+    ttl_dns_cache: int = 300
+
+    # Timeouts in seconds (aiohttp's default is a single 5 minute total)
+    total_timeout: float = 30.0
+    connect_timeout: float = 10.0
+    sock_connect_timeout: float = 5.0
+    sock_read_timeout: float = 15.0
+
+    # 'auto', 'orjson', 'ujson' or 'stdlib'
+    json_codec: str = "auto"
+
+    latency_buckets_ms: tuple[float, ...] = field(default=DEFAULT_LATENCY_BUCKETS_MS)
+
+
+class RequestTiming:
+    """Phase timestamps for one request, filled in by the session's trace hooks."""
+
+    __slots__ = ("start", "connect", "ttfb")
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.connect: float | None = None
+        self.ttfb: float | None = None
+
+
+class HttpTransport:
+    """
+    Session factory and latency recorder shared by a client's requests.
+
+    Pass a ``RequestTiming`` as ``trace_request_ctx`` on each request made with
+    the session from ``create_session``, then hand it to ``record`` once the
+    body has been read.
+    """
+
+    def __init__(self, config: TransportConfig | None = None) -> None:
+        self.config = config or TransportConfig()
+        self.codec = resolve_codec(self.config.json_codec)
+        self.latency = {
+            phase: LatencyHistogram(self.config.latency_buckets_ms) for phase in LATENCY_PHASES
+        }
+        self.connections_created = 0
+        self.connections_reused = 0
+
+    def create_session(self, headers: dict[str, str] | None = None) -> aiohttp.ClientSession:
+        """Create a pooled session configured from ``self.config``."""
+        cfg = self.config
+        connector = aiohttp.TCPConnector(
+            limit=cfg.limit,
+            limit_per_host=cfg.limit_per_host,
+            keepalive_timeout=cfg.keepalive_timeout,
+            use_dns_cache=cfg.use_dns_cache,
+            ttl_dns_cache=cfg.ttl_dns_cache,
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=cfg.total_timeout,
+            connect=cfg.connect_timeout,
+            sock_connect=cfg.sock_connect_timeout,
+            sock_read=cfg.sock_read_timeout,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers=headers,
+            json_serialize=self.codec.dumps,
+            trace_configs=[self._trace_config()],
+        )
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+
+        async def on_connection_create_end(
+            session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+        ) -> None:
+            self.connections_created += 1
+            timing = ctx.trace_request_ctx
+            if isinstance(timing, RequestTiming):
+                timing.connect = time.perf_counter() - timing.start
+
+        async def on_connection_reuseconn(
+            session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+        ) -> None:
+            self.connections_reused += 1
+            timing = ctx.trace_request_ctx
+            if isinstance(timing, RequestTiming):
+                timing.connect = time.perf_counter() - timing.start
+
+        async def on_request_end(
+            session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+        ) -> None:
+            timing = ctx.trace_request_ctx
+            if isinstance(timing, RequestTiming):
+                timing.ttfb = time.perf_counter() - timing.start
+
+        trace.on_connection_create_end.append(on_connection_create_end)
+        trace.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace.on_request_end.append(on_request_end)
+        return trace
+
+    def record(self, timing: RequestTiming) -> float:
+        """Record a completed request; returns its total latency in seconds."""
+        total = time.perf_counter() - timing.start
+        if timing.connect is not None:
+            self.latency["connect"].observe(timing.connect)
+        if timing.ttfb is not None:
+            self.latency["ttfb"].observe(timing.ttfb)
+        self.latency["total"].observe(total)
+        return total
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "json_codec": self.codec.name,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "latency": {phase: hist.to_dict() for phase, hist in self.latency.items()},
+        }
@@ -0,0 +1,348 @@
+"""
+MarketDataHub — process-wide ticker and OHLCV cache shared by all bots.
+
+Every BotOrchestrator polls its symbol's ticker and pulls the same
+1d/4h/1h/15m candles as its neighbours and the MarketScanner. The hub keeps
+one TTL cache per venue keyed by (symbol, timeframe) and coalesces
+concurrent identical requests onto a single in-flight exchange call.
+
+Consumers talk to a ``MarketDataFeed`` — an exchange-bound view exposing
+``fetch_ticker`` / ``fetch_ohlcv`` with the exchange client's signatures —
+so they can be handed a feed wherever they previously took a client.
+
+Usage:
+    hub = MarketDataHub(ticker_ttl=2.0, ohlcv_ttl=30.0)
+    feed = hub.feed(exchange_client)
+    ticker = await feed.fetch_ticker("BTC/USDT")
+    candles = await feed.fetch_ohlcv("BTC/USDT", "1h", limit=200)
+    hub.get_stats()  # hit rate, requests saved
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any
+
+from bot.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_TIMEFRAME_UNITS = {"m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def timeframe_seconds(timeframe: str) -> int | None:
+    """Length of a CCXT-style timeframe in seconds, or None if unknown (e.g. '1M')."""
+    unit = _TIMEFRAME_UNITS.get(timeframe[-1:])
+    if unit is None or not timeframe[:-1].isdigit():
+        return None
+    return int(timeframe[:-1]) * unit
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    expires_at: float
+    limit: int | None = None
+
+
+@dataclass
+class HubStats:
+    """Request counters for one data kind (ticker or ohlcv)."""
+
+    requests: int = 0
+    hits: int = 0
+    coalesced: int = 0
+    fetches: int = 0
+    bypassed: int = 0
+    errors: int = 0
+
+    @property
+    def requests_saved(self) -> int:
+        """Requests answered without an exchange call of their own."""
+        return self.hits + self.coalesced
+
+    @property
+    def hit_rate(self) -> float:
+        return self.requests_saved / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "hits": self.hits,
+            "coalesced": self.coalesced,
+            "fetches": self.fetches,
+            "bypassed": self.bypassed,
+            "errors": self.errors,
+            "requests_saved": self.requests_saved,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+@dataclass
+class _Inflight:
+    task: asyncio.Task
+    limit: int | None = None
+
+
+@dataclass
+class _VenueCache:
+    tickers: dict[str, _CacheEntry] = field(default_factory=dict)
+    ohlcv: dict[tuple[str, str], _CacheEntry] = field(default_factory=dict)
+
+
+class MarketDataHub:
+    """
+    Shared, TTL-aware market data cache with request coalescing.
+
+    Tickers live for ``ticker_ttl`` seconds. Candles live for ``ohlcv_ttl``
+    seconds but never past the open of the next bar, so a new candle is
+    always picked up. A cached candle request also serves any smaller
+    ``limit`` for the same (symbol, timeframe).
+
+    Requests with ``since`` or extra ``params`` go straight to the exchange.
+    Every caller gets its own copy of the tickers dicts and candle rows, so
+    one bot mutating a result cannot change what the others see.
+    """
+
+    def __init__(
+        self,
+        ticker_ttl: float = 2.0,
+        ohlcv_ttl: float = 30.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Args:
+            ticker_ttl: Seconds a ticker is served from cache.
+            ohlcv_ttl: Upper bound in seconds on how long candles are cached.
+            clock: Wall-clock source in epoch seconds (bar boundaries are UTC).
+        """
+        self.ticker_ttl = ticker_ttl
+        self.ohlcv_ttl = ohlcv_ttl
+        self._clock = clock
+        self._venues: dict[Hashable, _VenueCache] = {}
+        self._inflight: dict[tuple, _Inflight] = {}
+        self._stats = {"ticker": HubStats(), "ohlcv": HubStats()}
+
+    # =========================================================================
+    # Subscription
+    # =========================================================================
+
+    def feed(self, exchange: Any, venue: Hashable | None = None) -> "MarketDataFeed":
+        """
+        Return a cached market-data view of ``exchange``.
+
+        Clients on the same venue (exchange, sandbox flag, market type) share
+        cache entries even when they hold different credentials.
+        """
+        return MarketDataFeed(self, exchange, venue if venue is not None else venue_key(exchange))
+
+    # =========================================================================
+    # Fetching
+    # =========================================================================
+
+    async def fetch_ticker(self, exchange: Any, venue: Hashable, symbol: str) -> dict[str, Any]:
+        """Fetch a ticker through the cache."""
+        stats = self._stats["ticker"]
+        stats.requests += 1
+        cache = self._venue(venue).tickers
+
+        entry = cache.get(symbol)
+        if entry is not None and entry.expires_at > self._clock():
+            stats.hits += 1
+            return dict(entry.value)
+
+        async def load() -> dict[str, Any]:
+            ticker: dict[str, Any] = await exchange.fetch_ticker(symbol)
+            cache[symbol] = _CacheEntry(ticker, self._clock() + self.ticker_ttl)
+            return ticker
+
+        return dict(await self._coalesce(stats, (venue, "ticker", symbol), None, load))
+
+    async def fetch_tickers(
+        self, exchange: Any, venue: Hashable, symbols: list[str] | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Fetch many tickers through the cache with one bulk exchange call.
+
+        Served from cache only when every requested symbol is fresh; an
+        unrestricted (``symbols=None``) request always reaches the exchange.
+        Every returned ticker refreshes the per-symbol cache.
+        """
+        stats = self._stats["ticker"]
+        stats.requests += 1
+        cache = self._venue(venue).tickers
+
+        if symbols is not None:
+            now = self._clock()
+            entries = [cache.get(s) for s in symbols]
+            if all(e is not None and e.expires_at > now for e in entries):
+                stats.hits += 1
+                return {
+                    s: dict(e.value) for s, e in zip(symbols, entries, strict=True) if e is not None
+                }
+
+        async def load() -> dict[str, dict[str, Any]]:
+            tickers: dict[str, dict[str, Any]] = await exchange.fetch_tickers(symbols)
+            expires_at = self._clock() + self.ticker_ttl
+            for symbol, ticker in tickers.items():
+                cache[symbol] = _CacheEntry(ticker, expires_at)
+            return tickers
+
+        key = (venue, "tickers", tuple(symbols) if symbols is not None else None)
+        tickers = await self._coalesce(stats, key, None, load)
+        return {s: dict(ticker) for s, ticker in tickers.items()}
+
+    async def fetch_ohlcv(
+        self,
+        exchange: Any,
+        venue: Hashable,
+        symbol: str,
+        timeframe: str = "1h",
+        since: int | None = None,
+        limit: int | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> list[list]:
+        """Fetch candles through the cache; returns the newest ``limit`` rows."""
+        stats = self._stats["ohlcv"]
+        stats.requests += 1
+        if since is not None or params:
+            stats.bypassed += 1
+            stats.fetches += 1
+            rows: list[list] = await exchange.fetch_ohlcv(
+                symbol, timeframe, since=since, limit=limit, params=params
+            )
+            return rows
+
+        cache = self._venue(venue).ohlcv
+        key = (symbol, timeframe)
+        entry = cache.get(key)
+        if entry is not None and entry.expires_at > self._clock() and _covers(entry.limit, limit):
+            stats.hits += 1
+            return _tail(entry.value, limit)
+
+        async def load() -> list[list]:
+            candles: list[list] = await exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+            cache[key] = _CacheEntry(candles, self._ohlcv_expiry(timeframe), limit)
+            return candles
+
+        candles = await self._coalesce(stats, (venue, "ohlcv", symbol, timeframe), limit, load)
+        return _tail(candles, limit)
+
+    async def _coalesce(
+        self,
+        stats: HubStats,
+        key: tuple,
+        limit: int | None,
+        load: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Join a compatible in-flight request for ``key`` or start one."""
+        inflight = self._inflight.get(key)
+        if inflight is not None and _covers(inflight.limit, limit):
+            stats.coalesced += 1
+            return await asyncio.shield(inflight.task)
+
+        stats.fetches += 1
+        task = asyncio.ensure_future(load())
+        self._inflight[key] = _Inflight(task, limit)
+        task.add_done_callback(lambda t: self._finish(key, t, stats))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: tuple, task: asyncio.Task, stats: HubStats) -> None:
+        inflight = self._inflight.get(key)
+        if inflight is not None and inflight.task is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            stats.errors += 1
+
+    def _ohlcv_expiry(self, timeframe: str) -> float:
+        now = self._clock()
+        expires = now + self.ohlcv_ttl
+        period = timeframe_seconds(timeframe)
+        if period:
+            next_open = (now // period + 1) * period
+            expires = min(expires, next_open)
+        return expires
+
+    def _venue(self, venue: Hashable) -> _VenueCache:
+        cache = self._venues.get(venue)
+        if cache is None:
+            cache = self._venues[venue] = _VenueCache()
+        return cache
+
+    # =========================================================================
+    # Maintenance & Stats
+    # =========================================================================
+
+    def invalidate(self, symbol: str | None = None) -> None:
+        """Drop cached entries for ``symbol`` (or everything)."""
+        for cache in self._venues.values():
+            if symbol is None:
+                cache.tickers.clear()
+                cache.ohlcv.clear()
+                continue
+            cache.tickers.pop(symbol, None)
+            for key in [k for k in cache.ohlcv if k[0] == symbol]:
+                del cache.ohlcv[key]
+
+    @property
+    def stats(self) -> dict[str, HubStats]:
+        return dict(self._stats)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Per-kind counters plus cache sizes."""
+        return {
+            **{kind: s.to_dict() for kind, s in self._stats.items()},
+            "venues": len(self._venues),
+            "cached_tickers": sum(len(c.tickers) for c in self._venues.values()),
+            "cached_series": sum(len(c.ohlcv) for c in self._venues.values()),
+            "inflight": len(self._inflight),
+        }
+
+
+class MarketDataFeed:
+    """Exchange-bound view of a MarketDataHub with the client's fetch signatures."""
+
+    def __init__(self, hub: MarketDataHub, exchange: Any, venue: Hashable) -> None:
+        self.hub = hub
+        self.exchange = exchange
+        self.venue = venue
+
+    async def fetch_ticker(self, symbol: str) -> dict[str, Any]:
+        return await self.hub.fetch_ticker(self.exchange, self.venue, symbol)
+
+    async def fetch_tickers(self, symbols: list[str] | None = None) -> dict[str, dict[str, Any]]:
+        return await self.hub.fetch_tickers(self.exchange, self.venue, symbols)
+
+    async def fetch_ohlcv(
+        self,
+        symbol: str,
+        timeframe: str = "1h",
+        since: int | None = None,
+        limit: int | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> list[list]:
+        return await self.hub.fetch_ohlcv(
+            self.exchange, self.venue, symbol, timeframe, since=since, limit=limit, params=params
+        )
+
+
+def venue_key(exchange: Any) -> tuple[str, bool, str]:
+    """Identify the market an exchange client reads from, ignoring credentials."""
+    name = getattr(exchange, "exchange_id", None) or type(exchange).__name__
+    sandbox = getattr(exchange, "_sandbox", getattr(exchange, "testnet", False))
+    market = getattr(exchange, "_default_type", getattr(exchange, "market_type", "spot"))
+    return str(name), bool(sandbox), str(market)
+
+
+def _covers(have: int | None, want: int | None) -> bool:
+    """Whether a response fetched with limit ``have`` can answer limit ``want``."""
+    if have is None or want is None:
+        return have == want
+    return want <= have
+
+
+def _tail(candles: list[list], limit: int | None) -> list[list]:
+    """Copies of the newest ``limit`` rows (all rows when ``limit`` is None)."""
+    start = 0 if limit is None else max(0, len(candles) - limit)
+    return [list(row) for row in candles[start:]]
@@ -0,0 +1,485 @@
+"""
+Token-bucket rate limiting for exchange requests.
+
+A ``TokenBucket`` refills at ``rate`` tokens per second up to ``capacity``.
+``acquire`` waits until enough tokens are available; waiting requests are
+served by priority, then arrival order, so orders overtake queued
+market-data reads. Nothing is held while a request is in flight, so
+independent requests run concurrently as long as the budget allows.
+
+A ``RateLimiter`` routes endpoints to weighted buckets (orders, account,
+market data) and charges every request to a shared ``global`` bucket as
+well. It tightens its buckets from exchange rate-limit response headers and
+pauses a bucket after a 429. ``rate_limiters`` hands out one limiter per
+(exchange, API key), so every client on the same key shares one budget.
+
+Usage:
+    limiter = rate_limiters.get("bybit", api_key, bybit_rate_limiter)
+    await limiter.acquire("/v5/order/create")
+    limiter.update_from_headers("/v5/order/create", response.headers)
+    limiter.get_stats()  # tokens used and queue wait per bucket
+"""
+
+import asyncio
+import hashlib
+import heapq
+import itertools
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any
+
+from bot.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Longest pause taken on the strength of a response header or Retry-After
+MAX_PAUSE_SECONDS = 30.0
+
+
+class Priority(IntEnum):
+    """Queue lanes; lower values are served first."""
+
+    ORDER = 0
+    ACCOUNT = 1
+    MARKET_DATA = 2
+
+
+@dataclass
+class BucketStats:
+    """Usage counters for one bucket."""
+
+    requests: int = 0
+    tokens_used: float = 0.0
+    waits: int = 0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    rate_limit_hits: int = 0
+
+    @property
+    def avg_wait_seconds(self) -> float:
+        return self.wait_seconds / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "tokens_used": round(self.tokens_used, 2),
+            "waits": self.waits,
+            "wait_seconds": round(self.wait_seconds, 4),
+            "avg_wait_seconds": round(self.avg_wait_seconds, 6),
+            "max_wait_seconds": round(self.max_wait_seconds, 4),
+            "rate_limit_hits": self.rate_limit_hits,
+        }
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    tokens: float = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+class TokenBucket:
+    """
+    Asyncio token bucket with priority lanes.
+
+    A heavy request at the head of a lane is not starved by lighter requests
+    behind it; a higher-priority request arriving later goes ahead of it.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum burst size (defaults to ``rate``).
+            clock: Monotonic time source in seconds.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        if self.capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._waiters: list[_Waiter] = []
+        self._seq = itertools.count()
+        self._pump: asyncio.Task | None = None
+        self.stats = BucketStats()
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    @property
+    def queued(self) -> int:
+        """Requests waiting for tokens."""
+        return sum(1 for w in self._waiters if not w.future.done())
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def _take(self, tokens: float) -> None:
+        self._tokens -= tokens
+        self.stats.requests += 1
+        self.stats.tokens_used += tokens
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take ``tokens`` without waiting; return False if not enough are available."""
+        self._refill()
+        if self._waiters or self._clock() < self._paused_until or self._tokens < tokens:
+            return False
+        self._take(tokens)
+        return True
+
+    async def acquire(self, tokens: float = 1.0, priority: int = Priority.MARKET_DATA) -> float:
+        """
+        Wait until ``tokens`` are available and take them.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens from a bucket of {self.capacity}")
+        if self.try_acquire(tokens):
+            return 0.0
+
+        start = self._clock()
+        waiter = _Waiter(
+            int(priority), next(self._seq), tokens, asyncio.get_running_loop().create_future()
+        )
+        heapq.heappush(self._waiters, waiter)
+        if self._pump is None or self._pump.done():
+            self._pump = asyncio.ensure_future(self._serve())
+        await waiter.future
+        waited = self._clock() - start
+        self.stats.waits += 1
+        self.stats.wait_seconds += waited
+        self.stats.max_wait_seconds = max(self.stats.max_wait_seconds, waited)
+        return waited
+
+    async def _serve(self) -> None:
+        """Hand out tokens to waiters in priority order as they refill."""
+        while self._waiters:
+            head = self._waiters[0]
+            if head.future.done():
+                heapq.heappop(self._waiters)
+                continue
+            self._refill()
+            now = self._clock()
+            if now < self._paused_until:
+                await asyncio.sleep(self._paused_until - now)
+                continue
+            # resize() may have shrunk the bucket below an already queued weight
+            need = min(head.tokens, self.capacity)
+            if self._tokens >= need:
+                heapq.heappop(self._waiters)
+                self._take(need)
+                head.future.set_result(None)
+                continue
+            await asyncio.sleep((need - self._tokens) / self.rate)
+
+    # =========================================================================
+    # Feedback from the exchange
+    # =========================================================================
+
+    def sync(self, remaining: float, reset_in: float | None = None) -> None:
+        """
+        Align with the exchange's own count of requests left in the window.
+
+        The bucket never holds more than ``remaining`` tokens; once the
+        exchange reports nothing left it pauses until the window resets.
+        """
+        self._refill()
+        self._tokens = min(self._tokens, max(float(remaining), 0.0))
+        if remaining <= 0 and reset_in is not None and reset_in > 0:
+            self.pause(reset_in)
+
+    def resize(self, limit: float) -> None:
+        """Adopt a per-second limit reported by the exchange."""
+        if limit > 0 and limit != self.capacity:
+            self._refill()
+            self.rate = self.capacity = float(limit)
+            self._tokens = min(self._tokens, self.capacity)
+
+    def pause(self, seconds: float) -> None:
+        """Drain the bucket and hand out nothing for ``seconds``."""
+        seconds = min(seconds, MAX_PAUSE_SECONDS)
+        self._refill()
+        self._tokens = 0.0
+        self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+
+@dataclass(frozen=True)
+class Route:
+    """Where an endpoint draws tokens from and which lane it queues in."""
+
+    bucket: str
+    weight: float = 1.0
+    priority: Priority = Priority.MARKET_DATA
+
+
+class RateLimiter:
+    """
+    Weighted token buckets for one exchange account.
+
+    Each request draws ``weight`` tokens from its route's bucket and from the
+    ``global`` bucket (when configured), which models the account-wide limit
+    and is where priority lanes matter most.
+    """
+
+    GLOBAL = "global"
+
+    def __init__(
+        self,
+        buckets: Mapping[str, tuple[float, float]],
+        routes: Mapping[str, Route] | None = None,
+        default_route: Route | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Args:
+            buckets: Bucket name -> (tokens per second, burst capacity).
+            routes: Endpoint or endpoint prefix -> Route; the longest
+                matching prefix wins.
+            default_route: Route for endpoints matching no prefix.
+            clock: Monotonic time source for the buckets.
+            wall_clock: Epoch time source for reset timestamps in headers.
+        """
+        self.buckets = {
+            name: TokenBucket(rate, capacity, clock=clock)
+            for name, (rate, capacity) in buckets.items()
+        }
+        self.routes = dict(routes or {})
+        self.default_route = default_route or Route(next(iter(self.buckets)))
+        self._wall_clock = wall_clock
+        self._prefixes = sorted(self.routes, key=len, reverse=True)
+        for route in [*self.routes.values(), self.default_route]:
+            if route.bucket not in self.buckets:
+                raise ValueError(f"Route refers to unknown bucket '{route.bucket}'")
+
+    def route(self, endpoint: str) -> Route:
+        """Resolve the route for ``endpoint``."""
+        for prefix in self._prefixes:
+            if endpoint.startswith(prefix):
+                return self.routes[prefix]
+        return self.default_route
+
+    async def acquire(
+        self,
+        endpoint: str,
+        weight: float | None = None,
+        priority: Priority | None = None,
+    ) -> float:
+        """
+        Wait for budget to call ``endpoint``.
+
+        Args:
+            endpoint: Endpoint path or client method name.
+            weight: Tokens to draw (defaults to the route's weight).
+            priority: Queue lane (defaults to the route's lane).
+
+        Returns:
+            Seconds spent waiting.
+        """
+        route = self.route(endpoint)
+        weight = route.weight if weight is None else weight
+        priority = route.priority if priority is None else priority
+
+        bucket = self.buckets[route.bucket]
+        waited = await bucket.acquire(min(weight, bucket.capacity), priority)
+        shared = self.buckets.get(self.GLOBAL)
+        if shared is not None and shared is not bucket:
+            waited += await shared.acquire(min(weight, shared.capacity), priority)
+        return waited
+
+    def update_from_headers(self, endpoint: str, headers: Mapping[str, Any] | None) -> None:
+        """
+        Tighten the endpoint's bucket from rate-limit response headers.
+
+        Understands Bybit's ``X-Bapi-Limit*`` headers and the common
+        ``X-RateLimit-*`` / ``Retry-After`` headers.
+        """
+        if not isinstance(headers, Mapping) or not headers:
+            return
+        lowered = {str(k).lower(): v for k, v in headers.items()}
+        bucket = self.buckets[self.route(endpoint).bucket]
+        try:
+            limit = lowered.get("x-bapi-limit")
+            if limit is not None:
+                bucket.resize(float(limit))
+
+            remaining = lowered.get("x-bapi-limit-status", lowered.get("x-ratelimit-remaining"))
+            if remaining is not None:
+                bucket.sync(float(remaining), self._reset_in(lowered))
+
+            retry_after = lowered.get("retry-after")
+            if retry_after is not None:
+                bucket.pause(float(retry_after))
+        except (TypeError, ValueError):
+            pass
+
+    def _reset_in(self, headers: Mapping[str, Any]) -> float | None:
+        """Seconds until the limit window resets, from whichever header is present."""
+        reset_ms = headers.get("x-bapi-limit-reset-timestamp")
+        if reset_ms is not None:
+            return float(reset_ms) / 1000 - self._wall_clock()
+        reset = headers.get("x-ratelimit-reset")
+        if reset is not None:
+            reset = float(reset)
+            # Epoch seconds or a delta, depending on the exchange
+            return reset - self._wall_clock() if reset > 1e9 else reset
+        return None
+
+    def on_rate_limited(self, endpoint: str, retry_after: float | None = None) -> None:
+        """Back off the endpoint's bucket after the exchange rejected a request."""
+        bucket = self.buckets[self.route(endpoint).bucket]
+        bucket.stats.rate_limit_hits += 1
+        bucket.pause(retry_after if retry_after is not None else bucket.capacity / bucket.rate)
+        logger.warning(
+            "rate_limit_hit",
+            endpoint=endpoint,
+            bucket=self.route(endpoint).bucket,
+            total_hits=bucket.stats.rate_limit_hits,
+        )
+
+    @property
+    def stats(self) -> dict[str, BucketStats]:
+        return {name: bucket.stats for name, bucket in self.buckets.items()}
+
+    def get_stats(self) -> dict[str, Any]:
+        """Per-bucket usage, queue depth and remaining tokens."""
+        return {
+            name: {
+                **bucket.stats.to_dict(),
+                "queued": bucket.queued,
+                "tokens": round(bucket.tokens, 2),
+                "capacity": bucket.capacity,
+            }
+            for name, bucket in self.buckets.items()
+        }
+
+
+# =============================================================================
+# Exchange profiles
+# =============================================================================
+
+# Bybit V5: 600 requests per 5s per IP; per-UID endpoint limits of 10-20/s
+BYBIT_BUCKETS: dict[str, tuple[float, float]] = {
+    RateLimiter.GLOBAL: (120.0, 600.0),
+    "order": (10.0, 10.0),
+    "account": (10.0, 10.0),
+    "market": (50.0, 50.0),
+}
+
+BYBIT_ROUTES: dict[str, Route] = {
+    "/v5/order/create-batch": Route("order", 1.0, Priority.ORDER),
+    "/v5/order/cancel-batch": Route("order", 1.0, Priority.ORDER),
+    "/v5/order/realtime": Route("account", 1.0, Priority.ACCOUNT),
+    "/v5/order/history": Route("account", 1.0, Priority.ACCOUNT),
+    "/v5/order/": Route("order", 1.0, Priority.ORDER),
+    "/v5/position/": Route("account", 1.0, Priority.ACCOUNT),
+    "/v5/account/": Route("account", 1.0, Priority.ACCOUNT),
+    "/v5/market/": Route("market", 1.0, Priority.MARKET_DATA),
+}
+
+# ccxt unified methods (ExchangeAPIClient); weights follow relative cost
+CCXT_BUCKETS: dict[str, tuple[float, float]] = {
+    RateLimiter.GLOBAL: (20.0, 40.0),
+    "order": (10.0, 10.0),
+    "account": (10.0, 10.0),
+    "market": (20.0, 20.0),
+}
+
+CCXT_ROUTES: dict[str, Route] = {
+    "create_orders": Route("order", 2.0, Priority.ORDER),
+    "cancel_orders": Route("order", 2.0, Priority.ORDER),
+    "cancel_all_orders": Route("order", 2.0, Priority.ORDER),
+    "create_": Route("order", 1.0, Priority.ORDER),
+    "cancel_": Route("order", 1.0, Priority.ORDER),
+    "set_leverage": Route("account", 1.0, Priority.ACCOUNT),
+    "fetch_balance": Route("account", 1.0, Priority.ACCOUNT),
+    "fetch_order": Route("account", 1.0, Priority.ACCOUNT),
+    "fetch_open_orders": Route("account", 1.0, Priority.ACCOUNT),
+    "fetch_closed_orders": Route("account", 2.0, Priority.ACCOUNT),
+    "fetch_tickers": Route("market", 5.0, Priority.MARKET_DATA),
+    "fetch_order_book": Route("market", 2.0, Priority.MARKET_DATA),
+    "fetch_": Route("market", 1.0, Priority.MARKET_DATA),
+}
+
+
+def bybit_rate_limiter() -> RateLimiter:
+    """Limiter shaped after Bybit V5's IP and per-endpoint limits."""
+    return RateLimiter(BYBIT_BUCKETS, BYBIT_ROUTES, Route("market"))
+
+
+def ccxt_rate_limiter() -> RateLimiter:
+    """Limiter for ExchangeAPIClient's ccxt method names."""
+    return RateLimiter(CCXT_BUCKETS, CCXT_ROUTES, Route("market"))
+
+
+class RateLimiterRegistry:
+    """
+    One RateLimiter per (exchange, route profile, API key), shared by every
+    client using that key with the same route table.
+
+    The profile is the factory's name: the ccxt client and the direct Bybit
+    client both run on "bybit" but route different endpoint names, so each
+    gets a limiter built from its own table.
+    """
+
+    def __init__(self) -> None:
+        self._limiters: dict[tuple[str, str, str], RateLimiter] = {}
+
+    @staticmethod
+    def _key(
+        exchange_id: str, api_key: str, factory: Callable[[], RateLimiter]
+    ) -> tuple[str, str, str]:
+        profile = getattr(factory, "__name__", type(factory).__name__)
+        # Keys are held as a digest so the registry never stores credentials
+        return exchange_id, profile, hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+    def get(
+        self,
+        exchange_id: str,
+        api_key: str,
+        factory: Callable[[], RateLimiter],
+    ) -> RateLimiter:
+        """Return the limiter for this key and profile, creating it with ``factory`` on first use."""
+        key = self._key(exchange_id, api_key, factory)
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limiter = self._limiters[key] = factory()
+        return limiter
+
+    def items(self) -> list[tuple[str, RateLimiter]]:
+        """(label, limiter) pairs; the label is ``exchange:profile:key-digest``."""
+        return [
+            (f"{ex}:{profile}:{digest[:8]}", lim)
+            for (ex, profile, digest), lim in self._limiters.items()
+        ]
+
+    def clear(self) -> None:
+        self._limiters.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        return {label: limiter.get_stats() for label, limiter in self.items()}
+
+
+rate_limiters = RateLimiterRegistry()
@@ -30,6 +30,10 @@ class ExchangeConfig(BaseModel):
     credentials_name: str = Field(..., description="Name of stored credentials to use")
     sandbox: bool = Field(default=False, description="Use testnet/sandbox mode")
     rate_limit: bool = Field(default=True, description="Enable rate limiting")
+    use_websocket: bool = Field(
+        default=False,
+        description="Push ticker and order updates over WebSocket (polling covers stream gaps)",
+    )
 
 
 class GridConfig(BaseModel):
@@ -257,6 +261,10 @@ class SMCConfigSchema(BaseModel):
         le=0.1,
         description="Liquidity: percentage range for grouping swing clusters",
     )
+    incremental_structure: bool = Field(
+        default=False,
+        description="Track swings/zones incrementally by bar timestamp (no FVG joining)",
+    )
 
     # Risk Management
     risk_per_trade: Decimal = Field(
@@ -380,6 +388,11 @@ class BotConfig(BaseModel):
         default=False,
         description="Close open positions when deactivating a strategy (False = hold positions)",
     )
+    state_encoding: str = Field(
+        default="json",
+        pattern="^(json|zlib)$",
+        description="Encoding of persisted state snapshots (zlib = compressed JSON)",
+    )
 
     @model_validator(mode="after")
     def validate_strategy_config(self) -> "BotConfig":
@@ -454,6 +467,20 @@ class ScannerConfig(BaseModel):
     min_liquidity_usdt: float = Field(
         default=50_000.0, ge=0, description="Minimum orderbook liquidity in USDT"
     )
+    mode: str = Field(
+        default="sequential",
+        pattern="^(sequential|bulk)$",
+        description="sequential: one pair at a time; bulk: bulk tickers + concurrent OHLCV",
+    )
+    max_concurrency: int = Field(
+        default=16, ge=1, le=256, description="OHLCV requests in flight in bulk mode"
+    )
+    ohlcv_requests_per_second: float = Field(
+        default=20.0, gt=0, description="Token-bucket refill rate for bulk-mode requests"
+    )
+    ohlcv_burst: int = Field(
+        default=20, ge=1, description="Token-bucket capacity for bulk-mode requests"
+    )
 
 
 class AutoTradeConfig(BaseModel):
@@ -483,6 +510,22 @@ class AppConfig(BaseModel):
     database_pool_size: int = Field(
         default=5, ge=1, le=50, description="Database connection pool size"
     )
+    database_write_behind: bool = Field(
+        default=False,
+        description="Batch order/trade/DCA history/log inserts through a write-behind buffer",
+    )
+    database_write_buffer_size: int = Field(
+        default=10_000, ge=1, description="Queued rows at which inserts start waiting"
+    )
+    database_flush_interval: float = Field(
+        default=0.25, gt=0, le=60, description="Seconds between write-behind flushes"
+    )
+    performance_sample_interval: float = Field(
+        default=60.0,
+        ge=1,
+        le=3600,
+        description="Seconds between per-bot equity/PnL samples for portfolio history",
+    )
 
     # Logging
     log_level: str = Field(
@@ -15,15 +15,19 @@ from bot.database.models import (
     ExchangeCredential,
     GridLevel,
     Order,
+    PerformanceSnapshot,
     Position,
     Signal,
     Strategy,
     StrategyTemplate,
     Trade,
 )
+from bot.database.write_buffer import WriteBuffer, WriteBufferStats
 
 __all__ = [
     "DatabaseManager",
+    "WriteBuffer",
+    "WriteBufferStats",
     "Base",
     # v1.0 models
     "Bot",
@@ -36,6 +40,8 @@ __all__ = [
     "BotLog",
     # State persistence
     "BotStateSnapshot",
+    # Monitoring
+    "PerformanceSnapshot",
     # v2.0 models
     "Strategy",
     "Position",
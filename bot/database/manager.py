@@ -5,9 +5,12 @@ Provides high-level interface for database operations.
 
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from typing import Any, TypeVar
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -26,10 +29,17 @@ from bot.database.models import (
     Trade,
 )
 from bot.database.models import BotStateSnapshot
+from bot.database.write_buffer import WriteBuffer
 from bot.utils.logger import LoggerMixin
 
 T = TypeVar("T", bound=Base)
 
+# Snapshot columns holding serialized engine state
+_STATE_COLUMNS = ("grid_state", "dca_state", "risk_state", "trend_state", "hybrid_state")
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE
+_UPSERT_DIALECTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
 
 class DatabaseManager(LoggerMixin):
     """
@@ -41,8 +51,11 @@ class DatabaseManager(LoggerMixin):
     - Context managers for sessions
     - High-level CRUD operations
     - Transaction support
+    - Optional write-behind buffer for orders, trades, DCA history and logs
     """
 
+    _write_buffer: WriteBuffer | None = None
+
     def __init__(
         self,
         database_url: str,
@@ -50,6 +63,9 @@ class DatabaseManager(LoggerMixin):
         max_overflow: int = 10,
         pool_pre_ping: bool = True,
         echo: bool = False,
+        write_behind: bool = False,
+        write_buffer_size: int = 10_000,
+        write_flush_interval: float = 0.25,
     ) -> None:
         """
         Initialize Database Manager.
@@ -60,6 +76,11 @@ class DatabaseManager(LoggerMixin):
             max_overflow: Maximum overflow connections beyond pool_size
             pool_pre_ping: Enable connection health checks
             echo: Whether to log all SQL statements
+            write_behind: Queue order/trade/DCA history/log inserts and write
+                them in batches (see ``WriteBuffer``); the returned objects get
+                their ``id`` once flushed
+            write_buffer_size: Queued rows at which inserts start waiting
+            write_flush_interval: Seconds between write-behind flushes
         """
         self.database_url = database_url
         self._engine: AsyncEngine | None = None
@@ -68,11 +89,15 @@ class DatabaseManager(LoggerMixin):
         self._max_overflow = max_overflow
         self._pool_pre_ping = pool_pre_ping
         self._echo = echo
+        self._write_behind = write_behind
+        self._write_buffer_size = write_buffer_size
+        self._write_flush_interval = write_flush_interval
 
         self.logger.info(
             "Initializing DatabaseManager",
             pool_size=pool_size,
             max_overflow=max_overflow,
+            write_behind=write_behind,
         )
 
     async def initialize(self) -> None:
@@ -94,6 +119,14 @@ class DatabaseManager(LoggerMixin):
                 expire_on_commit=False,
             )
 
+            if self._write_behind:
+                self._write_buffer = WriteBuffer(
+                    self._session_factory,
+                    max_pending=self._write_buffer_size,
+                    flush_interval=self._write_flush_interval,
+                )
+                await self._write_buffer.start()
+
             self.logger.info("Database engine initialized successfully")
 
         except Exception as e:
@@ -101,7 +134,10 @@ class DatabaseManager(LoggerMixin):
             raise
 
     async def close(self) -> None:
-        """Close database connections"""
+        """Flush queued writes and close database connections"""
+        if self._write_buffer:
+            await self._write_buffer.stop()
+            self._write_buffer = None
         if self._engine:
             await self._engine.dispose()
             self.logger.info("Database connections closed")
@@ -160,6 +196,29 @@ class DatabaseManager(LoggerMixin):
                 await session.rollback()
                 raise
 
+    @property
+    def write_buffer(self) -> WriteBuffer | None:
+        """The write-behind buffer, when enabled."""
+        return self._write_buffer
+
+    async def flush_writes(self) -> int:
+        """Write out queued inserts now. Returns the number of rows written."""
+        if self._write_buffer is None:
+            return 0
+        return await self._write_buffer.flush()
+
+    async def _sync_writes(self) -> None:
+        """Read-your-writes barrier: flush queued inserts before reading or updating."""
+        if self._write_buffer is not None and self._write_buffer.pending:
+            await self._write_buffer.flush()
+
+    async def _append(self, obj: T) -> T:
+        """Insert via the write-behind buffer when enabled, else immediately."""
+        if self._write_buffer is None:
+            return await self.create(obj)
+        await self._write_buffer.put(obj)
+        return obj
+
     # CRUD Operations - Generic
 
     async def create(self, obj: T) -> T:
@@ -172,12 +231,14 @@ class DatabaseManager(LoggerMixin):
 
     async def get(self, model: type[T], id: int) -> T | None:
         """Get object by ID"""
+        await self._sync_writes()
         async with self.session() as session:
             result = await session.execute(select(model).where(model.id == id))
             return result.scalar_one_or_none()
 
     async def update(self, obj: T) -> T:
         """Update an existing object"""
+        await self._sync_writes()
         async with self.session() as session:
             merged = await session.merge(obj)
             await session.flush()
@@ -186,6 +247,7 @@ class DatabaseManager(LoggerMixin):
 
     async def delete(self, obj: T) -> None:
         """Delete an object"""
+        await self._sync_writes()
         async with self.session() as session:
             await session.delete(obj)
 
@@ -254,7 +316,7 @@ class DatabaseManager(LoggerMixin):
             side=order.side,
             amount=order.amount,
         )
-        return await self.create(order)
+        return await self._append(order)
 
     async def get_order(self, order_id: int) -> Order | None:
         """Get order by ID"""
@@ -262,6 +324,7 @@ class DatabaseManager(LoggerMixin):
 
     async def get_order_by_exchange_id(self, exchange_order_id: str) -> Order | None:
         """Get order by exchange order ID"""
+        await self._sync_writes()
         async with self.session() as session:
             result = await session.execute(
                 select(Order).where(Order.exchange_order_id == exchange_order_id)
@@ -270,6 +333,7 @@ class DatabaseManager(LoggerMixin):
 
     async def get_bot_orders(self, bot_id: int, status: str | None = None) -> list[Order]:
         """Get all orders for a bot, optionally filtered by status"""
+        await self._sync_writes()
         async with self.session() as session:
             query = select(Order).where(Order.bot_id == bot_id)
             if status:
@@ -292,7 +356,7 @@ class DatabaseManager(LoggerMixin):
             side=trade.side,
             amount=trade.amount,
         )
-        return await self.create(trade)
+        return await self._append(trade)
 
     async def get_bot_trades(
         self,
@@ -300,6 +364,7 @@ class DatabaseManager(LoggerMixin):
         limit: int | None = None,
     ) -> list[Trade]:
         """Get trades for a bot, optionally limited"""
+        await self._sync_writes()
         async with self.session() as session:
             query = select(Trade).where(Trade.bot_id == bot_id).order_by(Trade.executed_at.desc())
             if limit:
@@ -337,7 +402,7 @@ class DatabaseManager(LoggerMixin):
             step=dca_history.dca_step,
             price=dca_history.buy_price,
         )
-        return await self.create(dca_history)
+        return await self._append(dca_history)
 
     async def get_bot_dca_history(
         self,
@@ -345,6 +410,7 @@ class DatabaseManager(LoggerMixin):
         limit: int | None = None,
     ) -> list[DCAHistory]:
         """Get DCA history for a bot"""
+        await self._sync_writes()
         async with self.session() as session:
             query = (
                 select(DCAHistory)
@@ -360,7 +426,7 @@ class DatabaseManager(LoggerMixin):
 
     async def create_log(self, log: BotLog) -> BotLog:
         """Create a bot log entry"""
-        return await self.create(log)
+        return await self._append(log)
 
     async def get_bot_logs(
         self,
@@ -369,6 +435,7 @@ class DatabaseManager(LoggerMixin):
         limit: int | None = 100,
     ) -> list[BotLog]:
         """Get logs for a bot"""
+        await self._sync_writes()
         async with self.session() as session:
             query = select(BotLog).where(BotLog.bot_id == bot_id)
             if level:
@@ -381,29 +448,59 @@ class DatabaseManager(LoggerMixin):
 
     # State Snapshot Operations
 
-    async def save_state_snapshot(self, snapshot: BotStateSnapshot) -> BotStateSnapshot:
-        """Upsert a bot state snapshot (insert or update by bot_name)."""
+    async def save_state_snapshot(
+        self,
+        snapshot: BotStateSnapshot,
+        sections: list[str] | None = None,
+    ) -> BotStateSnapshot:
+        """
+        Upsert a bot state snapshot (insert or update by bot_name).
+
+        Args:
+            snapshot: Snapshot to save.
+            sections: State columns to write (e.g. ``["grid_state"]``); the
+                others keep their stored value. All sections when None.
+
+        On PostgreSQL and SQLite this is a single ``INSERT ... ON CONFLICT
+        DO UPDATE ... RETURNING`` statement.
+        """
+        if sections is None:
+            sections = list(_STATE_COLUMNS)
+        values: dict[str, Any] = {
+            "bot_name": snapshot.bot_name,
+            "bot_state": snapshot.bot_state,
+            "saved_at": snapshot.saved_at or datetime.now(timezone.utc),
+        }
+        values.update({name: getattr(snapshot, name) for name in sections})
+
+        dialect = self._engine.dialect.name if self._engine else ""
+        if dialect not in _UPSERT_DIALECTS:
+            return await self._save_state_snapshot_select(values)
+
+        stmt = _UPSERT_DIALECTS[dialect](BotStateSnapshot).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[BotStateSnapshot.bot_name],
+            set_={name: stmt.excluded[name] for name in values if name != "bot_name"},
+        ).returning(BotStateSnapshot)
+        async with self.session() as session:
+            result = await session.scalars(stmt, execution_options={"populate_existing": True})
+            return result.one()
+
+    async def _save_state_snapshot_select(self, values: dict[str, Any]) -> BotStateSnapshot:
+        """Select-then-write upsert for dialects without ON CONFLICT."""
         async with self.session() as session:
             result = await session.execute(
-                select(BotStateSnapshot).where(BotStateSnapshot.bot_name == snapshot.bot_name)
+                select(BotStateSnapshot).where(BotStateSnapshot.bot_name == values["bot_name"])
             )
             existing = result.scalar_one_or_none()
-            if existing:
-                existing.bot_state = snapshot.bot_state
-                existing.grid_state = snapshot.grid_state
-                existing.dca_state = snapshot.dca_state
-                existing.risk_state = snapshot.risk_state
-                existing.trend_state = snapshot.trend_state
-                existing.hybrid_state = snapshot.hybrid_state
-                existing.saved_at = snapshot.saved_at
-                await session.flush()
-                await session.refresh(existing)
-                return existing
+            if existing is None:
+                existing = BotStateSnapshot(**values)
+                session.add(existing)
             else:
-                session.add(snapshot)
-                await session.flush()
-                await session.refresh(snapshot)
-                return snapshot
+                for name, value in values.items():
+                    setattr(existing, name, value)
+            await session.flush()
+            return existing
 
     async def load_state_snapshot(self, bot_name: str) -> BotStateSnapshot | None:
         """Load a bot state snapshot by bot_name."""
@@ -5,6 +5,7 @@ All models in a single file:
 - v1.0: ExchangeCredential, Bot, Order, Trade, GridLevel, DCAHistory, StrategyTemplate, BotLog
 - v2.0: Strategy, Position, Signal, DCADeal, DCAOrder, DCASignal
 - State: BotStateSnapshot
+- Monitoring: PerformanceSnapshot
 """
 
 from datetime import datetime, timezone
@@ -22,6 +23,7 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    UniqueConstraint,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -374,6 +376,47 @@ class BotStateSnapshot(Base):
         return f"<BotStateSnapshot(bot_name={self.bot_name}, saved_at={self.saved_at})>"
 
 
+# =============================================================================
+# Performance time series (portfolio history / drawdown)
+# =============================================================================
+
+
+class PerformanceSnapshot(Base):
+    """Per-bot equity/PnL/exposure rolled up into 1m, 1h and 1d buckets."""
+
+    __tablename__ = "performance_snapshots"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    bot_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    resolution: Mapped[str] = mapped_column(String(3), nullable=False)  # 1m, 1h, 1d
+    bucket: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    # Equity close/high/low within the bucket; PnL and exposure at close
+    equity: Mapped[Decimal] = mapped_column(DECIMAL(20, 8), nullable=False)
+    equity_high: Mapped[Decimal] = mapped_column(DECIMAL(20, 8), nullable=False)
+    equity_low: Mapped[Decimal] = mapped_column(DECIMAL(20, 8), nullable=False)
+    realized_pnl: Mapped[Decimal] = mapped_column(DECIMAL(20, 8), nullable=False, default=0)
+    unrealized_pnl: Mapped[Decimal] = mapped_column(DECIMAL(20, 8), nullable=False, default=0)
+    exposure: Mapped[Decimal] = mapped_column(DECIMAL(20, 8), nullable=False, default=0)
+    samples: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        UniqueConstraint("bot_name", "resolution", "bucket", name="uq_perf_bot_res_bucket"),
+        Index("idx_perf_resolution_bucket", "resolution", "bucket"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<PerformanceSnapshot(bot_name={self.bot_name}, resolution={self.resolution}, "
+            f"bucket={self.bucket}, equity={self.equity})>"
+        )
+
+
 # =============================================================================
 # v2.0 Enums
 # =============================================================================
@@ -0,0 +1,332 @@
+"""
+WriteBuffer — asynchronous write-behind for append-only tables.
+
+Orders, trades, DCA history and bot logs are insert-heavy: committing each
+row in its own session costs one database round trip per event on the
+trading loop. The buffer queues new ORM objects in memory and a background
+task flushes them per table as one multi-row ``INSERT ... RETURNING``
+(``insertmanyvalues`` batches for asyncpg and aiosqlite), then writes the
+generated primary keys back onto the queued objects.
+
+Guarantees:
+- Bounded: ``put`` waits while ``max_pending`` rows are queued (backpressure)
+- Ordered: tables flush in foreign-key order, rows in submission order
+- No loss: a failed flush keeps its rows queued for the next attempt, and
+  ``stop`` drains everything (raising if the final flush fails)
+
+Usage:
+    buffer = WriteBuffer(session_factory, max_pending=10_000, flush_interval=0.25)
+    await buffer.start()
+    await buffer.put(order)        # returns once queued; order.id set after flush
+    await buffer.flush()           # read-your-writes barrier
+    await buffer.stop()            # drains the queue
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import Table, insert
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Mapper
+
+from bot.database.models import Base
+from bot.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class WriteBufferStats:
+    """Queue, throughput and latency counters of a WriteBuffer."""
+
+    pending: int = 0
+    max_pending: int = 0
+    rows_written: int = 0
+    flushes: int = 0
+    flush_errors: int = 0
+    backpressure_waits: int = 0
+    backpressure_seconds: float = 0.0
+    last_flush_rows: int = 0
+    last_flush_seconds: float = 0.0
+    max_flush_seconds: float = 0.0
+    total_flush_seconds: float = 0.0
+    # Age of the oldest row at its commit in the last flush (queue + flush time)
+    last_commit_lag_seconds: float = 0.0
+
+    @property
+    def avg_flush_seconds(self) -> float:
+        return self.total_flush_seconds / self.flushes if self.flushes else 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Insert throughput while flushing (excludes idle time between flushes)."""
+        if not self.total_flush_seconds:
+            return 0.0
+        return self.rows_written / self.total_flush_seconds
+
+
+@dataclass
+class _TableSpec:
+    """Column layout of one mapped model, resolved once per class."""
+
+    table: Table
+    attrs: list[str]
+    pk_attr: str
+    defaults: dict[str, Any] = field(default_factory=dict)
+
+
+class WriteBuffer:
+    """
+    Write-behind queue that batches ORM inserts per table.
+
+    Only plain inserts of new rows go through the buffer; updates and reads
+    use regular sessions. Call ``flush()`` before reading back rows that may
+    still be queued, or before using a queued object's ``id``.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        max_pending: int = 10_000,
+        batch_size: int = 1_000,
+        flush_interval: float = 0.25,
+    ) -> None:
+        """
+        Args:
+            session_factory: Session factory of the target database.
+            max_pending: Queued rows at which ``put`` starts waiting.
+            batch_size: Queued rows that trigger a flush before the interval ends.
+            flush_interval: Seconds between background flushes.
+        """
+        if max_pending < 1 or batch_size < 1:
+            raise ValueError("max_pending and batch_size must be positive")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+        self._session_factory = session_factory
+        self._max_pending = max_pending
+        self._batch_size = min(batch_size, max_pending)
+        self._flush_interval = flush_interval
+
+        # model class -> deque of (object, enqueue time); dicts keep first-seen order
+        self._queues: dict[type, deque[tuple[Any, float]]] = {}
+        self._specs: dict[type, _TableSpec] = {}
+        self._pending = 0
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+        self._task: asyncio.Task | None = None
+        self._running = False
+        self._stats = WriteBufferStats(max_pending=max_pending)
+
+    @property
+    def stats(self) -> WriteBufferStats:
+        self._stats.pending = self._pending
+        return self._stats
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    async def start(self) -> None:
+        """Start the periodic flush task."""
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._flush_loop())
+        logger.info(
+            "write_buffer_started",
+            max_pending=self._max_pending,
+            batch_size=self._batch_size,
+            flush_interval=self._flush_interval,
+        )
+
+    async def stop(self) -> None:
+        """Stop the flush task and write out every queued row."""
+        self._running = False
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        await self.flush()
+        logger.info(
+            "write_buffer_stopped",
+            rows_written=self._stats.rows_written,
+            flushes=self._stats.flushes,
+        )
+
+    # =========================================================================
+    # Queueing
+    # =========================================================================
+
+    async def put(self, obj: Base) -> None:
+        """
+        Queue a new ORM object for insertion.
+
+        Column defaults are applied now, so timestamps reflect submission
+        rather than flush time. Waits while the buffer is full.
+        """
+        if self._pending >= self._max_pending:
+            self._stats.backpressure_waits += 1
+            start = time.perf_counter()
+            if not self._running:
+                await self.flush()
+            while self._pending >= self._max_pending:
+                self._space.clear()
+                self._wakeup.set()
+                await self._space.wait()
+            self._stats.backpressure_seconds += time.perf_counter() - start
+
+        model = type(obj)
+        spec = self._spec(model)
+        for attr, default in spec.defaults.items():
+            if getattr(obj, attr) is None:
+                setattr(obj, attr, default() if callable(default) else default)
+        self._queues.setdefault(model, deque()).append((obj, time.perf_counter()))
+        self._pending += 1
+        if self._pending >= self._batch_size:
+            self._wakeup.set()
+
+    async def flush(self) -> int:
+        """
+        Insert every queued row now.
+
+        Returns:
+            Number of rows written.
+
+        Raises:
+            Exception: The database error of a failed flush; its rows stay queued.
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            batches = self._take_all()
+            start = time.perf_counter()
+            try:
+                written = await self._write(batches)
+            except Exception as e:
+                self._requeue(batches)
+                self._stats.flush_errors += 1
+                logger.error("write_buffer_flush_failed", rows=self._pending, error=str(e))
+                raise
+            finally:
+                if self._pending < self._max_pending:
+                    self._space.set()
+
+            done = time.perf_counter()
+            elapsed = done - start
+            oldest = min(q[0][1] for q in batches.values())
+            stats = self._stats
+            stats.rows_written += written
+            stats.flushes += 1
+            stats.last_flush_rows = written
+            stats.last_flush_seconds = elapsed
+            stats.max_flush_seconds = max(stats.max_flush_seconds, elapsed)
+            stats.total_flush_seconds += elapsed
+            stats.last_commit_lag_seconds = done - oldest
+            return written
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    async def _flush_loop(self) -> None:
+        """Flush every ``flush_interval`` seconds, or as soon as a batch fills."""
+        while self._running:
+            try:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self._flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                await self.flush()
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                # Rows stay queued; retry after the interval
+                await asyncio.sleep(self._flush_interval)
+
+    def _take_all(self) -> dict[type, deque[tuple[Any, float]]]:
+        batches = {m: q for m, q in self._queues.items() if q}
+        self._queues = {}
+        self._pending = 0
+        return batches
+
+    def _requeue(self, batches: dict[type, deque[tuple[Any, float]]]) -> None:
+        """Put a failed flush back in front of rows queued since it started."""
+        for model, queue in self._queues.items():
+            batches.setdefault(model, deque()).extend(queue)
+        self._queues = batches
+        self._pending = sum(len(q) for q in batches.values())
+
+    async def _write(self, batches: dict[type, deque[tuple[Any, float]]]) -> int:
+        """One transaction, one multi-row INSERT ... RETURNING per table."""
+        order = {table: i for i, table in enumerate(Base.metadata.sorted_tables)}
+        models = sorted(batches, key=lambda m: order.get(self._specs[m].table, len(order)))
+        assigned: list[tuple[Any, str, Any]] = []
+        written = 0
+        async with self._session_factory() as session:
+            try:
+                for model in models:
+                    spec = self._specs[model]
+                    objs = [obj for obj, _ in batches[model]]
+                    rows = [{a: getattr(obj, a) for a in spec.attrs} for obj in objs]
+                    pk = spec.table.c[spec.pk_attr]
+                    result = await session.execute(
+                        insert(spec.table).returning(pk, sort_by_parameter_order=True), rows
+                    )
+                    for obj, key in zip(objs, result.scalars().all(), strict=True):
+                        assigned.append((obj, spec.pk_attr, key))
+                    written += len(rows)
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+        # Only expose keys once they are committed
+        for obj, attr, key in assigned:
+            setattr(obj, attr, key)
+        return written
+
+    def _spec(self, model: type) -> _TableSpec:
+        spec = self._specs.get(model)
+        if spec is not None:
+            return spec
+        mapper: Mapper[Any] = sa_inspect(model)
+        table = mapper.local_table
+        if not isinstance(table, Table):
+            raise ValueError(f"{model.__name__} is not mapped to a table")
+        pk = mapper.primary_key
+        if len(pk) != 1:
+            raise ValueError(f"{model.__name__} needs a single-column primary key")
+        attrs: list[str] = []
+        defaults: dict[str, Any] = {}
+        pk_attr = ""
+        for prop in mapper.column_attrs:
+            column = prop.columns[0]
+            if column is pk[0]:
+                pk_attr = prop.key
+                continue
+            attrs.append(prop.key)
+            default = column.default
+            if default is not None and (default.is_scalar or default.is_callable):
+                # SQLAlchemy wraps zero-argument callables to take an execution context
+                arg = default.arg
+                defaults[prop.key] = (lambda f=arg: f(None)) if default.is_callable else arg
+        spec = _TableSpec(table=table, attrs=attrs, pk_attr=pk_attr, defaults=defaults)
+        self._specs[model] = spec
+        return spec
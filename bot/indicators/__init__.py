@@ -0,0 +1,29 @@
+"""Incremental technical indicators shared by detectors, analyzers and adapters."""
+
+from bot.indicators.streaming import (
+    IndicatorSnapshot,
+    IndicatorStream,
+    RollingPercentile,
+    RollingWindow,
+    StreamingADX,
+    StreamingATR,
+    StreamingBollinger,
+    StreamingEMA,
+    StreamingRSI,
+    StreamingVolumeRatio,
+    true_range,
+)
+
+__all__ = [
+    "IndicatorSnapshot",
+    "IndicatorStream",
+    "RollingPercentile",
+    "RollingWindow",
+    "StreamingADX",
+    "StreamingATR",
+    "StreamingBollinger",
+    "StreamingEMA",
+    "StreamingRSI",
+    "StreamingVolumeRatio",
+    "true_range",
+]
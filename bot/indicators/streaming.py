@@ -0,0 +1,540 @@
+"""
+Streaming technical indicators — O(1) state updates per bar.
+
+Each indicator keeps only the state it needs (previous value, running sums
+over a fixed window) so feeding a new bar does not re-scan history. The
+update rules mirror the pandas formulas used by MarketRegimeDetector and
+MarketAnalyzer:
+
+- EMA:            ``close.ewm(span=period, adjust=False).mean()``
+- Wilder smoother: ``series.ewm(alpha=1/period, adjust=False).mean()``
+- Rolling mean:   ``series.rolling(window=period).mean()``
+- Rolling std:    ``series.rolling(window=period).std()`` (ddof=1)
+
+so a stream fed bar-by-bar from the first row of a DataFrame produces the
+same last value as the pandas expression evaluated on that DataFrame.
+
+Usage:
+    stream = IndicatorStream()
+    stream.seed(df)                       # warm up from history
+    stream.update(o, h, l, c, v, ts)      # then one call per closed bar
+    snap = stream.snapshot()
+    snap.adx, snap.atr, snap.bb_width_pct
+"""
+
+from __future__ import annotations
+
+import copy
+import math
+from bisect import bisect_right, insort
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+import pandas as pd
+
+NAN = float("nan")
+
+# One OHLCV row: open, high, low, close, volume
+Bar = tuple[float, float, float, float, float]
+
+
+class StreamingEMA:
+    """Exponential moving average with ``adjust=False`` recursion."""
+
+    def __init__(self, period: int | None = None, alpha: float | None = None) -> None:
+        if alpha is None:
+            if period is None or period < 1:
+                raise ValueError("StreamingEMA requires period >= 1 or alpha")
+            alpha = 2.0 / (period + 1.0)
+        self.alpha = alpha
+        self.value = NAN
+        self.count = 0
+
+    def update(self, x: float) -> float:
+        if self.count == 0:
+            self.value = x
+        else:
+            self.value += self.alpha * (x - self.value)
+        self.count += 1
+        return self.value
+
+
+class RollingWindow:
+    """
+    Fixed-size rolling mean/std with running sums.
+
+    Sums are kept relative to a shift anchor and rebuilt from the window
+    once per ``period`` updates, which keeps the cost amortized O(1) while
+    bounding floating-point drift on long streams.
+    """
+
+    def __init__(self, period: int) -> None:
+        if period < 1:
+            raise ValueError("RollingWindow period must be >= 1")
+        self.period = period
+        self._values: deque[float] = deque(maxlen=period)
+        self._shift = 0.0
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._since_rebuild = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def full(self) -> bool:
+        return len(self._values) == self.period
+
+    def update(self, x: float) -> None:
+        if len(self._values) == self.period:
+            old = self._values[0] - self._shift
+            self._sum -= old
+            self._sumsq -= old * old
+        self._values.append(x)
+        d = x - self._shift
+        self._sum += d
+        self._sumsq += d * d
+        self._since_rebuild += 1
+        if self._since_rebuild >= self.period:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._shift = self._values[-1]
+        self._sum = 0.0
+        self._sumsq = 0.0
+        for v in self._values:
+            d = v - self._shift
+            self._sum += d
+            self._sumsq += d * d
+        self._since_rebuild = 0
+
+    @property
+    def mean(self) -> float:
+        if not self.full:
+            return NAN
+        return self._shift + self._sum / self.period
+
+    @property
+    def std(self) -> float:
+        if not self.full or self.period < 2:
+            return NAN
+        var = (self._sumsq - self._sum * self._sum / self.period) / (self.period - 1)
+        return math.sqrt(var) if var > 0 else 0.0
+
+
+class StreamingATR:
+    """
+    Average True Range.
+
+    ``smoothing="sma"`` matches ``true_range.rolling(period).mean()`` (used by
+    MarketRegimeDetector and MarketAnalyzer); ``smoothing="wilder"`` matches
+    ``true_range.ewm(alpha=1/period, adjust=False).mean()``.
+    """
+
+    def __init__(self, period: int = 14, smoothing: str = "sma") -> None:
+        if smoothing not in ("sma", "wilder"):
+            raise ValueError(f"Unknown ATR smoothing: {smoothing}")
+        self.period = period
+        self.smoothing = smoothing
+        self._prev_close: float | None = None
+        self._window = RollingWindow(period) if smoothing == "sma" else None
+        self._wilder = StreamingEMA(alpha=1.0 / period) if smoothing == "wilder" else None
+        self.true_range = NAN
+
+    def update(self, high: float, low: float, close: float) -> float:
+        self.true_range = true_range(high, low, self._prev_close)
+        self._prev_close = close
+        if self._window is not None:
+            self._window.update(self.true_range)
+        elif self._wilder is not None:
+            self._wilder.update(self.true_range)
+        return self.value
+
+    @property
+    def value(self) -> float:
+        if self._window is not None:
+            return self._window.mean
+        if self._wilder is not None:
+            return self._wilder.value
+        return NAN
+
+
+class StreamingRSI:
+    """
+    Relative Strength Index over rolling-mean gains and losses.
+
+    Matches the simple-average RSI used in this codebase: the first bar
+    contributes a zero gain and zero loss, and the value is defined once
+    ``period`` bars have been seen.
+    """
+
+    def __init__(self, period: int = 14) -> None:
+        self.period = period
+        self._prev_close: float | None = None
+        self._gains = RollingWindow(period)
+        self._losses = RollingWindow(period)
+
+    def update(self, close: float) -> float:
+        delta = 0.0 if self._prev_close is None else close - self._prev_close
+        self._prev_close = close
+        self._gains.update(delta if delta > 0 else 0.0)
+        self._losses.update(-delta if delta < 0 else 0.0)
+        return self.value
+
+    @property
+    def avg_gain(self) -> float:
+        return self._gains.mean
+
+    @property
+    def avg_loss(self) -> float:
+        return self._losses.mean
+
+    @property
+    def value(self) -> float:
+        gain, loss = self.avg_gain, self.avg_loss
+        if math.isnan(gain) or math.isnan(loss):
+            return NAN
+        if loss == 0:
+            return 100.0 if gain > 0 else NAN
+        return 100.0 - 100.0 / (1.0 + gain / loss)
+
+
+class StreamingADX:
+    """Average Directional Index with Wilder smoothing (+DI, -DI, ADX)."""
+
+    def __init__(self, period: int = 14) -> None:
+        self.period = period
+        alpha = 1.0 / period
+        self._tr = StreamingEMA(alpha=alpha)
+        self._plus_dm = StreamingEMA(alpha=alpha)
+        self._minus_dm = StreamingEMA(alpha=alpha)
+        self._adx = StreamingEMA(alpha=alpha)
+        self._prev_high: float | None = None
+        self._prev_low: float | None = None
+        self._prev_close: float | None = None
+        self.plus_di = NAN
+        self.minus_di = NAN
+
+    def update(self, high: float, low: float, close: float) -> float:
+        plus_dm = minus_dm = 0.0
+        if self._prev_high is not None and self._prev_low is not None:
+            up = high - self._prev_high
+            down = self._prev_low - low
+            if up > down and up > 0:
+                plus_dm = up
+            if down > up and down > 0:
+                minus_dm = down
+        tr = true_range(high, low, self._prev_close)
+        self._prev_high, self._prev_low, self._prev_close = high, low, close
+
+        atr = self._tr.update(tr)
+        plus = self._plus_dm.update(plus_dm)
+        minus = self._minus_dm.update(minus_dm)
+        self.plus_di = 100.0 * plus / atr if atr != 0 else 0.0
+        self.minus_di = 100.0 * minus / atr if atr != 0 else 0.0
+        di_sum = self.plus_di + self.minus_di
+        dx = 100.0 * abs(self.plus_di - self.minus_di) / di_sum if di_sum != 0 else 0.0
+        return self._adx.update(dx)
+
+    @property
+    def value(self) -> float:
+        return self._adx.value
+
+
+class StreamingBollinger:
+    """Bollinger Bands (rolling mean ± k·std) and width as % of the middle band."""
+
+    def __init__(self, period: int = 20, std_dev: float = 2.0) -> None:
+        self.period = period
+        self.std_dev = std_dev
+        self._window = RollingWindow(period)
+
+    def update(self, close: float) -> None:
+        self._window.update(close)
+
+    @property
+    def middle(self) -> float:
+        return self._window.mean
+
+    @property
+    def upper(self) -> float:
+        return self.middle + self._window.std * self.std_dev
+
+    @property
+    def lower(self) -> float:
+        return self.middle - self._window.std * self.std_dev
+
+    @property
+    def width_pct(self) -> float:
+        middle = self.middle
+        if math.isnan(middle):
+            return NAN
+        if middle == 0:
+            return 0.0
+        return (self.upper - self.lower) / middle * 100.0
+
+
+class StreamingVolumeRatio:
+    """Current volume divided by its rolling average."""
+
+    def __init__(self, lookback: int = 20) -> None:
+        self.lookback = lookback
+        self._window = RollingWindow(lookback)
+        self._last = NAN
+
+    def update(self, volume: float) -> None:
+        self._last = volume
+        self._window.update(volume)
+
+    @property
+    def average(self) -> float:
+        return self._window.mean
+
+    @property
+    def value(self) -> float:
+        avg = self.average
+        if math.isnan(avg):
+            return NAN
+        if avg == 0:
+            return 0.0
+        return self._last / avg
+
+
+class RollingPercentile:
+    """Percentile rank of the latest value within a bounded sorted window."""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._order: deque[float] = deque()
+        self._sorted: list[float] = []
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def update(self, x: float) -> None:
+        if math.isnan(x):
+            return
+        if len(self._order) == self.size:
+            old = self._order.popleft()
+            del self._sorted[bisect_right(self._sorted, old) - 1]
+        self._order.append(x)
+        insort(self._sorted, x)
+
+    def rank_pct(self, x: float) -> float:
+        """Percentage of window values <= x."""
+        if not self._sorted:
+            return NAN
+        return bisect_right(self._sorted, x) / len(self._sorted) * 100.0
+
+
+def true_range(high: float, low: float, prev_close: float | None) -> float:
+    """True range; the first bar (no previous close) is ``high - low``."""
+    if prev_close is None:
+        return high - low
+    return max(high - low, abs(high - prev_close), abs(low - prev_close))
+
+
+@dataclass(frozen=True)
+class IndicatorSnapshot:
+    """Point-in-time indicator values produced by IndicatorStream."""
+
+    timestamp: Any
+    bars: int
+    close: float
+    ema_fast: float
+    ema_slow: float
+    atr: float
+    atr_percentile: float
+    rsi: float
+    rsi_avg_gain: float
+    rsi_avg_loss: float
+    adx: float
+    plus_di: float
+    minus_di: float
+    bb_upper: float
+    bb_middle: float
+    bb_lower: float
+    bb_width_pct: float
+    avg_volume: float
+    volume_ratio: float
+
+
+class IndicatorStream:
+    """
+    Bundle of streaming indicators fed one OHLCV bar at a time.
+
+    The default periods match MarketRegimeDetector. ``atr_percentile_window``
+    bounds how many recent ATR values are ranked for ``atr_percentile``.
+    """
+
+    def __init__(
+        self,
+        ema_fast: int = 20,
+        ema_slow: int = 50,
+        atr_period: int = 14,
+        rsi_period: int = 14,
+        adx_period: int = 14,
+        bb_period: int = 20,
+        bb_std_dev: float = 2.0,
+        volume_lookback: int = 20,
+        atr_percentile_window: int = 200,
+    ) -> None:
+        self.params: dict[str, Any] = {
+            "ema_fast": ema_fast,
+            "ema_slow": ema_slow,
+            "atr_period": atr_period,
+            "rsi_period": rsi_period,
+            "adx_period": adx_period,
+            "bb_period": bb_period,
+            "bb_std_dev": bb_std_dev,
+            "volume_lookback": volume_lookback,
+            "atr_percentile_window": atr_percentile_window,
+        }
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all state."""
+        p = self.params
+        self._ema_fast = StreamingEMA(p["ema_fast"])
+        self._ema_slow = StreamingEMA(p["ema_slow"])
+        self._atr = StreamingATR(p["atr_period"], smoothing="sma")
+        self._atr_rank = RollingPercentile(p["atr_percentile_window"])
+        self._rsi = StreamingRSI(p["rsi_period"])
+        self._adx = StreamingADX(p["adx_period"])
+        self._bb = StreamingBollinger(p["bb_period"], p["bb_std_dev"])
+        self._volume = StreamingVolumeRatio(p["volume_lookback"])
+        self.bars = 0
+        self.last_timestamp: Any = None
+        self._close = NAN
+        # State before the last bar fed by seed/sync, and that bar's OHLCV:
+        # a live window's last bar is still forming and may be revised
+        self._provisional: tuple[IndicatorStream, Bar] | None = None
+
+    def update(
+        self,
+        open_: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+        timestamp: Any = None,
+    ) -> None:
+        """Feed one closed bar."""
+        self._provisional = None
+        self._ema_fast.update(close)
+        self._ema_slow.update(close)
+        atr = self._atr.update(high, low, close)
+        self._atr_rank.update(atr)
+        self._rsi.update(close)
+        self._adx.update(high, low, close)
+        self._bb.update(close)
+        self._volume.update(volume)
+        self._close = close
+        self.bars += 1
+        self.last_timestamp = timestamp
+
+    def seed(self, df: pd.DataFrame) -> None:
+        """Reset and warm up from every row of an OHLCV DataFrame."""
+        self.reset()
+        self._feed(df, _frame_timestamps(df))
+
+    def sync(self, df: pd.DataFrame) -> int:
+        """
+        Bring the stream up to date with a rolling OHLCV window.
+
+        Only rows newer than ``last_timestamp`` are fed. The last bar fed
+        by ``seed``/``sync`` stays provisional: if the window still holds it
+        with different OHLCV values (a still-forming candle), it is rolled
+        back and re-fed. If the window does not overlap the stream (a gap,
+        or data from a different series), or the frame carries no
+        timestamps, the stream is re-seeded from the whole window instead.
+
+        Returns:
+            Number of bars fed, including a re-fed provisional bar.
+        """
+        timestamps = _frame_timestamps(df)
+        if (
+            timestamps is None
+            or self.last_timestamp is None
+            or len(df) == 0
+            or timestamps[0] > self.last_timestamp
+            or timestamps[-1] < self.last_timestamp
+        ):
+            self.seed(df)
+            return len(df)
+        start = int(timestamps.searchsorted(self.last_timestamp, side="right"))
+        if self._provisional is not None and timestamps[start - 1] == self.last_timestamp:
+            state, bar = self._provisional
+            if _frame_bars(df.iloc[start - 1 : start])[0] != bar:
+                self.__dict__.update(state.__dict__)
+                start -= 1
+        return self._feed(df.iloc[start:], timestamps[start:])
+
+    def peek(
+        self, open_: float, high: float, low: float, close: float, volume: float
+    ) -> IndicatorSnapshot:
+        """Snapshot as if a (still forming) bar were appended, without committing it."""
+        trial = copy.deepcopy(self)
+        trial.update(open_, high, low, close, volume)
+        return trial.snapshot()
+
+    def snapshot(self) -> IndicatorSnapshot:
+        """Current indicator values."""
+        atr = self._atr.value
+        return IndicatorSnapshot(
+            timestamp=self.last_timestamp,
+            bars=self.bars,
+            close=self._close,
+            ema_fast=self._ema_fast.value,
+            ema_slow=self._ema_slow.value,
+            atr=atr,
+            atr_percentile=self._atr_rank.rank_pct(atr) if not math.isnan(atr) else NAN,
+            rsi=self._rsi.value,
+            rsi_avg_gain=self._rsi.avg_gain,
+            rsi_avg_loss=self._rsi.avg_loss,
+            adx=self._adx.value,
+            plus_di=self._adx.plus_di,
+            minus_di=self._adx.minus_di,
+            bb_upper=self._bb.upper,
+            bb_middle=self._bb.middle,
+            bb_lower=self._bb.lower,
+            bb_width_pct=self._bb.width_pct,
+            avg_volume=self._volume.average,
+            volume_ratio=self._volume.value,
+        )
+
+    def _feed(self, df: pd.DataFrame, timestamps: pd.Index | None) -> int:
+        bars = _frame_bars(df)
+        for i, bar in enumerate(bars):
+            timestamp = timestamps[i] if timestamps is not None else None
+            if i < len(bars) - 1:
+                self.update(*bar, timestamp)
+                continue
+            self._provisional = None
+            state = copy.deepcopy(self)
+            self.update(*bar, timestamp)
+            self._provisional = (state, bar)
+        return len(bars)
+
+
+def _frame_bars(df: pd.DataFrame) -> list[Bar]:
+    """(open, high, low, close, volume) float tuples, one per row."""
+    opens, highs, lows, closes, volumes = (
+        df[name].to_numpy(dtype=float).tolist()
+        for name in ("open", "high", "low", "close", "volume")
+    )
+    return list(zip(opens, highs, lows, closes, volumes, strict=True))
+
+
+def _frame_timestamps(df: pd.DataFrame) -> pd.Index | None:
+    """Bar timestamps from a DatetimeIndex or a ``timestamp`` column, if sorted."""
+    if isinstance(df.index, pd.DatetimeIndex):
+        index = df.index
+    elif "timestamp" in df.columns:
+        index = pd.Index(df["timestamp"])
+    else:
+        return None
+    if not index.is_monotonic_increasing:
+        return None
+    return index
@@ -13,11 +13,14 @@ from aiohttp import web
 
 from bot.api.bybit_direct_client import ByBitDirectClient
 from bot.api.exchange_client import ExchangeAPIClient
+from bot.api.market_data_hub import MarketDataHub
+from bot.api.rate_limiter import rate_limiters
 from bot.config.manager import ConfigManager
 from bot.database.manager import DatabaseManager
 from bot.monitoring.alert_handler import Alert, AlertHandler
 from bot.monitoring.metrics_collector import MetricsCollector
 from bot.monitoring.metrics_exporter import MetricsExporter
+from bot.monitoring.performance_store import PerformanceSampler, PerformanceStore
 from bot.orchestrator.bot_orchestrator import BotOrchestrator
 from bot.telegram.bot import TelegramBot
 from bot.utils.logger import get_logger, setup_logging
@@ -36,6 +39,7 @@ class BotApplication:
         self.telegram_bot: TelegramBot | None = None
         self.metrics_exporter: MetricsExporter | None = None
         self.metrics_collector: MetricsCollector | None = None
+        self.performance_sampler: PerformanceSampler | None = None
         self.alert_handler: AlertHandler | None = None
         self._alert_server_runner: web.AppRunner | None = None
         self._shutdown_event: asyncio.Event = asyncio.Event()
@@ -50,6 +54,9 @@ class BotApplication:
         self._redis_url: str = "redis://localhost:6379"
         self._main_exchange_client = None     # shared exchange client for scanner
 
+        # Shared ticker/candle cache for all orchestrators and the scanner
+        self.market_data_hub = MarketDataHub()
+
     async def initialize(self) -> None:
         """Initialize all components."""
         logger.info("initializing_bot_application")
@@ -68,7 +75,12 @@ class BotApplication:
         # Initialize database
         database_url = os.getenv("DATABASE_URL", main_config.database_url)
         logger.info("initializing_database")
-        self.db_manager = DatabaseManager(database_url)
+        self.db_manager = DatabaseManager(
+            database_url,
+            write_behind=main_config.database_write_behind,
+            write_buffer_size=main_config.database_write_buffer_size,
+            write_flush_interval=main_config.database_flush_interval,
+        )
         await self.db_manager.initialize()
 
         # Redis URL
@@ -135,6 +147,7 @@ class BotApplication:
                 exchange_client=exchange_client,
                 db_manager=self.db_manager,
                 redis_url=redis_url,
+                market_data=self.market_data_hub.feed(exchange_client),
             )
             await orchestrator.initialize()
 
@@ -154,6 +167,14 @@ class BotApplication:
         self.metrics_collector = MetricsCollector(
             exporter=self.metrics_exporter,
             orchestrators=self.orchestrators,
+            market_data_hub=self.market_data_hub,
+            write_buffer=self.db_manager.write_buffer,
+            rate_limiters=rate_limiters,
+        )
+        self.performance_sampler = PerformanceSampler(
+            PerformanceStore(self.db_manager),
+            orchestrators=self.orchestrators,
+            interval=main_config.performance_sample_interval,
         )
         self.alert_handler = AlertHandler()
 
@@ -197,16 +218,16 @@ class BotApplication:
         if main_config.auto_trade.enabled:
             try:
                 from bot.config.pair_template import PairTemplateManager
-                from bot.orchestrator.market_scanner import MarketScanner
+                from bot.scanner.market_scanner import MarketScanner
 
                 self._pair_template_manager = PairTemplateManager()
 
                 # Use the first exchange client as the scanner client
                 if self.orchestrators:
                     first_orch = next(iter(self.orchestrators.values()))
-                    self._main_exchange_client = first_orch._exchange_client
+                    self._main_exchange_client = first_orch.exchange
                     self._scanner = MarketScanner(
-                        exchange_client=self._main_exchange_client,
+                        exchange=self.market_data_hub.feed(self._main_exchange_client),
                         config=main_config.auto_trade.scanner,
                     )
                     self._scanner_task = asyncio.create_task(self._scanner_loop())
@@ -282,6 +303,7 @@ class BotApplication:
                 exchange_client=exchange_client,
                 db_manager=self.db_manager,
                 redis_url=self._redis_url,
+                market_data=self.market_data_hub.feed(exchange_client),
             )
             await orchestrator.initialize()
             await orchestrator.start()
@@ -291,6 +313,8 @@ class BotApplication:
             # Update metrics collector to include new bot
             if self.metrics_collector:
                 self.metrics_collector.orchestrators = self.orchestrators
+            if self.performance_sampler:
+                self.performance_sampler.set_orchestrators(self.orchestrators)
 
             # Notify Telegram
             if self.telegram_bot:
@@ -336,6 +360,8 @@ class BotApplication:
         # Update metrics collector
         if self.metrics_collector:
             self.metrics_collector.orchestrators = self.orchestrators
+        if self.performance_sampler:
+            self.performance_sampler.set_orchestrators(self.orchestrators)
 
         # Notify Telegram
         if self.telegram_bot:
@@ -479,6 +505,10 @@ class BotApplication:
                 await self.metrics_collector.start()
                 logger.info("metrics_collector_started")
 
+            # Start performance history sampling
+            if self.performance_sampler:
+                await self.performance_sampler.start()
+
             # Start alert webhook server (port 8080)
             if self.alert_handler:
                 alerts_port = int(os.getenv("ALERTS_PORT", "8080"))
@@ -520,6 +550,13 @@ class BotApplication:
             except Exception as e:
                 logger.error("metrics_collector_stop_failed", error=str(e))
 
+        # Stop performance sampler
+        if self.performance_sampler:
+            try:
+                await self.performance_sampler.stop()
+            except Exception as e:
+                logger.error("performance_sampler_stop_failed", error=str(e))
+
         # Stop metrics exporter
         if self.metrics_exporter:
             logger.info("stopping_metrics_exporter")
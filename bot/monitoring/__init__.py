@@ -3,10 +3,13 @@
 from bot.monitoring.alert_handler import Alert, AlertHandler
 from bot.monitoring.metrics_collector import MetricsCollector
 from bot.monitoring.metrics_exporter import MetricsExporter
+from bot.monitoring.performance_store import PerformanceSampler, PerformanceStore
 
 __all__ = [
     "MetricsExporter",
     "MetricsCollector",
+    "PerformanceStore",
+    "PerformanceSampler",
     "AlertHandler",
     "Alert",
 ]
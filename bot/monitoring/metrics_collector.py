@@ -36,15 +36,24 @@ class MetricsCollector:
         exporter: MetricsExporter,
         orchestrators: dict[str, Any] | None = None,
         collect_interval: float = 15.0,
+        market_data_hub: Any = None,
+        write_buffer: Any = None,
+        rate_limiters: Any = None,
     ) -> None:
         """
         Args:
             exporter: MetricsExporter instance.
             orchestrators: dict of bot_name -> BotOrchestrator.
             collect_interval: Seconds between collection cycles.
+            market_data_hub: Optional shared MarketDataHub to report cache metrics for.
+            write_buffer: Optional database WriteBuffer to report queue and flush metrics for.
+            rate_limiters: Optional RateLimiterRegistry to report per-bucket usage for.
         """
         self._exporter = exporter
         self._orchestrators: dict[str, Any] = orchestrators or {}
+        self._market_data_hub = market_data_hub
+        self._write_buffer = write_buffer
+        self._rate_limiters = rate_limiters
         self._collect_interval = collect_interval
         self._task: asyncio.Task | None = None
         self._running = False
@@ -127,6 +136,63 @@ class MetricsCollector:
             labels={"scope": "total"},
         )
 
+        if self._market_data_hub is not None:
+            self._collect_market_data_metrics()
+
+        if self._write_buffer is not None:
+            self._collect_write_buffer_metrics()
+
+        if self._rate_limiters is not None:
+            self._collect_rate_limit_metrics()
+
+    def _collect_market_data_metrics(self) -> None:
+        """Export shared market data cache counters per data kind."""
+        for kind, stats in self._market_data_hub.stats.items():
+            labels = {"kind": kind}
+            self._exporter.set_metric(
+                "traderagent_market_data_requests_total", float(stats.requests), labels
+            )
+            self._exporter.set_metric(
+                "traderagent_market_data_exchange_calls_total", float(stats.fetches), labels
+            )
+            self._exporter.set_metric(
+                "traderagent_market_data_requests_saved_total",
+                float(stats.requests_saved),
+                labels,
+            )
+            self._exporter.set_metric("traderagent_market_data_hit_ratio", stats.hit_rate, labels)
+
+    def _collect_write_buffer_metrics(self) -> None:
+        """Export database write-behind queue depth, throughput and flush latency."""
+        stats = self._write_buffer.stats
+        for name, value in (
+            ("traderagent_db_write_queue_depth", stats.pending),
+            ("traderagent_db_rows_written_total", stats.rows_written),
+            ("traderagent_db_flush_seconds", stats.last_flush_seconds),
+            ("traderagent_db_flush_max_seconds", stats.max_flush_seconds),
+            ("traderagent_db_commit_lag_seconds", stats.last_commit_lag_seconds),
+            ("traderagent_db_flush_errors_total", stats.flush_errors),
+            ("traderagent_db_backpressure_waits_total", stats.backpressure_waits),
+            ("traderagent_db_backpressure_seconds_total", stats.backpressure_seconds),
+        ):
+            self._exporter.set_metric(name, float(value))
+
+    def _collect_rate_limit_metrics(self) -> None:
+        """Export token usage, queue wait and depth per rate-limit bucket."""
+        for label, limiter in self._rate_limiters.items():
+            for name, bucket in limiter.buckets.items():
+                labels = {"limiter": label, "bucket": name}
+                stats = bucket.stats
+                for metric, value in (
+                    ("traderagent_rate_limit_requests_total", stats.requests),
+                    ("traderagent_rate_limit_tokens_used_total", stats.tokens_used),
+                    ("traderagent_rate_limit_wait_seconds_total", stats.wait_seconds),
+                    ("traderagent_rate_limit_max_wait_seconds", stats.max_wait_seconds),
+                    ("traderagent_rate_limit_queue_depth", bucket.queued),
+                    ("traderagent_rate_limit_hits_total", stats.rate_limit_hits),
+                ):
+                    self._exporter.set_metric(metric, float(value), labels)
+
     async def _collect_bot_metrics(self, bot_name: str, orch: Any) -> None:
         """Collect metrics from a single orchestrator."""
         labels = {"bot": bot_name}
@@ -261,6 +327,59 @@ class MetricsCollector:
                 labels={**labels, "detail": "health_monitor"},
             )
 
+        # Order flow (WebSocket streams, fill-to-counter-order latency)
+        if "order_flow" in status:
+            flow = status["order_flow"]
+            for name, stream in flow.get("streams", {}).items():
+                self._exporter.set_metric(
+                    "traderagent_stream_connected",
+                    1.0 if stream.get("connected") else 0.0,
+                    labels={**labels, "stream": name},
+                )
+            latency = flow.get("fill_latency", {})
+            for stat in ("last", "avg", "max"):
+                if latency.get(stat) is not None:
+                    self._exporter.set_metric(
+                        "traderagent_fill_to_counter_order_seconds",
+                        float(latency[stat]),
+                        labels={**labels, "stat": stat},
+                    )
+
+        # State snapshots: save latency and write volume
+        if "state_persistence" in status:
+            persistence = status["state_persistence"]
+            for stat in ("last", "avg", "max"):
+                self._exporter.set_metric(
+                    "traderagent_state_save_seconds",
+                    float(persistence.get(f"{stat}_save_seconds", 0.0)),
+                    labels={**labels, "stat": stat},
+                )
+            self._exporter.set_metric(
+                "traderagent_state_bytes_written_total",
+                float(persistence.get("bytes_written", 0)),
+                labels=labels,
+            )
+            self._exporter.set_metric(
+                "traderagent_state_saves_total",
+                float(persistence.get("saves", 0)),
+                labels=labels,
+            )
+
+        # Exchange HTTP transport: request latency percentiles by phase
+        if "exchange_transport" in status:
+            for phase, hist in status["exchange_transport"].get("latency", {}).items():
+                for stat in ("p50", "p90", "p99", "max"):
+                    self._exporter.set_metric(
+                        "traderagent_exchange_request_seconds",
+                        float(hist.get(stat, 0.0)),
+                        labels={**labels, "phase": phase, "stat": stat},
+                    )
+                self._exporter.set_metric(
+                    "traderagent_exchange_requests_total",
+                    float(hist.get("count", 0)),
+                    labels={**labels, "phase": phase},
+                )
+
         # Market regime
         if "market_regime" in status:
             regime = status["market_regime"]
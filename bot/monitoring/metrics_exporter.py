@@ -48,6 +48,88 @@ METRIC_DEFINITIONS: dict[str, tuple[str, str]] = {
     "traderagent_grid_open_orders": ("gauge", "Number of open grid orders"),
     "traderagent_dca_safety_orders_filled": ("counter", "Total safety orders filled"),
     "traderagent_regime_changes_total": ("counter", "Total market regime changes"),
+    "traderagent_stream_connected": (
+        "gauge",
+        "Whether a WebSocket stream is delivering updates (1=yes, 0=polling fallback)",
+    ),
+    "traderagent_fill_to_counter_order_seconds": (
+        "gauge",
+        "Seconds from a grid fill to its counter order being accepted",
+    ),
+    "traderagent_market_data_requests_total": (
+        "counter",
+        "Market data requests received by the shared hub",
+    ),
+    "traderagent_market_data_exchange_calls_total": (
+        "counter",
+        "Market data requests forwarded to the exchange",
+    ),
+    "traderagent_market_data_requests_saved_total": (
+        "counter",
+        "Market data requests served from cache or a coalesced in-flight call",
+    ),
+    "traderagent_market_data_hit_ratio": (
+        "gauge",
+        "Share of market data requests answered without an exchange call",
+    ),
+    "traderagent_db_write_queue_depth": (
+        "gauge",
+        "Rows waiting in the database write-behind buffer",
+    ),
+    "traderagent_db_rows_written_total": (
+        "counter",
+        "Rows inserted by the database write-behind buffer",
+    ),
+    "traderagent_db_flush_seconds": ("gauge", "Duration of the last write-behind flush"),
+    "traderagent_db_flush_max_seconds": ("gauge", "Longest write-behind flush so far"),
+    "traderagent_db_commit_lag_seconds": (
+        "gauge",
+        "Queue plus flush time of the oldest row in the last flush",
+    ),
+    "traderagent_db_flush_errors_total": ("counter", "Failed write-behind flushes"),
+    "traderagent_db_backpressure_waits_total": (
+        "counter",
+        "Inserts that waited for room in the full write-behind buffer",
+    ),
+    "traderagent_db_backpressure_seconds_total": (
+        "counter",
+        "Seconds inserts spent waiting on the full write-behind buffer",
+    ),
+    "traderagent_rate_limit_requests_total": (
+        "counter",
+        "Requests admitted by a rate-limit bucket",
+    ),
+    "traderagent_rate_limit_tokens_used_total": (
+        "counter",
+        "Weighted tokens drawn from a rate-limit bucket",
+    ),
+    "traderagent_rate_limit_wait_seconds_total": (
+        "counter",
+        "Seconds requests spent queued for rate-limit tokens",
+    ),
+    "traderagent_rate_limit_max_wait_seconds": (
+        "gauge",
+        "Longest queue wait for rate-limit tokens so far",
+    ),
+    "traderagent_rate_limit_queue_depth": ("gauge", "Requests waiting for rate-limit tokens"),
+    "traderagent_rate_limit_hits_total": (
+        "counter",
+        "Requests the exchange rejected for exceeding its rate limit",
+    ),
+    "traderagent_state_save_seconds": ("gauge", "State snapshot save latency"),
+    "traderagent_state_bytes_written_total": (
+        "counter",
+        "Bytes of state snapshot sections written",
+    ),
+    "traderagent_state_saves_total": ("counter", "State snapshot saves"),
+    "traderagent_exchange_request_seconds": (
+        "gauge",
+        "Exchange HTTP request latency percentile by phase (connect, ttfb, total)",
+    ),
+    "traderagent_exchange_requests_total": (
+        "counter",
+        "Exchange HTTP requests timed by the direct client transport",
+    ),
 }
 
 
@@ -0,0 +1,456 @@
+"""
+PerformanceStore — per-bot equity / PnL / exposure time series with rollups.
+
+A background ``PerformanceSampler`` reads every orchestrator's status at a
+fixed cadence and appends one sample per bot. Each sample is folded into
+three resolutions at write time — 1m, 1h and 1d buckets holding the
+closing equity, PnL and exposure plus the equity high/low within the
+bucket — with one multi-row upsert per resolution. Every tick also writes
+a portfolio-total row (``PORTFOLIO``) from the summed per-bot equity, so
+portfolio highs and lows are real totals. Dashboard queries read
+the coarsest resolution that still resolves their period, so 1d/7d/30d/all
+cost at most a few thousand rows regardless of how long the bots ran.
+Old fine-grained buckets are pruned per resolution retention.
+
+Usage:
+    store = PerformanceStore(db_manager)
+    sampler = PerformanceSampler(store, orchestrators, interval=60.0)
+    await sampler.start()
+    points = await store.series("7d")                  # portfolio equity
+    drawdown = await store.drawdown("all", "grid-bot")  # one bot
+    await sampler.stop()
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import ColumnElement, Insert, delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from bot.database.models import PerformanceSnapshot
+from bot.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bucket width per resolution
+RESOLUTIONS: dict[str, timedelta] = {
+    "1m": timedelta(minutes=1),
+    "1h": timedelta(hours=1),
+    "1d": timedelta(days=1),
+}
+
+# How long buckets are kept (None = forever)
+DEFAULT_RETENTION: dict[str, timedelta | None] = {
+    "1m": timedelta(days=2),
+    "1h": timedelta(days=90),
+    "1d": None,
+}
+
+# Dashboard period -> (lookback, resolution read)
+PERIODS: dict[str, tuple[timedelta | None, str]] = {
+    "1d": (timedelta(days=1), "1m"),
+    "7d": (timedelta(days=7), "1h"),
+    "30d": (timedelta(days=30), "1h"),
+    "all": (None, "1d"),
+}
+
+# Reserved bot_name of the portfolio-total rows
+PORTFOLIO = "__portfolio__"
+
+
+@dataclass
+class PerformanceSample:
+    """One bot's performance at one instant."""
+
+    bot_name: str
+    equity: Decimal
+    realized_pnl: Decimal = Decimal("0")
+    unrealized_pnl: Decimal = Decimal("0")
+    exposure: Decimal = Decimal("0")
+
+
+@dataclass
+class PerformancePoint:
+    """One bucket of a (bot or portfolio) series."""
+
+    timestamp: datetime
+    equity: Decimal
+    equity_high: Decimal
+    equity_low: Decimal
+    realized_pnl: Decimal
+    unrealized_pnl: Decimal
+    exposure: Decimal
+
+
+@dataclass
+class DrawdownStats:
+    current_drawdown_pct: float = 0.0
+    max_drawdown_pct: float = 0.0
+    max_drawdown_amount: Decimal = Decimal("0")
+    recovery_time_hours: float | None = None
+
+
+def _upsert(dialect: str, rows: list[dict[str, Any]]) -> Insert:
+    """Multi-row insert folding each row into its existing bucket."""
+    t = PerformanceSnapshot
+    index = [t.bot_name, t.resolution, t.bucket]
+    if dialect == "sqlite":
+        # SQLite's scalar max()/min() take several args
+        sqlite_stmt = sqlite_insert(t).values(rows)
+        new = sqlite_stmt.excluded
+        set_ = _rollup(
+            new,
+            func.max(t.equity_high, new.equity_high),
+            func.min(t.equity_low, new.equity_low),
+        )
+        return sqlite_stmt.on_conflict_do_update(index_elements=index, set_=set_)
+    pg_stmt = pg_insert(t).values(rows)
+    new = pg_stmt.excluded
+    set_ = _rollup(
+        new,
+        func.greatest(t.equity_high, new.equity_high),
+        func.least(t.equity_low, new.equity_low),
+    )
+    return pg_stmt.on_conflict_do_update(index_elements=index, set_=set_)
+
+
+def _rollup(excluded: Any, high: ColumnElement[Any], low: ColumnElement[Any]) -> dict[str, Any]:
+    return {
+        "equity": excluded.equity,
+        "equity_high": high,
+        "equity_low": low,
+        "realized_pnl": excluded.realized_pnl,
+        "unrealized_pnl": excluded.unrealized_pnl,
+        "exposure": excluded.exposure,
+        "samples": PerformanceSnapshot.samples + 1,
+        "updated_at": excluded.updated_at,
+    }
+
+
+def _dec(value: Any) -> Decimal:
+    return Decimal(str(value)) if value is not None else Decimal("0")
+
+
+def sample_from_status(status: dict[str, Any]) -> PerformanceSample:
+    """
+    Build a sample from ``BotOrchestrator.get_status()``.
+
+    Realized PnL sums grid, DCA and trend-follower profit. Exposure and
+    unrealized PnL come from the open DCA position marked at the current
+    price. Equity is the risk manager's current balance plus unrealized
+    PnL, or realized + unrealized PnL when no balance is tracked.
+    """
+    realized = Decimal("0")
+    unrealized = Decimal("0")
+    exposure = Decimal("0")
+
+    grid = status.get("grid")
+    if grid:
+        realized += _dec(grid.get("total_profit"))
+
+    price = _dec(status.get("current_price"))
+    dca = status.get("dca")
+    if dca:
+        realized += _dec(dca.get("realized_profit"))
+        entry = _dec(dca.get("average_entry_price"))
+        if dca.get("has_position") and entry > 0 and price > 0:
+            cost = _dec(dca.get("total_cost"))
+            exposure += cost * price / entry
+            unrealized += cost * price / entry - cost
+
+    tf = status.get("trend_follower")
+    if tf:
+        risk_metrics = tf.get("statistics", {}).get("risk_metrics", {})
+        realized += _dec(risk_metrics.get("total_pnl"))
+
+    balance = (status.get("risk") or {}).get("current_balance")
+    equity = _dec(balance) + unrealized if balance is not None else realized + unrealized
+    return PerformanceSample(
+        bot_name=status.get("bot_name", ""),
+        equity=equity,
+        realized_pnl=realized,
+        unrealized_pnl=unrealized,
+        exposure=exposure,
+    )
+
+
+def bucket_start(at: datetime, resolution: str) -> datetime:
+    """Start of the ``resolution`` bucket containing ``at`` (UTC)."""
+    at = at.astimezone(timezone.utc)
+    if resolution == "1m":
+        return at.replace(second=0, microsecond=0)
+    if resolution == "1h":
+        return at.replace(minute=0, second=0, microsecond=0)
+    if resolution == "1d":
+        return at.replace(hour=0, minute=0, second=0, microsecond=0)
+    raise ValueError(f"Unknown resolution {resolution!r}, expected one of {tuple(RESOLUTIONS)}")
+
+
+def compute_drawdown(points: list[PerformancePoint]) -> DrawdownStats:
+    """Drawdown of an equity series from its bucket highs and lows."""
+    stats = DrawdownStats()
+    if not points:
+        return stats
+    peak = points[0].equity_high
+    worst_pct = 0.0
+    worst_peak: Decimal | None = None
+    worst_trough_at: datetime | None = None
+    recovered_at: datetime | None = None
+    for p in points:
+        if worst_peak is not None and recovered_at is None and p.equity_high >= worst_peak:
+            recovered_at = p.timestamp
+        if p.equity_high > peak:
+            peak = p.equity_high
+        if peak <= 0:
+            continue
+        amount = peak - p.equity_low
+        pct = float(amount / peak) * 100
+        if pct > worst_pct:
+            worst_pct = pct
+            worst_peak = peak
+            worst_trough_at = p.timestamp
+            recovered_at = None
+            stats.max_drawdown_amount = amount
+    last = points[-1]
+    if peak > 0:
+        stats.current_drawdown_pct = max(0.0, float((peak - last.equity) / peak) * 100)
+    stats.max_drawdown_pct = worst_pct
+    if recovered_at is not None and worst_trough_at is not None:
+        stats.recovery_time_hours = (recovered_at - worst_trough_at).total_seconds() / 3600
+    return stats
+
+
+class PerformanceStore:
+    """Reads and writes the ``performance_snapshots`` rollup table."""
+
+    def __init__(
+        self,
+        db_manager: Any,
+        retention: dict[str, timedelta | None] | None = None,
+    ) -> None:
+        """
+        Args:
+            db_manager: DatabaseManager (anything with ``session()`` and ``_engine``).
+            retention: Per-resolution retention, defaults to ``DEFAULT_RETENTION``.
+        """
+        self._db = db_manager
+        self._retention = {**DEFAULT_RETENTION, **(retention or {})}
+        # Last sample per bot, carried into the portfolio total when a bot skips a tick
+        self._latest: dict[str, PerformanceSample] = {}
+
+    @property
+    def bot_names(self) -> set[str]:
+        """Bots currently counted in the portfolio total."""
+        return set(self._latest)
+
+    def forget(self, bot_name: str) -> None:
+        """Stop counting a removed bot in the portfolio total."""
+        self._latest.pop(bot_name, None)
+
+    async def record(self, samples: list[PerformanceSample], at: datetime | None = None) -> None:
+        """
+        Fold ``samples`` taken at ``at`` into their 1m, 1h and 1d buckets.
+
+        Also records a ``PORTFOLIO`` sample: the summed equity, PnL and
+        exposure of every known bot at ``at``, so portfolio highs and lows
+        come from real totals. Bots missing from ``samples`` count at their
+        last recorded values instead of dropping out of the total.
+        """
+        if not samples:
+            return
+        at = at or datetime.now(timezone.utc)
+        for s in samples:
+            self._latest[s.bot_name] = s
+        latest = self._latest.values()
+        total = PerformanceSample(
+            bot_name=PORTFOLIO,
+            equity=sum((s.equity for s in latest), Decimal("0")),
+            realized_pnl=sum((s.realized_pnl for s in latest), Decimal("0")),
+            unrealized_pnl=sum((s.unrealized_pnl for s in latest), Decimal("0")),
+            exposure=sum((s.exposure for s in latest), Decimal("0")),
+        )
+        dialect = self._db._engine.dialect.name
+        async with self._db.session() as session:
+            for resolution in RESOLUTIONS:
+                bucket = bucket_start(at, resolution)
+                rows = [
+                    {
+                        "bot_name": s.bot_name,
+                        "resolution": resolution,
+                        "bucket": bucket,
+                        "equity": s.equity,
+                        "equity_high": s.equity,
+                        "equity_low": s.equity,
+                        "realized_pnl": s.realized_pnl,
+                        "unrealized_pnl": s.unrealized_pnl,
+                        "exposure": s.exposure,
+                        "samples": 1,
+                        "updated_at": at,
+                    }
+                    for s in [*samples, total]
+                ]
+                await session.execute(_upsert(dialect, rows))
+
+    async def series(
+        self,
+        period: str = "7d",
+        bot_name: str | None = None,
+        now: datetime | None = None,
+    ) -> list[PerformancePoint]:
+        """
+        Buckets covering ``period`` for one bot, or for the portfolio total.
+
+        Args:
+            period: One of ``PERIODS`` ("1d", "7d", "30d", "all").
+            bot_name: Bot to read; None for the portfolio total.
+        """
+        if period not in PERIODS:
+            raise ValueError(f"Unknown period {period!r}, expected one of {tuple(PERIODS)}")
+        lookback, resolution = PERIODS[period]
+        t = PerformanceSnapshot
+        query = select(
+            t.bucket,
+            t.equity,
+            t.equity_high,
+            t.equity_low,
+            t.realized_pnl,
+            t.unrealized_pnl,
+            t.exposure,
+        ).where(t.resolution == resolution, t.bot_name == (bot_name or PORTFOLIO))
+        if lookback is not None:
+            since = (now or datetime.now(timezone.utc)) - lookback
+            query = query.where(t.bucket >= bucket_start(since, resolution))
+        query = query.order_by(t.bucket)
+
+        async with self._db.session() as session:
+            rows = (await session.execute(query)).all()
+        return [
+            PerformancePoint(
+                timestamp=_utc(bucket),
+                equity=_dec(equity),
+                equity_high=_dec(high),
+                equity_low=_dec(low),
+                realized_pnl=_dec(realized),
+                unrealized_pnl=_dec(unrealized),
+                exposure=_dec(exposure),
+            )
+            for bucket, equity, high, low, realized, unrealized, exposure in rows
+        ]
+
+    async def drawdown(self, period: str = "all", bot_name: str | None = None) -> DrawdownStats:
+        """Drawdown over ``period`` (see ``compute_drawdown``)."""
+        return compute_drawdown(await self.series(period, bot_name))
+
+    async def prune(self, now: datetime | None = None) -> int:
+        """Delete buckets past their resolution's retention. Returns rows deleted."""
+        now = now or datetime.now(timezone.utc)
+        deleted = 0
+        async with self._db.session() as session:
+            for resolution, keep in self._retention.items():
+                if keep is None:
+                    continue
+                result = await session.execute(
+                    delete(PerformanceSnapshot).where(
+                        PerformanceSnapshot.resolution == resolution,
+                        PerformanceSnapshot.bucket < now - keep,
+                    )
+                )
+                deleted += result.rowcount or 0
+        return deleted
+
+
+def _utc(value: datetime) -> datetime:
+    # SQLite returns naive datetimes
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+class PerformanceSampler:
+    """
+    Periodically samples every orchestrator into a PerformanceStore.
+
+    Runs alongside MetricsCollector; a failing bot is skipped for that
+    tick, a failing write is logged and retried on the next one.
+    """
+
+    def __init__(
+        self,
+        store: PerformanceStore,
+        orchestrators: dict[str, Any] | None = None,
+        interval: float = 60.0,
+        prune_interval: float = 3600.0,
+    ) -> None:
+        """
+        Args:
+            store: Destination store.
+            orchestrators: dict of bot_name -> BotOrchestrator (read on every tick).
+            interval: Seconds between samples.
+            prune_interval: Seconds between retention sweeps.
+        """
+        self._store = store
+        self._orchestrators: dict[str, Any] = orchestrators if orchestrators is not None else {}
+        self._interval = interval
+        self._prune_interval = prune_interval
+        self._last_prune = 0.0
+        self._task: asyncio.Task | None = None
+        self._running = False
+
+    @property
+    def store(self) -> PerformanceStore:
+        return self._store
+
+    def set_orchestrators(self, orchestrators: dict[str, Any]) -> None:
+        self._orchestrators = orchestrators
+
+    async def start(self) -> None:
+        """Start the sampling loop."""
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._sample_loop())
+        logger.info("performance_sampler_started", interval=self._interval)
+
+    async def stop(self) -> None:
+        """Stop the sampling loop."""
+        self._running = False
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        logger.info("performance_sampler_stopped")
+
+    async def _sample_loop(self) -> None:
+        while self._running:
+            try:
+                await self.sample_all()
+                if time.monotonic() - self._last_prune >= self._prune_interval:
+                    self._last_prune = time.monotonic()
+                    await self._store.prune()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error("performance_sample_failed", error=str(e))
+            await asyncio.sleep(self._interval)
+
+    async def sample_all(self, at: datetime | None = None) -> int:
+        """Sample every orchestrator once. Returns the number of bots recorded."""
+        samples = []
+        for bot_name, orch in list(self._orchestrators.items()):
+            try:
+                sample = sample_from_status(await orch.get_status())
+            except Exception as e:
+                logger.warning("performance_sample_skipped", bot_name=bot_name, error=str(e))
+                continue
+            sample.bot_name = bot_name
+            samples.append(sample)
+        for removed in self._store.bot_names - self._orchestrators.keys():
+            self._store.forget(removed)
+        await self._store.record(samples, at)
+        return len(samples)
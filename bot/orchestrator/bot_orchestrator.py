@@ -7,6 +7,7 @@ Manages Grid, DCA, SMC, and Trend-Follower engines with dynamic strategy selecti
 
 import asyncio
 import time
+from collections import deque
 from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
@@ -15,6 +16,9 @@ from typing import Any
 import pandas as pd
 import redis.asyncio as redis
 
+from bot.api.batch_orders import OrderRequest, create_orders
+from bot.api.exchange_stream import ExchangeStream
+from bot.api.http_transport import HttpTransport
 from bot.config.schemas import BotConfig, StrategyType
 from bot.core.dca_engine import DCAEngine
 from bot.core.grid_engine import GridEngine, GridType
@@ -81,6 +85,7 @@ class BotOrchestrator:
         exchange_client: Any,
         db_manager: DatabaseManager,
         redis_url: str = "redis://localhost:6379",
+        market_data: Any = None,
     ):
         """
         Initialize Bot Orchestrator.
@@ -90,9 +95,12 @@ class BotOrchestrator:
             exchange_client: Exchange API client
             db_manager: Database manager
             redis_url: Redis connection URL
+            market_data: Source of tickers/candles (e.g. a shared MarketDataFeed);
+                defaults to the exchange client
         """
         self.config = bot_config
         self.exchange = exchange_client
+        self.market_data = market_data or exchange_client
         self.db = db_manager
         self.redis_url = redis_url
 
@@ -121,10 +129,25 @@ class BotOrchestrator:
         self._cached_balance: Decimal | None = None
         self._last_daily_reset: object | None = None  # date object
 
-        # State persistence
+        # WebSocket streams (exchange.use_websocket); polling covers any gap
+        self._ticker_stream: ExchangeStream | None = None
+        self._order_stream: ExchangeStream | None = None
+        self._fill_latencies: deque[float] = deque(maxlen=100)  # fill -> counter order (s)
+
+        # State persistence: incremental snapshots, saved by _state_save_loop
+        # every _state_save_interval or shortly after request_state_save (fills)
         self._state_loaded = False
         self._last_state_save: float = 0.0
         self._state_save_interval: float = 30.0  # seconds
+        self._state_save_debounce: float = 0.2  # coalesce bursts of fills
+        encoding = getattr(bot_config, "state_encoding", "json")
+        self._state_tracker = sp.StateTracker(
+            encoding if encoding in sp.STATE_ENCODINGS else "json"
+        )
+        self._state_save_lock = asyncio.Lock()
+        self._state_save_requested = asyncio.Event()
+        self._state_save_task: asyncio.Task | None = None
+        self._saved_bot_state: str | None = None
 
         # SMC analysis throttle (entry timeframe is M15 → analyze every 5 min)
         self._smc_last_analysis: float = 0.0
@@ -317,6 +340,7 @@ class BotOrchestrator:
                 close_mitigation=pydantic_smc.close_mitigation,
                 join_consecutive_fvg=pydantic_smc.join_consecutive_fvg,
                 liquidity_range_percent=pydantic_smc.liquidity_range_percent,
+                incremental_structure=pydantic_smc.incremental_structure,
                 risk_per_trade=pydantic_smc.risk_per_trade,
                 min_risk_reward=pydantic_smc.min_risk_reward,
                 max_position_size=pydantic_smc.max_position_size,
@@ -359,7 +383,7 @@ class BotOrchestrator:
 
             try:
                 # Get current price
-                ticker = await self.exchange.fetch_ticker(self.config.symbol)
+                ticker = await self.market_data.fetch_ticker(self.config.symbol)
                 self.current_price = Decimal(str(ticker["last"]))
                 logger.info("current_price_fetched", price=str(self.current_price))
 
@@ -427,10 +451,12 @@ class BotOrchestrator:
                 self.state = BotState.RUNNING
                 self._main_task = asyncio.create_task(self._main_loop())
                 self._price_monitor_task = asyncio.create_task(self._price_monitor())
+                self._state_save_task = asyncio.create_task(self._state_save_loop())
 
                 # v2.0: Start regime monitor and health monitor
                 self._regime_monitor_task = asyncio.create_task(self._regime_monitor_loop())
                 await self.health_monitor.start()
+                await self._start_streams()
 
                 await self._publish_event(
                     EventType.BOT_STARTED,
@@ -458,10 +484,11 @@ class BotOrchestrator:
             logger.info("stopping_bot", bot_name=self.config.name)
             self.state = BotState.STOPPING
             self._running = False
+            await self._stop_state_save_loop()
 
             # Save state before stopping
             try:
-                await self.save_state()
+                await self.save_state(force=True)
             except Exception as e:
                 logger.error("save_state_on_stop_failed", error=str(e))
 
@@ -480,6 +507,8 @@ class BotOrchestrator:
                 except asyncio.CancelledError:
                     pass
 
+            await self._stop_streams()
+
             # v2.0: Stop regime monitor
             if self._regime_monitor_task and not self._regime_monitor_task.done():
                 self._regime_monitor_task.cancel()
@@ -536,10 +565,11 @@ class BotOrchestrator:
             logger.warning("emergency_stop_triggered", bot_name=self.config.name)
             self.state = BotState.EMERGENCY
             self._running = False
+            await self._stop_state_save_loop()
 
             # Best-effort state save
             try:
-                await self.save_state()
+                await self.save_state(force=True)
             except Exception as e:
                 logger.error("save_state_on_emergency_failed", error=str(e))
 
@@ -548,6 +578,7 @@ class BotOrchestrator:
                 self._main_task.cancel()
             if self._price_monitor_task:
                 self._price_monitor_task.cancel()
+            await self._stop_streams()
 
             # Cancel all orders
             if not self.config.dry_run:
@@ -844,15 +875,6 @@ class BotOrchestrator:
                 if self.risk_manager:
                     await self._update_risk_manager()
 
-                # Periodic state save
-                now = time.monotonic()
-                if now - self._last_state_save >= self._state_save_interval:
-                    try:
-                        await self.save_state()
-                        self._last_state_save = now
-                    except Exception as e:
-                        logger.error("periodic_state_save_failed", error=str(e))
-
                 # Sleep between iterations
                 await asyncio.sleep(1)
 
@@ -875,15 +897,10 @@ class BotOrchestrator:
 
         while self._running:
             try:
-                ticker = await self.exchange.fetch_ticker(self.config.symbol)
-                new_price = Decimal(str(ticker["last"]))
-
-                if new_price != self.current_price:
-                    self.current_price = new_price
-                    await self._publish_event(
-                        EventType.PRICE_UPDATED,
-                        {"price": str(self.current_price)},
-                    )
+                # Ticker stream pushes prices itself; poll only while it is down
+                if not (self._ticker_stream and self._ticker_stream.connected):
+                    ticker = await self.market_data.fetch_ticker(self.config.symbol)
+                    await self._update_price(ticker)
 
                 await asyncio.sleep(5)  # Update every 5 seconds
 
@@ -896,6 +913,70 @@ class BotOrchestrator:
 
         logger.info("price_monitor_stopped")
 
+    async def _update_price(self, ticker: dict[str, Any]) -> None:
+        """Apply a ticker update and publish PRICE_UPDATED on change."""
+        if ticker.get("last") is None:
+            return
+        new_price = Decimal(str(ticker["last"]))
+        if new_price != self.current_price:
+            self.current_price = new_price
+            await self._publish_event(
+                EventType.PRICE_UPDATED,
+                {"price": str(self.current_price)},
+            )
+
+    # =========================================================================
+    # WebSocket Streams
+    # =========================================================================
+
+    async def _start_streams(self) -> None:
+        """Start ticker/order streams when the exchange config enables WebSocket."""
+        if not getattr(self.config.exchange, "use_websocket", False):
+            return
+
+        symbol = self.config.symbol
+        if hasattr(self.exchange, "watch_ticker"):
+            self._ticker_stream = ExchangeStream(
+                "ticker",
+                watch=lambda: self.exchange.watch_ticker(symbol),
+                on_update=self._update_price,
+                stale_after=30.0,
+            )
+            await self._ticker_stream.start()
+
+        if self.grid_engine and not self.config.dry_run and hasattr(self.exchange, "watch_orders"):
+            self._order_stream = ExchangeStream(
+                "orders",
+                watch=lambda: self.exchange.watch_orders(symbol),
+                on_update=self._on_order_updates,
+                on_resume=self.reconcile_with_exchange,
+            )
+            await self._order_stream.start()
+
+    async def _stop_streams(self) -> None:
+        for stream in (self._ticker_stream, self._order_stream):
+            if stream:
+                await stream.stop()
+
+    async def _on_order_updates(self, orders: list[dict[str, Any]]) -> None:
+        """Handle grid fills and cancellations pushed by the order stream."""
+        if not self.grid_engine:
+            return
+
+        for order in orders:
+            order_id = order.get("id")
+            if order_id not in self.grid_engine.active_orders:
+                continue
+            if order.get("symbol") not in (None, self.config.symbol):
+                continue
+
+            order_status = order.get("status", "")
+            if order_status == "closed":
+                await self._on_grid_order_filled(order_id, order.get("lastTradeTimestamp"))
+            elif order_status in ("canceled", "cancelled", "expired", "rejected"):
+                self.grid_engine.active_orders.pop(order_id, None)
+                logger.warning("grid_order_not_filled", order_id=order_id, status=order_status)
+
     async def _process_hybrid_logic(self) -> None:
         """Delegate Grid/DCA execution to HybridCoordinator (unified kernel)."""
         if not self.current_price:
@@ -958,12 +1039,15 @@ class BotOrchestrator:
         if self.config.dry_run:
             # In dry run, simulate order fills based on current price
             pass
+        elif self._order_stream and self._order_stream.connected:
+            # Fills arrive through the order stream (_on_order_updates)
+            return
         else:
             # Fetch actual orders from exchange
             open_orders = await self.exchange.fetch_open_orders(self.config.symbol)
             # Process filled orders
             open_order_ids = {o["id"] for o in open_orders}
-            for order_id, grid_order in list(self.grid_engine.active_orders.items()):
+            for order_id in list(self.grid_engine.active_orders):
                 if order_id not in open_order_ids:
                     # Order disappeared — verify it was actually filled (#230)
                     try:
@@ -984,22 +1068,49 @@ class BotOrchestrator:
                             self.grid_engine.active_orders.pop(order_id, None)
                         continue
 
-                    filled_price = grid_order.price
-                    rebalance_order = self.grid_engine.handle_order_filled(
-                        order_id, filled_price, grid_order.amount
+                    await self._on_grid_order_filled(
+                        order_id, order_info.get("lastTradeTimestamp")
                     )
 
-                    await self._publish_event(
-                        EventType.ORDER_FILLED,
-                        {
-                            "order_id": order_id,
-                            "price": str(filled_price),
-                            "side": grid_order.side,
-                        },
-                    )
+    async def _on_grid_order_filled(self, order_id: str, filled_at_ms: int | None = None) -> None:
+        """
+        Book a grid fill and place its counter order.
+
+        Args:
+            order_id: Filled exchange order ID.
+            filled_at_ms: Exchange fill timestamp, used to measure
+                fill-to-counter-order latency (detection time if missing).
+        """
+        if not self.grid_engine:
+            return
+        grid_order = self.grid_engine.active_orders.get(order_id)
+        if grid_order is None:
+            return  # Already handled via another path (stream/poll/reconcile)
+        detected_at = time.monotonic()
+
+        filled_price = grid_order.price
+        rebalance_order = self.grid_engine.handle_order_filled(
+            order_id, filled_price, grid_order.amount
+        )
+        self.request_state_save("grid_state")
 
-                    if rebalance_order and self.state == BotState.RUNNING:
-                        await self._place_single_order(rebalance_order)
+        await self._publish_event(
+            EventType.ORDER_FILLED,
+            {
+                "order_id": order_id,
+                "price": str(filled_price),
+                "side": grid_order.side,
+            },
+        )
+
+        if rebalance_order and self.state == BotState.RUNNING:
+            if await self._place_single_order(rebalance_order):
+                if filled_at_ms:
+                    latency = max(0.0, time.time() - filled_at_ms / 1000)
+                else:
+                    latency = time.monotonic() - detected_at
+                self._fill_latencies.append(latency)
+                logger.info("grid_counter_order_placed", order_id=order_id, latency_s=round(latency, 3))
 
     async def _process_dca_logic(self) -> None:
         """Process DCA triggers and take profit logic."""
@@ -1035,6 +1146,7 @@ class BotOrchestrator:
             # Only advance DCA state after order confirmed
             success = self.dca_engine.execute_dca_step(self.current_price)
             if success:
+                self.request_state_save("dca_state")
                 await self._publish_event(
                     EventType.DCA_TRIGGERED,
                     {
@@ -1053,6 +1165,7 @@ class BotOrchestrator:
         # Handle take profit
         if dca_actions["tp_triggered"] and self.state == BotState.RUNNING:
             pnl = self.dca_engine.close_position(self.current_price)
+            self.request_state_save("dca_state")
             await self._publish_event(
                 EventType.TAKE_PROFIT_HIT,
                 {
@@ -1084,12 +1197,44 @@ class BotOrchestrator:
             await self.emergency_stop()
 
     async def _place_grid_orders(self, orders: list) -> None:
-        """Place grid orders on exchange."""
-        for order in orders:
-            await self._place_single_order(order)
+        """Place grid orders on exchange as a batch (bounded concurrency fallback)."""
+        if not orders:
+            return
+        requests = [
+            OrderRequest(
+                symbol=self.config.symbol,
+                side=order.side,
+                amount=order.amount,
+                price=order.price,
+            )
+            for order in orders
+        ]
+        results = await create_orders(self.exchange, requests)
 
-    async def _place_single_order(self, order: Any) -> None:
-        """Place a single order on exchange."""
+        for order, result in zip(orders, results, strict=True):
+            if result.order is None:
+                logger.error("order_placement_failed", error=str(result.error))
+                await self._publish_event(
+                    EventType.ORDER_FAILED,
+                    {"error": str(result.error), "order": str(order)},
+                )
+                continue
+
+            order_id = result.order["id"]
+            if self.grid_engine:
+                self.grid_engine.register_order(order, order_id)
+            await self._publish_event(
+                EventType.ORDER_PLACED,
+                {
+                    "order_id": order_id,
+                    "side": order.side,
+                    "price": str(order.price),
+                    "amount": str(order.amount),
+                },
+            )
+
+    async def _place_single_order(self, order: Any) -> str | None:
+        """Place a single order on exchange. Returns the order ID, or None on failure."""
         try:
             result = await self.exchange.create_order(
                 symbol=self.config.symbol,
@@ -1098,7 +1243,7 @@ class BotOrchestrator:
                 amount=float(order.amount),
                 price=float(order.price),
             )
-            order_id = result["id"]
+            order_id: str = result["id"]
             if self.grid_engine:
                 self.grid_engine.register_order(order, order_id)
 
@@ -1111,12 +1256,14 @@ class BotOrchestrator:
                     "amount": str(order.amount),
                 },
             )
+            return order_id
         except Exception as e:
             logger.error("order_placement_failed", error=str(e))
             await self._publish_event(
                 EventType.ORDER_FAILED,
                 {"error": str(e), "order": str(order)},
             )
+            return None
 
     async def _place_dca_order(self) -> None:
         """Place DCA buy order."""
@@ -1170,7 +1317,7 @@ class BotOrchestrator:
 
         try:
             # Fetch OHLCV data for analysis
-            ohlcv = await self.exchange.fetch_ohlcv(
+            ohlcv = await self.market_data.fetch_ohlcv(
                 symbol=self.config.symbol,
                 timeframe="1h",  # TODO: Make configurable
                 limit=100,
@@ -1376,10 +1523,10 @@ class BotOrchestrator:
 
             # Fetch 4 timeframes of OHLCV data
             ohlcv_d1, ohlcv_h4, ohlcv_h1, ohlcv_m15 = await asyncio.gather(
-                self.exchange.fetch_ohlcv(symbol=self.config.symbol, timeframe="1d", limit=200),
-                self.exchange.fetch_ohlcv(symbol=self.config.symbol, timeframe="4h", limit=200),
-                self.exchange.fetch_ohlcv(symbol=self.config.symbol, timeframe="1h", limit=200),
-                self.exchange.fetch_ohlcv(symbol=self.config.symbol, timeframe="15m", limit=200),
+                self.market_data.fetch_ohlcv(symbol=self.config.symbol, timeframe="1d", limit=200),
+                self.market_data.fetch_ohlcv(symbol=self.config.symbol, timeframe="4h", limit=200),
+                self.market_data.fetch_ohlcv(symbol=self.config.symbol, timeframe="1h", limit=200),
+                self.market_data.fetch_ohlcv(symbol=self.config.symbol, timeframe="15m", limit=200),
             )
 
             # Convert each to DataFrame
@@ -1590,21 +1737,77 @@ class BotOrchestrator:
     # State Persistence
     # =========================================================================
 
-    async def save_state(self) -> None:
-        """Serialize all engine state and upsert into DB."""
-        hybrid = getattr(self, "hybrid_strategy", None)
-        snapshot = BotStateSnapshot(
-            bot_name=self.config.name,
-            bot_state=self.state.value,
-            grid_state=sp.serialize_grid_state(self.grid_engine),
-            dca_state=sp.serialize_dca_state(self.dca_engine),
-            risk_state=sp.serialize_risk_state(self.risk_manager),
-            trend_state=sp.serialize_trend_state(self.trend_follower_strategy),
-            hybrid_state=sp.serialize_hybrid_state(hybrid),
-            saved_at=datetime.now(timezone.utc),
-        )
-        await self.db.save_state_snapshot(snapshot)
-        logger.debug("state_saved", bot_name=self.config.name)
+    async def save_state(self, force: bool = False) -> None:
+        """
+        Upsert the engine state sections that changed since the last save.
+
+        Args:
+            force: Re-serialize every section instead of trusting the probes.
+        """
+        async with self._state_save_lock:
+            start = time.perf_counter()
+            tracker = self._state_tracker
+            changes = tracker.collect(
+                {
+                    "grid_state": self.grid_engine,
+                    "dca_state": self.dca_engine,
+                    "risk_state": self.risk_manager,
+                    "trend_state": self.trend_follower_strategy,
+                    "hybrid_state": getattr(self, "hybrid_strategy", None),
+                },
+                force=force,
+            )
+            bot_state = self.state.value
+            if changes or bot_state != self._saved_bot_state:
+                snapshot = BotStateSnapshot(
+                    bot_name=self.config.name,
+                    bot_state=bot_state,
+                    saved_at=datetime.now(timezone.utc),
+                    **changes,
+                )
+                await self.db.save_state_snapshot(snapshot, sections=list(changes))
+                self._saved_bot_state = bot_state
+            tracker.commit(time.perf_counter() - start)
+            self._last_state_save = time.monotonic()
+        logger.debug("state_saved", bot_name=self.config.name, sections=list(changes))
+
+    def request_state_save(self, *sections: str) -> None:
+        """
+        Save state soon (e.g. after a fill) without blocking the caller.
+
+        Marks ``sections`` dirty (all when none given) and wakes the
+        background save task, which coalesces bursts within
+        ``_state_save_debounce`` seconds into one save.
+        """
+        self._state_tracker.mark_dirty(*sections)
+        self._state_save_requested.set()
+
+    async def _state_save_loop(self) -> None:
+        """Save on request or every ``_state_save_interval`` seconds."""
+        while self._running:
+            try:
+                try:
+                    await asyncio.wait_for(
+                        self._state_save_requested.wait(), timeout=self._state_save_interval
+                    )
+                    await asyncio.sleep(self._state_save_debounce)
+                except asyncio.TimeoutError:
+                    pass
+                self._state_save_requested.clear()
+                await self.save_state()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error("periodic_state_save_failed", error=str(e))
+
+    async def _stop_state_save_loop(self) -> None:
+        if self._state_save_task and not self._state_save_task.done():
+            self._state_save_task.cancel()
+            try:
+                await self._state_save_task
+            except asyncio.CancelledError:
+                pass
+        self._state_save_task = None
 
     async def load_state(self) -> None:
         """Load persisted state from DB into engines."""
@@ -1639,6 +1842,8 @@ class BotOrchestrator:
     async def reset_state(self) -> None:
         """Delete persisted state so next start is a fresh start."""
         deleted = await self.db.delete_state_snapshot(self.config.name)
+        self._state_tracker.reset()
+        self._saved_bot_state = None
         self._state_loaded = False
         logger.info("state_reset", bot_name=self.config.name, deleted=deleted)
 
@@ -1679,10 +1884,9 @@ class BotOrchestrator:
                             status = "unknown"
 
                         if status == "closed":
-                            # Was filled while offline — handle it
-                            grid_order = self.grid_engine.active_orders[order_id]
-                            self.grid_engine.handle_order_filled(
-                                order_id, grid_order.price, grid_order.amount
+                            # Filled while offline or during a stream gap — handle it
+                            await self._on_grid_order_filled(
+                                order_id, info.get("lastTradeTimestamp")
                             )
                             logger.info("reconcile_order_filled", order_id=order_id)
                         else:
@@ -1797,6 +2001,34 @@ class BotOrchestrator:
         }
         status["active_strategies"] = sorted(self._active_strategies)
 
+        # Order flow: stream health and fill-to-counter-order latency
+        streams = {
+            s.name: s.get_status() for s in (self._ticker_stream, self._order_stream) if s
+        }
+        latencies = list(self._fill_latencies)
+        status["order_flow"] = {
+            "mode": (
+                "stream" if self._order_stream and self._order_stream.connected else "polling"
+            ),
+            "streams": streams,
+            "fill_latency": {
+                "count": len(latencies),
+                "last": round(latencies[-1], 4) if latencies else None,
+                "avg": round(sum(latencies) / len(latencies), 4) if latencies else None,
+                "max": round(max(latencies), 4) if latencies else None,
+            },
+        }
+
+        status["state_persistence"] = {
+            "encoding": self._state_tracker.encoding,
+            **self._state_tracker.stats.to_dict(),
+        }
+
+        # Direct HTTP clients: connect / TTFB / total request latency
+        transport = getattr(getattr(self, "exchange", None), "transport", None)
+        if isinstance(transport, HttpTransport):
+            status["exchange_transport"] = transport.get_stats()
+
         return status
 
     # =========================================================================
@@ -1907,7 +2139,7 @@ class BotOrchestrator:
             RegimeAnalysis or None on failure.
         """
         try:
-            ohlcv = await self.exchange.fetch_ohlcv(
+            ohlcv = await self.market_data.fetch_ohlcv(
                 symbol=self.config.symbol,
                 timeframe="1h",
                 limit=100,
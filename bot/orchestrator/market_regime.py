@@ -32,6 +32,7 @@ Indicators:
 - Volume ratio for regime confirmation
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
@@ -40,6 +41,7 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
+from bot.indicators import IndicatorSnapshot, IndicatorStream
 from bot.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -139,6 +141,8 @@ class MarketRegimeDetector:
         high_volatility_percentile: float = 90.0,
         confluence_threshold: float = 0.7,
         regime_history_size: int = 10,
+        incremental: bool = False,
+        atr_percentile_window: int = 200,
     ):
         """
         Args:
@@ -154,6 +158,12 @@ class MarketRegimeDetector:
             high_volatility_percentile: ATR percentile for high-volatility regime.
             confluence_threshold: Score above which Hybrid mode is recommended.
             regime_history_size: Number of regime analyses to keep in history.
+            incremental: Maintain indicators in an IndicatorStream and feed only
+                bars newer than the previous call instead of recomputing the
+                whole window. EMA/ADX state then carries over from earlier
+                windows rather than restarting at the first row of ``df``.
+            atr_percentile_window: Recent ATR values ranked for the volatility
+                percentile in incremental mode.
         """
         self.ema_fast = ema_fast
         self.ema_slow = ema_slow
@@ -176,6 +186,21 @@ class MarketRegimeDetector:
         self.atr_wide_threshold = 1.0  # % — splits tight/wide range
         self.atr_volatile_threshold = 2.0  # % — splits quiet/volatile transition
 
+        self.incremental = incremental
+        self._stream: IndicatorStream | None = None
+        if incremental:
+            self._stream = IndicatorStream(
+                ema_fast=ema_fast,
+                ema_slow=ema_slow,
+                atr_period=atr_period,
+                rsi_period=rsi_period,
+                adx_period=adx_period,
+                bb_period=bb_period,
+                bb_std_dev=bb_std_dev,
+                volume_lookback=volume_lookback,
+                atr_percentile_window=atr_percentile_window,
+            )
+
         self._last_analysis: RegimeAnalysis | None = None
         self._regime_history: list[RegimeAnalysis] = []
 
@@ -192,6 +217,15 @@ class MarketRegimeDetector:
         """Return regime analysis history (most recent first)."""
         return self._regime_history.copy()
 
+    @property
+    def min_rows(self) -> int:
+        """Bars required before a regime can be classified."""
+        return max(
+            self.ema_slow + self.atr_period,
+            self.adx_period * 2,
+            self.bb_period + self.volume_lookback,
+        )
+
     def analyze(self, df: pd.DataFrame) -> RegimeAnalysis:
         """
         Analyze market data and detect current regime.
@@ -203,11 +237,7 @@ class MarketRegimeDetector:
         Returns:
             RegimeAnalysis with regime, confidence, and strategy recommendation.
         """
-        min_rows = max(
-            self.ema_slow + self.atr_period,
-            self.adx_period * 2,
-            self.bb_period + self.volume_lookback,
-        )
+        min_rows = self.min_rows
         if len(df) < min_rows:
             self._insufficient_data_count += 1
             if self._insufficient_data_count == 1:
@@ -218,37 +248,39 @@ class MarketRegimeDetector:
                 )
             return self._unknown_analysis("Insufficient data")
 
-        close = df["close"].astype(float)
-        high = df["high"].astype(float)
-        low = df["low"].astype(float)
-        volume = df["volume"].astype(float)
+        if self._stream is not None:
+            self._stream.sync(df)
+            snapshot = self._stream.snapshot()
+        else:
+            snapshot = self._snapshot_from_frame(df)
+        return self.analyze_snapshot(snapshot, data_points=len(df))
 
-        # Calculate indicators
-        ema_fast_vals = close.ewm(span=self.ema_fast, adjust=False).mean()
-        ema_slow_vals = close.ewm(span=self.ema_slow, adjust=False).mean()
-        atr = self._calculate_atr(high, low, close, self.atr_period)
-        rsi = self._calculate_rsi(close, self.rsi_period)
-        adx_vals, plus_di, minus_di = self._calculate_adx(high, low, close, self.adx_period)
-        bb_upper, bb_middle, bb_lower, bb_width_pct = self._calculate_bollinger_bands(
-            close, self.bb_period, self.bb_std_dev
-        )
-        avg_volume, volume_ratio = self._calculate_volume_ratio(volume, self.volume_lookback)
+    def analyze_snapshot(
+        self, snapshot: IndicatorSnapshot, data_points: int | None = None
+    ) -> RegimeAnalysis:
+        """
+        Classify the regime from precomputed indicator values.
 
-        # Extract current values
-        current_price = float(close.iloc[-1])
-        current_ema_fast = float(ema_fast_vals.iloc[-1])
-        current_ema_slow = float(ema_slow_vals.iloc[-1])
-        current_atr = float(atr.iloc[-1])
-        current_rsi = float(rsi.iloc[-1])
+        Lets callers that already maintain an IndicatorStream (e.g. one
+        shared per symbol) skip indicator computation entirely.
+
+        Args:
+            snapshot: Indicator values from IndicatorStream.snapshot().
+            data_points: Bars behind the snapshot (defaults to snapshot.bars).
+
+        Returns:
+            RegimeAnalysis with regime, confidence, and strategy recommendation.
+        """
+        current_price = snapshot.close
+        current_ema_fast = snapshot.ema_fast
+        current_ema_slow = snapshot.ema_slow
+        current_atr = snapshot.atr
+        current_rsi = self._rsi_from_averages(snapshot.rsi_avg_gain, snapshot.rsi_avg_loss)
 
         # Safe extraction for new indicators (handle NaN)
-        current_adx = float(adx_vals.iloc[-1]) if not pd.isna(adx_vals.iloc[-1]) else 20.0
-        current_bb_width = (
-            float(bb_width_pct.iloc[-1]) if not pd.isna(bb_width_pct.iloc[-1]) else 4.0
-        )
-        current_volume_ratio = (
-            float(volume_ratio.iloc[-1]) if not pd.isna(volume_ratio.iloc[-1]) else 1.0
-        )
+        current_adx = snapshot.adx if not pd.isna(snapshot.adx) else 20.0
+        current_bb_width = snapshot.bb_width_pct if not pd.isna(snapshot.bb_width_pct) else 4.0
+        current_volume_ratio = snapshot.volume_ratio if not pd.isna(snapshot.volume_ratio) else 1.0
 
         # EMA divergence as percentage
         ema_divergence_pct = (
@@ -261,11 +293,7 @@ class MarketRegimeDetector:
         atr_pct = (current_atr / current_price * 100) if current_price != 0 else 0.0
 
         # ATR percentile (how volatile relative to recent history)
-        atr_values = atr.dropna().values
-        if len(atr_values) > 0:
-            vol_pctile = float((np.sum(atr_values <= current_atr) / len(atr_values)) * 100)
-        else:
-            vol_pctile = 50.0
+        vol_pctile = snapshot.atr_percentile if not pd.isna(snapshot.atr_percentile) else 50.0
 
         # Trend strength: blend EMA divergence with ADX confirmation
         ema_trend = max(-1.0, min(1.0, ema_divergence_pct / 2.0))
@@ -330,15 +358,13 @@ class MarketRegimeDetector:
                 "ema_fast": current_ema_fast,
                 "ema_slow": current_ema_slow,
                 "atr": current_atr,
-                "bb_upper": float(bb_upper.iloc[-1]) if not pd.isna(bb_upper.iloc[-1]) else 0.0,
-                "bb_middle": float(bb_middle.iloc[-1]) if not pd.isna(bb_middle.iloc[-1]) else 0.0,
-                "bb_lower": float(bb_lower.iloc[-1]) if not pd.isna(bb_lower.iloc[-1]) else 0.0,
-                "avg_volume": (
-                    float(avg_volume.iloc[-1]) if not pd.isna(avg_volume.iloc[-1]) else 0.0
-                ),
-                "plus_di": float(plus_di.iloc[-1]) if not pd.isna(plus_di.iloc[-1]) else 0.0,
-                "minus_di": float(minus_di.iloc[-1]) if not pd.isna(minus_di.iloc[-1]) else 0.0,
-                "data_points": len(df),
+                "bb_upper": _or_zero(snapshot.bb_upper),
+                "bb_middle": _or_zero(snapshot.bb_middle),
+                "bb_lower": _or_zero(snapshot.bb_lower),
+                "avg_volume": _or_zero(snapshot.avg_volume),
+                "plus_di": _or_zero(snapshot.plus_di),
+                "minus_di": _or_zero(snapshot.minus_di),
+                "data_points": data_points if data_points is not None else snapshot.bars,
             },
         )
 
@@ -601,14 +627,128 @@ class MarketRegimeDetector:
     # Technical Indicator Calculations
     # =========================================================================
 
+    def snapshot_batch(self, frames: Sequence[pd.DataFrame]) -> list[IndicatorSnapshot]:
+        """
+        Compute indicator snapshots for many equal-length OHLCV windows at once.
+
+        Each indicator runs once over a (bars x frames) panel instead of once
+        per frame; the values match ``_snapshot_from_frame`` on every frame.
+
+        Args:
+            frames: OHLCV DataFrames, all with the same number of rows.
+
+        Returns:
+            One IndicatorSnapshot per frame, in order.
+        """
+        if not frames:
+            return []
+        bars = len(frames[0])
+        if any(len(df) != bars for df in frames):
+            raise ValueError("snapshot_batch requires frames of equal length")
+
+        def panel(column: str) -> pd.DataFrame:
+            return pd.DataFrame(
+                np.column_stack([df[column].to_numpy(dtype=float) for df in frames])
+            )
+
+        return self._snapshots_from_panel(
+            close=panel("close"),
+            high=panel("high"),
+            low=panel("low"),
+            volume=panel("volume"),
+            timestamps=[df.index[-1] for df in frames],
+        )
+
+    def _snapshot_from_frame(self, df: pd.DataFrame) -> IndicatorSnapshot:
+        """Compute all indicators over the full window with pandas."""
+        return self.snapshot_batch([df])[0]
+
+    def _snapshots_from_panel(
+        self,
+        close: pd.DataFrame,
+        high: pd.DataFrame,
+        low: pd.DataFrame,
+        volume: pd.DataFrame,
+        timestamps: Sequence[Any],
+    ) -> list[IndicatorSnapshot]:
+        """Compute all indicators column-wise over panels with one column per window."""
+        ema_fast_vals = close.ewm(span=self.ema_fast, adjust=False).mean()
+        ema_slow_vals = close.ewm(span=self.ema_slow, adjust=False).mean()
+        atr = self._calculate_atr(high, low, close, self.atr_period)
+        delta = close.diff()
+        avg_gain = delta.where(delta > 0, 0.0).rolling(self.rsi_period).mean()
+        avg_loss = (-delta).where(delta < 0, 0.0).rolling(self.rsi_period).mean()
+        adx_vals, plus_di, minus_di = self._calculate_adx(high, low, close, self.adx_period)
+        bb_upper, bb_middle, bb_lower, bb_width_pct = self._calculate_bollinger_bands(
+            close, self.bb_period, self.bb_std_dev
+        )
+        avg_volume, volume_ratio = self._calculate_volume_ratio(volume, self.volume_lookback)
+
+        # Share of each window's ATR values at or below its latest ATR
+        atr_values = atr.to_numpy()
+        current_atr = atr_values[-1]
+        valid = np.count_nonzero(~np.isnan(atr_values), axis=0)
+        at_or_below = np.count_nonzero(atr_values <= current_atr, axis=0)
+        atr_percentile = np.where(valid > 0, at_or_below / np.maximum(valid, 1) * 100, np.nan)
+
+        def last(frame: pd.DataFrame) -> np.ndarray:
+            row: np.ndarray = frame.iloc[-1].to_numpy(dtype=float)
+            return row
+
+        closes = last(close)
+        ema_fast_last = last(ema_fast_vals)
+        ema_slow_last = last(ema_slow_vals)
+        gain_last = last(avg_gain)
+        loss_last = last(avg_loss)
+        adx_last = last(adx_vals)
+        plus_di_last = last(plus_di)
+        minus_di_last = last(minus_di)
+        bb_upper_last = last(bb_upper)
+        bb_middle_last = last(bb_middle)
+        bb_lower_last = last(bb_lower)
+        bb_width_last = last(bb_width_pct)
+        avg_volume_last = last(avg_volume)
+        volume_ratio_last = last(volume_ratio)
+
+        return [
+            IndicatorSnapshot(
+                timestamp=timestamps[j],
+                bars=len(close),
+                close=float(closes[j]),
+                ema_fast=float(ema_fast_last[j]),
+                ema_slow=float(ema_slow_last[j]),
+                atr=float(current_atr[j]),
+                atr_percentile=float(atr_percentile[j]),
+                rsi=self._rsi_from_averages(float(gain_last[j]), float(loss_last[j])),
+                rsi_avg_gain=float(gain_last[j]),
+                rsi_avg_loss=float(loss_last[j]),
+                adx=float(adx_last[j]),
+                plus_di=float(plus_di_last[j]),
+                minus_di=float(minus_di_last[j]),
+                bb_upper=float(bb_upper_last[j]),
+                bb_middle=float(bb_middle_last[j]),
+                bb_lower=float(bb_lower_last[j]),
+                bb_width_pct=float(bb_width_last[j]),
+                avg_volume=float(avg_volume_last[j]),
+                volume_ratio=float(volume_ratio_last[j]),
+            )
+            for j in range(close.shape[1])
+        ]
+
+    @staticmethod
+    def _rsi_from_averages(avg_gain: float, avg_loss: float) -> float:
+        """RSI from average gain/loss, with the same zero-loss handling as _calculate_rsi."""
+        rs = avg_gain / (avg_loss if avg_loss != 0 else np.inf)
+        return float(100 - (100 / (1 + rs)))
+
     @staticmethod
     def _calculate_atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int) -> pd.Series:
-        """Calculate Average True Range."""
+        """Calculate Average True Range (element-wise, so DataFrame panels work too)."""
         prev_close = close.shift(1)
         tr1 = high - low
         tr2 = (high - prev_close).abs()
         tr3 = (low - prev_close).abs()
-        true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+        true_range = np.fmax(np.fmax(tr1, tr2), tr3)
         return true_range.rolling(window=period).mean()
 
     @staticmethod
@@ -647,7 +787,7 @@ class MarketRegimeDetector:
         tr1 = high - low
         tr2 = (high - prev_close).abs()
         tr3 = (low - prev_close).abs()
-        true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+        true_range = np.fmax(np.fmax(tr1, tr2), tr3)
 
         # Wilder's smoothing (exponential with alpha=1/period)
         alpha = 1.0 / period
@@ -726,3 +866,8 @@ class MarketRegimeDetector:
             timestamp=datetime.now(timezone.utc),
             analysis_details={"reason": reason},
         )
+
+
+def _or_zero(value: float) -> float:
+    """Replace NaN with 0.0 for analysis_details."""
+    return float(value) if not pd.isna(value) else 0.0
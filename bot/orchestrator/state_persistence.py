@@ -3,9 +3,21 @@ State serialization / deserialization for trading engines.
 
 Converts in-memory engine state to JSON strings for DB persistence
 and restores engine state from saved snapshots.
+
+``StateTracker`` keeps saves incremental: each snapshot section has a cheap
+probe (a tuple of the raw fields it serializes), and a section is only
+re-serialized when its probe changed or it was marked dirty, and only
+written when its encoded payload differs from the last one saved.
+Sections can be stored as plain JSON or zlib-compressed JSON (``"zlib"``
+encoding, base64 text so the columns stay ``Text``).
 """
 
+import base64
+import hashlib
 import json
+import zlib
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Any
@@ -28,6 +40,33 @@ class DecimalEncoder(json.JSONEncoder):
         return super().default(o)
 
 
+# ---------------------------------------------------------------------------
+# Encoding
+# ---------------------------------------------------------------------------
+
+STATE_ENCODINGS = ("json", "zlib")
+
+# Marks a zlib-compressed, base64-encoded JSON section
+ZLIB_PREFIX = "zlib:"
+
+
+def encode_state(json_str: str | None, encoding: str = "json") -> str | None:
+    """Encode a serialized section for storage."""
+    if json_str is None or encoding == "json":
+        return json_str
+    if encoding == "zlib":
+        packed = zlib.compress(json_str.encode(), 6)
+        return ZLIB_PREFIX + base64.b64encode(packed).decode("ascii")
+    raise ValueError(f"Unknown state encoding {encoding!r}, expected one of {STATE_ENCODINGS}")
+
+
+def decode_state(stored: str) -> str:
+    """Inverse of ``encode_state``; plain JSON passes through."""
+    if stored.startswith(ZLIB_PREFIX):
+        return zlib.decompress(base64.b64decode(stored[len(ZLIB_PREFIX) :])).decode()
+    return stored
+
+
 # ---------------------------------------------------------------------------
 # Grid Engine
 # ---------------------------------------------------------------------------
@@ -66,7 +105,7 @@ def deserialize_grid_state(grid_engine: Any, json_str: str | None) -> bool:
     try:
         from bot.core.grid_engine import GridOrder
 
-        state = json.loads(json_str)
+        state = json.loads(decode_state(json_str))
         grid_engine.active_orders.clear()
         for order_id, od in state.get("active_orders", {}).items():
             order = GridOrder(
@@ -139,7 +178,7 @@ def deserialize_dca_state(dca_engine: Any, json_str: str | None) -> bool:
     try:
         from bot.core.dca_engine import DCAPosition
 
-        state = json.loads(json_str)
+        state = json.loads(decode_state(json_str))
 
         pos_data = state.get("position")
         if pos_data:
@@ -208,7 +247,7 @@ def deserialize_risk_state(risk_manager: Any, json_str: str | None) -> bool:
         return False
 
     try:
-        state = json.loads(json_str)
+        state = json.loads(decode_state(json_str))
 
         ib = state.get("initial_balance")
         if ib is not None:
@@ -271,7 +310,7 @@ def deserialize_trend_state(strategy: Any, json_str: str | None) -> bool:
         return False
 
     try:
-        state = json.loads(json_str)
+        state = json.loads(decode_state(json_str))
         rm.current_capital = Decimal(state.get("current_capital", str(rm.current_capital)))
         rm.consecutive_losses = state.get("consecutive_losses", 0)
         rm.daily_pnl = Decimal(state.get("daily_pnl", "0"))
@@ -335,7 +374,7 @@ def deserialize_hybrid_state(hybrid_strategy: Any, json_str: str | None) -> bool
             StrategyRecommendation,
         )
 
-        state = json.loads(json_str)
+        state = json.loads(decode_state(json_str))
 
         hybrid_strategy._mode = HybridMode(state["mode"])
         hybrid_strategy._mode_since = datetime.fromisoformat(state["mode_since"])
@@ -363,3 +402,222 @@ def deserialize_hybrid_state(hybrid_strategy: Any, json_str: str | None) -> bool
     except Exception as e:
         logger.error("hybrid_state_restore_failed", error=str(e))
         return False
+
+
+# ---------------------------------------------------------------------------
+# Incremental snapshots
+# ---------------------------------------------------------------------------
+
+
+def probe_grid_state(grid_engine: Any) -> Any:
+    """Raw fields behind ``serialize_grid_state``, without string conversion."""
+    if grid_engine is None:
+        return None
+    orders = tuple(
+        (key, o.level, o.price, o.amount, o.side, o.order_id, o.filled)
+        for key, o in grid_engine.active_orders.items()
+    )
+    return (orders, grid_engine.total_profit, grid_engine.buy_count, grid_engine.sell_count)
+
+
+def probe_dca_state(dca_engine: Any) -> Any:
+    if dca_engine is None:
+        return None
+    pos = dca_engine.position
+    position = (
+        None
+        if pos is None
+        else (
+            pos.symbol,
+            pos.entry_price,
+            pos.amount,
+            pos.step_number,
+            pos.total_cost,
+            pos.average_entry_price,
+        )
+    )
+    return (
+        position,
+        dca_engine.last_buy_price,
+        dca_engine.highest_price_since_entry,
+        dca_engine.total_dca_steps,
+        dca_engine.total_invested,
+        dca_engine.realized_profit,
+    )
+
+
+def probe_risk_state(risk_manager: Any) -> Any:
+    if risk_manager is None:
+        return None
+    rm = risk_manager
+    return (
+        rm.initial_balance,
+        rm.current_balance,
+        rm.peak_balance,
+        rm.daily_loss,
+        rm.is_halted,
+        rm.halt_reason,
+        rm.total_trades,
+        rm.rejected_trades,
+        rm.stop_loss_triggers,
+    )
+
+
+def probe_trend_state(strategy: Any) -> Any:
+    rm = getattr(strategy, "risk_manager", None)
+    if rm is None:
+        return None
+    return (rm.current_capital, rm.consecutive_losses, rm.daily_pnl, rm.daily_trades)
+
+
+def probe_hybrid_state(hybrid_strategy: Any) -> Any:
+    if hybrid_strategy is None:
+        return None
+    h = hybrid_strategy
+    detector = getattr(h, "_regime_detector", None)
+    regime = (
+        None
+        if detector is None
+        else (detector._current_regime, detector._current_strategy, detector._evaluation_count)
+    )
+    return (
+        h._mode,
+        h._mode_since,
+        h._total_transitions,
+        h._grid_to_dca_count,
+        h._dca_to_grid_count,
+        h._last_transition,
+        regime,
+    )
+
+
+# Snapshot column -> (serializer, probe)
+STATE_SECTIONS: dict[str, tuple[Callable[[Any], str | None], Callable[[Any], Any]]] = {
+    "grid_state": (serialize_grid_state, probe_grid_state),
+    "dca_state": (serialize_dca_state, probe_dca_state),
+    "risk_state": (serialize_risk_state, probe_risk_state),
+    "trend_state": (serialize_trend_state, probe_trend_state),
+    "hybrid_state": (serialize_hybrid_state, probe_hybrid_state),
+}
+
+
+@dataclass
+class StateSaveStats:
+    """Counters for one bot's snapshot saves."""
+
+    saves: int = 0
+    unchanged: int = 0
+    sections_serialized: int = 0
+    sections_written: int = 0
+    bytes_written: int = 0
+    last_bytes: int = 0
+    last_save_seconds: float = 0.0
+    max_save_seconds: float = 0.0
+    total_save_seconds: float = 0.0
+
+    @property
+    def avg_save_seconds(self) -> float:
+        return self.total_save_seconds / self.saves if self.saves else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            **asdict(self),
+            "last_save_seconds": round(self.last_save_seconds, 6),
+            "max_save_seconds": round(self.max_save_seconds, 6),
+            "total_save_seconds": round(self.total_save_seconds, 6),
+            "avg_save_seconds": round(self.avg_save_seconds, 6),
+        }
+
+
+class StateTracker:
+    """
+    Dirty tracking for ``BotStateSnapshot`` sections.
+
+    ``collect`` returns only the sections whose content changed since the
+    last ``commit``; a failed write is simply not committed, so its
+    sections are collected again next time.
+
+    Usage:
+        changes = tracker.collect({"grid_state": grid_engine, ...})
+        if changes:
+            await db.save_state_snapshot(snapshot, sections=list(changes))
+        tracker.commit(elapsed)
+    """
+
+    def __init__(self, encoding: str = "json") -> None:
+        if encoding not in STATE_ENCODINGS:
+            raise ValueError(
+                f"Unknown state encoding {encoding!r}, expected one of {STATE_ENCODINGS}"
+            )
+        self.encoding = encoding
+        self.stats = StateSaveStats()
+        self._probes: dict[str, Any] = {}
+        self._digests: dict[str, bytes] = {}
+        self._dirty: set[str] = set(STATE_SECTIONS)
+        self._pending: dict[str, tuple[Any, bytes]] = {}
+        self._pending_written = 0
+        self._pending_bytes = 0
+
+    def mark_dirty(self, *sections: str) -> None:
+        """Force re-serialization of ``sections`` (all when none given) on the next collect."""
+        self._dirty.update(sections or STATE_SECTIONS)
+
+    def reset(self) -> None:
+        """Forget what was saved, e.g. after the snapshot row was deleted."""
+        self._probes.clear()
+        self._digests.clear()
+        self._dirty = set(STATE_SECTIONS)
+
+    def collect(self, sources: dict[str, Any], force: bool = False) -> dict[str, str | None]:
+        """
+        Encoded payloads of the sections that changed.
+
+        Args:
+            sources: Snapshot column -> engine object it is serialized from.
+            force: Ignore probes and re-serialize every section.
+        """
+        changes: dict[str, str | None] = {}
+        self._pending = {}
+        self._pending_written = 0
+        self._pending_bytes = 0
+        for section, source in sources.items():
+            serialize, probe = STATE_SECTIONS[section]
+            probe_value = probe(source)
+            if (
+                not force
+                and section not in self._dirty
+                and section in self._probes
+                and self._probes[section] == probe_value
+            ):
+                continue
+            payload = encode_state(serialize(source), self.encoding)
+            self.stats.sections_serialized += 1
+            raw = b"" if payload is None else payload.encode()
+            digest = hashlib.blake2b(raw, digest_size=16).digest()
+            self._pending[section] = (probe_value, digest)
+            if section in self._digests and self._digests[section] == digest:
+                continue
+            changes[section] = payload
+            self._pending_bytes += len(raw)
+        self._pending_written = len(changes)
+        return changes
+
+    def commit(self, elapsed: float) -> None:
+        """Record that the last ``collect`` was saved, taking ``elapsed`` seconds."""
+        for section, (probe_value, digest) in self._pending.items():
+            self._probes[section] = probe_value
+            self._digests[section] = digest
+            self._dirty.discard(section)
+        stats = self.stats
+        stats.saves += 1
+        if not self._pending_written:
+            stats.unchanged += 1
+        stats.sections_written += self._pending_written
+        stats.bytes_written += self._pending_bytes
+        stats.last_bytes = self._pending_bytes
+        stats.last_save_seconds = elapsed
+        stats.max_save_seconds = max(stats.max_save_seconds, elapsed)
+        stats.total_save_seconds += elapsed
+        self._pending = {}
+        self._pending_written = 0
+        self._pending_bytes = 0
@@ -4,11 +4,15 @@ Replay exchange client — drop-in replacement for ``ByBitDirectClient``.
 Fed with a list of historical OHLCV candles and a ``SimulatedClock``, it
 simulates an exchange: ticker prices, order placement/cancellation, limit
 order fill matching, and balance management.
+
+Higher-timeframe bars are maintained incrementally (closed bars plus the
+forming bar) and open limit orders are kept in price-sorted books, so
+``fetch_ohlcv`` costs O(limit) and matching only touches crossed orders.
 """
 
 from __future__ import annotations
 
-import uuid
+import bisect
 from decimal import Decimal
 from typing import Any
 
@@ -55,6 +59,10 @@ class ReplayExchangeClient:
 
         # Orders
         self._open_orders: dict[str, dict] = {}
+        # Price-sorted books of open limit orders: (price, seq, order_id, amount)
+        self._buy_book: list[tuple[Decimal, int, str, Decimal]] = []
+        self._sell_book: list[tuple[Decimal, int, str, Decimal]] = []
+        self._book_entries: dict[str, tuple[Decimal, int, str, Decimal]] = {}
         self._order_history: dict[str, dict] = {}
         self._order_counter = 0
         self._fill_log: list[dict] = []
@@ -62,6 +70,9 @@ class ReplayExchangeClient:
         # Candle index (cached)
         self._last_candle_idx = 0
 
+        # Aggregated bar buffers keyed by raw candles per bar
+        self._bar_buffers: dict[int, _BarBuffer] = {}
+
         # Statistics
         self._request_count = 0
         self._initialized = False
@@ -100,30 +111,52 @@ class ReplayExchangeClient:
     # =====================================================================
 
     def _match_limit_orders(self) -> None:
-        """Check all open limit orders against the current candle's high/low."""
+        """Fill open limit orders crossed by the current candle's high/low."""
+        if not self._book_entries:
+            return
+
         candle = self._current_candle()
         low = Decimal(str(candle["low"]))
         high = Decimal(str(candle["high"]))
 
-        filled_ids = []
-        for order_id, order in self._open_orders.items():
-            if order["type"] != "limit":
-                continue
-
-            price = Decimal(str(order["price"]))
-            amount = Decimal(str(order["amount"]))
-
-            if order["side"] == "buy" and low <= price:
-                self._fill_order(order_id, order, price, amount)
-                filled_ids.append(order_id)
-            elif order["side"] == "sell" and high >= price:
-                self._fill_order(order_id, order, price, amount)
-                filled_ids.append(order_id)
+        # Buys with price >= low form the top of the buy book, sells with
+        # price <= high the bottom of the sell book
+        buy_idx = bisect.bisect_left(self._buy_book, (low,))
+        sell_idx = bisect.bisect_right(self._sell_book, (high, float("inf")))
+        if buy_idx == len(self._buy_book) and sell_idx == 0:
+            return
+
+        crossed = self._buy_book[buy_idx:] + self._sell_book[:sell_idx]
+        del self._buy_book[buy_idx:]
+        del self._sell_book[:sell_idx]
+
+        # Fill in placement order, as a scan over all open orders would
+        crossed.sort(key=lambda entry: entry[1])
+        for price, _seq, order_id, amount in crossed:
+            del self._book_entries[order_id]
+            order = self._open_orders.pop(order_id)
+            self._fill_order(order_id, order, price, amount)
+            self._order_history[order_id] = order
 
-        for oid in filled_ids:
-            filled_order = self._open_orders.pop(oid)
-            filled_order["status"] = "closed"
-            self._order_history[oid] = filled_order
+    def _add_to_book(self, order_id: str, order: dict) -> None:
+        entry = (
+            Decimal(str(order["price"])),
+            self._order_counter,
+            order_id,
+            Decimal(str(order["amount"])),
+        )
+        book = self._buy_book if order["side"] == "buy" else self._sell_book
+        bisect.insort(book, entry)
+        self._book_entries[order_id] = entry
+
+    def _remove_from_book(self, order_id: str, side: str) -> None:
+        entry = self._book_entries.pop(order_id, None)
+        if entry is None:
+            return
+        book = self._buy_book if side == "buy" else self._sell_book
+        idx = bisect.bisect_left(book, entry)
+        if idx < len(book) and book[idx] == entry:
+            del book[idx]
 
     def _fill_order(
         self,
@@ -327,6 +360,7 @@ class ReplayExchangeClient:
                 "timestamp": int(self._clock.current_time * 1000),
             }
             self._open_orders[order_id] = order
+            self._add_to_book(order_id, order)
 
             # Check if it fills immediately against current candle
             self._match_limit_orders()
@@ -345,6 +379,7 @@ class ReplayExchangeClient:
         self._request_count += 1
         order = self._open_orders.pop(order_id, None)
         if order:
+            self._remove_from_book(order_id, order["side"])
             # Release reserved funds
             price_d = Decimal(str(order["price"]))
             amount_d = Decimal(str(order["amount"]))
@@ -405,8 +440,9 @@ class ReplayExchangeClient:
         """
         Return candle data from the historical feed.
 
-        Timeframe aggregation: the raw data is 5-minute candles.
-        For larger timeframes we aggregate on the fly.
+        Timeframe aggregation: the raw data is 5-minute candles. Larger
+        timeframes group consecutive raw candles from the start of the feed;
+        the last bar is the one still forming at the current clock time.
         """
         self._request_count += 1
         current_idx = self._current_candle_index()
@@ -417,36 +453,18 @@ class ReplayExchangeClient:
 
         effective_limit = limit or 100
 
-        # Slice raw candles up to current time
-        raw = self._candles[: current_idx + 1]
-
         if raw_per_bar == 1:
             # No aggregation needed
-            raw = raw[-effective_limit:]
+            start = max(0, current_idx + 1 - effective_limit)
             return [
                 [c["timestamp"], c["open"], c["high"], c["low"], c["close"], c["volume"]]
-                for c in raw
-            ]
-
-        # Aggregate
-        bars: list[list] = []
-        # Work backwards from end, group into chunks of raw_per_bar
-        start = len(raw) - (len(raw) % raw_per_bar) if len(raw) % raw_per_bar != 0 else len(raw)
-        for i in range(0, len(raw), raw_per_bar):
-            chunk = raw[i: i + raw_per_bar]
-            if not chunk:
-                continue
-            bar = [
-                chunk[0]["timestamp"],
-                chunk[0]["open"],
-                max(c["high"] for c in chunk),
-                min(c["low"] for c in chunk),
-                chunk[-1]["close"],
-                sum(c["volume"] for c in chunk),
+                for c in self._candles[start: current_idx + 1]
             ]
-            bars.append(bar)
 
-        return bars[-effective_limit:]
+        buffer = self._bar_buffers.get(raw_per_bar)
+        if buffer is None:
+            buffer = self._bar_buffers[raw_per_bar] = _BarBuffer(self._candles, raw_per_bar)
+        return buffer.tail(current_idx + 1, effective_limit)
 
     # -- markets ----------------------------------------------------------
 
@@ -488,6 +506,64 @@ class ReplayExchangeClient:
         }
 
 
+class _BarBuffer:
+    """
+    Incrementally aggregated bars for one timeframe.
+
+    Bar ``j`` covers raw candles ``[j * n, (j + 1) * n)``. Closed bars are
+    appended once as the replay advances; the forming bar is extended
+    candle by candle, so each call costs O(new candles + limit).
+    """
+
+    def __init__(self, candles: list[dict], raw_per_bar: int) -> None:
+        self._candles = candles
+        self._n = raw_per_bar
+        self._closed: list[list] = []
+        self._forming: list | None = None
+        self._forming_index = -1  # bar index of the forming bar
+        self._forming_upto = 0  # raw candles folded into the forming bar
+
+    def _extend(self, bar: list, start: int, stop: int) -> None:
+        for c in self._candles[start:stop]:
+            if c["high"] > bar[2]:
+                bar[2] = c["high"]
+            if c["low"] < bar[3]:
+                bar[3] = c["low"]
+            bar[4] = c["close"]
+            bar[5] += c["volume"]
+
+    def _bar(self, index: int, count: int) -> list:
+        """Bar ``index`` over its first ``count`` raw candles, reusing the forming bar."""
+        start = index * self._n
+        if self._forming_index != index:
+            c0 = self._candles[start]
+            self._forming = [
+                c0["timestamp"], c0["open"], c0["high"], c0["low"], c0["close"], c0["volume"],
+            ]
+            self._forming_index = index
+            self._forming_upto = 1
+        assert self._forming is not None
+        if self._forming_upto < count:
+            self._extend(self._forming, start + self._forming_upto, start + count)
+            self._forming_upto = count
+        return self._forming
+
+    def tail(self, total: int, limit: int) -> list[list]:
+        """Return the last ``limit`` bars over the first ``total`` raw candles."""
+        full, partial = divmod(total, self._n)
+        closed = self._closed
+        while len(closed) < full:
+            closed.append(self._bar(len(closed), self._n))
+            self._forming_index = -1
+
+        if not partial:
+            return [list(b) for b in closed[-limit:]]
+
+        forming = self._bar(full, partial)
+        head = closed[-(limit - 1):] if limit > 1 else []
+        return [list(b) for b in head] + [list(forming)]
+
+
 def _timeframe_to_minutes(tf: str) -> int:
     """Convert a timeframe string like '1h', '15m', '1d' to minutes."""
     mapping = {
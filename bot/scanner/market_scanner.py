@@ -4,6 +4,15 @@ Periodically fetches OHLCV and ticker data for a configurable list of
 trading pairs, runs each through ``MarketRegimeDetector.analyze()``, and
 filters by minimum 24h volume, maximum spread, and minimum liquidity.
 
+Two modes:
+
+- ``sequential`` — ticker, OHLCV and regime detection one pair at a time,
+  with ``request_delay_seconds`` between pairs.
+- ``bulk`` — one ``fetch_tickers`` call for the whole universe, filters
+  applied as array masks, OHLCV for survivors fetched concurrently
+  (``max_concurrency``) under a token bucket, and indicators for all
+  survivors computed in one ``MarketRegimeDetector.snapshot_batch`` pass.
+
 Usage::
 
     scanner = MarketScanner(exchange_client, config)
@@ -15,14 +24,19 @@ Usage::
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from bot.api.exceptions import NotSupportedError
+from bot.api.rate_limiter import TokenBucket
 from bot.orchestrator.market_regime import (
+    IndicatorSnapshot,
     MarketRegime,
     MarketRegimeDetector,
     RecommendedStrategy,
@@ -47,6 +61,10 @@ class ScannerConfig:
     max_spread_pct: float = 0.5
     min_liquidity_usdt: float = 50_000.0
     request_delay_seconds: float = 0.2
+    mode: str = "sequential"
+    max_concurrency: int = 16
+    ohlcv_requests_per_second: float = 20.0
+    ohlcv_burst: int = 20
 
 
 @dataclass
@@ -81,9 +99,12 @@ class MarketScanner:
     """Scan multiple trading pairs, classify regimes, filter by quality.
 
     Args:
-        exchange: Exchange client with ``fetch_ticker`` and ``fetch_ohlcv``.
+        exchange: Exchange client (or shared ``MarketDataFeed``) with
+            ``fetch_ticker`` and ``fetch_ohlcv``.
         config: Scanner configuration.
         detector: Optional pre-configured regime detector (uses default if None).
+        rate_limiter: Token bucket for bulk-mode OHLCV requests (built from
+            the config's rate and burst if None).
     """
 
     def __init__(
@@ -91,10 +112,15 @@ class MarketScanner:
         exchange: Any,
         config: ScannerConfig | None = None,
         detector: MarketRegimeDetector | None = None,
+        rate_limiter: TokenBucket | None = None,
     ) -> None:
         self.exchange = exchange
         self.config = config or ScannerConfig()
         self.detector = detector or MarketRegimeDetector()
+        self.rate_limiter = rate_limiter or TokenBucket(
+            rate=self.config.ohlcv_requests_per_second,
+            capacity=self.config.ohlcv_burst,
+        )
         self._last_results: list[ScanResult] = []
 
     @property
@@ -114,8 +140,29 @@ class MarketScanner:
         Returns:
             List of ScanResult for pairs that pass all filters.
         """
+        if self.config.mode == "bulk":
+            results = await self._scan_bulk()
+        else:
+            results = await self._scan_sequential()
+
+        results.sort(key=lambda r: r.confidence, reverse=True)
+        self._last_results = results
+
+        logger.info(
+            "scan_completed",
+            mode=self.config.mode,
+            total_pairs=len(self.config.pairs),
+            passed_filters=len(results),
+            top_pair=results[0].symbol if results else None,
+        )
+
+        return results
+
+    async def _scan_sequential(self) -> list[ScanResult]:
+        """Scan pairs one at a time with ``request_delay_seconds`` between them."""
         results: list[ScanResult] = []
-        delay = self.config.request_delay_seconds
+        # Pydantic ScannerConfig (auto_trade.scanner) has no request delay
+        delay = getattr(self.config, "request_delay_seconds", 0.0)
 
         for symbol in self.config.pairs:
             try:
@@ -128,18 +175,142 @@ class MarketScanner:
             if delay > 0:
                 await asyncio.sleep(delay)
 
-        results.sort(key=lambda r: r.confidence, reverse=True)
-        self._last_results = results
+        return results
 
-        logger.info(
-            "scan_completed",
-            total_pairs=len(self.config.pairs),
-            passed_filters=len(results),
-            top_pair=results[0].symbol if results else None,
+    async def _scan_bulk(self) -> list[ScanResult]:
+        """Scan the whole universe with bulk tickers and batched regime detection."""
+        pairs = list(self.config.pairs)
+        try:
+            tickers = await self._fetch_tickers(pairs)
+        except Exception as e:
+            logger.warning("scan_tickers_failed", pairs=len(pairs), error=str(e))
+            return []
+
+        symbols = [s for s in pairs if tickers.get(s)]
+        volume, spread, liquidity = self._ticker_metrics([tickers[s] for s in symbols])
+        volume_ok = volume >= self.config.min_volume_usdt
+        spread_ok = spread <= self.config.max_spread_pct
+        liquidity_ok = liquidity >= self.config.min_liquidity_usdt
+        passed = np.flatnonzero(volume_ok & spread_ok & liquidity_ok)
+
+        logger.debug(
+            "scan_bulk_filtered",
+            tickers=len(symbols),
+            missing_ticker=len(pairs) - len(symbols),
+            low_volume=int(np.count_nonzero(~volume_ok)),
+            high_spread=int(np.count_nonzero(~spread_ok)),
+            low_liquidity=int(np.count_nonzero(~liquidity_ok)),
+            passed=len(passed),
         )
 
+        frames = await self._fetch_frames([symbols[i] for i in passed])
+        analyses = self._analyze_frames(frames)
+
+        results: list[ScanResult] = []
+        for i in passed:
+            symbol = symbols[i]
+            analysis = analyses.get(symbol)
+            if analysis is None:
+                continue
+            if analysis.regime == MarketRegime.UNKNOWN:
+                logger.debug("scan_unknown_regime", symbol=symbol)
+                continue
+            results.append(
+                ScanResult(
+                    symbol=symbol,
+                    regime=analysis.regime,
+                    recommended_strategy=analysis.recommended_strategy,
+                    confidence=analysis.confidence,
+                    volume_24h=float(volume[i]),
+                    spread_pct=float(spread[i]),
+                    liquidity_usdt=float(liquidity[i]),
+                    regime_analysis=analysis,
+                )
+            )
         return results
 
+    async def _fetch_tickers(self, symbols: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch tickers in one bulk call, or per symbol if the exchange lacks one."""
+        fetch_tickers = getattr(self.exchange, "fetch_tickers", None)
+        if fetch_tickers is not None:
+            try:
+                bulk: dict[str, dict[str, Any]] = await fetch_tickers(symbols)
+                return bulk
+            except (AttributeError, NotImplementedError, NotSupportedError):
+                # A MarketDataFeed over a client without bulk tickers, or an
+                # exchange whose ccxt driver has no fetchTickers
+                logger.debug("scan_bulk_tickers_unsupported")
+
+        async def load(symbol: str) -> dict[str, Any] | None:
+            await self.rate_limiter.acquire()
+            try:
+                ticker: dict[str, Any] = await self.exchange.fetch_ticker(symbol)
+                return ticker
+            except Exception as e:
+                logger.warning("scan_pair_failed", symbol=symbol, error=str(e))
+                return None
+
+        tickers = await self._gather_bounded(load, symbols)
+        return {s: t for s, t in zip(symbols, tickers, strict=True) if t is not None}
+
+    async def _fetch_frames(self, symbols: list[str]) -> dict[str, pd.DataFrame]:
+        """Fetch OHLCV for ``symbols`` concurrently under the rate limiter."""
+
+        async def load(symbol: str) -> pd.DataFrame | None:
+            await self.rate_limiter.acquire()
+            try:
+                ohlcv_raw = await self.exchange.fetch_ohlcv(
+                    symbol,
+                    timeframe=self.config.timeframe,
+                    limit=self.config.ohlcv_limit,
+                )
+            except Exception as e:
+                logger.warning("scan_pair_failed", symbol=symbol, error=str(e))
+                return None
+            df = self._ohlcv_to_dataframe(ohlcv_raw)
+            if df.empty:
+                logger.warning("scan_empty_ohlcv", symbol=symbol)
+                return None
+            return df
+
+        frames = await self._gather_bounded(load, symbols)
+        return {s: df for s, df in zip(symbols, frames, strict=True) if df is not None}
+
+    async def _gather_bounded(self, load: Any, symbols: list[str]) -> list[Any]:
+        """Run ``load(symbol)`` for every symbol with at most ``max_concurrency`` in flight."""
+        semaphore = asyncio.Semaphore(max(1, self.config.max_concurrency))
+
+        async def bounded(symbol: str) -> Any:
+            async with semaphore:
+                return await load(symbol)
+
+        return await asyncio.gather(*(bounded(s) for s in symbols))
+
+    def _analyze_frames(self, frames: dict[str, pd.DataFrame]) -> dict[str, RegimeAnalysis]:
+        """Classify all frames, computing indicators once per group of equal length.
+
+        Frames shorter than the detector's minimum are left out (the
+        sequential path would classify them UNKNOWN and drop them).
+        """
+        by_length: dict[int, list[str]] = {}
+        for symbol, df in frames.items():
+            by_length.setdefault(len(df), []).append(symbol)
+
+        snapshots: dict[str, IndicatorSnapshot] = {}
+        for bars, symbols in by_length.items():
+            if bars < self.detector.min_rows:
+                logger.debug("scan_insufficient_ohlcv", pairs=len(symbols), bars=bars)
+                continue
+            batch = self.detector.snapshot_batch([frames[s] for s in symbols])
+            snapshots.update(zip(symbols, batch, strict=True))
+
+        # Classify in scan order so the detector's hysteresis sees pairs as before
+        return {
+            symbol: self.detector.analyze_snapshot(snapshots[symbol], data_points=len(df))
+            for symbol, df in frames.items()
+            if symbol in snapshots
+        }
+
     async def _scan_pair(self, symbol: str) -> ScanResult | None:
         """Scan a single pair: fetch data, filter, classify regime.
 
@@ -264,6 +435,54 @@ class MarketScanner:
             return float(Decimal(str(quote_vol)) / 24)
         return 0.0
 
+    @staticmethod
+    def _ticker_metrics(
+        tickers: Sequence[dict[str, Any]],
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Volume, spread and liquidity for many tickers as arrays.
+
+        Same rules as ``_extract_volume_24h``, ``_calculate_spread`` and
+        ``_extract_liquidity``, evaluated across all tickers at once.
+        """
+
+        def column(key: str) -> np.ndarray:
+            return np.array(
+                [np.nan if (v := t.get(key)) is None else float(v) for t in tickers],
+                dtype=float,
+            )
+
+        def truthy(values: np.ndarray) -> np.ndarray:
+            mask: np.ndarray = ~np.isnan(values) & (values != 0)
+            return mask
+
+        quote_vol = column("quoteVolume")
+        base_vol = column("baseVolume")
+        last = column("last")
+        bid = column("bid")
+        ask = column("ask")
+        bid_vol = column("bidVolume")
+        ask_vol = column("askVolume")
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            volume = np.where(
+                ~np.isnan(quote_vol),
+                quote_vol,
+                np.where(truthy(base_vol) & truthy(last), base_vol * last, 0.0),
+            )
+
+            quoted = truthy(bid) & truthy(ask) & (bid > 0) & (ask > 0)
+            mid = (bid + ask) / 2
+            spread = np.where(quoted, (ask - bid) / mid * 100, 0.0)
+
+            has_depth = truthy(bid_vol) & truthy(ask_vol) & truthy(bid) & truthy(ask)
+            liquidity = np.where(
+                has_depth,
+                bid_vol * bid + ask_vol * ask,
+                np.where(truthy(quote_vol), quote_vol / 24, 0.0),
+            )
+
+        return volume, spread, liquidity
+
     @staticmethod
     def _ohlcv_to_dataframe(ohlcv_raw: list[list]) -> pd.DataFrame:
         """Convert raw OHLCV list to DataFrame expected by MarketRegimeDetector."""
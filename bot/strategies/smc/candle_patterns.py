@@ -0,0 +1,273 @@
+"""
+Vectorized Candle Pattern Detection
+
+Computes engulfing, pin bar and inside bar masks together with their 0-100
+quality scores for a whole OHLCV window in a handful of NumPy operations.
+The scores use the same formulas, applied in the same order, as the
+per-candle checks they replace, so the same patterns come out.
+
+IncrementalPatternDetector re-evaluates only bars that were appended (or
+changed) since the previous window — the common case when a backtest
+re-analyzes a sliding window every few bars.
+"""
+
+from dataclasses import dataclass, fields
+
+import numpy as np
+
+# Patterns scoring below this are discarded
+MIN_PATTERN_QUALITY = 50.0
+
+# Column order of the ``bars`` arrays (volume is optional)
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+@dataclass
+class PatternMasks:
+    """
+    Per-bar pattern hits for one window.
+
+    Direction arrays hold +1 (bullish), -1 (bearish) or 0 (no pattern);
+    quality arrays hold the 0-100 score of the hit (0 where there is none).
+    """
+
+    engulfing: np.ndarray
+    engulfing_quality: np.ndarray
+    pin_bar: np.ndarray
+    pin_bar_quality: np.ndarray
+    inside_bar: np.ndarray
+    inside_bar_quality: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.engulfing)
+
+    def hits(self, name: str) -> np.ndarray:
+        """Positions of ``name`` patterns that pass MIN_PATTERN_QUALITY."""
+        direction = getattr(self, name)
+        quality = getattr(self, f"{name}_quality")
+        return np.flatnonzero((direction != 0) & (quality >= MIN_PATTERN_QUALITY))
+
+    def slice(self, start: int, stop: int | None = None) -> "PatternMasks":
+        return PatternMasks(*(getattr(self, f.name)[start:stop] for f in fields(self)))
+
+    @classmethod
+    def concat(cls, head: "PatternMasks", tail: "PatternMasks") -> "PatternMasks":
+        return cls(
+            *(np.concatenate([getattr(head, f.name), getattr(tail, f.name)]) for f in fields(cls))
+        )
+
+
+def detect_patterns(bars: np.ndarray) -> PatternMasks:
+    """
+    Detect all candle patterns in a window.
+
+    Args:
+        bars: float array of shape (n, 4) or (n, 5) with columns
+            open, high, low, close[, volume]
+
+    Returns:
+        PatternMasks for every bar in the window
+    """
+    open_, high, low, close = bars[:, 0], bars[:, 1], bars[:, 2], bars[:, 3]
+    volume = bars[:, 4] if bars.shape[1] > 4 else None
+
+    body = np.abs(close - open_)
+    candle_range = high - low
+    body_top = np.maximum(open_, close)
+    body_bottom = np.minimum(open_, close)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        engulfing, engulfing_quality = _engulfing(open_, close, volume, body, candle_range)
+        pin_bar, pin_bar_quality = _pin_bars(high, low, body, candle_range, body_top, body_bottom)
+        inside_bar, inside_bar_quality = _inside_bars(high, low, close, candle_range)
+
+    return PatternMasks(
+        engulfing, engulfing_quality, pin_bar, pin_bar_quality, inside_bar, inside_bar_quality
+    )
+
+
+def _directions(bullish: np.ndarray, bearish: np.ndarray) -> np.ndarray:
+    return bullish.astype(np.int8) - bearish.astype(np.int8)
+
+
+def _engulfing(
+    open_: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray | None,
+    body: np.ndarray,
+    candle_range: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Current body engulfs the previous body; bar 0 has no predecessor."""
+    n = len(close)
+    direction = np.zeros(n, dtype=np.int8)
+    quality = np.zeros(n)
+    if n < 2:
+        return direction, quality
+
+    prev_open, prev_close = open_[:-1], close[:-1]
+    curr_open, curr_close = open_[1:], close[1:]
+    curr_body, prev_body, curr_range = body[1:], body[:-1], candle_range[1:]
+
+    # Skip doji-like candles whose body is under 30% of the range
+    solid = ~(curr_body < curr_range * 0.3)
+    bullish = (
+        solid
+        & (prev_close < prev_open)
+        & (curr_close > curr_open)
+        & (curr_open <= prev_close)
+        & (curr_close >= prev_open)
+    )
+    bearish = (
+        solid
+        & ~bullish
+        & (prev_close > prev_open)
+        & (curr_close < curr_open)
+        & (curr_open >= prev_close)
+        & (curr_close <= prev_open)
+    )
+
+    # Body size ratio (0-40), body dominance (0-30), volume (0-30)
+    score = np.where(prev_body > 0, (np.minimum(curr_body / prev_body, 3.0) / 3.0) * 40, 0.0)
+    score = score + np.where(curr_range > 0, (curr_body / curr_range) * 30, 0.0)
+    if volume is not None:
+        prev_volume, curr_volume = volume[:-1], volume[1:]
+        score = score + np.where(
+            prev_volume > 0, (np.minimum(curr_volume / prev_volume, 2.0) / 2.0) * 30, 0.0
+        )
+
+    hit = bullish | bearish
+    direction[1:] = _directions(bullish, bearish)
+    quality[1:] = np.where(hit, np.minimum(100.0, score), 0.0)
+    return direction, quality
+
+
+def _pin_bars(
+    high: np.ndarray,
+    low: np.ndarray,
+    body: np.ndarray,
+    candle_range: np.ndarray,
+    body_top: np.ndarray,
+    body_bottom: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Long rejection wick with a small body at the opposite end."""
+    upper_wick = high - body_top
+    lower_wick = body_bottom - low
+
+    valid = candle_range != 0
+    small_body = body < candle_range * 0.4
+    bullish = (
+        valid & (lower_wick > candle_range * 0.6) & small_body & (upper_wick < candle_range * 0.2)
+    )
+    bearish = (
+        valid
+        & ~bullish
+        & (upper_wick > candle_range * 0.6)
+        & small_body
+        & (lower_wick < candle_range * 0.2)
+    )
+
+    # Wick/body ratio (0-40), wick dominance (0-40), body position (0-20)
+    wick = np.where(bullish, lower_wick, upper_wick)
+    score = np.where(body > 0, (np.minimum(wick / body, 5.0) / 5.0) * 40, 40.0)
+    score = score + (wick / candle_range) * 40
+    body_center = (body_top + body_bottom) / 2
+    position = np.where(
+        bullish, (body_center - low) / candle_range, (high - body_center) / candle_range
+    )
+    score = score + position * 20
+
+    hit = bullish | bearish
+    return _directions(bullish, bearish), np.where(hit, np.minimum(100.0, score), 0.0)
+
+
+def _inside_bars(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, candle_range: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Range contained in the previous (mother) bar; bias from close vs its midpoint."""
+    n = len(close)
+    direction = np.zeros(n, dtype=np.int8)
+    quality = np.zeros(n)
+    if n < 2:
+        return direction, quality
+
+    prev_high, prev_low = high[:-1], low[:-1]
+    inside = (high[1:] <= prev_high) & (low[1:] >= prev_low)
+    bullish = inside & (close[1:] > (prev_high + prev_low) / 2)
+    bearish = inside & ~bullish
+
+    # Base 50, compression (0-30), mother bar size vs a typical range of 1.0 (0-20)
+    prev_range, curr_range = candle_range[:-1], candle_range[1:]
+    score = 50.0 + (1.0 - curr_range / prev_range) * 30
+    score = score + (np.minimum(prev_range / 1.0, 2.0) / 2.0) * 20
+    score = np.where(prev_range == 0, 0.0, np.minimum(100.0, score))
+
+    direction[1:] = _directions(bullish, bearish)
+    quality[1:] = np.where(inside, score, 0.0)
+    return direction, quality
+
+
+class IncrementalPatternDetector:
+    """
+    Pattern detection over successive, overlapping windows.
+
+    Bars are matched to the previous window by index value and OHLCV
+    contents; matching bars reuse their earlier result and only the rest
+    (appended bars, or a still-forming last bar that changed) is evaluated.
+    Results always equal ``detect_patterns`` on the full window.
+    """
+
+    def __init__(self) -> None:
+        self._index: np.ndarray | None = None
+        self._bars: np.ndarray | None = None
+        self._masks: PatternMasks | None = None
+        self.bars_evaluated = 0
+        self.bars_reused = 0
+
+    def reset(self) -> None:
+        self._index = None
+        self._bars = None
+        self._masks = None
+
+    def update(self, index: np.ndarray, bars: np.ndarray) -> PatternMasks:
+        """
+        Detect patterns for a window, reusing results for bars seen last time.
+
+        Args:
+            index: per-bar keys (e.g. timestamps) in window order
+            bars: float array (n, 4|5) of open, high, low, close[, volume]
+
+        Returns:
+            PatternMasks for the full window
+        """
+        offset, reused = self._match(index, bars)
+
+        if reused == 0:
+            masks = detect_patterns(bars)
+        else:
+            # Re-evaluate from the last reused bar so the first new bar has its predecessor
+            tail = detect_patterns(bars[reused - 1 :]).slice(1)
+            masks = PatternMasks.concat(self._masks.slice(offset, offset + reused), tail)
+            # Bar 0 has no predecessor in this window
+            masks.engulfing[0] = masks.inside_bar[0] = 0
+            masks.engulfing_quality[0] = masks.inside_bar_quality[0] = 0.0
+
+        self.bars_reused += reused
+        self.bars_evaluated += len(bars) - reused
+        # Copies: callers may hand in views of a DataFrame they later modify
+        self._index, self._bars, self._masks = index.copy(), bars.copy(), masks
+        return masks
+
+    def _match(self, index: np.ndarray, bars: np.ndarray) -> tuple[int, int]:
+        """Return (position of index[0] in the previous window, number of reusable bars)."""
+        if self._index is None or not len(index) or self._bars.shape[1] != bars.shape[1]:
+            return 0, 0
+
+        offset = int(np.searchsorted(self._index, index[0]))
+        if offset >= len(self._index) or self._index[offset] != index[0]:
+            return 0, 0
+
+        overlap = min(len(self._index) - offset, len(index))
+        same = (self._index[offset : offset + overlap] == index[:overlap]) & np.all(
+            self._bars[offset : offset + overlap] == bars[:overlap], axis=1
+        )
+        return offset, overlap if same.all() else int(np.argmin(same))
@@ -36,6 +36,9 @@ class SMCConfig:
     join_consecutive_fvg: bool = False  # FVG: merge adjacent same-direction FVGs
     liquidity_range_percent: float = 0.01  # Liquidity: % range for grouping swing clusters
 
+    # Track structure/zones incrementally by bar timestamp (no FVG joining)
+    incremental_structure: bool = False
+
     # Risk Management
     risk_per_trade: Decimal = Decimal("0.02")  # 2% risk per trade
     min_risk_reward: Decimal = Decimal("2.5")  # Minimum R:R ratio
@@ -8,15 +8,19 @@ Detects and manages institutional order zones:
 - Zone strength scoring
 - Zone invalidation tracking
 
-Uses the smartmoneyconcepts library for OB/FVG/Liquidity detection.
+Uses the smartmoneyconcepts library for OB/FVG/Liquidity detection, or in
+incremental mode a StructureEngine that only processes newly appended bars.
 """
 
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 import smartmoneyconcepts.smc as smc
 
@@ -24,6 +28,7 @@ from bot.strategies.smc.market_structure import (
     MarketStructureAnalyzer,
     StructureEvent,
 )
+from bot.strategies.smc.structure_engine import OrderBlockRecord, StructureEngine
 from bot.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -156,6 +161,42 @@ class LiquidityZone:
     strength_score: float = 0.0
 
 
+class ZoneIntervalIndex:
+    """
+    Price-interval index over a zone list for overlap queries.
+
+    Zones are sorted by their low edge; a query only inspects zones whose low
+    lies within [low - widest zone, high], found by bisection. The index is a
+    snapshot of one list object at one length (see ``covers``).
+    """
+
+    def __init__(self, zones: list, bounds: Callable[[Any], tuple[Decimal, Decimal]]):
+        self.zones = zones
+        self.size = len(zones)
+
+        entries = []
+        for order, zone in enumerate(zones):
+            low, high = bounds(zone)
+            entries.append((low, high, order, zone))
+        entries.sort(key=lambda e: e[0])
+
+        self._entries = entries
+        self._lows = [e[0] for e in entries]
+        self._max_width = max((e[1] - e[0] for e in entries), default=Decimal("0"))
+
+    def covers(self, zones: list) -> bool:
+        """True if the index was built from this list and it has not grown or shrunk"""
+        return zones is self.zones and len(zones) == self.size
+
+    def overlapping(self, low: Decimal, high: Decimal) -> list:
+        """Zones with zone_low <= high and zone_high >= low, in list order"""
+        first = bisect_left(self._lows, low - self._max_width)
+        last = bisect_right(self._lows, high)
+        hits = [e for e in self._entries[first:last] if e[1] >= low]
+        hits.sort(key=lambda e: e[2])
+        return [e[3] for e in hits]
+
+
 class ConfluenceZoneAnalyzer:
     """
     Analyzes and manages confluence zones (Order Blocks, Fair Value Gaps, Liquidity)
@@ -171,6 +212,7 @@ class ConfluenceZoneAnalyzer:
         close_mitigation: bool = False,
         join_consecutive_fvg: bool = False,
         liquidity_range_percent: float = 0.01,
+        incremental: bool = False,
     ):
         """
         Initialize Confluence Zone Analyzer
@@ -182,7 +224,13 @@ class ConfluenceZoneAnalyzer:
             close_mitigation: If True, require close through OB for mitigation
             join_consecutive_fvg: If True, merge adjacent same-direction FVGs
             liquidity_range_percent: Percentage range for grouping swing clusters
+            incremental: Detect zones with a StructureEngine keyed by bar
+                timestamp, so repeated calls on a sliding window only process
+                the appended bars (FVG joining is not supported)
         """
+        if incremental and join_consecutive_fvg:
+            raise ValueError("join_consecutive_fvg is not supported with incremental=True")
+
         self.market_structure = market_structure
         self.timeframe = timeframe
         self.max_active_zones = max_active_zones
@@ -194,6 +242,23 @@ class ConfluenceZoneAnalyzer:
         self.fair_value_gaps: list[FairValueGap] = []
         self.liquidity_zones: list[LiquidityZone] = []
 
+        self.engine: Optional[StructureEngine] = (
+            StructureEngine(
+                swing_length=market_structure.swing_length,
+                close_break=market_structure.close_break,
+                close_mitigation=close_mitigation,
+                liquidity_range_percent=liquidity_range_percent,
+            )
+            if incremental
+            else None
+        )
+        # Incremental zones by bar timestamp
+        self._ob_by_ts: dict[pd.Timestamp, OrderBlock] = {}
+        self._fvg_by_ts: dict[pd.Timestamp, FairValueGap] = {}
+        self._liquidity_by_ts: dict[pd.Timestamp, LiquidityZone] = {}
+        self._window_start: int = 0
+        self._zone_indexes: dict[ZoneType, ZoneIntervalIndex] = {}
+
         # Log-spam suppression
         self._insufficient_data_count: int = 0
         self._liquidity_fail_count: int = 0
@@ -203,6 +268,7 @@ class ConfluenceZoneAnalyzer:
             timeframe=timeframe,
             max_zones=max_active_zones,
             close_mitigation=close_mitigation,
+            incremental=incremental,
         )
 
     @staticmethod
@@ -215,6 +281,12 @@ class ConfluenceZoneAnalyzer:
             ohlc["volume"] = df["volume"].astype(float)
         return ohlc
 
+    @staticmethod
+    def _frame_columns(frame: pd.DataFrame, names: tuple[str, ...]) -> dict[str, np.ndarray]:
+        """Column arrays in the frame-wide common dtype, as a row from .iloc would have."""
+        values = frame.to_numpy()
+        return {name: values[:, frame.columns.get_loc(name)] for name in names}
+
     def analyze(self, df: pd.DataFrame) -> dict:
         """
         Analyze price data for confluence zones
@@ -231,14 +303,17 @@ class ConfluenceZoneAnalyzer:
                 logger.warning("Insufficient data for zone analysis")
             return self.get_zones_summary()
 
-        # Detect Order Blocks from structure breaks
-        self._detect_order_blocks(df)
+        if self.engine is not None:
+            self._sync_engine_zones(df)
+        else:
+            # Detect Order Blocks from structure breaks
+            self._detect_order_blocks(df)
 
-        # Detect Fair Value Gaps
-        self._detect_fair_value_gaps(df)
+            # Detect Fair Value Gaps
+            self._detect_fair_value_gaps(df)
 
-        # Detect Liquidity Zones
-        self._detect_liquidity_zones(df)
+            # Detect Liquidity Zones
+            self._detect_liquidity_zones(df)
 
         # Update zone status (check invalidations)
         self._update_zone_status(df)
@@ -274,21 +349,22 @@ class ConfluenceZoneAnalyzer:
             logger.warning("OB detection failed", error=str(e))
             return
 
-        for i in range(len(ob_df)):
-            row = ob_df.iloc[i]
-            if pd.isna(row["OB"]):
-                continue
+        # Hash set of known OB rows instead of a scan of all OBs per row
+        known = {ob.index for ob in self.order_blocks}
+        columns = self._frame_columns(ob_df, ("OB", "Top", "Bottom", "OBVolume", "MitigatedIndex"))
 
+        for i in np.flatnonzero(ob_df["OB"].notna().to_numpy()).tolist():
             # Check if we already have an OB at this index
-            existing = any(ob.index == i for ob in self.order_blocks)
-            if existing:
+            if i in known:
                 continue
+            known.add(i)
 
-            is_bullish = row["OB"] == 1.0
-            top = Decimal(str(row["Top"]))
-            bottom = Decimal(str(row["Bottom"]))
-            ob_volume = float(row["OBVolume"]) if pd.notna(row["OBVolume"]) else 0.0
-            mitigated_idx = row["MitigatedIndex"] if pd.notna(row["MitigatedIndex"]) else None
+            is_bullish = columns["OB"][i] == 1.0
+            top = Decimal(str(columns["Top"][i]))
+            bottom = Decimal(str(columns["Bottom"][i]))
+            ob_volume = float(columns["OBVolume"][i]) if pd.notna(columns["OBVolume"][i]) else 0.0
+            mitigated = columns["MitigatedIndex"][i]
+            mitigated_idx = mitigated if pd.notna(mitigated) else None
 
             # Determine status: if mitigated at a valid future index, mark as invalidated
             status = ZoneStatus.ACTIVE
@@ -333,20 +409,20 @@ class ConfluenceZoneAnalyzer:
             logger.warning("FVG detection failed", error=str(e))
             return
 
-        for i in range(len(fvg_df)):
-            row = fvg_df.iloc[i]
-            if pd.isna(row["FVG"]):
-                continue
+        known = {fvg.candle2_index for fvg in self.fair_value_gaps}
+        columns = self._frame_columns(fvg_df, ("FVG", "Top", "Bottom", "MitigatedIndex"))
 
+        for i in np.flatnonzero(fvg_df["FVG"].notna().to_numpy()).tolist():
             # Check if we already have this FVG
-            existing = any(fvg.candle2_index == i for fvg in self.fair_value_gaps)
-            if existing:
+            if i in known:
                 continue
+            known.add(i)
 
-            is_bullish = row["FVG"] == 1.0
-            gap_high = Decimal(str(row["Top"]))
-            gap_low = Decimal(str(row["Bottom"]))
-            mitigated_idx = row["MitigatedIndex"] if pd.notna(row["MitigatedIndex"]) else None
+            is_bullish = columns["FVG"][i] == 1.0
+            gap_high = Decimal(str(columns["Top"][i]))
+            gap_low = Decimal(str(columns["Bottom"][i]))
+            mitigated = columns["MitigatedIndex"][i]
+            mitigated_idx = mitigated if pd.notna(mitigated) else None
 
             # Determine status
             status = ZoneStatus.ACTIVE
@@ -398,15 +474,15 @@ class ConfluenceZoneAnalyzer:
 
         self.liquidity_zones.clear()
 
-        for i in range(len(liq_df)):
-            row = liq_df.iloc[i]
-            if pd.isna(row["Liquidity"]):
-                continue
+        columns = self._frame_columns(liq_df, ("Liquidity", "Level", "End", "Swept"))
 
-            is_bullish = row["Liquidity"] == 1.0  # 1.0 = buy-side, -1.0 = sell-side
-            level = Decimal(str(row["Level"])) if pd.notna(row["Level"]) else Decimal("0")
-            end_index = int(row["End"]) if pd.notna(row["End"]) else i
-            swept = pd.notna(row["Swept"])
+        for i in np.flatnonzero(liq_df["Liquidity"].notna().to_numpy()).tolist():
+            is_bullish = columns["Liquidity"][i] == 1.0  # 1.0 = buy-side, -1.0 = sell-side
+            level = columns["Level"][i]
+            level = Decimal(str(level)) if pd.notna(level) else Decimal("0")
+            end = columns["End"][i]
+            end_index = int(end) if pd.notna(end) else i
+            swept = pd.notna(columns["Swept"][i])
 
             timestamp = (
                 df.index[i] if isinstance(df.index[i], pd.Timestamp) else pd.Timestamp(df.index[i])
@@ -430,6 +506,115 @@ class ConfluenceZoneAnalyzer:
             active=len([lz for lz in self.liquidity_zones if not lz.swept]),
         )
 
+    def _sync_engine_zones(self, df: pd.DataFrame) -> None:
+        """
+        Apply what the StructureEngine confirmed for the appended bars: new
+        OBs/FVGs are added once per timestamp, mitigations update their
+        status and liquidity pools inside the window are refreshed.
+        """
+        update = self.engine.update(df)
+        start = self.engine.window_start(len(df))
+        self._reindex_zones(df, start, update.rebuilt)
+
+        for record in update.order_blocks:
+            if record.position < start or record.timestamp in self._ob_by_ts:
+                continue
+            order_block = OrderBlock(
+                is_bullish=record.is_bullish,
+                high=Decimal(str(record.top)),
+                low=Decimal(str(record.bottom)),
+                open=Decimal(str(record.open)),
+                close=Decimal(str(record.close)),
+                index=record.position - start,
+                timestamp=record.timestamp,
+                timeframe=self.timeframe,
+                volume=record.volume,
+                status=(
+                    ZoneStatus.INVALIDATED if record.mitigated_position >= 0 else ZoneStatus.ACTIVE
+                ),
+            )
+            self.order_blocks.append(order_block)
+            self._ob_by_ts[record.timestamp] = order_block
+
+        for record in update.fair_value_gaps:
+            if record.position < start or record.timestamp in self._fvg_by_ts:
+                continue
+            index = record.position - start
+            fvg = FairValueGap(
+                is_bullish=record.is_bullish,
+                gap_high=Decimal(str(record.top)),
+                gap_low=Decimal(str(record.bottom)),
+                candle1_index=max(0, index - 1),
+                candle2_index=index,
+                candle3_index=index + 1,
+                timestamp=record.timestamp,
+                timeframe=self.timeframe,
+                status=ZoneStatus.FILLED if record.mitigated_position >= 0 else ZoneStatus.ACTIVE,
+            )
+            self.fair_value_gaps.append(fvg)
+            self._fvg_by_ts[record.timestamp] = fvg
+
+        for record in update.mitigated:
+            if isinstance(record, OrderBlockRecord):
+                order_block = self._ob_by_ts.get(record.timestamp)
+                if order_block is not None and order_block.status == ZoneStatus.ACTIVE:
+                    order_block.status = ZoneStatus.INVALIDATED
+                    order_block.invalidated_at = datetime.now()
+            else:
+                fvg = self._fvg_by_ts.get(record.timestamp)
+                if fvg is not None and fvg.status != ZoneStatus.FILLED:
+                    fvg.status = ZoneStatus.FILLED
+                    fvg.fill_percentage = 100.0
+                    fvg.filled_at = datetime.now()
+
+        for pool in self.engine.liquidity.values() if update.rebuilt else update.liquidity:
+            if pool.position < start:
+                continue
+            zone = self._liquidity_by_ts.get(pool.timestamp)
+            if zone is None:
+                zone = LiquidityZone(
+                    is_bullish=pool.is_bullish, timestamp=pool.timestamp, timeframe=self.timeframe
+                )
+                self._liquidity_by_ts[pool.timestamp] = zone
+            zone.level = Decimal(str(pool.level))
+            zone.index = pool.position - start
+            zone.end_index = pool.end_position - start
+            zone.swept = pool.swept_position >= 0
+
+        self._liquidity_by_ts = {
+            ts: zone for ts, zone in self._liquidity_by_ts.items() if zone.index >= 0
+        }
+        self.liquidity_zones = sorted(self._liquidity_by_ts.values(), key=lambda z: z.index)
+
+    def _reindex_zones(self, df: pd.DataFrame, start: int, rebuilt: bool) -> None:
+        """Keep window-relative indexes of tracked zones in step with the sliding window."""
+        if rebuilt:
+            # Pools are re-read from the rebuilt engine
+            self._liquidity_by_ts.clear()
+
+            # Engine positions were renumbered; look the zones up by timestamp (-1 if older)
+            stamps = list(self._ob_by_ts) + list(self._fvg_by_ts)
+            found = dict(zip(stamps, df.index.get_indexer(stamps).tolist(), strict=True))
+            for ts, order_block in self._ob_by_ts.items():
+                order_block.index = found[ts]
+            for ts, fvg in self._fvg_by_ts.items():
+                fvg.candle1_index = found[ts] - 1
+                fvg.candle2_index = found[ts]
+                fvg.candle3_index = found[ts] + 1
+        else:
+            shift = start - self._window_start
+            if shift:
+                for order_block in self._ob_by_ts.values():
+                    order_block.index -= shift
+                for fvg in self._fvg_by_ts.values():
+                    fvg.candle1_index -= shift
+                    fvg.candle2_index -= shift
+                    fvg.candle3_index -= shift
+                for zone in self._liquidity_by_ts.values():
+                    zone.index -= shift
+                    zone.end_index -= shift
+        self._window_start = start
+
     def _update_zone_status(self, df: pd.DataFrame) -> None:
         """
         Update status of all zones (check invalidations and fills)
@@ -578,6 +763,10 @@ class ConfluenceZoneAnalyzer:
             or (fvg.filled_at and (datetime.now() - fvg.filled_at).days < 1)
         ][: self.max_active_zones]
 
+        if self.engine is not None:
+            self._ob_by_ts = {ob.timestamp: ob for ob in self.order_blocks}
+            self._fvg_by_ts = {fvg.timestamp: fvg for fvg in self.fair_value_gaps}
+
     def get_zones_summary(self) -> dict:
         """Get summary of all confluence zones"""
         active_obs = [ob for ob in self.order_blocks if ob.status == ZoneStatus.ACTIVE]
@@ -677,16 +866,20 @@ class ConfluenceZoneAnalyzer:
         price_low = price - tolerance_range
         price_high = price + tolerance_range
 
-        nearby_obs = []
-        nearby_fvgs = []
-
-        for ob in self.get_active_order_blocks():
-            if ob.low <= price_high and ob.high >= price_low:
-                nearby_obs.append(ob)
+        nearby_obs = [
+            ob
+            for ob in self._zone_index(ZoneType.ORDER_BLOCK).overlapping(price_low, price_high)
+            if ob.status == ZoneStatus.ACTIVE
+        ]
+        nearby_fvgs = [
+            fvg
+            for fvg in self._zone_index(ZoneType.FAIR_VALUE_GAP).overlapping(price_low, price_high)
+            if fvg.status == ZoneStatus.ACTIVE
+        ]
 
-        for fvg in self.get_active_fvgs():
-            if fvg.gap_low <= price_high and fvg.gap_high >= price_low:
-                nearby_fvgs.append(fvg)
+        # Same order as get_active_order_blocks / get_active_fvgs
+        nearby_obs.sort(key=lambda x: x.strength_score, reverse=True)
+        nearby_fvgs.sort(key=lambda x: x.strength_score, reverse=True)
 
         return {
             "price": float(price),
@@ -694,3 +887,16 @@ class ConfluenceZoneAnalyzer:
             "fair_value_gaps": nearby_fvgs,
             "confluence_count": len(nearby_obs) + len(nearby_fvgs),
         }
+
+    def _zone_index(self, zone_type: ZoneType) -> ZoneIntervalIndex:
+        """Interval index over the current OB or FVG list, rebuilt when the list changes."""
+        if zone_type == ZoneType.ORDER_BLOCK:
+            zones, bounds = self.order_blocks, lambda z: (z.low, z.high)
+        else:
+            zones, bounds = self.fair_value_gaps, lambda z: (z.gap_low, z.gap_high)
+
+        index = self._zone_indexes.get(zone_type)
+        if index is None or not index.covers(zones):
+            index = ZoneIntervalIndex(zones, bounds)
+            self._zone_indexes[zone_type] = index
+        return index
@@ -7,6 +7,9 @@ Detects price action patterns for precise entry signals:
 - Inside Bars (consolidation patterns)
 - Confluence checking with Order Blocks and Fair Value Gaps
 - Signal generation with entry, SL, TP levels
+
+Pattern masks and quality scores are computed vectorized per window
+(see candle_patterns), optionally reusing results for bars already seen.
 """
 
 from dataclasses import dataclass, field
@@ -17,6 +20,12 @@ from typing import Optional
 import numpy as np
 import pandas as pd
 
+from bot.strategies.smc.candle_patterns import (
+    OHLCV_COLUMNS,
+    IncrementalPatternDetector,
+    PatternMasks,
+    detect_patterns,
+)
 from bot.strategies.smc.confluence_zones import ConfluenceZoneAnalyzer
 from bot.strategies.smc.market_structure import MarketStructureAnalyzer, TrendDirection
 from bot.utils.logger import get_logger
@@ -126,6 +135,7 @@ class EntrySignalGenerator:
         confluence_analyzer: ConfluenceZoneAnalyzer,
         min_risk_reward: float = 2.5,
         sl_buffer_pct: float = 0.5,
+        incremental: bool = False,
     ):
         """
         Initialize Entry Signal Generator
@@ -135,6 +145,8 @@ class EntrySignalGenerator:
             confluence_analyzer: ConfluenceZoneAnalyzer instance
             min_risk_reward: Minimum risk:reward ratio for signals
             sl_buffer_pct: Stop loss buffer percentage
+            incremental: Reuse pattern results for bars already seen in the
+                previous window (for callers analyzing a sliding window)
         """
         self.market_structure = market_structure
         self.confluence_analyzer = confluence_analyzer
@@ -147,6 +159,9 @@ class EntrySignalGenerator:
         # Log-spam suppression
         self._insufficient_data_count: int = 0
 
+        # Incremental mode: only newly appended bars are evaluated
+        self._pattern_detector = IncrementalPatternDetector() if incremental else None
+
         logger.info(
             "EntrySignalGenerator initialized", min_rr=min_risk_reward, sl_buffer=sl_buffer_pct
         )
@@ -170,10 +185,11 @@ class EntrySignalGenerator:
         self.detected_patterns.clear()
         self.generated_signals.clear()
 
-        # Detect all patterns
-        self._detect_engulfing_patterns(df)
-        self._detect_pin_bar_patterns(df)
-        self._detect_inside_bar_patterns(df)
+        # Detect all patterns (one vectorized pass over the window)
+        masks = self._pattern_masks(df)
+        self._detect_engulfing_patterns(df, masks)
+        self._detect_pin_bar_patterns(df, masks)
+        self._detect_inside_bar_patterns(df, masks)
 
         # Generate signals from patterns
         for pattern in self.detected_patterns:
@@ -189,122 +205,29 @@ class EntrySignalGenerator:
 
         return self.generated_signals
 
-    def _detect_engulfing_patterns(self, df: pd.DataFrame) -> None:
+    def _pattern_masks(self, df: pd.DataFrame) -> PatternMasks:
+        """Vectorized pattern masks for the window (incremental when enabled)."""
+        columns = [c for c in OHLCV_COLUMNS if c in df.columns]
+        bars = df[columns].to_numpy(dtype=float)
+        if self._pattern_detector is not None:
+            return self._pattern_detector.update(np.asarray(df.index), bars)
+        return detect_patterns(bars)
+
+    def _detect_engulfing_patterns(
+        self, df: pd.DataFrame, masks: Optional[PatternMasks] = None
+    ) -> None:
         """
         Detect Engulfing patterns (bullish and bearish)
 
         Engulfing: Current candle body fully engulfs previous candle body
         """
-        for i in range(1, len(df)):
-            curr = df.iloc[i]
-            prev = df.iloc[i - 1]
-
-            curr_body_size = abs(curr["close"] - curr["open"])
-            prev_body_size = abs(prev["close"] - prev["open"])
-            curr_range = curr["high"] - curr["low"]
-
-            # Skip if body is too small (doji-like)
-            if curr_body_size < curr_range * 0.3:
-                continue
-
-            # Bullish Engulfing
-            if (
-                prev["close"] < prev["open"]
-                and curr["close"] > curr["open"]  # Previous bearish
-                and curr["open"] <= prev["close"]  # Current bullish
-                and curr["close"] >= prev["open"]  # Opens at/below prev close
-            ):  # Closes at/above prev open
-                quality = self._calculate_engulfing_quality(curr, prev, True)
-
-                if quality >= 50:  # Min quality threshold
-                    pattern = PriceActionPattern(
-                        pattern_type=PatternType.ENGULFING,
-                        is_bullish=True,
-                        index=i,
-                        timestamp=curr.name,
-                        open=Decimal(str(curr["open"])),
-                        high=Decimal(str(curr["high"])),
-                        low=Decimal(str(curr["low"])),
-                        close=Decimal(str(curr["close"])),
-                        quality_score=quality,
-                        previous_candle={
-                            "open": prev["open"],
-                            "high": prev["high"],
-                            "low": prev["low"],
-                            "close": prev["close"],
-                        },
-                        volume=float(curr["volume"]) if "volume" in curr else 0.0,
-                    )
-                    self.detected_patterns.append(pattern)
-
-                    logger.debug(f"Bullish Engulfing detected at index {i}, quality={quality:.1f}")
-
-            # Bearish Engulfing
-            elif (
-                prev["close"] > prev["open"]
-                and curr["close"] < curr["open"]  # Previous bullish
-                and curr["open"] >= prev["close"]  # Current bearish
-                and curr["close"] <= prev["open"]  # Opens at/above prev close
-            ):  # Closes at/below prev open
-                quality = self._calculate_engulfing_quality(curr, prev, False)
-
-                if quality >= 50:
-                    pattern = PriceActionPattern(
-                        pattern_type=PatternType.ENGULFING,
-                        is_bullish=False,
-                        index=i,
-                        timestamp=curr.name,
-                        open=Decimal(str(curr["open"])),
-                        high=Decimal(str(curr["high"])),
-                        low=Decimal(str(curr["low"])),
-                        close=Decimal(str(curr["close"])),
-                        quality_score=quality,
-                        previous_candle={
-                            "open": prev["open"],
-                            "high": prev["high"],
-                            "low": prev["low"],
-                            "close": prev["close"],
-                        },
-                        volume=float(curr["volume"]) if "volume" in curr else 0.0,
-                    )
-                    self.detected_patterns.append(pattern)
-
-                    logger.debug(f"Bearish Engulfing detected at index {i}, quality={quality:.1f}")
-
-    def _calculate_engulfing_quality(self, curr, prev, is_bullish: bool) -> float:
-        """
-        Calculate quality score for engulfing pattern (0-100)
-
-        Factors:
-        - Body size ratio (0-40)
-        - Body dominance in candle (0-30)
-        - Volume (0-30)
-        """
-        score = 0.0
-
-        curr_body = abs(curr["close"] - curr["open"])
-        prev_body = abs(prev["close"] - prev["open"])
-        curr_range = curr["high"] - curr["low"]
-
-        # Body size ratio (bigger engulfing = better)
-        if prev_body > 0:
-            body_ratio = min(curr_body / prev_body, 3.0)  # Cap at 3x
-            score += (body_ratio / 3.0) * 40
-
-        # Body dominance (body should be large part of range)
-        if curr_range > 0:
-            body_dominance = curr_body / curr_range
-            score += body_dominance * 30
+        if masks is None:
+            masks = self._pattern_masks(df)
+        self._add_patterns(df, PatternType.ENGULFING, masks, "engulfing", "Engulfing")
 
-        # Volume (higher volume = more conviction)
-        if "volume" in curr and "volume" in prev:
-            if prev["volume"] > 0:
-                volume_ratio = min(curr["volume"] / prev["volume"], 2.0)
-                score += (volume_ratio / 2.0) * 30
-
-        return min(100.0, score)
-
-    def _detect_pin_bar_patterns(self, df: pd.DataFrame) -> None:
+    def _detect_pin_bar_patterns(
+        self, df: pd.DataFrame, masks: Optional[PatternMasks] = None
+    ) -> None:
         """
         Detect Pin Bar patterns (Hammer and Shooting Star)
 
@@ -312,173 +235,73 @@ class EntrySignalGenerator:
         - Bullish: Long lower wick (rejection of lows)
         - Bearish: Long upper wick (rejection of highs)
         """
-        for i in range(len(df)):
-            candle = df.iloc[i]
-
-            candle_range = candle["high"] - candle["low"]
-            if candle_range == 0:
-                continue
-
-            body_size = abs(candle["close"] - candle["open"])
-            upper_wick = candle["high"] - max(candle["open"], candle["close"])
-            lower_wick = min(candle["open"], candle["close"]) - candle["low"]
-
-            # Bullish Pin Bar (Hammer)
-            if (
-                lower_wick > candle_range * 0.6
-                and body_size < candle_range * 0.4  # Long lower wick
-                and upper_wick < candle_range * 0.2  # Small body
-            ):  # Small upper wick
-                quality = self._calculate_pin_bar_quality(candle, True)
-
-                if quality >= 50:
-                    pattern = PriceActionPattern(
-                        pattern_type=PatternType.PIN_BAR,
-                        is_bullish=True,
-                        index=i,
-                        timestamp=candle.name,
-                        open=Decimal(str(candle["open"])),
-                        high=Decimal(str(candle["high"])),
-                        low=Decimal(str(candle["low"])),
-                        close=Decimal(str(candle["close"])),
-                        quality_score=quality,
-                        volume=float(candle["volume"]) if "volume" in candle else 0.0,
-                    )
-                    self.detected_patterns.append(pattern)
-
-                    logger.debug(f"Bullish Pin Bar detected at index {i}, quality={quality:.1f}")
-
-            # Bearish Pin Bar (Shooting Star)
-            elif (
-                upper_wick > candle_range * 0.6
-                and body_size < candle_range * 0.4  # Long upper wick
-                and lower_wick < candle_range * 0.2  # Small body
-            ):  # Small lower wick
-                quality = self._calculate_pin_bar_quality(candle, False)
-
-                if quality >= 50:
-                    pattern = PriceActionPattern(
-                        pattern_type=PatternType.PIN_BAR,
-                        is_bullish=False,
-                        index=i,
-                        timestamp=candle.name,
-                        open=Decimal(str(candle["open"])),
-                        high=Decimal(str(candle["high"])),
-                        low=Decimal(str(candle["low"])),
-                        close=Decimal(str(candle["close"])),
-                        quality_score=quality,
-                        volume=float(candle["volume"]) if "volume" in candle else 0.0,
-                    )
-                    self.detected_patterns.append(pattern)
-
-                    logger.debug(f"Bearish Pin Bar detected at index {i}, quality={quality:.1f}")
-
-    def _calculate_pin_bar_quality(self, candle, is_bullish: bool) -> float:
-        """Calculate quality score for pin bar (0-100)"""
-        score = 0.0
-
-        candle_range = candle["high"] - candle["low"]
-        if candle_range == 0:
-            return 0.0
-
-        body_size = abs(candle["close"] - candle["open"])
-        upper_wick = candle["high"] - max(candle["open"], candle["close"])
-        lower_wick = min(candle["open"], candle["close"]) - candle["low"]
-
-        if is_bullish:
-            wick = lower_wick
-        else:
-            wick = upper_wick
+        if masks is None:
+            masks = self._pattern_masks(df)
+        self._add_patterns(df, PatternType.PIN_BAR, masks, "pin_bar", "Pin Bar")
 
-        # Wick to body ratio (longer wick relative to body = better)
-        if body_size > 0:
-            wick_body_ratio = min(wick / body_size, 5.0)
-            score += (wick_body_ratio / 5.0) * 40
-        else:
-            score += 40  # Perfect: no body
-
-        # Wick to range ratio (wick should dominate)
-        wick_dominance = wick / candle_range
-        score += wick_dominance * 40
-
-        # Body position (should be at opposite end)
-        body_center = (
-            max(candle["open"], candle["close"]) + min(candle["open"], candle["close"])
-        ) / 2
-        if is_bullish:
-            # Body should be near high
-            position_score = (body_center - candle["low"]) / candle_range
-        else:
-            # Body should be near low
-            position_score = (candle["high"] - body_center) / candle_range
-        score += position_score * 20
-
-        return min(100.0, score)
-
-    def _detect_inside_bar_patterns(self, df: pd.DataFrame) -> None:
+    def _detect_inside_bar_patterns(
+        self, df: pd.DataFrame, masks: Optional[PatternMasks] = None
+    ) -> None:
         """
         Detect Inside Bar patterns
 
         Inside Bar: Current candle contained within previous candle range
         """
-        for i in range(1, len(df)):
-            curr = df.iloc[i]
-            prev = df.iloc[i - 1]
-
-            # Inside bar condition
-            if curr["high"] <= prev["high"] and curr["low"] >= prev["low"]:
-                # Determine bias based on close relative to previous candle
-                is_bullish = curr["close"] > (prev["high"] + prev["low"]) / 2
-
-                quality = self._calculate_inside_bar_quality(curr, prev)
-
-                if quality >= 50:
-                    pattern = PriceActionPattern(
-                        pattern_type=PatternType.INSIDE_BAR,
-                        is_bullish=is_bullish,
-                        index=i,
-                        timestamp=curr.name,
-                        open=Decimal(str(curr["open"])),
-                        high=Decimal(str(curr["high"])),
-                        low=Decimal(str(curr["low"])),
-                        close=Decimal(str(curr["close"])),
-                        quality_score=quality,
-                        previous_candle={
-                            "open": prev["open"],
-                            "high": prev["high"],
-                            "low": prev["low"],
-                            "close": prev["close"],
-                        },
-                        volume=float(curr["volume"]) if "volume" in curr else 0.0,
-                    )
-                    self.detected_patterns.append(pattern)
-
-                    direction = "Bullish" if is_bullish else "Bearish"
-                    logger.debug(
-                        f"{direction} Inside Bar detected at index {i}, quality={quality:.1f}"
-                    )
-
-    def _calculate_inside_bar_quality(self, curr, prev) -> float:
-        """Calculate quality score for inside bar (0-100)"""
-        score = 50.0  # Base score for valid inside bar
-
-        prev_range = prev["high"] - prev["low"]
-        curr_range = curr["high"] - curr["low"]
-
-        if prev_range == 0:
-            return 0.0
-
-        # Compression ratio (smaller inside bar = better compression)
-        compression = 1.0 - (curr_range / prev_range)
-        score += compression * 30
-
-        # Previous candle size (larger mother bar = better)
-        if prev_range > 0:
-            # Normalize by typical range (assume 1.0 is typical)
-            size_score = min(prev_range / 1.0, 2.0) / 2.0
-            score += size_score * 20
-
-        return min(100.0, score)
+        if masks is None:
+            masks = self._pattern_masks(df)
+        self._add_patterns(df, PatternType.INSIDE_BAR, masks, "inside_bar", "Inside Bar")
+
+    def _add_patterns(
+        self,
+        df: pd.DataFrame,
+        pattern_type: PatternType,
+        masks: PatternMasks,
+        name: str,
+        label: str,
+    ) -> None:
+        """Build PriceActionPattern objects for the qualifying hits of one pattern type"""
+        hits = masks.hits(name)
+        if not len(hits):
+            return
+
+        direction = getattr(masks, name)
+        quality = getattr(masks, f"{name}_quality")
+        ohlc = df[["open", "high", "low", "close"]].to_numpy(dtype=float)
+        volume = df["volume"].to_numpy(dtype=float) if "volume" in df.columns else None
+        # Pin bars are single-candle patterns; the others compare with the mother bar
+        with_previous = pattern_type != PatternType.PIN_BAR
+
+        for i in hits:
+            is_bullish = bool(direction[i] > 0)
+            open_, high, low, close = ohlc[i]
+            previous_candle = None
+            if with_previous:
+                prev = ohlc[i - 1]
+                previous_candle = {
+                    "open": prev[0],
+                    "high": prev[1],
+                    "low": prev[2],
+                    "close": prev[3],
+                }
+            pattern = PriceActionPattern(
+                pattern_type=pattern_type,
+                is_bullish=is_bullish,
+                index=int(i),
+                timestamp=df.index[i],
+                open=Decimal(str(open_)),
+                high=Decimal(str(high)),
+                low=Decimal(str(low)),
+                close=Decimal(str(close)),
+                quality_score=float(quality[i]),
+                previous_candle=previous_candle,
+                volume=float(volume[i]) if volume is not None else 0.0,
+            )
+            self.detected_patterns.append(pattern)
+
+            direction_label = "Bullish" if is_bullish else "Bearish"
+            logger.debug(
+                f"{direction_label} {label} detected at index {i}, quality={quality[i]:.1f}"
+            )
 
     def _generate_signal_from_pattern(
         self, df: pd.DataFrame, pattern: PriceActionPattern
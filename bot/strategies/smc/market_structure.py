@@ -7,17 +7,21 @@ Identifies market structure elements:
 - Break of Structure (BOS)
 - Change of Character (CHoCH)
 
-Uses the smartmoneyconcepts library for swing/BOS/CHoCH detection.
+Uses the smartmoneyconcepts library for swing/BOS/CHoCH detection, or in
+incremental mode a StructureEngine that only processes newly appended bars.
 """
 
+from bisect import bisect_left
 from dataclasses import dataclass
 from decimal import Decimal
 from enum import Enum
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 import smartmoneyconcepts.smc as smc
 
+from bot.strategies.smc.structure_engine import StructureEngine
 from bot.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -69,7 +73,13 @@ class MarketStructureAnalyzer:
     Uses smartmoneyconcepts library for detection.
     """
 
-    def __init__(self, swing_length: int = 50, trend_period: int = 20, close_break: bool = True):
+    def __init__(
+        self,
+        swing_length: int = 50,
+        trend_period: int = 20,
+        close_break: bool = True,
+        incremental: bool = False,
+    ):
         """
         Initialize Market Structure Analyzer
 
@@ -77,16 +87,26 @@ class MarketStructureAnalyzer:
             swing_length: Number of candles on each side for swing point validation
             trend_period: Lookback period for trend determination
             close_break: If True, require candle close beyond level for BOS/CHoCH
+            incremental: Track structure with a StructureEngine keyed by bar
+                timestamp, so repeated calls on a sliding window only process
+                the appended bars
         """
         self.swing_length = swing_length
         self.trend_period = trend_period
         self.close_break = close_break
+        self.engine: Optional[StructureEngine] = (
+            StructureEngine(swing_length=swing_length, close_break=close_break)
+            if incremental
+            else None
+        )
 
         self.swing_highs: list[SwingPoint] = []
         self.swing_lows: list[SwingPoint] = []
         self.structure_events: list[StructureEvent] = []
         self.current_trend: TrendDirection = TrendDirection.RANGING
         self._swings_df: Optional[pd.DataFrame] = None
+        self._window_length: int = 0
+        self._swing_cache: dict[pd.Timestamp, SwingPoint] = {}
 
         # Log-spam suppression: count warnings, log only first occurrence
         self._insufficient_data_count: int = 0
@@ -96,6 +116,7 @@ class MarketStructureAnalyzer:
             swing_length=swing_length,
             trend_period=trend_period,
             close_break=close_break,
+            incremental=incremental,
         )
 
     @staticmethod
@@ -108,6 +129,12 @@ class MarketStructureAnalyzer:
             ohlc["volume"] = df["volume"].astype(float)
         return ohlc
 
+    @staticmethod
+    def _frame_columns(frame: pd.DataFrame, names: tuple[str, ...]) -> dict[str, np.ndarray]:
+        """Column arrays in the frame-wide common dtype, as a row from .iloc would have."""
+        values = frame.to_numpy()
+        return {name: values[:, frame.columns.get_loc(name)] for name in names}
+
     def analyze(self, df: pd.DataFrame) -> dict:
         """
         Analyze market structure on given dataframe
@@ -141,14 +168,17 @@ class MarketStructureAnalyzer:
                 self.swing_length = original_swing_length
             return self.get_current_structure()
 
-        # Detect swing points
-        self._detect_swing_points(df)
+        if self.engine is not None:
+            self._analyze_incremental(df)
+        else:
+            # Detect swing points
+            self._detect_swing_points(df)
 
-        # Determine current trend
-        self._determine_trend(df)
+            # Determine current trend
+            self._determine_trend(df)
 
-        # Detect structure breaks
-        self._detect_structure_breaks(df)
+            # Detect structure breaks
+            self._detect_structure_breaks(df)
 
         logger.debug(
             "Market structure analyzed",
@@ -173,23 +203,13 @@ class MarketStructureAnalyzer:
         ohlc = self._prepare_ohlc_df(df)
         self._swings_df = smc.swing_highs_lows(ohlc, swing_length=self.swing_length)
 
-        for i in range(len(self._swings_df)):
-            row = self._swings_df.iloc[i]
-            if pd.isna(row["HighLow"]):
-                continue
-
-            is_high = row["HighLow"] == 1.0
-            price = Decimal(str(row["Level"]))
-            timestamp = (
-                df.index[i]
-                if hasattr(df.index[i], "timestamp") or isinstance(df.index[i], pd.Timestamp)
-                else pd.Timestamp(df.index[i])
-            )
-
+        columns = self._frame_columns(self._swings_df, ("HighLow", "Level"))
+        for i in np.flatnonzero(self._swings_df["HighLow"].notna().to_numpy()).tolist():
+            is_high = columns["HighLow"][i] == 1.0
             swing = SwingPoint(
                 index=i,
-                price=price,
-                timestamp=timestamp,
+                price=Decimal(str(columns["Level"][i])),
+                timestamp=self._timestamp(df, i),
                 is_high=is_high,
                 strength=self.swing_length,
             )
@@ -221,72 +241,26 @@ class MarketStructureAnalyzer:
         ohlc = self._prepare_ohlc_df(df)
         bos_choch_df = smc.bos_choch(ohlc, self._swings_df, close_break=self.close_break)
 
-        for i in range(len(bos_choch_df)):
-            row = bos_choch_df.iloc[i]
-            timestamp = (
-                df.index[i] if isinstance(df.index[i], pd.Timestamp) else pd.Timestamp(df.index[i])
-            )
-
-            # Process BOS events
-            if pd.notna(row["BOS"]):
-                is_bullish = row["BOS"] == 1.0
-                event_type = StructureBreak.BOS
-                trend = TrendDirection.BULLISH if is_bullish else TrendDirection.BEARISH
-                price = Decimal(str(row["Level"]))
-
-                broken_idx = int(row["BrokenIndex"]) if pd.notna(row["BrokenIndex"]) else i
-                previous_swing = self._find_nearest_swing(broken_idx, is_high=is_bullish)
-
-                if previous_swing is None:
-                    previous_swing = SwingPoint(
-                        index=broken_idx,
-                        price=price,
-                        timestamp=timestamp,
-                        is_high=is_bullish,
-                        strength=self.swing_length,
-                    )
-
-                event = StructureEvent(
-                    event_type=event_type,
-                    index=i,
-                    price=price,
-                    timestamp=timestamp,
-                    previous_swing=previous_swing,
-                    current_trend=trend,
-                )
-                self.structure_events.append(event)
-
-            # Process CHoCH events
-            if pd.notna(row["CHOCH"]):
-                is_bullish = row["CHOCH"] == 1.0
-                event_type = StructureBreak.CHOCH
-                trend = TrendDirection.BULLISH if is_bullish else TrendDirection.BEARISH
-                price = Decimal(str(row["Level"]))
-
-                broken_idx = int(row["BrokenIndex"]) if pd.notna(row["BrokenIndex"]) else i
-                previous_swing = self._find_nearest_swing(broken_idx, is_high=is_bullish)
-
-                if previous_swing is None:
-                    previous_swing = SwingPoint(
-                        index=broken_idx,
-                        price=price,
-                        timestamp=timestamp,
-                        is_high=is_bullish,
-                        strength=self.swing_length,
-                    )
-
-                event = StructureEvent(
-                    event_type=event_type,
-                    index=i,
-                    price=price,
-                    timestamp=timestamp,
-                    previous_swing=previous_swing,
-                    current_trend=trend,
+        columns = self._frame_columns(bos_choch_df, ("BOS", "CHOCH", "Level", "BrokenIndex"))
+        flagged = bos_choch_df["BOS"].notna() | bos_choch_df["CHOCH"].notna()
+
+        for i in np.flatnonzero(flagged.to_numpy()).tolist():
+            timestamp = self._timestamp(df, i)
+            broken = columns["BrokenIndex"][i]
+            broken_idx = int(broken) if pd.notna(broken) else i
+
+            for name, event_type in (("BOS", StructureBreak.BOS), ("CHOCH", StructureBreak.CHOCH)):
+                if pd.isna(columns[name][i]):
+                    continue
+                is_bullish = columns[name][i] == 1.0
+                self._add_structure_event(
+                    event_type,
+                    is_bullish,
+                    i,
+                    Decimal(str(columns["Level"][i])),
+                    timestamp,
+                    broken_idx,
                 )
-                self.structure_events.append(event)
-
-                # Update trend on CHoCH
-                self.current_trend = trend
 
         logger.debug(
             "Structure breaks detected",
@@ -296,23 +270,121 @@ class MarketStructureAnalyzer:
             ].__len__(),
         )
 
+    def _add_structure_event(
+        self,
+        event_type: StructureBreak,
+        is_bullish: bool,
+        index: int,
+        price: Decimal,
+        timestamp: pd.Timestamp,
+        broken_idx: int,
+    ) -> None:
+        """Record a BOS/CHoCH; a CHoCH also sets the current trend."""
+        trend = TrendDirection.BULLISH if is_bullish else TrendDirection.BEARISH
+        previous_swing = self._find_nearest_swing(broken_idx, is_high=is_bullish)
+
+        if previous_swing is None:
+            previous_swing = SwingPoint(
+                index=broken_idx,
+                price=price,
+                timestamp=timestamp,
+                is_high=is_bullish,
+                strength=self.swing_length,
+            )
+
+        self.structure_events.append(
+            StructureEvent(
+                event_type=event_type,
+                index=index,
+                price=price,
+                timestamp=timestamp,
+                previous_swing=previous_swing,
+                current_trend=trend,
+            )
+        )
+
+        if event_type == StructureBreak.CHOCH:
+            self.current_trend = trend
+
+    @staticmethod
+    def _timestamp(df: pd.DataFrame, i: int) -> pd.Timestamp:
+        label = df.index[i]
+        return label if isinstance(label, pd.Timestamp) else pd.Timestamp(label)
+
+    def _analyze_incremental(self, df: pd.DataFrame) -> None:
+        """
+        Feed the window to the StructureEngine and rebuild the swing and
+        event lists from the engine records that fall inside it.
+        """
+        update = self.engine.update(df)
+        start = self.engine.window_start(len(df))
+        self._window_length = len(df)
+        self._swings_df = None
+        if update.rebuilt or update.replayed:
+            self._swing_cache.clear()
+
+        self.swing_highs.clear()
+        self.swing_lows.clear()
+        swings = self.engine.swings
+        cache: dict[pd.Timestamp, SwingPoint] = {}
+        for record in swings[bisect_left(swings, start, key=lambda s: s.position) :]:
+            swing = self._swing_cache.get(record.timestamp)
+            if swing is None or swing.is_high != record.is_high:
+                swing = SwingPoint(
+                    index=0,
+                    price=Decimal(str(record.level)),
+                    timestamp=record.timestamp,
+                    is_high=record.is_high,
+                    strength=self.swing_length,
+                )
+            swing.index = record.position - start
+            cache[record.timestamp] = swing
+            (self.swing_highs if record.is_high else self.swing_lows).append(swing)
+        self._swing_cache = cache
+
+        self._determine_trend(df)
+
+        self.structure_events.clear()
+        in_window = []
+        for record in reversed(self.engine.breaks):
+            if record.broken_position < start:
+                break
+            if record.position >= start:
+                in_window.append(record)
+
+        for record in sorted(in_window, key=lambda r: r.position):
+            self._add_structure_event(
+                StructureBreak.CHOCH if record.is_choch else StructureBreak.BOS,
+                record.is_bullish,
+                record.position - start,
+                Decimal(str(record.level)),
+                record.timestamp,
+                record.broken_position - start,
+            )
+
     def _find_nearest_swing(self, target_index: int, is_high: bool) -> Optional[SwingPoint]:
-        """Find the closest SwingPoint to a given index."""
+        """Find the closest SwingPoint to a given index (earlier one on ties)."""
         swings = self.swing_highs if is_high else self.swing_lows
         if not swings:
             return None
 
-        best = None
-        best_dist = float("inf")
-        for s in swings:
-            dist = abs(s.index - target_index)
-            if dist < best_dist:
-                best_dist = dist
-                best = s
-        return best
+        pos = bisect_left(swings, target_index, key=lambda s: s.index)
+        if pos == len(swings):
+            return swings[-1]
+        if pos > 0 and target_index - swings[pos - 1].index <= swings[pos].index - target_index:
+            return swings[pos - 1]
+        return swings[pos]
 
     def get_swings_df(self) -> Optional[pd.DataFrame]:
         """Return raw swings DataFrame for downstream consumers (OB, liquidity)."""
+        if self._swings_df is None and self.engine is not None and self._window_length:
+            # Same layout as smc.swing_highs_lows, built on demand from the engine swings
+            high_low = np.full(self._window_length, np.nan)
+            levels = np.full(self._window_length, np.nan)
+            for swing in self.swing_highs + self.swing_lows:
+                high_low[swing.index] = 1.0 if swing.is_high else -1.0
+                levels[swing.index] = float(swing.price)
+            self._swings_df = pd.DataFrame({"HighLow": high_low, "Level": levels})
         return self._swings_df
 
     def _determine_trend(self, df: pd.DataFrame) -> None:
@@ -47,6 +47,7 @@ class SMCStrategy:
             swing_length=self.config.swing_length,
             trend_period=self.config.trend_period,
             close_break=self.config.close_break,
+            incremental=self.config.incremental_structure,
         )
 
         self.confluence_analyzer = ConfluenceZoneAnalyzer(
@@ -55,6 +56,7 @@ class SMCStrategy:
             close_mitigation=self.config.close_mitigation,
             join_consecutive_fvg=self.config.join_consecutive_fvg,
             liquidity_range_percent=self.config.liquidity_range_percent,
+            incremental=self.config.incremental_structure,
         )
 
         self.signal_generator = EntrySignalGenerator(
@@ -62,6 +64,7 @@ class SMCStrategy:
             confluence_analyzer=self.confluence_analyzer,
             min_risk_reward=self.config.min_risk_reward,
             sl_buffer_pct=0.5,
+            incremental=True,
         )
 
         self.position_manager = PositionManager(
@@ -352,6 +355,7 @@ class SMCStrategy:
             swing_length=self.config.swing_length,
             trend_period=self.config.trend_period,
             close_break=self.config.close_break,
+            incremental=self.config.incremental_structure,
         )
         self.confluence_analyzer = ConfluenceZoneAnalyzer(
             market_structure=self.market_structure,
@@ -359,12 +363,14 @@ class SMCStrategy:
             close_mitigation=self.config.close_mitigation,
             join_consecutive_fvg=self.config.join_consecutive_fvg,
             liquidity_range_percent=self.config.liquidity_range_percent,
+            incremental=self.config.incremental_structure,
         )
         self.signal_generator = EntrySignalGenerator(
             market_structure=self.market_structure,
             confluence_analyzer=self.confluence_analyzer,
             min_risk_reward=self.config.min_risk_reward,
             sl_buffer_pct=0.5,
+            incremental=True,
         )
         self.active_signals.clear()
         self._generate_call_count = 0
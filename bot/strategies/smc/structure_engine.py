@@ -0,0 +1,615 @@
+"""
+Incremental SMC Structure Engine
+
+Tracks swing points, BOS/CHoCH, order blocks, fair value gaps and liquidity
+sweeps bar by bar, keyed by absolute bar timestamps instead of positions in
+the analyzed window. Each appended bar only does the work that became
+decidable at that bar:
+
+- confirms the swing ``swing_length`` bars back (its right side is complete)
+- checks pending structure breaks, FVG fills, OB mitigations and liquidity
+  sweeps against the new high/low/close (heaps keyed by level)
+- detects the FVG centred on the previous bar
+- creates order blocks when the close crosses the last confirmed swing
+
+Swing and FVG rules follow smartmoneyconcepts, so confirmed swings and FVGs
+equal the library's over the same history (the library also pins synthetic
+swings to the first and last bar of every window; those are not tracked).
+Structure breaks, order blocks and liquidity pools only use swings that were
+confirmed at the time, so — unlike a batch pass over a window — they never
+depend on bars that had not closed yet. Liquidity bands are a percentage of
+the swing level rather than of the window's price range.
+"""
+
+import heapq
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from bot.strategies.smc.candle_patterns import OHLCV_COLUMNS
+
+
+@dataclass
+class SwingRecord:
+    """Confirmed swing high or low"""
+
+    timestamp: Any
+    position: int
+    is_high: bool
+    level: float
+
+
+@dataclass
+class BreakRecord:
+    """BOS/CHoCH level, marked at the swing that defined it and reported once broken"""
+
+    timestamp: Any
+    position: int
+    is_bullish: bool
+    is_choch: bool
+    level: float
+    broken_at: Any = None
+    broken_position: int = -1
+
+
+@dataclass
+class OrderBlockRecord:
+    """Order block candle; mitigated once price trades through its far edge"""
+
+    timestamp: Any
+    position: int
+    is_bullish: bool
+    top: float
+    bottom: float
+    open: float
+    close: float
+    volume: float
+    mitigated_at: Any = None
+    mitigated_position: int = -1
+
+
+@dataclass
+class FVGRecord:
+    """Fair value gap centred on ``position``; mitigated once price re-enters it"""
+
+    timestamp: Any
+    position: int
+    is_bullish: bool
+    top: float
+    bottom: float
+    mitigated_at: Any = None
+    mitigated_position: int = -1
+
+
+@dataclass
+class LiquidityRecord:
+    """Pool of equal swing highs (buy-side) or lows (sell-side)"""
+
+    timestamp: Any
+    position: int
+    is_bullish: bool
+    band_low: float
+    band_high: float
+    levels: list[float] = field(default_factory=list)
+    end_at: Any = None
+    end_position: int = -1
+    swept_at: Any = None
+    swept_position: int = -1
+
+    @property
+    def level(self) -> float:
+        return sum(self.levels) / len(self.levels)
+
+
+@dataclass
+class StructureUpdate:
+    """What one ``update`` call confirmed"""
+
+    bars: int = 0  # bars appended (after any replay)
+    replayed: int = 0  # retained bars re-run because an already seen bar changed
+    rebuilt: bool = False  # state was rebuilt from scratch; records below are complete
+    breaks: list[BreakRecord] = field(default_factory=list)
+    order_blocks: list[OrderBlockRecord] = field(default_factory=list)
+    fair_value_gaps: list[FVGRecord] = field(default_factory=list)
+    mitigated: list = field(default_factory=list)  # OrderBlockRecord / FVGRecord
+    liquidity: list[LiquidityRecord] = field(default_factory=list)
+
+
+class StructureEngine:
+    """
+    Bar-by-bar SMC structure state over a growing history.
+
+    ``update`` accepts successive (overlapping) OHLCV windows: bars already
+    seen are matched by timestamp and skipped, so a sliding window only
+    feeds its new bars. When a seen bar changed (e.g. a still-forming last
+    candle) the retained history is replayed from that bar. Results always
+    equal feeding the retained history to a fresh engine in one go.
+    """
+
+    def __init__(
+        self,
+        swing_length: int = 50,
+        close_break: bool = True,
+        close_mitigation: bool = False,
+        liquidity_range_percent: float = 0.01,
+        max_bars: int = 2000,
+    ):
+        """
+        Initialize Structure Engine
+
+        Args:
+            swing_length: Swing high/low validation length (as in smc.swing_highs_lows)
+            close_break: If True, BOS/CHoCH need a close beyond the level (vs wick)
+            close_mitigation: If True, OBs are mitigated by a body close through them
+            liquidity_range_percent: Band around a swing level that groups equal swings
+            max_bars: History to retain; trimmed back to this once it doubles
+        """
+        if swing_length < 1:
+            raise ValueError(f"swing_length must be >= 1, got {swing_length}")
+
+        self.swing_length = swing_length
+        self.close_break = close_break
+        self.close_mitigation = close_mitigation
+        self.liquidity_range_percent = liquidity_range_percent
+        self.max_bars = max_bars
+
+        self.bars_processed = 0  # new bars fed; replays of retained bars not counted
+        self.rebuilds = 0
+        self._window = 0
+        self._update = StructureUpdate()
+        self._quiet_until = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self._ts: list = []
+        self._open: list[float] = []
+        self._high: list[float] = []
+        self._low: list[float] = []
+        self._close: list[float] = []
+        self._volume: list[float] = []
+
+        # Positions of the running max high / min low over the swing window
+        self._max_high: deque[int] = deque()
+        self._min_low: deque[int] = deque()
+
+        self.swings: list[SwingRecord] = []
+        self.breaks: list[BreakRecord] = []
+        self.order_blocks: dict[Any, OrderBlockRecord] = {}
+        self.fair_value_gaps: dict[Any, FVGRecord] = {}
+        self.liquidity: dict[Any, LiquidityRecord] = {}  # pools with 2+ swings
+
+        self._last_high: Optional[SwingRecord] = None
+        self._last_low: Optional[SwingRecord] = None
+        self._crossed: set[int] = set()
+        self._pools: dict[bool, list[LiquidityRecord]] = {True: [], False: []}
+
+        # Min-heaps of (key, seq, record); keys are negated where the max matters
+        self._seq = 0
+        self._breaks_up: list = []
+        self._breaks_down: list = []
+        self._fvg_bull: list = []
+        self._fvg_bear: list = []
+        self._ob_bull: list = []
+        self._ob_bear: list = []
+        self._breaker_bull: list = []
+        self._breaker_bear: list = []
+        self._sweep_high: list = []
+        self._sweep_low: list = []
+
+    def __len__(self) -> int:
+        return len(self._ts)
+
+    def window_start(self, length: int) -> int:
+        """Absolute position of the first bar of the last ``length``-bar window"""
+        return len(self._ts) - length
+
+    def update(self, df: pd.DataFrame) -> StructureUpdate:
+        """
+        Feed an OHLCV window whose last bar is the newest one.
+
+        Args:
+            df: DataFrame indexed by timestamp with open/high/low/close[/volume]
+
+        Returns:
+            StructureUpdate with the records confirmed by the new bars
+        """
+        bars = df[[c for c in OHLCV_COLUMNS if c in df.columns]].to_numpy(dtype=float)
+        if bars.shape[1] < len(OHLCV_COLUMNS):
+            bars = np.column_stack([bars, np.zeros(len(bars))])
+        return self.extend(df.index, bars)
+
+    def extend(self, index: pd.Index, bars: np.ndarray) -> StructureUpdate:
+        """
+        Feed bars as an index plus an (n, 5) open/high/low/close/volume array.
+
+        Returns:
+            StructureUpdate with the records confirmed by the new bars
+        """
+        self._update = StructureUpdate()
+        self._window = len(index)
+
+        seen = self._align(index, bars)
+        if seen is None:
+            self._reset()
+            self._update.rebuilt = True
+            self.rebuilds += 1
+            seen = 0
+
+        self._append(index[seen:], bars[seen:])
+        self._update.bars = len(index) - seen
+
+        keep = max(self.max_bars, self._window)
+        if len(self._ts) > 2 * keep:
+            self._replay(len(self._ts) - keep, len(self._ts))
+            self._update.rebuilt = True
+            self.rebuilds += 1
+
+        return self._update
+
+    def _align(self, index: pd.Index, bars: np.ndarray) -> Optional[int]:
+        """
+        Match the window against the retained history.
+
+        Returns the number of leading window bars already processed (replaying
+        history first if one of them changed), or None if the window does
+        not continue the history.
+        """
+        n = len(self._ts)
+        if not n or not len(index):
+            return 0
+
+        seen = int(index.searchsorted(self._ts[-1], side="right"))
+        if seen == 0:
+            return 0 if index[0] > self._ts[-1] else None
+        if seen > n or index[0] != self._ts[n - seen] or index[seen - 1] != self._ts[-1]:
+            return None
+
+        columns = (self._open, self._high, self._low, self._close, self._volume)
+        same = np.ones(seen, dtype=bool)
+        for j, column in enumerate(columns):
+            if bars[:seen, j].tolist() != column[n - seen :]:
+                same &= bars[:seen, j] == np.asarray(column[n - seen :])
+        if same.all():
+            return seen
+
+        changed = int(np.argmin(same))
+        self._update.replayed = n - seen + changed
+        self._replay(0, n - seen + changed)
+        return changed
+
+    def _replay(self, start: int, stop: int) -> None:
+        """Rebuild state from retained bars [start, stop)"""
+        ts = self._ts[start:stop]
+        columns = [
+            c[start:stop] for c in (self._open, self._high, self._low, self._close, self._volume)
+        ]
+        self._reset()
+        # Records from a replayed prefix were already reported
+        self._quiet_until = stop if start == 0 else 0
+        for k, timestamp in enumerate(ts):
+            self._push(timestamp, *(c[k] for c in columns))
+        self._quiet_until = 0
+
+    def _append(self, index: pd.Index, bars: np.ndarray) -> None:
+        for timestamp, row in zip(index, bars.tolist(), strict=True):
+            self._push(timestamp, *row)
+        self.bars_processed += len(index)
+
+    def _push(
+        self, timestamp: Any, open_: float, high: float, low: float, close: float, volume: float
+    ) -> None:
+        self._ts.append(timestamp)
+        self._open.append(open_)
+        self._high.append(high)
+        self._low.append(low)
+        self._close.append(close)
+        self._volume.append(volume)
+
+        k = len(self._ts) - 1
+        self._check_breaks(k)
+        self._check_fvg_fills(k)
+        self._check_order_blocks(k)
+        self._check_sweeps(k)
+        self._confirm_swing(k)
+        self._detect_fvg(k)
+        self._detect_order_blocks(k)
+
+    def _report(self, bucket: str, record: Any) -> None:
+        if len(self._ts) > self._quiet_until:
+            getattr(self._update, bucket).append(record)
+
+    def _heap_push(self, heap: list, key: float, record: Any) -> None:
+        self._seq += 1
+        heapq.heappush(heap, (key, self._seq, record))
+
+    # ------------------------------------------------------------------
+    # Swings
+    # ------------------------------------------------------------------
+
+    def _confirm_swing(self, k: int) -> None:
+        """
+        Confirm the swing at ``k - swing_length``.
+
+        Same rule as smc.swing_highs_lows: the bar's high (low) equals the
+        max (min) of the 2*swing_length bars ending swing_length bars later.
+        """
+        length = self.swing_length
+        high, low = self._high, self._low
+
+        while self._max_high and high[self._max_high[-1]] <= high[k]:
+            self._max_high.pop()
+        self._max_high.append(k)
+        while self._min_low and low[self._min_low[-1]] >= low[k]:
+            self._min_low.pop()
+        self._min_low.append(k)
+
+        first = k - 2 * length + 1
+        while self._max_high[0] < first:
+            self._max_high.popleft()
+        while self._min_low[0] < first:
+            self._min_low.popleft()
+
+        i = k - length
+        if i < 2 * length - 1:
+            return
+        if high[i] == high[self._max_high[0]]:
+            swing = SwingRecord(self._ts[i], i, True, high[i])
+        elif low[i] == low[self._min_low[0]]:
+            swing = SwingRecord(self._ts[i], i, False, low[i])
+        else:
+            return
+        self._add_swing(swing, k)
+
+    def _add_swing(self, swing: SwingRecord, k: int) -> None:
+        """Append a swing; consecutive same-side swings keep only the first extreme"""
+        swings = self.swings
+        if swings and swings[-1].is_high == swing.is_high:
+            last = swings[-1]
+            if not (swing.level > last.level if swing.is_high else swing.level < last.level):
+                return
+            swings[-1] = swing
+        else:
+            swings.append(swing)
+            if len(swings) >= 2:
+                # The previous swing can no longer be replaced
+                self._finalize(swings[-2], k)
+
+        if swing.is_high:
+            self._last_high = swing
+        else:
+            self._last_low = swing
+
+    def _finalize(self, swing: SwingRecord, k: int) -> None:
+        if len(self.swings) >= 5:
+            self._check_structure(self.swings[-5:-1], k)
+        self._add_to_pool(swing, k)
+
+    # ------------------------------------------------------------------
+    # BOS / CHoCH
+    # ------------------------------------------------------------------
+
+    def _check_structure(self, last_four: list[SwingRecord], k: int) -> None:
+        """Classify the last four final swings as in smc.bos_choch"""
+        s4, s3, s2, s1 = last_four
+        l4, l3, l2, l1 = s4.level, s3.level, s2.level, s1.level
+
+        if not s4.is_high:
+            is_bullish = True
+            if l4 < l2 < l3 < l1:
+                is_choch = False
+            elif l1 > l3 > l4 > l2:
+                is_choch = True
+            else:
+                return
+        else:
+            is_bullish = False
+            if l4 > l2 > l3 > l1:
+                is_choch = False
+            elif l1 < l3 < l4 < l2:
+                is_choch = True
+            else:
+                return
+
+        record = BreakRecord(s3.timestamp, s3.position, is_bullish, is_choch, s3.level)
+
+        # The level may already have been broken by bars seen before confirmation
+        if is_bullish:
+            series = self._close if self.close_break else self._high
+            for j in range(record.position + 2, k + 1):
+                if series[j] > record.level:
+                    self._break(record, j)
+                    return
+            self._heap_push(self._breaks_up, record.level, record)
+        else:
+            series = self._close if self.close_break else self._low
+            for j in range(record.position + 2, k + 1):
+                if series[j] < record.level:
+                    self._break(record, j)
+                    return
+            self._heap_push(self._breaks_down, -record.level, record)
+
+    def _check_breaks(self, k: int) -> None:
+        up = self._close[k] if self.close_break else self._high[k]
+        while self._breaks_up and self._breaks_up[0][0] < up:
+            self._break(heapq.heappop(self._breaks_up)[2], k)
+
+        down = self._close[k] if self.close_break else self._low[k]
+        while self._breaks_down and -self._breaks_down[0][0] > down:
+            self._break(heapq.heappop(self._breaks_down)[2], k)
+
+    def _break(self, record: BreakRecord, k: int) -> None:
+        record.broken_at = self._ts[k]
+        record.broken_position = k
+        self.breaks.append(record)
+        self._report("breaks", record)
+
+    # ------------------------------------------------------------------
+    # Fair value gaps
+    # ------------------------------------------------------------------
+
+    def _detect_fvg(self, k: int) -> None:
+        """Three-candle gap around bar k-1, as in smc.fvg (no joining)"""
+        if k < 2:
+            return
+        i = k - 1
+        rising = self._close[i] > self._open[i]
+        falling = self._close[i] < self._open[i]
+
+        if rising and self._high[i - 1] < self._low[k]:
+            record = FVGRecord(self._ts[i], i, True, self._low[k], self._high[i - 1])
+            self._heap_push(self._fvg_bull, -record.top, record)
+        elif falling and self._low[i - 1] > self._high[k]:
+            record = FVGRecord(self._ts[i], i, False, self._low[i - 1], self._high[k])
+            self._heap_push(self._fvg_bear, record.bottom, record)
+        else:
+            return
+
+        self.fair_value_gaps[record.timestamp] = record
+        self._report("fair_value_gaps", record)
+
+    def _check_fvg_fills(self, k: int) -> None:
+        while self._fvg_bull and -self._fvg_bull[0][0] >= self._low[k]:
+            self._mitigate(heapq.heappop(self._fvg_bull)[2], k)
+        while self._fvg_bear and self._fvg_bear[0][0] <= self._high[k]:
+            self._mitigate(heapq.heappop(self._fvg_bear)[2], k)
+
+    def _mitigate(self, record: OrderBlockRecord | FVGRecord, k: int) -> None:
+        record.mitigated_at = self._ts[k]
+        record.mitigated_position = k
+        self._report("mitigated", record)
+
+    # ------------------------------------------------------------------
+    # Order blocks
+    # ------------------------------------------------------------------
+
+    def _detect_order_blocks(self, k: int) -> None:
+        """
+        Close through the last swing high (low) creates a bullish (bearish) OB
+        at the lowest (highest) candle since that swing, as in smc.ob.
+        """
+        top = self._last_high
+        if top is not None and top.position not in self._crossed and self._close[k] > top.level:
+            self._crossed.add(top.position)
+            self._add_order_block(self._extreme(self._low, top.position + 1, k, min), k, True)
+
+        bottom = self._last_low
+        if (
+            bottom is not None
+            and bottom.position not in self._crossed
+            and self._close[k] < bottom.level
+        ):
+            self._crossed.add(bottom.position)
+            self._add_order_block(self._extreme(self._high, bottom.position + 1, k, max), k, False)
+
+    @staticmethod
+    def _extreme(values: list[float], start: int, stop: int, pick) -> int:
+        """Position of the last occurrence of the min/max of values[start:stop]"""
+        if stop <= start:
+            return stop - 1
+        segment = values[start:stop]
+        target = pick(segment)
+        return stop - 1 - segment[::-1].index(target)
+
+    def _add_order_block(self, j: int, k: int, is_bullish: bool) -> None:
+        record = OrderBlockRecord(
+            timestamp=self._ts[j],
+            position=j,
+            is_bullish=is_bullish,
+            top=self._high[j],
+            bottom=self._low[j],
+            open=self._open[j],
+            close=self._close[j],
+            volume=sum(self._volume[max(0, k - 2) : k + 1]),
+        )
+        self.order_blocks[record.timestamp] = record
+        if is_bullish:
+            self._heap_push(self._ob_bull, -record.bottom, record)
+        else:
+            self._heap_push(self._ob_bear, record.top, record)
+        self._report("order_blocks", record)
+
+    def _check_order_blocks(self, k: int) -> None:
+        open_, high, low, close = self._open[k], self._high[k], self._low[k], self._close[k]
+
+        # Mitigated OBs are dropped once price trades back through them
+        while self._breaker_bull and self._breaker_bull[0][0] < high:
+            self._drop_order_block(heapq.heappop(self._breaker_bull)[2])
+        while self._breaker_bear and -self._breaker_bear[0][0] > low:
+            self._drop_order_block(heapq.heappop(self._breaker_bear)[2])
+
+        probe = min(open_, close) if self.close_mitigation else low
+        while self._ob_bull and -self._ob_bull[0][0] > probe:
+            record = heapq.heappop(self._ob_bull)[2]
+            if self.order_blocks.get(record.timestamp) is record:
+                self._mitigate(record, k)
+                self._heap_push(self._breaker_bull, record.top, record)
+
+        probe = max(open_, close) if self.close_mitigation else high
+        while self._ob_bear and self._ob_bear[0][0] < probe:
+            record = heapq.heappop(self._ob_bear)[2]
+            if self.order_blocks.get(record.timestamp) is record:
+                self._mitigate(record, k)
+                self._heap_push(self._breaker_bear, -record.bottom, record)
+
+    def _drop_order_block(self, record: OrderBlockRecord) -> None:
+        if self.order_blocks.get(record.timestamp) is record:
+            del self.order_blocks[record.timestamp]
+
+    # ------------------------------------------------------------------
+    # Liquidity
+    # ------------------------------------------------------------------
+
+    def _add_to_pool(self, swing: SwingRecord, k: int) -> None:
+        """Join the earliest pool still open at the swing, or start a new one"""
+        pools = self._pools[swing.is_high]
+        # Pools swept before this swing can no longer collect members
+        pools[:] = [p for p in pools if p.swept_position < 0 or p.swept_position >= swing.position]
+
+        for pool in pools:
+            if pool.band_low <= swing.level <= pool.band_high:
+                pool.levels.append(swing.level)
+                pool.end_at = swing.timestamp
+                pool.end_position = swing.position
+                self.liquidity[pool.timestamp] = pool
+                self._report("liquidity", pool)
+                return
+
+        band = abs(swing.level) * self.liquidity_range_percent
+        pool = LiquidityRecord(
+            timestamp=swing.timestamp,
+            position=swing.position,
+            is_bullish=swing.is_high,
+            band_low=swing.level - band,
+            band_high=swing.level + band,
+            levels=[swing.level],
+            end_at=swing.timestamp,
+            end_position=swing.position,
+        )
+        pools.append(pool)
+
+        for j in range(swing.position + 1, k + 1):
+            if swing.is_high and self._high[j] >= pool.band_high:
+                self._sweep(pool, j)
+                return
+            if not swing.is_high and self._low[j] <= pool.band_low:
+                self._sweep(pool, j)
+                return
+        if swing.is_high:
+            self._heap_push(self._sweep_high, pool.band_high, pool)
+        else:
+            self._heap_push(self._sweep_low, -pool.band_low, pool)
+
+    def _check_sweeps(self, k: int) -> None:
+        while self._sweep_high and self._sweep_high[0][0] <= self._high[k]:
+            self._sweep(heapq.heappop(self._sweep_high)[2], k)
+        while self._sweep_low and -self._sweep_low[0][0] >= self._low[k]:
+            self._sweep(heapq.heappop(self._sweep_low)[2], k)
+
+    def _sweep(self, pool: LiquidityRecord, k: int) -> None:
+        pool.swept_at = self._ts[k]
+        pool.swept_position = k
+        if len(pool.levels) > 1:
+            self._report("liquidity", pool)
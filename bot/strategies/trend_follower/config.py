@@ -36,6 +36,10 @@ class TrendFollowerConfig:
     # Ranging detection (sideways market)
     ranging_high_low_lookback: int = 50  # Candles for range detection
 
+    # Incremental indicators: feed only new bars into a streaming EMA/ATR/RSI
+    # state instead of recomputing the whole window on every analyze() call
+    incremental_indicators: bool = False
+
     # ===== ENTRY LOGIC =====
     # Volume confirmation
     require_volume_confirmation: bool = True
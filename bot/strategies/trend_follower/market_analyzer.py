@@ -15,6 +15,7 @@ from typing import Optional
 
 import pandas as pd
 
+from bot.indicators import IndicatorStream
 from bot.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -78,6 +79,7 @@ class MarketAnalyzer:
         ranging_lookback: int = 50,
         weak_trend_threshold: Decimal = Decimal("0.01"),
         strong_trend_threshold: Decimal = Decimal("0.02"),
+        incremental: bool = False,
     ):
         """
         Initialize Market Analyzer
@@ -91,6 +93,8 @@ class MarketAnalyzer:
             ranging_lookback: Candles for range detection (default: 50)
             weak_trend_threshold: EMA divergence for weak trend (default: 1%)
             strong_trend_threshold: EMA divergence for strong trend (default: 2%)
+            incremental: Keep EMA/ATR/RSI in an IndicatorStream and only feed
+                bars newer than the previous call (default: False)
         """
         self.ema_fast_period = ema_fast_period
         self.ema_slow_period = ema_slow_period
@@ -100,6 +104,15 @@ class MarketAnalyzer:
         self.ranging_lookback = ranging_lookback
         self.weak_trend_threshold = weak_trend_threshold
         self.strong_trend_threshold = strong_trend_threshold
+        self.incremental = incremental
+        self._stream: Optional[IndicatorStream] = None
+        if incremental:
+            self._stream = IndicatorStream(
+                ema_fast=ema_fast_period,
+                ema_slow=ema_slow_period,
+                atr_period=atr_period,
+                rsi_period=rsi_period,
+            )
 
         logger.info(
             "MarketAnalyzer initialized",
@@ -124,16 +137,24 @@ class MarketAnalyzer:
         self._validate_dataframe(df)
 
         # Calculate all indicators
-        ema_fast = self._calculate_ema(df, self.ema_fast_period)
-        ema_slow = self._calculate_ema(df, self.ema_slow_period)
-        atr = self._calculate_atr(df, self.atr_period)
-        rsi = self._calculate_rsi(df, self.rsi_period)
-
         current_price = Decimal(str(df["close"].iloc[-1]))
-        ema_fast_val = Decimal(str(ema_fast.iloc[-1]))
-        ema_slow_val = Decimal(str(ema_slow.iloc[-1]))
-        atr_val = Decimal(str(atr.iloc[-1]))
-        rsi_val = Decimal(str(rsi.iloc[-1]))
+        if self._stream is not None:
+            self._stream.sync(df)
+            snapshot = self._stream.snapshot()
+            ema_fast_val = Decimal(str(snapshot.ema_fast))
+            ema_slow_val = Decimal(str(snapshot.ema_slow))
+            atr_val = Decimal(str(snapshot.atr))
+            rsi_val = Decimal(str(snapshot.rsi))
+        else:
+            ema_fast = self._calculate_ema(df, self.ema_fast_period)
+            ema_slow = self._calculate_ema(df, self.ema_slow_period)
+            atr = self._calculate_atr(df, self.atr_period)
+            rsi = self._calculate_rsi(df, self.rsi_period)
+
+            ema_fast_val = Decimal(str(ema_fast.iloc[-1]))
+            ema_slow_val = Decimal(str(ema_slow.iloc[-1]))
+            atr_val = Decimal(str(atr.iloc[-1]))
+            rsi_val = Decimal(str(rsi.iloc[-1]))
 
         # Calculate EMA divergence percentage
         ema_divergence_pct = abs((ema_fast_val - ema_slow_val) / ema_slow_val)
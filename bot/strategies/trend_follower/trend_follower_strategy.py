@@ -89,6 +89,7 @@ class TrendFollowerStrategy:
             ranging_lookback=self.config.ranging_high_low_lookback,
             weak_trend_threshold=self.config.weak_trend_threshold,
             strong_trend_threshold=self.config.strong_trend_threshold,
+            incremental=self.config.incremental_indicators,
         )
 
         self.entry_logic = EntryLogicAnalyzer(
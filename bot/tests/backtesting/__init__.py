@@ -1,7 +1,11 @@
 """Backtesting and market simulation framework"""
 
+from .adaptive_search import AdaptiveSearch, AdaptiveSearchConfig, ParamRange
 from .backtesting_engine import BacktestingEngine
+from .candle_store import CandleStore
 from .checkpoint import OptimizationCheckpoint
+from .equity_curve import EquityCurve
+from .fast_market_simulator import FastMarketSimulator
 from .indicator_cache import IndicatorCache
 from .job_store import JobStore
 from .market_simulator import MarketSimulator
@@ -10,7 +14,9 @@ from .multi_tf_data_loader import MultiTimeframeData, MultiTimeframeDataLoader
 from .multi_tf_engine import MultiTFBacktestConfig, MultiTimeframeBacktestEngine
 from .optimization import OptimizationConfig, OptimizationResult, ParameterOptimizer
 from .preset_export import PresetExporter
+from .process_executor import ProcessTrialExecutor, StrategySpec
 from .report_generator import ReportConfig, ReportGenerator
+from .result_cache import ResultCache
 from .sensitivity import SensitivityAnalysis, SensitivityConfig, SensitivityResult
 from .strategy_comparison import StrategyComparison, StrategyComparisonResult
 from .stress_testing import StressTestConfig, StressTester, StressTestResult
@@ -19,12 +25,15 @@ from .walk_forward import WalkForwardAnalysis, WalkForwardConfig, WalkForwardRes
 
 __all__ = [
     "MarketSimulator",
+    "FastMarketSimulator",
     "BacktestingEngine",
     "HistoricalDataProvider",
     "MultiTimeframeDataLoader",
     "MultiTimeframeData",
     "MultiTimeframeBacktestEngine",
     "MultiTFBacktestConfig",
+    "CandleStore",
+    "EquityCurve",
     "StrategyComparison",
     "StrategyComparisonResult",
     "WalkForwardAnalysis",
@@ -36,6 +45,8 @@ __all__ = [
     "ParameterOptimizer",
     "OptimizationConfig",
     "OptimizationResult",
+    "ProcessTrialExecutor",
+    "StrategySpec",
     "SensitivityAnalysis",
     "SensitivityConfig",
     "SensitivityResult",
@@ -44,6 +55,10 @@ __all__ = [
     "OptimizationCheckpoint",
     "IndicatorCache",
     "JobStore",
+    "ResultCache",
+    "AdaptiveSearch",
+    "AdaptiveSearchConfig",
+    "ParamRange",
     "PresetExporter",
     "StressTester",
     "StressTestConfig",
@@ -0,0 +1,667 @@
+"""
+Adaptive Search — successive halving / Hyperband over data fidelity with a
+TPE sampler for continuous ranges.
+
+Grid search runs every combination over the whole dataset. Successive
+halving instead evaluates many configurations on a short prefix of the
+data, keeps the best ``1/eta`` and re-runs them on an ``eta`` times longer
+prefix until the survivors see the full history. Hyperband runs several
+such brackets, trading the number of configurations against their starting
+length. Parameters are either value lists (as in a grid) or ``ParamRange``
+intervals; configurations are drawn by a Tree-structured Parzen Estimator
+once enough results exist at one fidelity, uniformly before that.
+
+Plans are engine-agnostic generators: they yield ``(configs, fraction)``
+batches and are sent one score per config (higher is better), so sync and
+async optimizers drive the same logic. ``ParameterOptimizer.adaptive_optimize``
+and ``GridOptimizer.optimize_adaptive`` are the drivers.
+
+Usage:
+    result = await ParameterOptimizer(config).adaptive_optimize(
+        StrategySpec("mypkg.strategies:make_strategy"),
+        {"tp_pct": ParamRange(0.005, 0.05, log=True), "buy_every_n": [5, 10, 20]},
+        data,
+        search=AdaptiveSearchConfig(method="hyperband"),
+    )
+    print(result.report(grid=grid_result, grid_seconds=grid_elapsed))
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import json
+import logging
+import math
+import time
+from collections.abc import Callable, Generator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from bot.strategies.base import BaseStrategy
+    from bot.tests.backtesting.backtesting_engine import BacktestResult
+    from bot.tests.backtesting.multi_tf_data_loader import MultiTimeframeData
+    from bot.tests.backtesting.optimization import (
+        OptimizationResult,
+        ParameterOptimizer,
+        TrialCallback,
+    )
+
+logger = logging.getLogger(__name__)
+
+METHODS = ("halving", "hyperband", "bayesian")
+
+# A plan yields (configs, data fraction) and is sent one score per config
+Plan = Generator[tuple[list[dict[str, Any]], float], list[float], None]
+
+
+@dataclass(frozen=True)
+class ParamRange:
+    """
+    Continuous (or integer) parameter interval ``[low, high]``.
+
+    ``log`` samples uniformly in log space; ``digits`` rounds float values,
+    which keeps keys, checkpoints and reports readable.
+    """
+
+    low: float
+    high: float
+    log: bool = False
+    integer: bool = False
+    digits: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.high < self.low:
+            raise ValueError(f"ParamRange high {self.high} is below low {self.low}")
+        if self.log and self.low <= 0:
+            raise ValueError("ParamRange with log=True needs low > 0")
+
+    def from_unit(self, u: float) -> float | int:
+        """Map ``u`` in [0, 1] onto the range."""
+        if self.log:
+            value = math.exp(math.log(self.low) + u * (math.log(self.high) - math.log(self.low)))
+        else:
+            value = self.low + u * (self.high - self.low)
+        value = min(max(value, self.low), self.high)
+        if self.integer:
+            return int(round(value))
+        return round(value, self.digits) if self.digits is not None else value
+
+    def to_unit(self, value: float) -> float:
+        if self.high == self.low:
+            return 0.5
+        if self.log:
+            span = math.log(self.high) - math.log(self.low)
+            return (math.log(value) - math.log(self.low)) / span
+        return (value - self.low) / (self.high - self.low)
+
+
+SearchSpace = dict[str, "list[Any] | ParamRange"]
+
+
+def space_size(space: SearchSpace) -> float:
+    """Number of distinct configurations (``inf`` with a float range)."""
+    size = 1.0
+    for dim in space.values():
+        if isinstance(dim, ParamRange):
+            if not dim.integer:
+                return math.inf
+            size *= int(dim.high) - int(dim.low) + 1
+        else:
+            size *= len(dim)
+    return size
+
+
+def params_key(params: dict[str, Any]) -> str:
+    return json.dumps(params, sort_keys=True, default=str)
+
+
+@dataclass
+class AdaptiveSearchConfig:
+    """Configuration for adaptive search."""
+
+    # "halving", "hyperband" or "bayesian" (TPE at full fidelity)
+    method: str = "halving"
+    # Keep the best 1/eta per rung; each rung sees eta times more data
+    eta: int = 3
+    # Data fraction of the first rung (of the bars after warm-up)
+    min_fraction: float = 1 / 9
+    # Configurations in the first halving rung (capped at the space size)
+    n_configs: int = 81
+    # Full-fidelity trials for "bayesian"
+    n_trials: int = 30
+    # TPE: random configurations before the model is used, share of
+    # observations treated as "good", candidates scored per proposal
+    n_startup: int = 8
+    gamma: float = 0.25
+    n_candidates: int = 24
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.method not in METHODS:
+            raise ValueError(f"Unknown method {self.method!r}, expected one of {METHODS}")
+        if self.eta < 2:
+            raise ValueError("eta must be at least 2")
+        if not 0 < self.min_fraction <= 1:
+            raise ValueError("min_fraction must be in (0, 1]")
+
+
+# ---------------------------------------------------------------------------
+# Sampler
+# ---------------------------------------------------------------------------
+
+
+class TPESampler:
+    """
+    Tree-structured Parzen Estimator over a ``SearchSpace``.
+
+    Observations are split into the best ``gamma`` share and the rest; each
+    dimension gets a density for both groups (Gaussian kernels in unit space
+    for ranges, smoothed frequencies for value lists) and the candidate with
+    the highest good/bad density ratio is proposed. Only observations from
+    the highest fidelity with at least ``n_startup`` results are used.
+    Configurations are never proposed twice.
+    """
+
+    def __init__(
+        self,
+        space: SearchSpace,
+        seed: int | None = None,
+        n_startup: int = 8,
+        gamma: float = 0.25,
+        n_candidates: int = 24,
+    ) -> None:
+        if not space:
+            raise ValueError("Search space is empty")
+        self.space = space
+        self.n_startup = n_startup
+        self.gamma = gamma
+        self.n_candidates = n_candidates
+        self.rng = np.random.default_rng(seed)
+        self._size = space_size(space)
+        self._seen: set[str] = set()
+        # fraction -> [(params, score)]
+        self._history: dict[float, list[tuple[dict[str, Any], float]]] = {}
+
+    def observe(self, params: dict[str, Any], fraction: float, score: float) -> None:
+        if math.isfinite(score):
+            self._history.setdefault(fraction, []).append((params, score))
+
+    def propose(self, n: int) -> list[dict[str, Any]]:
+        """Up to ``n`` new configurations (fewer once the space is exhausted)."""
+        picked: list[dict[str, Any]] = []
+        if self._size - len(self._seen) <= n:
+            # Everything left fits in this batch: take it, in random order
+            rest = [p for p in self._enumerate() if params_key(p) not in self._seen]
+            picked = [rest[i] for i in self.rng.permutation(len(rest))]
+        else:
+            for _ in range(n):
+                params = self._propose_one()
+                if params is None:
+                    break
+                picked.append(params)
+                self._seen.add(params_key(params))
+        self._seen.update(params_key(p) for p in picked)
+        return picked
+
+    def _enumerate(self) -> list[dict[str, Any]]:
+        axes = []
+        for dim in self.space.values():
+            if isinstance(dim, ParamRange):
+                axes.append(list(range(int(dim.low), int(dim.high) + 1)))
+            else:
+                axes.append(list(dim))
+        names = list(self.space)
+        return [dict(zip(names, combo, strict=True)) for combo in itertools.product(*axes)]
+
+    def _model_observations(self) -> list[tuple[dict[str, Any], float]] | None:
+        for fraction in sorted(self._history, reverse=True):
+            if len(self._history[fraction]) >= self.n_startup:
+                return self._history[fraction]
+        return None
+
+    def _propose_one(self) -> dict[str, Any] | None:
+        observations = self._model_observations()
+        for _ in range(100):
+            if observations is None:
+                params = self._random()
+            else:
+                params = self._tpe(observations)
+            if params_key(params) not in self._seen:
+                return params
+        return None
+
+    def _random(self) -> dict[str, Any]:
+        params = {}
+        for name, dim in self.space.items():
+            if isinstance(dim, ParamRange):
+                params[name] = dim.from_unit(float(self.rng.random()))
+            else:
+                params[name] = dim[int(self.rng.integers(len(dim)))]
+        return params
+
+    def _tpe(self, observations: list[tuple[dict[str, Any], float]]) -> dict[str, Any]:
+        ranked = sorted(observations, key=lambda o: o[1], reverse=True)
+        n_good = max(1, math.ceil(self.gamma * len(ranked)))
+        good = [p for p, _ in ranked[:n_good]]
+        bad = [p for p, _ in ranked[n_good:]] or good
+
+        n = self.n_candidates
+        candidates: dict[str, list[Any]] = {}
+        log_ratio = np.zeros(n)
+        for name, dim in self.space.items():
+            if isinstance(dim, ParamRange):
+                g = np.array([dim.to_unit(p[name]) for p in good])
+                b = np.array([dim.to_unit(p[name]) for p in bad])
+                g_bw, b_bw = _bandwidth(g), _bandwidth(b)
+                centres = g[self.rng.integers(len(g), size=n)]
+                u = np.clip(centres + self.rng.normal(0, g_bw, size=n), 0.0, 1.0)
+                log_ratio += np.log(_parzen(u, g, g_bw)) - np.log(_parzen(u, b, b_bw))
+                candidates[name] = [dim.from_unit(float(x)) for x in u]
+            else:
+                k = len(dim)
+                keys = [params_key({"v": v}) for v in dim]
+                index = {key: i for i, key in enumerate(keys)}
+                g_counts = np.ones(k)
+                b_counts = np.ones(k)
+                for p in good:
+                    g_counts[index[params_key({"v": p[name]})]] += 1
+                for p in bad:
+                    b_counts[index[params_key({"v": p[name]})]] += 1
+                g_prob, b_prob = g_counts / g_counts.sum(), b_counts / b_counts.sum()
+                picks = self.rng.choice(k, size=n, p=g_prob)
+                log_ratio += np.log(g_prob[picks]) - np.log(b_prob[picks])
+                candidates[name] = [dim[i] for i in picks]
+
+        for i in np.argsort(-log_ratio):
+            params = {name: values[i] for name, values in candidates.items()}
+            if params_key(params) not in self._seen:
+                return params
+        return self._random()
+
+
+def _bandwidth(points: np.ndarray) -> float:
+    # Scott's rule, floored so a single point still explores its neighbourhood
+    if len(points) < 2:
+        return 0.25
+    return float(max(1.06 * points.std() * len(points) ** -0.2, 0.05))
+
+
+def _parzen(x: np.ndarray, points: np.ndarray, bw: float) -> np.ndarray:
+    # Gaussian mixture on the points plus a uniform prior component
+    z = (x[:, None] - points[None, :]) / bw
+    kernels = np.exp(-0.5 * z * z) / (bw * math.sqrt(2 * math.pi))
+    return (kernels.sum(axis=1) + 1.0) / (len(points) + 1)
+
+
+# ---------------------------------------------------------------------------
+# Plans
+# ---------------------------------------------------------------------------
+
+
+def rung_fractions(eta: int, min_fraction: float) -> list[float]:
+    """Data fractions of the rungs of one halving bracket, ending at 1.0."""
+    n_rungs = int(math.floor(math.log(1 / min_fraction, eta) + 1e-9)) + 1
+    return [min(1.0, min_fraction * eta**i) for i in range(n_rungs - 1)] + [1.0]
+
+
+def successive_halving(sampler: TPESampler, n_configs: int, eta: int, min_fraction: float) -> Plan:
+    """One bracket: ``n_configs`` at ``min_fraction``, top ``1/eta`` promoted per rung."""
+    configs = sampler.propose(n_configs)
+    for fraction in rung_fractions(eta, min_fraction):
+        if not configs:
+            return
+        scores = yield configs, fraction
+        for params, score in zip(configs, scores, strict=True):
+            sampler.observe(params, fraction, score)
+        if fraction >= 1.0:
+            return
+        ranked = sorted(zip(configs, scores, strict=True), key=lambda c: c[1], reverse=True)
+        keep = max(1, len(configs) // eta)
+        configs = [p for p, s in ranked[:keep] if math.isfinite(s)]
+
+
+def hyperband(sampler: TPESampler, eta: int, min_fraction: float) -> Plan:
+    """
+    Brackets from most aggressive (many configs, shortest prefix) to plain
+    full-length runs. Later brackets draw from the TPE model fitted on the
+    earlier ones.
+    """
+    s_max = len(rung_fractions(eta, min_fraction)) - 1
+    for s in range(s_max, -1, -1):
+        n = math.ceil((s_max + 1) / (s + 1) * eta**s)
+        bracket_min = 1.0 if s == 0 else eta ** (-s)
+        yield from successive_halving(sampler, n, eta, bracket_min)
+
+
+def bayesian(sampler: TPESampler, n_trials: int, batch_size: int = 1) -> Plan:
+    """TPE at full fidelity, ``batch_size`` proposals per model update."""
+    done = 0
+    while done < n_trials:
+        configs = sampler.propose(min(batch_size, n_trials - done))
+        if not configs:
+            return
+        scores = yield configs, 1.0
+        for params, score in zip(configs, scores, strict=True):
+            sampler.observe(params, 1.0, score)
+        done += len(configs)
+
+
+def make_plan(config: AdaptiveSearchConfig, space: SearchSpace, batch_size: int = 1) -> Plan:
+    sampler = TPESampler(
+        space,
+        seed=config.seed,
+        n_startup=config.n_startup,
+        gamma=config.gamma,
+        n_candidates=config.n_candidates,
+    )
+    if config.method == "hyperband":
+        return hyperband(sampler, config.eta, config.min_fraction)
+    if config.method == "bayesian":
+        return bayesian(sampler, config.n_trials, batch_size)
+    return successive_halving(sampler, config.n_configs, config.eta, config.min_fraction)
+
+
+def run_plan(
+    plan: Plan,
+    evaluate: Callable[[list[dict[str, Any]], float], list[float]],
+) -> None:
+    """Drive ``plan`` with a synchronous ``evaluate(configs, fraction) -> scores``."""
+    batch = next(plan, None)
+    while batch is not None:
+        scores = evaluate(*batch)
+        try:
+            batch = plan.send(scores)
+        except StopIteration:
+            batch = None
+
+
+# ---------------------------------------------------------------------------
+# ParameterOptimizer driver
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class AdaptiveTrial:
+    """One evaluation of a configuration on a data prefix."""
+
+    params: dict[str, Any]
+    bars: int
+    fraction: float
+    objective_value: float
+    # None when restored from a checkpoint
+    result: BacktestResult | None = None
+
+
+@dataclass
+class AdaptiveSearchResult:
+    """Outcome of an adaptive search plus its cost."""
+
+    optimization: OptimizationResult
+    evaluations: list[AdaptiveTrial]
+    method: str
+    full_bars: int
+    warmup_bars: int
+    wall_clock_seconds: float
+    higher_is_better: bool = True
+    space: SearchSpace = field(default_factory=dict)
+
+    @property
+    def best_params(self) -> dict[str, Any]:
+        return self.optimization.best_params
+
+    @property
+    def best_objective(self) -> float:
+        return self.optimization.best_objective
+
+    def _cost(self, trial: AdaptiveTrial) -> float:
+        active = max(1, self.full_bars - self.warmup_bars)
+        return max(0, trial.bars - self.warmup_bars) / active
+
+    @property
+    def full_run_equivalents(self) -> float:
+        """Total simulated bars (after warm-up) in units of one full-length run."""
+        return sum(self._cost(t) for t in self.evaluations)
+
+    @property
+    def trials_to_best(self) -> int:
+        """Evaluations run up to the full-length evaluation of the best configuration."""
+        best = params_key(self.best_params)
+        for i, t in enumerate(self.evaluations, 1):
+            if t.fraction >= 1.0 and params_key(t.params) == best:
+                return i
+        return len(self.evaluations)
+
+    @property
+    def budget_to_best(self) -> float:
+        """Full-run equivalents spent up to the best configuration's full evaluation."""
+        return sum(self._cost(t) for t in self.evaluations[: self.trials_to_best])
+
+    def report(
+        self, grid: OptimizationResult | None = None, grid_seconds: float | None = None
+    ) -> dict[str, Any]:
+        """Cost summary, optionally against a grid search over the same space."""
+        report: dict[str, Any] = {
+            "method": self.method,
+            "best_params": self.best_params,
+            "best_objective": self.best_objective,
+            "evaluations": len(self.evaluations),
+            "full_run_equivalents": round(self.full_run_equivalents, 3),
+            "trials_to_best": self.trials_to_best,
+            "budget_to_best": round(self.budget_to_best, 3),
+            "wall_clock_seconds": round(self.wall_clock_seconds, 3),
+        }
+        if grid is not None:
+            order = [
+                params_key(dict(zip(grid.param_grid, combo, strict=True)))
+                for combo in itertools.product(*grid.param_grid.values())
+            ]
+            best = params_key(grid.best_params)
+            sign = 1 if self.higher_is_better else -1
+            report["grid"] = {
+                "best_params": grid.best_params,
+                "best_objective": grid.best_objective,
+                "evaluations": len(grid.all_trials),
+                "trials_to_best": order.index(best) + 1 if best in order else len(order),
+                "wall_clock_seconds": grid_seconds,
+                # How far the adaptive best falls short of the grid best
+                "regret": sign * (grid.best_objective - self.best_objective),
+            }
+            if grid_seconds:
+                report["grid"]["speedup"] = round(grid_seconds / self.wall_clock_seconds, 2)
+        return report
+
+
+def objective_from_dict(result_dict: dict[str, Any], objective: str) -> float:
+    """Objective value from a ``BacktestResult.to_dict()`` (metrics are nested by section)."""
+    sections = [result_dict] + [v for v in result_dict.values() if isinstance(v, dict)]
+    for section in sections:
+        value = section.get(objective)
+        if value is not None:
+            return float(value)
+    return 0.0
+
+
+def _callable_identity(fn: Callable[..., Any]) -> str:
+    """``module:qualname`` of a strategy factory (unwrapping ``functools.partial``)."""
+    if isinstance(fn, functools.partial):
+        return f"{_callable_identity(fn.func)}{fn.args!r}{sorted(fn.keywords.items())!r}"
+    module = getattr(fn, "__module__", None) or type(fn).__module__
+    qualname = getattr(fn, "__qualname__", None) or type(fn).__qualname__
+    return f"{module}:{qualname}"
+
+
+class AdaptiveSearch:
+    """Runs a plan with a ``ParameterOptimizer``'s engine, objective, checkpoint and cache."""
+
+    def __init__(
+        self, optimizer: ParameterOptimizer, config: AdaptiveSearchConfig | None = None
+    ) -> None:
+        self.optimizer = optimizer
+        self.config = config or AdaptiveSearchConfig()
+
+    async def run(
+        self,
+        strategy_factory: Callable[[dict[str, Any]], BaseStrategy],
+        space: SearchSpace,
+        data: MultiTimeframeData,
+        max_workers: int | None = None,
+        on_trial: TrialCallback | None = None,
+        run_id: str | None = None,
+    ) -> AdaptiveSearchResult:
+        from bot.tests.backtesting.checkpoint import OptimizationCheckpoint
+        from bot.tests.backtesting.optimization import OptimizationResult, OptimizationTrial
+
+        opt = self.optimizer
+        opt._cancelled = False
+        start = time.perf_counter()
+        warmup = opt.config.backtest_config.warmup_bars
+        full_bars = len(data.m5)
+        if run_id is None:
+            # Deterministic, so an interrupted search resumes from its checkpoint
+            # and a different dataset or strategy never reuses another run's scores
+            m5 = data.m5
+            run_id = "adaptive-" + OptimizationCheckpoint.config_hash(
+                {
+                    "space": space,
+                    "search": self.config,
+                    "objective": opt.config.objective,
+                    "dataset": {
+                        "symbol": opt.config.backtest_config.symbol,
+                        "first": m5.index[0] if full_bars else None,
+                        "last": m5.index[-1] if full_bars else None,
+                        "bars": full_bars,
+                    },
+                    "strategy": _callable_identity(strategy_factory),
+                }
+            )
+
+        evaluations: list[AdaptiveTrial] = []
+        rung_ids: set[str] = set()
+
+        async def evaluate(configs: list[dict[str, Any]], fraction: float) -> list[float]:
+            bars = self._bars(fraction, full_bars, warmup)
+            rung_id = f"{run_id}-{bars}"
+            rung_ids.add(rung_id)
+            trials = await self._evaluate_rung(
+                strategy_factory, configs, data, bars, fraction, rung_id, max_workers, on_trial
+            )
+            scores = []
+            for params in configs:
+                trial = trials.get(params_key(params))
+                if trial is None:
+                    scores.append(-math.inf)
+                    continue
+                evaluations.append(trial)
+                value = trial.objective_value
+                scores.append(value if opt.config.higher_is_better else -value)
+            logger.info(
+                "Rung: %d configs on %d bars (%.0f%%), best %.4f",
+                len(configs),
+                bars,
+                fraction * 100,
+                max(scores, default=0.0),
+            )
+            return scores
+
+        plan = make_plan(self.config, space, batch_size=max(1, max_workers or 1))
+        batch = next(plan, None)
+        while batch is not None and not opt._cancelled:
+            scores = await evaluate(*batch)
+            try:
+                batch = plan.send(scores)
+            except StopIteration:
+                batch = None
+
+        final = [t for t in evaluations if t.fraction >= 1.0]
+        final.sort(key=lambda t: t.objective_value, reverse=opt.config.higher_is_better)
+        if final and final[0].result is None:
+            # Best was restored from a checkpoint: re-run it for the full result
+            best = final[0]
+            trials = await opt._evaluate(strategy_factory, [best.params], data, max_workers)
+            if trials:
+                best.result = trials[0].result
+
+        ranked = [
+            OptimizationTrial(params=t.params, result=t.result, objective_value=t.objective_value)
+            for t in final
+            if t.result is not None
+        ]
+        best_trial = ranked[0] if ranked else None
+        optimization = OptimizationResult(
+            best_params=best_trial.params if best_trial else {},
+            best_result=best_trial.result if best_trial else opt._empty_result(),
+            best_objective=best_trial.objective_value if best_trial else 0.0,
+            all_trials=ranked,
+            objective_metric=opt.config.objective,
+            param_grid={k: v for k, v in space.items() if isinstance(v, list)},
+        )
+
+        if opt.checkpoint and not opt._cancelled:
+            for rung_id in rung_ids:
+                opt.checkpoint.cleanup(rung_id)
+
+        return AdaptiveSearchResult(
+            optimization=optimization,
+            evaluations=evaluations,
+            method=self.config.method,
+            full_bars=full_bars,
+            warmup_bars=warmup,
+            wall_clock_seconds=time.perf_counter() - start,
+            higher_is_better=opt.config.higher_is_better,
+            space=space,
+        )
+
+    @staticmethod
+    def _bars(fraction: float, full_bars: int, warmup: int) -> int:
+        if fraction >= 1.0:
+            return full_bars
+        active = max(1, full_bars - warmup)
+        return min(full_bars, warmup + max(1, math.ceil(fraction * active)))
+
+    async def _evaluate_rung(
+        self,
+        strategy_factory: Callable[[dict[str, Any]], BaseStrategy],
+        configs: list[dict[str, Any]],
+        data: MultiTimeframeData,
+        bars: int,
+        fraction: float,
+        rung_id: str,
+        max_workers: int | None,
+        on_trial: TrialCallback | None,
+    ) -> dict[str, AdaptiveTrial]:
+        """Evaluate ``configs`` on the first ``bars`` M5 bars, resuming from the checkpoint."""
+        from bot.tests.backtesting.checkpoint import OptimizationCheckpoint
+        from bot.tests.backtesting.walk_forward import segment_data
+
+        opt = self.optimizer
+        out: dict[str, AdaptiveTrial] = {}
+
+        pending = []
+        completed = opt.checkpoint.load_completed(rung_id) if opt.checkpoint else {}
+        for params in configs:
+            saved = completed.get(OptimizationCheckpoint.config_hash(params))
+            if saved is None:
+                pending.append(params)
+                continue
+            value = objective_from_dict(saved, opt.config.objective)
+            out[params_key(params)] = AdaptiveTrial(params, bars, fraction, value)
+
+        if pending:
+            rung_data = data if bars >= len(data.m5) else segment_data(data, slice(0, bars))[0]
+            trials = await opt._evaluate(
+                strategy_factory,
+                pending,
+                rung_data,
+                max_workers,
+                run_id=rung_id,
+                on_trial=on_trial,
+            )
+            for t in trials:
+                out[params_key(t.params)] = AdaptiveTrial(
+                    t.params, bars, fraction, t.objective_value, t.result
+                )
+        return out
@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Any
 
+from .fast_market_simulator import FastMarketSimulator
 from .market_simulator import MarketSimulator
 from .test_data import HistoricalDataProvider
 
@@ -175,10 +176,12 @@ class BacktestingEngine:
         self,
         symbol: str = "BTC/USDT",
         initial_balance: Decimal = Decimal("10000"),
+        fast_simulator: bool = False,
     ):
         self.symbol = symbol
         self.initial_balance = initial_balance
-        self.simulator = MarketSimulator(
+        simulator_cls = FastMarketSimulator if fast_simulator else MarketSimulator
+        self.simulator = simulator_cls(
             symbol=symbol,
             initial_balance_quote=initial_balance,
         )
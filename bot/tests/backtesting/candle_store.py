@@ -0,0 +1,273 @@
+"""
+Columnar OHLCV candle store — memory-mapped ``.npy`` columns plus a JSON manifest.
+
+Parsing CSVs row by row dominates load time for multi-year M5 data. The
+store keeps one directory per (symbol, timeframe) with a column per file:
+
+    <root>/manifest.json
+    <root>/BTC_USDT/5m/timestamp.npy   (datetime64[ns], naive UTC, sorted)
+    <root>/BTC_USDT/5m/open.npy        (float64)
+    ...
+
+Loads memory-map the columns, binary-search the date range on the
+timestamp column and copy only the requested slice.
+
+Usage:
+    store = CandleStore("data/candles")
+    store.import_csv("data/historical/bybit_BTC_USDT_5m.csv", "BTC/USDT", "5m")
+    df = store.load("BTC/USDT", "5m", start=datetime(2024, 1, 1))
+    data = MultiTimeframeDataLoader().load_store(store, "BTC/USDT")
+
+CLI (one-time import):
+    python -m bot.tests.backtesting.candle_store data/historical/*.csv --store data/candles
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+MANIFEST_NAME = "manifest.json"
+STORE_VERSION = 1
+
+# Downloader naming: {exchange}_{BASE}_{QUOTE}_{timeframe}.csv
+_CSV_NAME_RE = re.compile(
+    r"^(?P<exchange>[a-z]+)_(?P<base>\w+?)_(?P<quote>[A-Z]+)_(?P<tf>\d+[mhdw])$"
+)
+
+
+def read_ohlcv_csv(filepath: str | Path) -> pd.DataFrame:
+    """
+    Vectorized CSV reader returning an OHLCV DataFrame with a DatetimeIndex.
+
+    Accepts the same layouts as ``HistoricalDataProvider.load_csv_data``:
+    ``datetime`` (ISO) is preferred, then ``Open time``, then ``timestamp``;
+    numeric timestamp columns are Unix milliseconds. The index is always
+    ``datetime64[ns]``, matching CandleStore loads whatever pandas' default
+    unit is.
+    """
+    raw = pd.read_csv(filepath)
+    if "datetime" in raw.columns and raw["datetime"].notna().all():
+        ts_col = raw["datetime"]
+    elif "Open time" in raw.columns:
+        ts_col = raw["Open time"]
+    else:
+        ts_col = raw["timestamp"]
+
+    if pd.api.types.is_numeric_dtype(ts_col):
+        index = pd.to_datetime(ts_col.astype("int64"), unit="ms")
+    else:
+        index = pd.to_datetime(ts_col, format="ISO8601")
+
+    df = raw[list(OHLCV_COLUMNS)].astype("float64")
+    df.index = pd.DatetimeIndex(index, name="timestamp").as_unit("ns")
+    return df.sort_index()
+
+
+class CandleStore:
+    """Per-symbol/timeframe columnar candle storage with memory-mapped loads."""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._manifest = self._read_manifest()
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def series_key(symbol: str, timeframe: str) -> str:
+        return f"{symbol.replace('/', '_')}/{timeframe}"
+
+    def _read_manifest(self) -> dict[str, Any]:
+        path = self.root / MANIFEST_NAME
+        if not path.exists():
+            return {"version": STORE_VERSION, "series": {}}
+        with open(path) as f:
+            manifest = json.load(f)
+        if manifest.get("version") != STORE_VERSION:
+            raise ValueError(f"Unsupported candle store version: {manifest.get('version')}")
+        return manifest
+
+    def _write_manifest(self) -> None:
+        path = self.root / MANIFEST_NAME
+        tmp = path.with_suffix(".json.tmp")
+        with open(tmp, "w") as f:
+            json.dump(self._manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp, path)
+
+    def series(self) -> dict[str, dict[str, Any]]:
+        """Manifest entries keyed by ``SYMBOL/timeframe``."""
+        return dict(self._manifest["series"])
+
+    def has(self, symbol: str, timeframe: str) -> bool:
+        return self.series_key(symbol, timeframe) in self._manifest["series"]
+
+    # ------------------------------------------------------------------
+    # Write
+    # ------------------------------------------------------------------
+
+    def write(
+        self,
+        symbol: str,
+        timeframe: str,
+        df: pd.DataFrame,
+        merge: bool = True,
+    ) -> int:
+        """
+        Store OHLCV candles for a series.
+
+        ``df`` needs OHLCV columns and either a DatetimeIndex or a
+        ``timestamp`` column. With ``merge=True`` rows are merged into the
+        existing series (new rows win on duplicate timestamps).
+
+        Returns:
+            Number of rows in the stored series.
+        """
+        frame = _normalize(df)
+        if merge and self.has(symbol, timeframe):
+            existing = self.load(symbol, timeframe, mmap=False)
+            frame = pd.concat([existing, frame])
+            frame = frame[~frame.index.duplicated(keep="last")].sort_index()
+
+        key = self.series_key(symbol, timeframe)
+        directory = self.root / key
+        directory.mkdir(parents=True, exist_ok=True)
+
+        columns = {"timestamp": frame.index.values.astype("datetime64[ns]")}
+        for col in OHLCV_COLUMNS:
+            columns[col] = frame[col].to_numpy(dtype=np.float64)
+        for name, values in columns.items():
+            tmp = directory / f"{name}.tmp.npy"
+            np.save(tmp, values)
+            os.replace(tmp, directory / f"{name}.npy")
+
+        self._manifest["series"][key] = {
+            "symbol": symbol,
+            "timeframe": timeframe,
+            "rows": len(frame),
+            "start": frame.index[0].isoformat() if len(frame) else None,
+            "end": frame.index[-1].isoformat() if len(frame) else None,
+        }
+        self._write_manifest()
+        return len(frame)
+
+    def write_ohlcv(self, symbol: str, timeframe: str, candles: list[list]) -> int:
+        """Store raw ccxt ``[ms, open, high, low, close, volume]`` rows."""
+        arr = np.asarray(candles, dtype=np.float64).reshape(-1, 6)
+        df = pd.DataFrame(arr[:, 1:], columns=list(OHLCV_COLUMNS))
+        df.index = pd.DatetimeIndex(
+            pd.to_datetime(arr[:, 0].astype(np.int64), unit="ms"), name="timestamp"
+        )
+        return self.write(symbol, timeframe, df)
+
+    def import_csv(
+        self,
+        filepath: str | Path,
+        symbol: str | None = None,
+        timeframe: str | None = None,
+    ) -> int:
+        """
+        Import a CSV file into the store.
+
+        ``symbol``/``timeframe`` default to those parsed from the downloader's
+        ``{exchange}_{BASE}_{QUOTE}_{tf}.csv`` file names.
+        """
+        path = Path(filepath)
+        if symbol is None or timeframe is None:
+            match = _CSV_NAME_RE.match(path.stem)
+            if not match:
+                raise ValueError(f"Cannot infer symbol/timeframe from {path.name}")
+            symbol = symbol or f"{match['base']}/{match['quote']}"
+            timeframe = timeframe or match["tf"]
+        return self.write(symbol, timeframe, read_ohlcv_csv(path))
+
+    # ------------------------------------------------------------------
+    # Read
+    # ------------------------------------------------------------------
+
+    def load(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: datetime | str | None = None,
+        end: datetime | str | None = None,
+        mmap: bool = True,
+    ) -> pd.DataFrame:
+        """
+        Load candles in ``[start, end)`` as an OHLCV DataFrame with DatetimeIndex.
+
+        Columns are memory-mapped; only the selected slice is copied.
+        """
+        key = self.series_key(symbol, timeframe)
+        if key not in self._manifest["series"]:
+            raise KeyError(f"No candles stored for {symbol} {timeframe}")
+
+        directory = self.root / key
+        mode = "r" if mmap else None
+        timestamps = np.load(directory / "timestamp.npy", mmap_mode=mode)
+
+        lo = 0 if start is None else int(np.searchsorted(timestamps, _to_ns(start), "left"))
+        hi = (
+            len(timestamps)
+            if end is None
+            else int(np.searchsorted(timestamps, _to_ns(end), "left"))
+        )
+
+        data = {
+            col: np.array(np.load(directory / f"{col}.npy", mmap_mode=mode)[lo:hi])
+            for col in OHLCV_COLUMNS
+        }
+        index = pd.DatetimeIndex(np.array(timestamps[lo:hi]), name="timestamp")
+        return pd.DataFrame(data, index=index)
+
+
+def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+    frame = df
+    if not isinstance(frame.index, pd.DatetimeIndex):
+        if "timestamp" not in frame.columns:
+            raise ValueError("Candles need a DatetimeIndex or a 'timestamp' column")
+        frame = frame.set_index(pd.to_datetime(frame["timestamp"]))
+    if frame.index.tz is not None:
+        frame = frame.tz_convert("UTC").tz_localize(None)
+    frame = frame[list(OHLCV_COLUMNS)].astype("float64")
+    frame.index = frame.index.as_unit("ns").rename("timestamp")
+    return frame.sort_index()
+
+
+def _to_ns(value: datetime | str) -> np.datetime64:
+    ts = pd.Timestamp(value)
+    if ts.tz is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    return np.datetime64(ts.as_unit("ns").value, "ns")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Import OHLCV CSV files into a candle store")
+    parser.add_argument("csv", nargs="+", help="CSV files ({exchange}_{BASE}_{QUOTE}_{tf}.csv)")
+    parser.add_argument("--store", default="data/candles", help="Store directory")
+    parser.add_argument("--symbol", help="Override symbol (single file only)")
+    parser.add_argument("--timeframe", help="Override timeframe (single file only)")
+    args = parser.parse_args(argv)
+
+    if (args.symbol or args.timeframe) and len(args.csv) > 1:
+        parser.error("--symbol/--timeframe only apply to a single CSV")
+
+    store = CandleStore(args.store)
+    for path in args.csv:
+        rows = store.import_csv(path, args.symbol, args.timeframe)
+        print(f"Imported {path} ({rows} rows)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+"""
+Columnar equity-curve recorder and vectorized performance metrics.
+
+Engines record one row per bar into preallocated NumPy arrays (timestamp,
+price, portfolio value, plus small integer codes for the regime and the
+active strategy set) instead of appending a dict with an ISO timestamp
+string. Sharpe, Sortino, Calmar and drawdown are computed on the value
+array directly.
+
+``EquityCurve`` is also a read-only sequence of the legacy dict rows, built
+lazily, so code that indexes ``result.equity_curve[i]["portfolio_value"]``,
+slices it or compares it with a list keeps working. Use ``.values`` /
+``.timestamps`` for array access.
+
+Usage:
+    curve = EquityCurve(capacity=len(base_df))
+    for i in range(warmup, len(base_df)):
+        ...
+        curve.append(ts_ns[i], price, portfolio_value, regime=regime_value)
+    sharpe = annualized_sharpe(curve.returns(), periods_per_year=365 * 24 * 12)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterator, Sequence
+from decimal import Decimal
+from typing import Any, overload
+
+import numpy as np
+import pandas as pd
+
+# 5-minute bars
+M5_PERIODS_PER_YEAR = 365 * 24 * 12
+
+_NO_CODE = -1
+
+
+class _Codes:
+    """Interns repeated labels (regimes, strategy sets) as small integer codes."""
+
+    __slots__ = ("labels", "_index")
+
+    def __init__(self) -> None:
+        self.labels: list[Hashable] = []
+        self._index: dict[Hashable, int] = {}
+
+    def code(self, label: Hashable | None) -> int:
+        if label is None:
+            return _NO_CODE
+        code = self._index.get(label)
+        if code is None:
+            code = self._index[label] = len(self.labels)
+            self.labels.append(label)
+        return code
+
+
+class EquityCurve(Sequence):
+    """
+    Preallocated columnar equity curve.
+
+    Arrays grow by doubling if more than ``capacity`` rows are appended.
+    ``track_active`` adds an ``active_strategies`` entry to every row, as
+    the orchestrator engine records. Timestamps are stored as UTC
+    nanoseconds; ``tz`` is the timezone of the source index, used when
+    rendering rows.
+    """
+
+    def __init__(self, capacity: int = 1024, track_active: bool = False, tz: Any = None) -> None:
+        capacity = max(1, capacity)
+        self.tz = tz
+        self._ts = np.empty(capacity, dtype=np.int64)
+        self._price = np.empty(capacity, dtype=np.float64)
+        self._value = np.empty(capacity, dtype=np.float64)
+        self._regime = np.empty(capacity, dtype=np.int16)
+        self._active = np.empty(capacity, dtype=np.int32) if track_active else None
+        self._regimes = _Codes()
+        self._active_sets = _Codes()
+        self._n = 0
+        self._records: list[dict[str, Any]] | None = None
+
+    # -- recording ---------------------------------------------------------
+
+    def append(
+        self,
+        timestamp_ns: int,
+        price: float,
+        portfolio_value: float,
+        regime: str | None = None,
+        active: tuple[str, ...] | None = None,
+    ) -> None:
+        """Record one bar; ``active`` is the sorted active-strategy tuple."""
+        n = self._n
+        if n == len(self._ts):
+            self._grow()
+        self._ts[n] = timestamp_ns
+        self._price[n] = price
+        self._value[n] = portfolio_value
+        self._regime[n] = self._regimes.code(regime)
+        if self._active is not None:
+            self._active[n] = self._active_sets.code(active or ())
+        self._n = n + 1
+        self._records = None
+
+    def _grow(self) -> None:
+        size = max(1, len(self._ts) * 2)
+        self._ts = np.resize(self._ts, size)
+        self._price = np.resize(self._price, size)
+        self._value = np.resize(self._value, size)
+        self._regime = np.resize(self._regime, size)
+        if self._active is not None:
+            self._active = np.resize(self._active, size)
+
+    # -- array access ------------------------------------------------------
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Bar timestamps as ``datetime64[ns]``."""
+        return self._ts[: self._n].view("datetime64[ns]")
+
+    @property
+    def prices(self) -> np.ndarray:
+        return self._price[: self._n]
+
+    @property
+    def values(self) -> np.ndarray:
+        """Portfolio value per bar."""
+        return self._value[: self._n]
+
+    def returns(self) -> np.ndarray:
+        """Simple period returns, skipping periods that start at a non-positive value."""
+        return period_returns(self.values)
+
+    def max_drawdown(self, initial: float | None = None) -> float:
+        return max_drawdown(self.values, initial)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Timestamp (ISO string), price and portfolio value columns."""
+        return pd.DataFrame(
+            {
+                "timestamp": _isoformat(self._ts[: self._n], self.tz),
+                "price": self.prices,
+                "portfolio_value": self.values,
+            }
+        )
+
+    # -- legacy row view ---------------------------------------------------
+
+    def to_records(self) -> list[dict[str, Any]]:
+        """The curve as the legacy list of row dicts (built once, then cached)."""
+        if self._records is None:
+            n = self._n
+            regimes = self._regimes.labels
+            active_sets = self._active_sets.labels
+            stamps = _isoformat(self._ts[:n], self.tz)
+            prices = self._price[:n].tolist()
+            values = self._value[:n].tolist()
+            regime_codes = self._regime[:n].tolist()
+            active_codes = self._active[:n].tolist() if self._active is not None else None
+            records = []
+            for i in range(n):
+                row: dict[str, Any] = {
+                    "timestamp": stamps[i],
+                    "price": prices[i],
+                    "portfolio_value": values[i],
+                }
+                if active_codes is not None:
+                    row["active_strategies"] = list(active_sets[active_codes[i]])
+                if regime_codes[i] != _NO_CODE:
+                    row["regime"] = regimes[regime_codes[i]]
+                records.append(row)
+            self._records = records
+        return self._records
+
+    def __len__(self) -> int:
+        return self._n
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        return self.to_records()[index]
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return iter(self.to_records())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EquityCurve):
+            other = other.to_records()
+        if isinstance(other, list):
+            return self.to_records() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"EquityCurve({self._n} rows)"
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Ship only the filled rows, never the cached dicts
+        n = self._n
+        state = dict(self.__dict__)
+        for key in ("_ts", "_price", "_value", "_regime", "_active"):
+            if state[key] is not None:
+                state[key] = state[key][:n].copy()
+        state["_records"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+
+
+def _isoformat(ts_ns: np.ndarray, tz: Any = None) -> list[str]:
+    """``Timestamp.isoformat()`` for every value, vectorized for naive whole seconds."""
+    if tz is None and not np.any(ts_ns % 1_000_000_000):
+        return np.datetime_as_string(ts_ns.view("datetime64[ns]"), unit="s").tolist()
+    index = pd.DatetimeIndex(ts_ns.view("datetime64[ns]"))
+    if tz is not None:
+        index = index.tz_localize("UTC").tz_convert(tz)
+    return [t.isoformat() for t in index]
+
+
+# ---------------------------------------------------------------------------
+# Vectorized metrics
+# ---------------------------------------------------------------------------
+
+
+def portfolio_values(equity_curve: Sequence[dict[str, Any]]) -> np.ndarray:
+    """Portfolio values of an ``EquityCurve`` or a legacy list of row dicts."""
+    if isinstance(equity_curve, EquityCurve):
+        return equity_curve.values
+    return np.fromiter(
+        (e["portfolio_value"] for e in equity_curve), dtype=np.float64, count=len(equity_curve)
+    )
+
+
+def period_returns(values: np.ndarray) -> np.ndarray:
+    """Simple returns between consecutive values, skipping non-positive starts."""
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) < 2:
+        return np.empty(0)
+    prev, curr = values[:-1], values[1:]
+    mask = prev > 0
+    return (curr[mask] - prev[mask]) / prev[mask]
+
+
+def _to_decimal(value: float) -> Decimal | None:
+    return Decimal(str(value)) if np.isfinite(value) else None
+
+
+def annualized_sharpe(
+    returns: np.ndarray, periods_per_year: int = M5_PERIODS_PER_YEAR
+) -> Decimal | None:
+    """Annualised Sharpe ratio (zero risk-free rate, population std); None if undefined."""
+    returns = np.asarray(returns, dtype=np.float64)
+    if not len(returns):
+        return None
+    std = returns.std()
+    if std <= 0:
+        return None
+    return _to_decimal(returns.mean() / std * periods_per_year**0.5)
+
+
+def annualized_sortino(
+    returns: np.ndarray, periods_per_year: int = M5_PERIODS_PER_YEAR
+) -> Decimal | None:
+    """Annualised Sortino ratio; None without downside returns."""
+    returns = np.asarray(returns, dtype=np.float64)
+    if not len(returns):
+        return None
+    downside = returns[returns < 0]
+    if not len(downside):
+        return None
+    downside_std = np.sqrt(np.dot(downside, downside) / len(returns))
+    if downside_std <= 0:
+        return None
+    return _to_decimal(returns.mean() / downside_std * periods_per_year**0.5)
+
+
+def max_drawdown(values: np.ndarray, initial: float | None = None) -> float:
+    """Largest peak-to-trough drop in absolute terms; the peak starts at ``initial``."""
+    values = np.asarray(values, dtype=np.float64)
+    if not len(values):
+        return 0.0
+    peaks = np.maximum.accumulate(values)
+    if initial is not None:
+        peaks = np.maximum(peaks, initial)
+    return float(max(0.0, np.max(peaks - values)))
+
+
+def max_drawdown_pct(values: np.ndarray) -> float:
+    """Largest peak-to-trough drop as a percentage of the running peak."""
+    values = np.asarray(values, dtype=np.float64)
+    if not len(values):
+        return 0.0
+    peaks = np.maximum.accumulate(values)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dd = np.where(peaks > 0, (peaks - values) / peaks, 0.0)
+    return float(max(0.0, dd.max()) * 100)
+
+
+def calmar(total_return_pct: Decimal, max_drawdown_pct: Decimal) -> Decimal | None:
+    """Total return over max drawdown (both in percent); None without drawdown."""
+    if max_drawdown_pct <= 0:
+        return None
+    return (total_return_pct / Decimal("100")) / (max_drawdown_pct / Decimal("100"))
@@ -0,0 +1,421 @@
+"""
+High-throughput float64 market simulator.
+
+Drop-in alternative to MarketSimulator for backtests with many resting
+limit orders (grids with 50-200 levels). Public methods and return shapes
+match MarketSimulator; the differences are internal:
+
+- Balances, fees and short positions are float64 instead of Decimal.
+- Open limit orders live in price-sorted bid/ask books, so each price
+  (or candle sweep point) fills the crossed orders with one bisect instead
+  of scanning every order ever placed.
+- Orders are ``__slots__`` records; order dicts are only built when
+  requested.
+
+Fills are executed in placement order within a sweep point, exactly like
+MarketSimulator, so results agree with the Decimal simulator up to float64
+rounding (relative error around 1e-12 for typical backtests; see
+``PARITY_REL_TOLERANCE``).
+
+Usage:
+    simulator = FastMarketSimulator(symbol="BTC/USDT", initial_balance_quote=Decimal("10000"))
+    await simulator.create_order("BTC/USDT", "limit", "buy", Decimal("0.01"), Decimal("44000"))
+    await simulator.set_candle(o, h, l, c)
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any
+
+from .market_simulator import OrderSide, OrderStatus, OrderType
+
+# Documented agreement with MarketSimulator for balances and portfolio value
+PARITY_REL_TOLERANCE = 1e-9
+
+_INF = float("inf")
+
+# Relative slack for balance checks; Decimal amounts rounded to float64 can
+# land a few ulps above the float balance they were derived from
+_REL_EPS = 1e-9
+
+
+def _to_decimal(value: float) -> Decimal:
+    return Decimal(repr(value))
+
+
+def _covers(available: float, required: float) -> bool:
+    """``available >= required`` up to float64 rounding."""
+    return available >= required - abs(required) * _REL_EPS
+
+
+def _settle(value: float, scale: float) -> float:
+    """Clamp a rounding residue of an operation on ``scale`` to exactly 0."""
+    return 0.0 if abs(value) <= abs(scale) * _REL_EPS else value
+
+
+class _FastOrder:
+    """Compact order record."""
+
+    __slots__ = ("id", "seq", "is_buy", "is_limit", "price", "amount", "filled", "status", "ts")
+
+    def __init__(
+        self, order_id: str, seq: int, is_buy: bool, is_limit: bool, price: float, amount: float
+    ) -> None:
+        self.id = order_id
+        self.seq = seq
+        self.is_buy = is_buy
+        self.is_limit = is_limit
+        self.price = price
+        self.amount = amount
+        self.filled = 0.0
+        self.status = OrderStatus.OPEN
+        self.ts = datetime.now(timezone.utc)
+
+
+class FastBalance:
+    """
+    Float64 balance with Decimal-valued views.
+
+    Engines read ``simulator.balance.base`` / ``.quote`` and mix them with
+    Decimal prices, so the public attributes return Decimal.
+    """
+
+    __slots__ = ("base_f", "quote_f")
+
+    def __init__(self, base: float = 0.0, quote: float = 10000.0) -> None:
+        self.base_f = base
+        self.quote_f = quote
+
+    @property
+    def base(self) -> Decimal:
+        return _to_decimal(self.base_f)
+
+    @property
+    def quote(self) -> Decimal:
+        return _to_decimal(self.quote_f)
+
+    def can_buy(self, amount: Decimal, price: Decimal) -> bool:
+        return _covers(self.quote_f, float(amount) * float(price))
+
+    def can_sell(self, amount: Decimal) -> bool:
+        return _covers(self.base_f, float(amount))
+
+
+class FastMarketSimulator:
+    """
+    Float64 exchange simulator with bisect-matched limit order books.
+
+    Same constructor and async/sync API as MarketSimulator.
+    """
+
+    def __init__(
+        self,
+        symbol: str = "BTC/USDT",
+        initial_balance_base: Decimal = Decimal("0"),
+        initial_balance_quote: Decimal = Decimal("10000"),
+        maker_fee: Decimal = Decimal("0.001"),
+        taker_fee: Decimal = Decimal("0.001"),
+        slippage: Decimal = Decimal("0.0001"),
+    ):
+        self.symbol = symbol
+        self.balance = FastBalance(float(initial_balance_base), float(initial_balance_quote))
+        self.maker_fee = maker_fee
+        self.taker_fee = taker_fee
+        self.slippage = slippage
+        self._maker_fee = float(maker_fee)
+        self._taker_fee = float(taker_fee)
+        self._slippage = float(slippage)
+
+        self._price = 45000.0
+        self.orders: dict[str, _FastOrder] = {}
+        self.order_id_counter = 0
+        # (price, seq, order) — bids and asks each sorted ascending by price, then seq
+        self._bids: list[tuple[float, int, _FastOrder]] = []
+        self._asks: list[tuple[float, int, _FastOrder]] = []
+        self.trade_history: list[dict[str, Any]] = []
+
+        # Futures SHORT positions: [amount, entry_price]
+        self._shorts: list[list[float]] = []
+        self._short_id_counter = 0
+
+    # -------------------------------------------------------------------------
+    # Prices
+    # -------------------------------------------------------------------------
+
+    @property
+    def current_price(self) -> Decimal:
+        return _to_decimal(self._price)
+
+    @current_price.setter
+    def current_price(self, price: Decimal) -> None:
+        self._price = float(price)
+
+    async def set_price(self, price: Decimal) -> None:
+        """Update current market price"""
+        self._price = float(price)
+        self._match(self._price)
+
+    async def set_candle(
+        self,
+        open_price: Decimal,
+        high: Decimal,
+        low: Decimal,
+        close: Decimal,
+    ) -> None:
+        """O->L->H->C sweep for realistic limit order fills."""
+        for price in (float(open_price), float(low), float(high), float(close)):
+            self._price = price
+            self._match(price)
+
+    def get_ticker(self) -> dict[str, Any]:
+        """Get current market ticker"""
+        return {
+            "symbol": self.symbol,
+            "last": self._price,
+            "bid": self._price * (1.0 - self._slippage),
+            "ask": self._price * (1.0 + self._slippage),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+
+    def get_balance(self) -> dict[str, dict[str, float]]:
+        """Get account balance"""
+        base_currency, quote_currency = self.symbol.split("/")[:2]
+        return {
+            base_currency: {
+                "free": self.balance.base_f,
+                "used": 0.0,
+                "total": self.balance.base_f,
+            },
+            quote_currency: {
+                "free": self.balance.quote_f,
+                "used": 0.0,
+                "total": self.balance.quote_f,
+            },
+        }
+
+    # -------------------------------------------------------------------------
+    # Orders
+    # -------------------------------------------------------------------------
+
+    async def create_order(
+        self,
+        symbol: str,
+        order_type: str,
+        side: str,
+        amount: Decimal,
+        price: Decimal | None = None,
+    ) -> dict[str, Any]:
+        """Create a simulated order (see MarketSimulator.create_order)."""
+        if symbol != self.symbol:
+            raise ValueError(f"Invalid symbol: {symbol}")
+
+        self.order_id_counter += 1
+        order_id = f"sim_{self.order_id_counter}"
+        is_buy = OrderSide(side) == OrderSide.BUY
+
+        if order_type == "market":
+            if is_buy:
+                execution_price = self._price * (1.0 + self._slippage)
+            else:
+                execution_price = self._price * (1.0 - self._slippage)
+        elif order_type == "limit":
+            if price is None:
+                raise ValueError("Limit orders require a price")
+            execution_price = float(price)
+        else:
+            raise ValueError(f"Invalid order type: {order_type}")
+
+        order = _FastOrder(
+            order_id,
+            self.order_id_counter,
+            is_buy,
+            order_type == "limit",
+            execution_price,
+            float(amount),
+        )
+
+        if order_type == "market":
+            self._execute(order)
+        else:
+            self.orders[order_id] = order
+            book = self._bids if is_buy else self._asks
+            insort(book, (execution_price, order.seq, order))
+            self._match(self._price)
+
+        return self._order_to_dict(order)
+
+    async def cancel_order(self, order_id: str) -> dict[str, Any]:
+        """Cancel an order"""
+        order = self.orders.get(order_id)
+        if order is None:
+            raise ValueError(f"Order not found: {order_id}")
+        if order.status != OrderStatus.OPEN:
+            raise ValueError(f"Order is not open: {order_id}")
+
+        book = self._bids if order.is_buy else self._asks
+        i = bisect_left(book, (order.price, order.seq))
+        if i < len(book) and book[i][2] is order:
+            del book[i]
+        order.status = OrderStatus.CANCELED
+        return self._order_to_dict(order)
+
+    def get_order(self, order_id: str) -> dict[str, Any]:
+        """Get order information"""
+        if order_id not in self.orders:
+            raise ValueError(f"Order not found: {order_id}")
+        return self._order_to_dict(self.orders[order_id])
+
+    def get_open_orders(self, symbol: str | None = None) -> list[dict[str, Any]]:
+        """Get all open orders in placement order"""
+        if symbol is not None and symbol != self.symbol:
+            return []
+        resting = sorted((entry[2] for entry in self._bids + self._asks), key=lambda o: o.seq)
+        return [self._order_to_dict(order) for order in resting]
+
+    def _order_to_dict(self, order: _FastOrder) -> dict[str, Any]:
+        return {
+            "id": order.id,
+            "symbol": self.symbol,
+            "type": OrderType.LIMIT.value if order.is_limit else OrderType.MARKET.value,
+            "side": OrderSide.BUY.value if order.is_buy else OrderSide.SELL.value,
+            "price": order.price,
+            "amount": order.amount,
+            "filled": order.filled,
+            "remaining": order.amount - order.filled,
+            "status": order.status.value,
+            "timestamp": order.ts.isoformat(),
+        }
+
+    # -------------------------------------------------------------------------
+    # Matching & execution
+    # -------------------------------------------------------------------------
+
+    def _match(self, price: float) -> None:
+        """Fill every resting order crossed by ``price``, in placement order."""
+        bids, asks = self._bids, self._asks
+        triggered: list[_FastOrder] = []
+        if bids and bids[-1][0] >= price:
+            i = bisect_left(bids, (price, -1))
+            triggered.extend(entry[2] for entry in bids[i:])
+            del bids[i:]
+        if asks and asks[0][0] <= price:
+            j = bisect_right(asks, (price, _INF))
+            triggered.extend(entry[2] for entry in asks[:j])
+            del asks[:j]
+        if not triggered:
+            return
+        if len(triggered) > 1:
+            triggered.sort(key=lambda o: o.seq)
+        for order in triggered:
+            try:
+                self._execute(order)
+            except Exception:
+                pass  # Order execution failed, already marked as canceled
+
+    def _execute(self, order: _FastOrder) -> None:
+        """Execute an order, supporting both spot and futures SHORT positions."""
+        balance = self.balance
+        fee_rate = self._maker_fee if order.is_limit else self._taker_fee
+        price = order.price
+        amount = order.amount
+        try:
+            if order.is_buy:
+                remaining = amount
+                fee = 0.0
+                shorts = self._shorts
+                while remaining > 0 and shorts:
+                    short = shorts[0]
+                    close_amount = min(remaining, short[0])
+                    pnl = (short[1] - price) * close_amount
+                    balance.quote_f += close_amount * short[1] + pnl
+                    fee += close_amount * price * fee_rate
+                    short[0] = _settle(short[0] - close_amount, close_amount)
+                    remaining = _settle(remaining - close_amount, close_amount)
+                    if short[0] <= 0:
+                        shorts.pop(0)
+
+                balance.quote_f -= fee
+
+                if remaining > 0:
+                    cost = remaining * price
+                    if not _covers(balance.quote_f, cost):
+                        raise ValueError(f"Insufficient quote balance: {balance.quote_f} < {cost}")
+                    spot_fee = remaining * fee_rate
+                    balance.quote_f = _settle(balance.quote_f - cost, cost)
+                    balance.base_f += remaining - spot_fee
+                    fee += spot_fee
+            else:
+                if _covers(balance.base_f, amount):
+                    balance.base_f = _settle(balance.base_f - amount, amount)
+                    proceeds = amount * price
+                    fee = proceeds * fee_rate
+                    balance.quote_f += proceeds - fee
+                else:
+                    margin = amount * price
+                    if not _covers(balance.quote_f, margin):
+                        raise ValueError(
+                            f"Insufficient margin for short: {balance.quote_f} < {margin}"
+                        )
+                    self._short_id_counter += 1
+                    self._shorts.append([amount, price])
+                    fee = margin * fee_rate
+                    balance.quote_f -= margin + fee
+
+            order.filled = amount
+            order.status = OrderStatus.CLOSED
+            self.trade_history.append(
+                {
+                    "order_id": order.id,
+                    "symbol": self.symbol,
+                    "side": "buy" if order.is_buy else "sell",
+                    "price": price,
+                    "amount": amount,
+                    "fee": fee,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                }
+            )
+        except ValueError as e:
+            order.status = OrderStatus.CANCELED
+            raise Exception(f"Order execution failed: {e}") from e
+
+    # -------------------------------------------------------------------------
+    # Portfolio
+    # -------------------------------------------------------------------------
+
+    @property
+    def short_positions(self) -> list[dict[str, Any]]:
+        """Open SHORT positions in MarketSimulator's dict shape."""
+        return [
+            {"amount": _to_decimal(amount), "entry_price": _to_decimal(entry)}
+            for amount, entry in self._shorts
+        ]
+
+    def portfolio_value_float(self) -> float:
+        """Total portfolio value in quote currency as float64."""
+        price = self._price
+        short_value = 0.0
+        for amount, entry in self._shorts:
+            short_value += amount * entry + (entry - price) * amount
+        return self.balance.quote_f + self.balance.base_f * price + short_value
+
+    def get_portfolio_value(self) -> Decimal:
+        """Calculate total portfolio value in quote currency, including unrealized SHORT PnL."""
+        return _to_decimal(self.portfolio_value_float())
+
+    def get_trade_history(self) -> list[dict[str, Any]]:
+        """Get all executed trades"""
+        return self.trade_history.copy()
+
+    def reset(self, initial_balance_quote: Decimal = Decimal("10000")) -> None:
+        """Reset simulator to initial state"""
+        self.balance = FastBalance(0.0, float(initial_balance_quote))
+        self.orders.clear()
+        self._bids.clear()
+        self._asks.clear()
+        self.trade_history.clear()
+        self.order_id_counter = 0
+        self._shorts.clear()
+        self._short_id_counter = 0
@@ -0,0 +1,645 @@
+"""
+LockstepPortfolioEngine — all pairs on one merged timeline sharing one capital pool.
+
+PortfolioBacktestEngine gives every pair a fixed slice of capital and runs
+it in isolation. The live system instead gates every entry through
+PortfolioRiskManager and its SharedCapitalPool, so pairs compete for the
+same capital. This engine reproduces that:
+
+- M5 bars of every symbol are merged into one timeline (``heapq.merge`` over
+  per-symbol streams) and processed by a single loop.
+- Every entry is checked with ``PortfolioRiskManager.check_allocation`` and
+  committed with ``confirm_allocation``; exits release the capital. The
+  portfolio stop-loss sees the live portfolio value after every timestamp.
+- One cash ledger backs all pairs, and the portfolio equity curve,
+  drawdown, Sharpe and pair correlations are updated incrementally rather
+  than merged after the fact.
+- Memory stays bounded: bars are streamed per symbol in chunks (e.g. weekly
+  ``CandleStore`` loads) and each symbol keeps only ``lookback`` bars per
+  timeframe.
+
+Differences from BacktestOrchestratorEngine: there is no regime routing
+(all enabled strategies run), the ledger is float64 like
+FastMarketSimulator, and higher-timeframe windows end with the bar that is
+still forming, built from the M5 bars seen so far (no lookahead).
+
+Usage::
+
+    engine = LockstepPortfolioEngine()
+    engine.register_strategy_factory("grid", lambda p: GridStrategy(**p))
+    sources = {s: store_source(store, s, start=start, end=end) for s in symbols}
+    result = await engine.run(sources, PortfolioBacktestConfig(symbols=symbols))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import math
+from array import array
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta
+from decimal import Decimal
+from itertools import repeat
+from typing import Any, Union
+
+import numpy as np
+import pandas as pd
+
+from bot.core.portfolio_risk_manager import PortfolioRiskManager
+from bot.strategies.base import BaseStrategy, ExitReason, SignalDirection
+from bot.tests.backtesting.candle_store import OHLCV_COLUMNS, CandleStore
+from bot.tests.backtesting.multi_tf_data_loader import MultiTimeframeData
+from bot.tests.backtesting.orchestrator_engine import OrchestratorBacktestResult
+from bot.tests.backtesting.portfolio_engine import (
+    PortfolioBacktestConfig,
+    PortfolioBacktestEngine,
+    PortfolioBacktestResult,
+)
+
+logger = logging.getLogger(__name__)
+
+BarSource = Union[pd.DataFrame, MultiTimeframeData, Iterable[pd.DataFrame]]
+
+_NS_PER_MIN = 60_000_000_000
+# (d1, h4, h1, m15, m5) — the order strategies receive in analyze_market()
+_TF_PERIODS_NS: tuple[int | None, ...] = (
+    1440 * _NS_PER_MIN,
+    240 * _NS_PER_MIN,
+    60 * _NS_PER_MIN,
+    15 * _NS_PER_MIN,
+    None,  # base M5 bars are appended as-is
+)
+_COLUMNS = pd.Index(OHLCV_COLUMNS)
+_BARS_PER_YEAR = 365 * 24 * 12
+_YIELD_EVERY = 1000
+
+
+def _dec(value: float) -> Decimal:
+    return Decimal(repr(round(float(value), 8)))
+
+
+# ---------------------------------------------------------------------------
+# Bar sources
+# ---------------------------------------------------------------------------
+
+
+def frame_source(df: pd.DataFrame, chunk_size: int = 10_000) -> Iterator[pd.DataFrame]:
+    """Yield an in-memory OHLCV DataFrame in chunks."""
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start : start + chunk_size]
+
+
+def store_source(
+    store: CandleStore,
+    symbol: str,
+    timeframe: str = "5m",
+    start: datetime | str | None = None,
+    end: datetime | str | None = None,
+    chunk: timedelta = timedelta(days=7),
+) -> Iterator[pd.DataFrame]:
+    """Yield a CandleStore series in ``chunk``-sized date windows."""
+    meta = store.series().get(CandleStore.series_key(symbol, timeframe))
+    if not meta or not meta["rows"]:
+        return
+    lo = pd.Timestamp(start or meta["start"])
+    hi = pd.Timestamp(end) if end is not None else pd.Timestamp(meta["end"]) + chunk
+    while lo < hi:
+        window_end = min(lo + chunk, hi)
+        df = store.load(symbol, timeframe, start=lo, end=window_end)
+        if len(df):
+            yield df
+        lo = window_end
+
+
+def _chunks(source: BarSource) -> Iterable[pd.DataFrame]:
+    if isinstance(source, MultiTimeframeData):
+        return frame_source(source.m5)
+    if isinstance(source, pd.DataFrame):
+        return frame_source(source)
+    return source
+
+
+def _iter_bars(index: int, source: BarSource) -> Iterator[tuple]:
+    """``(ts_ns, symbol_index, open, high, low, close, volume)`` per bar."""
+    for df in _chunks(source):
+        ts = df.index.values.astype("datetime64[ns]").view(np.int64).tolist()
+        cols = [df[c].to_numpy(dtype=np.float64).tolist() for c in OHLCV_COLUMNS]
+        yield from zip(ts, repeat(index), *cols)
+
+
+# ---------------------------------------------------------------------------
+# Per-symbol state
+# ---------------------------------------------------------------------------
+
+
+class _BarWindow:
+    """
+    Rolling OHLCV window of at most ``lookback`` bars.
+
+    With ``period_ns`` set, incoming base bars are aggregated into buckets
+    of that length and the last row is the bucket still forming.
+    """
+
+    __slots__ = ("lookback", "period", "_ts", "_bars", "_n", "_bucket")
+
+    def __init__(self, lookback: int, period_ns: int | None = None) -> None:
+        self.lookback = lookback
+        self.period = period_ns
+        capacity = max(2 * lookback, lookback + 64)
+        self._ts = np.empty(capacity, dtype=np.int64)
+        self._bars = np.empty((capacity, 5), dtype=np.float64)
+        self._n = 0
+        self._bucket: int | None = None
+
+    def __len__(self) -> int:
+        return min(self._n, self.lookback)
+
+    def push(self, ts: int, o: float, h: float, lo: float, c: float, v: float) -> None:
+        if self.period is not None:
+            bucket = ts - ts % self.period
+            if bucket == self._bucket:
+                row = self._bars[self._n - 1]
+                if h > row[1]:
+                    row[1] = h
+                if lo < row[2]:
+                    row[2] = lo
+                row[3] = c
+                row[4] += v
+                return
+            self._bucket = ts = bucket
+
+        if self._n == len(self._ts):
+            # Compact: keep the newest lookback - 1 rows, amortised O(1) per push
+            keep = self.lookback - 1
+            self._ts[:keep] = self._ts[self._n - keep : self._n]
+            self._bars[:keep] = self._bars[self._n - keep : self._n]
+            self._n = keep
+        self._ts[self._n] = ts
+        self._bars[self._n] = (o, h, lo, c, v)
+        self._n += 1
+
+    def frame(self) -> pd.DataFrame:
+        start = max(0, self._n - self.lookback)
+        return pd.DataFrame(
+            self._bars[start : self._n].copy(),
+            index=pd.DatetimeIndex(self._ts[start : self._n].view("datetime64[ns]")),
+            columns=_COLUMNS,
+        )
+
+
+class _Position:
+    __slots__ = ("strategy", "qty", "entry", "direction", "cost")
+
+    def __init__(self, strategy: str, qty: float, entry: float, direction: int, cost: float):
+        self.strategy = strategy
+        self.qty = qty
+        self.entry = entry
+        self.direction = direction
+        self.cost = cost
+
+
+class _PairState:
+    """Windows, strategies and ledger for one symbol."""
+
+    def __init__(self, symbol: str, strategies: dict[str, BaseStrategy], lookback: int) -> None:
+        self.symbol = symbol
+        self.strategies = strategies
+        self.windows = [_BarWindow(lookback, period) for period in _TF_PERIODS_NS]
+        self._m5: pd.DataFrame | None = None
+        self.bars = 0
+        self.price = 0.0
+        self.first_ts: int | None = None
+        self.last_ts: int | None = None
+
+        self.positions: dict[str, _Position] = {}
+        self.net_qty = 0.0  # sum(direction * qty)
+        self.basis = 0.0  # sum(direction * qty * entry)
+        self.allocated = 0.0
+        self.realized = 0.0
+        self.peak_pnl = 0.0
+        self.max_dd = 0.0
+
+        self.trades: list[dict[str, Any]] = []
+        self.buys = 0
+        self.sells = 0
+        self.wins = 0
+        self.losses = 0
+        self.gross_profit = 0.0
+        self.gross_loss = 0.0
+        self.max_allocated = 0.0
+
+    def push(self, ts: int, o: float, h: float, lo: float, c: float, v: float) -> None:
+        for window in self.windows:
+            window.push(ts, o, h, lo, c, v)
+        self._m5 = None
+        self.bars += 1
+        self.price = c
+        if self.first_ts is None:
+            self.first_ts = ts
+        self.last_ts = ts
+
+    def m5(self) -> pd.DataFrame:
+        if self._m5 is None:
+            self._m5 = self.windows[-1].frame()
+        return self._m5
+
+    def context(self) -> list[pd.DataFrame]:
+        return [w.frame() for w in self.windows[:-1]] + [self.m5()]
+
+    @property
+    def pnl(self) -> float:
+        return self.realized + self.price * self.net_qty - self.basis
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+
+class LockstepPortfolioEngine:
+    """
+    Simulates a multi-pair portfolio bar by bar on a merged timeline.
+
+    Takes the same PortfolioBacktestConfig and strategy factories as
+    PortfolioBacktestEngine and returns a PortfolioBacktestResult. Per-pair
+    results carry P&L and trade statistics but no equity curve; the
+    portfolio curve is the single source of truth.
+    """
+
+    def __init__(self) -> None:
+        self._strategy_factories: dict[str, Any] = {}
+
+    def register_strategy_factory(self, name: str, factory: Any) -> None:
+        """Register a strategy factory (same interface as OrchestratorBacktestEngine)."""
+        self._strategy_factories[name] = factory
+
+    async def run(
+        self,
+        sources: dict[str, BarSource],
+        config: PortfolioBacktestConfig,
+    ) -> PortfolioBacktestResult:
+        """
+        Run the lockstep portfolio backtest.
+
+        Args:
+            sources: symbol → M5 bars: a DataFrame, MultiTimeframeData (its
+                     ``m5`` frame is used) or an iterable of DataFrame chunks
+                     (see ``store_source``) for bounded-memory runs.
+            config:  Portfolio-level configuration; ``per_pair_config``
+                     supplies lookback, warmup, strategy switches, position
+                     sizing and fees.
+
+        Returns:
+            PortfolioBacktestResult with incrementally computed metrics.
+        """
+        symbols = [s for s in (config.symbols or list(sources)) if s in sources]
+        if not symbols:
+            raise ValueError("No symbols specified in config or sources.")
+
+        template = config.per_pair_config
+        initial = float(config.initial_capital)
+        fee_rate = float(template.taker_fee)
+        slippage = float(template.slippage)
+        position_pct = float(template.max_position_pct)
+        pair_cap = initial * config.max_single_pair_pct
+
+        prm = PortfolioRiskManager(
+            total_capital=config.initial_capital,
+            max_total_exposure_pct=config.max_total_exposure_pct,
+            max_single_pair_pct=config.max_single_pair_pct,
+            max_correlation_limit=config.max_correlation_limit,
+            portfolio_stop_loss_pct=config.portfolio_stop_loss_pct,
+        )
+        pairs = [
+            _PairState(s, self._build_strategies(s, config), template.lookback) for s in symbols
+        ]
+        n = len(pairs)
+
+        # Portfolio accumulators
+        equity_ts = array("q")
+        equity_values = array("d")
+        total_pnl = 0.0
+        peak = initial
+        max_dd_pct = 0.0
+        ret_sum = ret_sq = 0.0
+        ret_count = 0
+        prev_value = initial
+        rejections: dict[str, int] = {}
+
+        # Pair P&L deltas per timestamp, for the correlation matrix
+        pnl_now = np.zeros(n)
+        pnl_prev = np.zeros(n)
+        sum_x = np.zeros(n)
+        sum_xy = np.zeros((n, n))
+        steps = 0
+
+        def close_timestamp(ts: int) -> None:
+            nonlocal peak, max_dd_pct, ret_sum, ret_sq, ret_count, prev_value, steps
+            value = initial + total_pnl
+            equity_ts.append(ts)
+            equity_values.append(value)
+            if value > peak:
+                peak = value
+            elif peak > 0:
+                max_dd_pct = max(max_dd_pct, (peak - value) / peak * 100)
+            if prev_value > 0:
+                r = (value - prev_value) / prev_value
+                ret_sum += r
+                ret_sq += r * r
+                ret_count += 1
+            prev_value = value
+            prm.update_all_balances({"portfolio": _dec(value)})
+
+            delta = pnl_now - pnl_prev
+            sum_x[:] += delta
+            sum_xy[:] += np.outer(delta, delta)
+            pnl_prev[:] = pnl_now
+            steps += 1
+
+        def mark(i: int) -> None:
+            nonlocal total_pnl
+            pair = pairs[i]
+            pnl = pair.pnl
+            total_pnl += pnl - float(pnl_now[i])
+            pnl_now[i] = pnl
+            if pnl > pair.peak_pnl:
+                pair.peak_pnl = pnl
+            elif pair.peak_pnl - pnl > pair.max_dd:
+                pair.max_dd = pair.peak_pnl - pnl
+
+        def open_position(i: int, name: str, strategy: BaseStrategy, signal: Any) -> None:
+            pair = pairs[i]
+            value = initial + total_pnl
+            # Floor to cents so rounding never trips the per-pair limit
+            amount = math.floor(min(value * position_pct, pair_cap - pair.allocated) * 100) / 100
+            if amount <= 10 or pair.price <= 0:
+                return
+            # The pool cap is per allocation; cumulative per-pair use is capped above
+            first = not pair.positions
+            check = prm.check_allocation(
+                pair.symbol,
+                _dec(amount),
+                balance=_dec(value),
+                symbol=pair.symbol if first else None,
+            )
+            if not check.approved:
+                key = check.status.value
+                rejections[key] = rejections.get(key, 0) + 1
+                return
+
+            direction = 1 if signal.direction == SignalDirection.LONG else -1
+            fill = pair.price * (1 + direction * slippage)
+            qty = amount / fill
+            try:
+                pos_id = strategy.open_position(signal, _dec(amount))
+            except Exception as e:
+                logger.debug("open_position failed for %s/%s: %s", pair.symbol, name, e)
+                return
+            prm.confirm_allocation(pair.symbol, _dec(amount), symbol=pair.symbol)
+
+            fee = amount * fee_rate
+            pair.positions[pos_id] = _Position(name, qty, fill, direction, amount)
+            pair.net_qty += direction * qty
+            pair.basis += direction * qty * fill
+            pair.allocated += amount
+            pair.max_allocated = max(pair.max_allocated, pair.allocated)
+            pair.realized -= fee
+            if direction > 0:
+                pair.buys += 1
+            else:
+                pair.sells += 1
+            mark(i)
+
+        def close_position(i: int, pos_id: str, reason: ExitReason, ts: int) -> None:
+            pair = pairs[i]
+            pos = pair.positions.pop(pos_id, None)
+            if pos is None:
+                return
+            try:
+                pair.strategies[pos.strategy].close_position(pos_id, reason, _dec(pair.price))
+            except Exception as e:
+                logger.debug("close_position failed for %s: %s", pair.symbol, e)
+
+            fill = pair.price * (1 - pos.direction * slippage)
+            gross = pos.direction * (fill - pos.entry) * pos.qty
+            fee = pos.qty * fill * fee_rate
+            pnl = gross - fee
+            pair.net_qty -= pos.direction * pos.qty
+            pair.basis -= pos.direction * pos.qty * pos.entry
+            pair.allocated -= pos.cost
+            pair.realized += pnl
+            release = pos.cost
+            if pos.direction > 0:
+                pair.sells += 1
+            else:
+                pair.buys += 1
+            if pnl > 0:
+                pair.wins += 1
+                pair.gross_profit += pnl
+            else:
+                pair.losses += 1
+                pair.gross_loss += -pnl
+            pair.trades.append(
+                {
+                    "timestamp": pd.Timestamp(ts).isoformat(),
+                    "strategy": pos.strategy,
+                    "side": "long" if pos.direction > 0 else "short",
+                    "entry_price": pos.entry,
+                    "exit_price": fill,
+                    "amount": pos.qty,
+                    "pnl": pnl,
+                    "exit_reason": getattr(reason, "value", str(reason)),
+                }
+            )
+            if pair.positions:
+                prm.release_allocation(pair.symbol, _dec(release))
+            else:
+                # Flat: drop float residue and free the symbol for correlation checks
+                release += pair.allocated
+                pair.net_qty = pair.basis = pair.allocated = 0.0
+                prm.release_allocation(pair.symbol, _dec(release), symbol=pair.symbol)
+            mark(i)
+
+        # Merged timeline
+        streams = [_iter_bars(i, sources[p.symbol]) for i, p in enumerate(pairs)]
+        current_ts: int | None = None
+        events = 0
+        warmup = template.warmup_bars
+        analyze_every = max(1, template.analyze_every_n)
+
+        for ts, i, o, h, lo, c, v in heapq.merge(*streams):
+            if ts != current_ts:
+                if current_ts is not None:
+                    close_timestamp(current_ts)
+                current_ts = ts
+
+            pair = pairs[i]
+            pair.push(ts, o, h, lo, c, v)
+            if pair.positions:
+                mark(i)
+
+            since_warmup = pair.bars - 1 - warmup
+            if since_warmup >= 0 and pair.strategies:
+                if since_warmup % analyze_every == 0:
+                    context = pair.context()
+                    for name, strategy in pair.strategies.items():
+                        try:
+                            strategy.analyze_market(*context)
+                        except Exception as e:
+                            logger.debug("analyze_market error %s/%s: %s", pair.symbol, name, e)
+
+                df_m5 = pair.m5()
+                price = _dec(c)
+                balance = _dec(initial + total_pnl)
+                for name, strategy in pair.strategies.items():
+                    try:
+                        signal = strategy.generate_signal(df_m5, balance)
+                    except Exception as e:
+                        logger.debug("generate_signal error %s/%s: %s", pair.symbol, name, e)
+                        signal = None
+                    if signal is not None:
+                        open_position(i, name, strategy, signal)
+
+                    try:
+                        exits = strategy.update_positions(price, df_m5)
+                    except Exception as e:
+                        logger.debug("update_positions error %s/%s: %s", pair.symbol, name, e)
+                        exits = []
+                    for pos_id, reason in exits:
+                        close_position(i, pos_id, reason, ts)
+
+            events += 1
+            if events % _YIELD_EVERY == 0:
+                await asyncio.sleep(0)
+
+        if current_ts is None:
+            raise RuntimeError("No bars in any source.")
+        close_timestamp(current_ts)
+
+        # Assemble result
+        stamps = np.datetime_as_string(
+            np.frombuffer(equity_ts, dtype=np.int64).view("datetime64[ns]").astype("datetime64[s]")
+        )
+        equity_curve = [
+            {"timestamp": ts, "portfolio_value": value}
+            for ts, value in zip(stamps.tolist(), equity_values, strict=True)
+        ]
+        corr_matrix = self._correlation_matrix(symbols, sum_x, sum_xy, steps)
+        per_pair_results = {p.symbol: self._pair_result(p, pair_cap) for p in pairs}
+        pair_returns = {s: float(r.total_return_pct) for s, r in per_pair_results.items()}
+        final_value = initial + total_pnl
+
+        sharpe = 0.0
+        if ret_count:
+            mean_r = ret_sum / ret_count
+            std_r = math.sqrt(max(0.0, ret_sq / ret_count - mean_r * mean_r))
+            if std_r > 0:
+                sharpe = mean_r / std_r * math.sqrt(_BARS_PER_YEAR)
+
+        result = PortfolioBacktestResult(
+            per_pair_results=per_pair_results,
+            portfolio_total_return_pct=(final_value - initial) / initial * 100 if initial else 0.0,
+            portfolio_sharpe=sharpe,
+            portfolio_max_drawdown_pct=max_dd_pct,
+            portfolio_equity_curve=equity_curve,
+            pair_correlation_matrix=corr_matrix,
+            avg_pair_correlation=PortfolioBacktestEngine._avg_correlation(corr_matrix),
+            best_pair=max(pair_returns, key=pair_returns.__getitem__),
+            worst_pair=min(pair_returns, key=pair_returns.__getitem__),
+            pairs_profitable=sum(1 for v in pair_returns.values() if v > 0),
+            total_pairs=n,
+        )
+        result.risk_summary = {
+            **prm.get_summary(),
+            "rejections": rejections,
+        }
+        return result
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _build_strategies(
+        self, symbol: str, config: PortfolioBacktestConfig
+    ) -> dict[str, BaseStrategy]:
+        template = config.per_pair_config
+        overrides = config.per_pair_overrides.get(symbol, {})
+        desired = {
+            "grid": (template.enable_grid, "grid_params"),
+            "dca": (template.enable_dca, "dca_params"),
+            "trend_follower": (template.enable_trend_follower, "tf_params"),
+            "smc": (template.enable_smc, "smc_params"),
+        }
+        strategies: dict[str, BaseStrategy] = {}
+        for name, (enabled, params_key) in desired.items():
+            factory = self._strategy_factories.get(name)
+            if not enabled or factory is None:
+                continue
+            params = overrides.get(params_key, getattr(template, params_key))
+            try:
+                strategies[name] = factory(params)
+            except Exception as e:
+                logger.warning("Failed to build strategy '%s' for %s: %s", name, symbol, e)
+        return strategies
+
+    @staticmethod
+    def _correlation_matrix(
+        symbols: list[str], sum_x: np.ndarray, sum_xy: np.ndarray, steps: int
+    ) -> dict[str, dict[str, float]]:
+        """Pearson correlation of per-timestamp pair P&L changes from running sums."""
+        n = len(symbols)
+        if steps >= 2:
+            mean = sum_x / steps
+            cov = sum_xy / steps - np.outer(mean, mean)
+            std = np.sqrt(np.clip(np.diag(cov), 0.0, None))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                corr = cov / np.outer(std, std)
+            corr = np.clip(np.nan_to_num(corr, nan=0.0, posinf=0.0, neginf=0.0), -1.0, 1.0)
+        else:
+            corr = np.zeros((n, n))
+        corr = corr.round(4)
+        np.fill_diagonal(corr, 1.0)
+        return {
+            a: {b: float(corr[i, j]) for j, b in enumerate(symbols)} for i, a in enumerate(symbols)
+        }
+
+    @staticmethod
+    def _pair_result(pair: _PairState, pair_cap: float) -> OrchestratorBacktestResult:
+        """Per-pair summary; returns are relative to the pair's capital cap."""
+        start = pd.Timestamp(pair.first_ts or 0).to_pydatetime()
+        end = pd.Timestamp(pair.last_ts or 0).to_pydatetime()
+        pnl = _dec(pair.pnl)
+        cap = _dec(pair_cap)
+        total = pair.wins + pair.losses
+        net = pair.gross_profit - pair.gross_loss
+        return OrchestratorBacktestResult(
+            strategy_name="lockstep_portfolio",
+            symbol=pair.symbol,
+            start_time=start,
+            end_time=end,
+            duration=end - start,
+            initial_balance=cap,
+            final_balance=cap + pnl,
+            total_return=pnl,
+            total_return_pct=pnl / cap * 100 if cap > 0 else Decimal("0"),
+            max_drawdown=_dec(pair.max_dd),
+            max_drawdown_pct=_dec(pair.max_dd / pair_cap * 100) if pair_cap > 0 else Decimal("0"),
+            total_trades=total,
+            winning_trades=pair.wins,
+            losing_trades=pair.losses,
+            win_rate=Decimal(pair.wins) / Decimal(total) * 100 if total else Decimal("0"),
+            total_buy_orders=pair.buys,
+            total_sell_orders=pair.sells,
+            avg_profit_per_trade=_dec(net / total) if total else Decimal("0"),
+            profit_factor=(
+                _dec(pair.gross_profit / pair.gross_loss) if pair.gross_loss > 0 else None
+            ),
+            max_position_value=_dec(pair.max_allocated),
+            trade_history=pair.trades,
+            per_strategy_pnl={
+                name: sum(t["pnl"] for t in pair.trades if t["strategy"] == name)
+                for name in pair.strategies
+            },
+        )
@@ -1,19 +1,38 @@
 """
 Monte Carlo Simulation — Bootstrap analysis for trading strategy robustness.
 
-Reshuffles trade returns from a backtest to simulate alternative equity paths
-and derive confidence intervals for key performance metrics.
+Reshuffles or resamples trade returns from a backtest to simulate
+alternative equity paths and derive confidence intervals for key
+performance metrics.
+
+Paths are simulated with NumPy, a chunk of paths at a time: each chunk is
+a (paths x trades) matrix of sampled trade indices, balances come from a
+cumulative product along each row and drawdowns from the running maximum,
+so no Python code runs per trade or per path.
+
+Sampling modes:
+    shuffle     — permutation of the original trades (the default)
+    bootstrap   — i.i.d. sampling with replacement
+    block       — moving-block bootstrap with fixed ``block_size`` blocks
+    stationary  — stationary bootstrap (Politis & Romano) with geometric
+                  block lengths of mean ``block_size``
+
+The block modes keep runs of consecutive trades together, so streaks and
+volatility clustering survive the resampling.
 
 Usage:
-    mc = MonteCarloSimulation(n_simulations=1000)
+    mc = MonteCarloSimulation(MonteCarloConfig(n_simulations=100_000, mode="stationary"))
     result = mc.run(backtest_result)
 """
 
-import random
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from bot.tests.backtesting.backtesting_engine import BacktestResult
 
+MODES = ("shuffle", "bootstrap", "block", "stationary")
+
 
 @dataclass
 class MonteCarloConfig:
@@ -22,6 +41,12 @@ class MonteCarloConfig:
     n_simulations: int = 1000
     seed: int | None = None
     confidence_levels: list[float] = field(default_factory=lambda: [0.05, 0.25, 0.50, 0.75, 0.95])
+    # Sampling mode, one of MODES
+    mode: str = "shuffle"
+    # Block length for "block", mean block length for "stationary"
+    block_size: int = 10
+    # Upper bound on matrix cells (paths x trades) simulated at once
+    chunk_cells: int = 2_000_000
 
 
 @dataclass
@@ -55,29 +80,36 @@ class MonteCarloResult:
     def get_cvar(self, confidence: float = 0.05) -> float:
         """Conditional VaR: average return below VaR threshold."""
         var = self.get_var(confidence)
-        below = [r for r in self.simulated_returns if r <= var]
-        return sum(below) / len(below) if below else var
+        returns = np.asarray(self.simulated_returns)
+        below = returns[returns <= var]
+        # min() absorbs rounding when every tail value equals VaR
+        return min(float(below.mean()), var) if below.size else var
 
 
 class MonteCarloSimulation:
     """
     Monte Carlo analysis via bootstrap resampling of trade returns.
 
-    Takes a BacktestResult, extracts per-trade returns, reshuffles them
-    to generate alternative equity paths, and computes statistics.
+    Takes a BacktestResult, extracts per-trade returns, reshuffles or
+    resamples them to generate alternative equity paths, and computes
+    statistics.
     """
 
     def __init__(self, config: MonteCarloConfig | None = None) -> None:
         self.config = config or MonteCarloConfig()
+        if self.config.mode not in MODES:
+            raise ValueError(f"Unknown mode {self.config.mode!r}, expected one of {MODES}")
+        if self.config.block_size < 1:
+            raise ValueError("block_size must be >= 1")
 
     def run(self, backtest_result: BacktestResult) -> MonteCarloResult:
         """
         Run Monte Carlo simulation on backtest results.
 
         Extracts trade-level returns, then for each simulation:
-        - Randomly reshuffle trade order
-        - Compute equity curve from reshuffled trades
-        - Record final return and max drawdown
+        - Reshuffle or resample the trades (per ``config.mode``)
+        - Compute equity curve from the sampled trades
+        - Record final return, max drawdown and win rate
 
         Args:
             backtest_result: A completed BacktestResult.
@@ -85,27 +117,28 @@ class MonteCarloSimulation:
         Returns:
             MonteCarloResult with distributions and confidence intervals.
         """
-        trade_returns = self._extract_trade_returns(backtest_result)
+        trade_returns = np.asarray(self._extract_trade_returns(backtest_result), dtype=np.float64)
 
-        if not trade_returns:
+        if not trade_returns.size:
             return self._empty_result(backtest_result)
 
-        rng = random.Random(self.config.seed)
-
-        simulated_returns: list[float] = []
-        simulated_drawdowns: list[float] = []
-        simulated_win_rates: list[float] = []
+        rng = np.random.default_rng(self.config.seed)
+        n_sims = self.config.n_simulations
+        n_trades = trade_returns.size
+        chunk = max(1, self.config.chunk_cells // n_trades)
 
-        for _ in range(self.config.n_simulations):
-            shuffled = trade_returns.copy()
-            rng.shuffle(shuffled)
+        simulated_returns = np.empty(n_sims)
+        simulated_drawdowns = np.empty(n_sims)
+        simulated_win_rates = np.empty(n_sims)
 
-            final_return, max_dd, win_rate = self._simulate_path(
-                shuffled, float(backtest_result.initial_balance)
-            )
-            simulated_returns.append(final_return)
-            simulated_drawdowns.append(max_dd)
-            simulated_win_rates.append(win_rate)
+        for start in range(0, n_sims, chunk):
+            stop = min(start + chunk, n_sims)
+            sampled = trade_returns[self._sample_indices(rng, stop - start, n_trades)]
+            (
+                simulated_returns[start:stop],
+                simulated_drawdowns[start:stop],
+                simulated_win_rates[start:stop],
+            ) = self._simulate_paths(sampled)
 
         # Compute percentiles
         return_pcts = self._percentiles(simulated_returns)
@@ -113,14 +146,12 @@ class MonteCarloSimulation:
         wr_pcts = self._percentiles(simulated_win_rates)
 
         # Probability metrics
-        prob_profit = sum(1 for r in simulated_returns if r > 0) / len(simulated_returns)
+        prob_profit = float(np.mean(simulated_returns > 0))
         orig_dd = float(backtest_result.max_drawdown_pct)
-        prob_worse_dd = sum(1 for d in simulated_drawdowns if d > orig_dd) / len(
-            simulated_drawdowns
-        )
+        prob_worse_dd = float(np.mean(simulated_drawdowns > orig_dd))
 
         return MonteCarloResult(
-            n_simulations=self.config.n_simulations,
+            n_simulations=n_sims,
             original_return_pct=float(backtest_result.total_return_pct),
             original_max_drawdown_pct=orig_dd,
             return_percentiles=return_pcts,
@@ -128,9 +159,57 @@ class MonteCarloSimulation:
             win_rate_percentiles=wr_pcts,
             probability_of_profit=prob_profit,
             probability_of_worse_drawdown=prob_worse_dd,
-            simulated_returns=simulated_returns,
-            simulated_drawdowns=simulated_drawdowns,
+            simulated_returns=simulated_returns.tolist(),
+            simulated_drawdowns=simulated_drawdowns.tolist(),
+        )
+
+    def _sample_indices(self, rng: np.random.Generator, n_paths: int, n_trades: int) -> np.ndarray:
+        """(n_paths, n_trades) matrix of trade indices for the configured mode."""
+        mode = self.config.mode
+        if mode == "shuffle":
+            return rng.permuted(np.broadcast_to(np.arange(n_trades), (n_paths, n_trades)), axis=1)
+        if mode == "bootstrap":
+            return rng.integers(0, n_trades, size=(n_paths, n_trades))
+
+        positions = np.arange(n_trades)
+        block = min(self.config.block_size, n_trades)
+        if mode == "block":
+            # Blocks start anywhere and wrap around the end of the trade list
+            n_blocks = -(-n_trades // block)
+            starts = rng.integers(0, n_trades, size=(n_paths, n_blocks))
+            offsets = positions % block
+            return (np.repeat(starts, block, axis=1)[:, :n_trades] + offsets) % n_trades
+
+        # Stationary: each position starts a new block with probability 1/block,
+        # otherwise continues the previous block with the next trade
+        new_block = rng.random((n_paths, n_trades)) < 1.0 / block
+        new_block[:, 0] = True
+        block_start = np.maximum.accumulate(np.where(new_block, positions, 0), axis=1)
+        starts = np.take_along_axis(
+            rng.integers(0, n_trades, size=(n_paths, n_trades)), block_start, axis=1
         )
+        return (starts + positions - block_start) % n_trades
+
+    def _simulate_paths(
+        self, trade_returns: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Simulate equity paths, one per row of trade return percentages.
+
+        Balances are relative to the initial balance, which cancels out of
+        every reported metric.
+
+        Returns:
+            (final_return_pct, max_drawdown_pct, win_rate) arrays, one value per path.
+        """
+        balances = np.cumprod(1.0 + trade_returns / 100.0, axis=1)
+        # The running peak starts at the initial balance (1.0)
+        peaks = np.maximum.accumulate(np.maximum(balances, 1.0), axis=1)
+        max_dd = np.max((peaks - balances) / peaks, axis=1) * 100
+
+        final_return_pct = (balances[:, -1] - 1.0) * 100
+        win_rate = np.count_nonzero(trade_returns > 0, axis=1) / trade_returns.shape[1] * 100
+        return final_return_pct, max_dd, win_rate
 
     def _extract_trade_returns(self, result: BacktestResult) -> list[float]:
         """Extract per-trade return percentages from trade history."""
@@ -151,49 +230,16 @@ class MonteCarloSimulation:
 
         return returns
 
-    def _simulate_path(
-        self, trade_returns: list[float], initial_balance: float
-    ) -> tuple[float, float, float]:
-        """
-        Simulate an equity path from reshuffled trade returns.
-
-        Returns:
-            (final_return_pct, max_drawdown_pct, win_rate)
-        """
-        balance = initial_balance
-        peak = balance
-        max_dd = 0.0
-        wins = 0
-
-        for ret_pct in trade_returns:
-            pnl = balance * (ret_pct / 100.0)
-            balance += pnl
-            if ret_pct > 0:
-                wins += 1
-
-            if balance > peak:
-                peak = balance
-            elif peak > 0:
-                dd_pct = ((peak - balance) / peak) * 100
-                max_dd = max(max_dd, dd_pct)
-
-        final_return_pct = ((balance - initial_balance) / initial_balance) * 100
-        win_rate = (wins / len(trade_returns) * 100) if trade_returns else 0.0
-
-        return final_return_pct, max_dd, win_rate
-
-    def _percentiles(self, values: list[float]) -> dict[float, float]:
+    def _percentiles(self, values: np.ndarray) -> dict[float, float]:
         """Compute percentiles for configured confidence levels."""
-        if not values:
+        if not len(values):
             return dict.fromkeys(self.config.confidence_levels, 0.0)
 
-        sorted_vals = sorted(values)
-        n = len(sorted_vals)
-        result = {}
-        for level in self.config.confidence_levels:
-            idx = min(int(level * n), n - 1)
-            result[level] = sorted_vals[idx]
-        return result
+        n = len(values)
+        levels = self.config.confidence_levels
+        idx = [min(int(level * n), n - 1) for level in levels]
+        picked = np.partition(values, idx)[idx]
+        return {level: float(v) for level, v in zip(levels, picked, strict=True)}
 
     def _empty_result(self, result: BacktestResult) -> MonteCarloResult:
         """Return empty result when no trades available."""
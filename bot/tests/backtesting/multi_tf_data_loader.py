@@ -8,16 +8,24 @@ upward using pandas resample to ensure perfect timestamp alignment.
 Usage:
     loader = MultiTimeframeDataLoader()
     data = loader.load("BTC/USDT", start, end, trend="up")
+    data = loader.load_store(CandleStore("data/candles"), "BTC/USDT", start, end)
     df_d1, df_h4, df_h1, df_m15, df_m5 = loader.get_context_at(data, base_index=200, lookback=50)
+
+Context lookups go through a MultiTimeframeIndex that is built once per
+MultiTimeframeData (searchsorted over each timeframe's DatetimeIndex), so
+each get_context_at call is an O(1) positional slice instead of a boolean
+mask over the full history.
 """
 
 import warnings
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 
+import numpy as np
 import pandas as pd
 
+from bot.tests.backtesting.candle_store import CandleStore, read_ohlcv_csv
 from bot.tests.backtesting.test_data import HistoricalDataProvider
 
 # Map human-readable timeframe strings to pandas resample rules
@@ -39,6 +47,9 @@ class MultiTimeframeData:
     h1: pd.DataFrame
     m15: pd.DataFrame
     m5: pd.DataFrame
+    _alignment: dict[str, "MultiTimeframeIndex"] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def as_tuple(
         self,
@@ -46,6 +57,65 @@ class MultiTimeframeData:
         """Return (d1, h4, h1, m15, m5) tuple for unpacking."""
         return (self.d1, self.h4, self.h1, self.m15, self.m5)
 
+    def alignment_index(self, base: str = "m5") -> "MultiTimeframeIndex":
+        """
+        Return the precomputed alignment index for the given base timeframe.
+
+        The index is built on first use and cached on this instance, so the
+        cost is paid once per dataset rather than once per bar. The frames
+        must not be mutated after the index has been built.
+
+        Args:
+            base: Attribute name of the iteration timeframe ("m5" or "m15").
+
+        Returns:
+            MultiTimeframeIndex mapping each base bar to end offsets in every TF.
+        """
+        index = self._alignment.get(base)
+        if index is None:
+            index = MultiTimeframeIndex.build(self, base=base)
+            self._alignment[base] = index
+        return index
+
+
+# Timeframe attribute names in (d1, h4, h1, m15, m5) order
+_TF_ATTRS: tuple[str, ...] = ("d1", "h4", "h1", "m15", "m5")
+
+
+@dataclass(frozen=True)
+class MultiTimeframeIndex:
+    """
+    Base-bar to higher-timeframe alignment map.
+
+    ``ends[tf][i]`` is the exclusive end offset into timeframe ``tf`` of all
+    candles whose timestamp is <= the timestamp of base bar ``i`` — exactly
+    the rows selected by ``df[df.index <= base_ts]``. Slicing
+    ``df.iloc[max(0, end - lookback):end]`` therefore reproduces the rolling
+    window without scanning the frame.
+    """
+
+    base: str
+    ends: dict[str, np.ndarray]
+
+    @classmethod
+    def build(cls, data: MultiTimeframeData, base: str = "m5") -> "MultiTimeframeIndex":
+        """Build the index with one vectorized searchsorted per timeframe."""
+        if base not in _TF_ATTRS:
+            raise ValueError(f"Unknown base timeframe: {base}")
+        base_index = getattr(data, base).index
+        ends: dict[str, np.ndarray] = {}
+        for tf in _TF_ATTRS:
+            if tf == base:
+                ends[tf] = np.arange(1, len(base_index) + 1, dtype=np.int64)
+                continue
+            tf_index = getattr(data, tf).index
+            ends[tf] = np.asarray(tf_index.searchsorted(base_index, side="right"), dtype=np.int64)
+        return cls(base=base, ends=ends)
+
+    def end_at(self, tf: str, base_pos: int) -> int:
+        """Exclusive end offset into ``tf`` for base bar ``base_pos``."""
+        return int(self.ends[tf][base_pos])
+
 
 class MultiTimeframeDataLoader:
     """
@@ -134,9 +204,28 @@ class MultiTimeframeDataLoader:
         Returns:
             MultiTimeframeData with all five DataFrames.
         """
-        candles = self._provider.load_csv_data(filepath)
-        df_base = self._candles_to_dataframe(candles)
+        return self._from_base(read_ohlcv_csv(filepath), base_timeframe)
+
+    def load_store(
+        self,
+        store: CandleStore,
+        symbol: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        base_timeframe: str = "5m",
+    ) -> MultiTimeframeData:
+        """
+        Load a date range from a CandleStore and build multi-timeframe DataFrames.
+
+        Only ``base_timeframe`` is read (memory-mapped and sliced to
+        ``[start_date, end_date)``); coarser timeframes are resampled from it
+        exactly as in load_csv().
+        """
+        df_base = store.load(symbol, base_timeframe, start=start_date, end=end_date)
+        return self._from_base(df_base, base_timeframe)
 
+    def _from_base(self, df_base: pd.DataFrame, base_timeframe: str) -> MultiTimeframeData:
+        """Build all five timeframes from a base-resolution OHLCV DataFrame."""
         # Define the target timeframes in order from finest to coarsest
         tf_order = ["5m", "15m", "1h", "4h", "1d"]
         tf_minutes = {"5m": 5, "15m": 15, "1h": 60, "4h": 240, "1d": 1440}
@@ -210,7 +299,9 @@ class MultiTimeframeDataLoader:
         Get rolling context DataFrames at a specific bar index.
 
         For each timeframe, returns the last `lookback` completed candles
-        as of the base timestamp.
+        as of the base timestamp. Windows are positional ``iloc`` slices
+        resolved through ``data.alignment_index()``, so the call is O(1) in
+        the dataset length and returns views rather than filtered copies.
 
         Args:
             data: Full MultiTimeframeData.
@@ -224,32 +315,27 @@ class MultiTimeframeDataLoader:
         """
         # Determine which DataFrame is the iteration base
         if base_index is not None:
-            base_df = data.m5
+            base = "m5"
             idx = base_index
         elif m15_index is not None:
             # Backwards compatibility: iterate m15
-            base_df = data.m15
+            base = "m15"
             idx = m15_index
         else:
             raise ValueError("Either base_index or m15_index must be provided")
 
-        current_ts = base_df.index[idx]
-
-        # Base TF: simple slice
-        start = max(0, idx - lookback + 1)
-        df_base = base_df.iloc[start : idx + 1]
+        base_len = len(getattr(data, base))
+        if idx < 0:
+            idx += base_len
+        if not 0 <= idx < base_len:
+            raise IndexError(f"{base} index {idx} out of range for {base_len} bars")
 
-        # All other TFs: filter by timestamp
-        df_m5 = data.m5[data.m5.index <= current_ts].tail(lookback)
-        df_m15 = data.m15[data.m15.index <= current_ts].tail(lookback)
-        df_h1 = data.h1[data.h1.index <= current_ts].tail(lookback)
-        df_h4 = data.h4[data.h4.index <= current_ts].tail(lookback)
-        df_d1 = data.d1[data.d1.index <= current_ts].tail(lookback)
-
-        # If we iterated on m5, use our precise slice; otherwise use m15
-        if base_index is not None:
-            df_m5 = df_base
-        else:
-            df_m15 = df_base
+        alignment = data.alignment_index(base)
+        windows: list[pd.DataFrame] = []
+        for tf in _TF_ATTRS:
+            end = alignment.end_at(tf, idx)
+            start = max(0, end - lookback)
+            windows.append(getattr(data, tf).iloc[start:end])
 
+        df_d1, df_h4, df_h1, df_m15, df_m5 = windows
         return (df_d1, df_h4, df_h1, df_m15, df_m5)
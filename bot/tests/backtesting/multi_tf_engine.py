@@ -13,11 +13,14 @@ Usage:
 
 import asyncio
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from typing import Any
 
+import numpy as np
+
 from bot.core.risk_manager import RiskManager
 from bot.orchestrator.market_regime import (
     MarketRegime,
@@ -28,6 +31,15 @@ from bot.orchestrator.market_regime import (
 from bot.orchestrator.strategy_selector import DEFAULT_REGIME_STRATEGIES
 from bot.strategies.base import BaseStrategy, ExitReason, SignalDirection
 from bot.tests.backtesting.backtesting_engine import BacktestResult
+from bot.tests.backtesting.equity_curve import (
+    EquityCurve,
+    annualized_sharpe,
+    annualized_sortino,
+    calmar,
+    period_returns,
+    portfolio_values,
+)
+from bot.tests.backtesting.fast_market_simulator import FastMarketSimulator
 from bot.tests.backtesting.market_simulator import MarketSimulator
 from bot.tests.backtesting.multi_tf_data_loader import (
     MultiTimeframeData,
@@ -55,11 +67,15 @@ class MultiTFBacktestConfig:
     risk_per_trade: Decimal = Decimal("0.02")
     max_position_pct: Decimal = Decimal("0.5")
     use_candle_sweep: bool = False
+    fast_simulator: bool = False  # float64 FastMarketSimulator instead of Decimal
+    # False drops the per-bar equity curve once metrics are computed (optimizer trials)
+    keep_equity_curve: bool = True
 
     # Regime filtering (opt-in)
     enable_regime_filter: bool = False
     regime_check_interval: int = 12  # every N M5 bars (12 = every 1h)
     regime_timeframe: str = "h1"  # which TF to use for regime detection
+    incremental_indicators: bool = False  # stream regime indicators bar-by-bar
 
     # Risk management (opt-in)
     enable_risk_manager: bool = False
@@ -120,14 +136,17 @@ class MultiTimeframeBacktestEngine:
         strategy.reset()
 
         # Create fresh simulator
-        simulator = MarketSimulator(
+        simulator_cls = FastMarketSimulator if self.config.fast_simulator else MarketSimulator
+        simulator = simulator_cls(
             symbol=self.config.symbol,
             initial_balance_quote=self.config.initial_balance,
         )
 
         # Initialize regime detector (opt-in)
         if self.config.enable_regime_filter:
-            self._regime_detector = MarketRegimeDetector()
+            self._regime_detector = MarketRegimeDetector(
+                incremental=self.config.incremental_indicators
+            )
         else:
             self._regime_detector = None
         self._current_regime = None
@@ -198,14 +217,13 @@ class MultiTimeframeBacktestEngine:
         strategy: BaseStrategy,
         data: MultiTimeframeData,
         simulator: MarketSimulator,
-    ) -> tuple[list[dict[str, Any]], Decimal, Decimal | None]:
+    ) -> tuple[EquityCurve, Decimal, Decimal | None]:
         """
         Core execution loop.
 
         Returns:
             (equity_curve, max_drawdown, capital_efficiency)
         """
-        equity_curve: list[dict[str, Any]] = []
         peak_value = self.config.initial_balance
         max_drawdown = Decimal("0")
         self._position_amounts = {}
@@ -216,6 +234,10 @@ class MultiTimeframeBacktestEngine:
         # Iterate over the finest-resolution TF (M5)
         base_df = data.m5
         total_bars = len(base_df)
+        timestamps = base_df.index.as_unit("ns").asi8
+        equity_curve = EquityCurve(
+            capacity=total_bars - self.config.warmup_bars, tz=base_df.index.tz
+        )
 
         for i in range(self.config.warmup_bars, total_bars):
             # Get rolling context — 5 DataFrames
@@ -284,14 +306,12 @@ class MultiTimeframeBacktestEngine:
 
             # Record equity curve
             portfolio_value = simulator.get_portfolio_value()
-            ec_entry: dict[str, Any] = {
-                "timestamp": base_df.index[i].isoformat(),
-                "price": float(current_price),
-                "portfolio_value": float(portfolio_value),
-            }
-            if self._current_regime:
-                ec_entry["regime"] = self._current_regime.regime.value
-            equity_curve.append(ec_entry)
+            equity_curve.append(
+                timestamps[i],
+                float(current_price),
+                float(portfolio_value),
+                regime=self._current_regime.regime.value if self._current_regime else None,
+            )
 
             # Track capital efficiency (base_value / portfolio_value)
             base_value = simulator.balance.base * current_price
@@ -473,7 +493,7 @@ class MultiTimeframeBacktestEngine:
         self,
         strategy_name: str,
         simulator: MarketSimulator,
-        equity_curve: list[dict[str, Any]],
+        equity_curve: EquityCurve,
         max_drawdown: Decimal,
         start_time: datetime,
         end_time: datetime,
@@ -521,19 +541,11 @@ class MultiTimeframeBacktestEngine:
         )
         avg_profit = total_profit / Decimal(total_trades) if total_trades > 0 else Decimal("0")
 
-        # Sharpe ratio
-        sharpe_ratio = self._calculate_sharpe_ratio(equity_curve)
-
-        # Sortino ratio
+        # Sharpe / Sortino / Calmar, vectorized over the value array
         returns = self._extract_returns(equity_curve)
+        sharpe_ratio = annualized_sharpe(returns)
         sortino_ratio = self._calculate_sortino(returns)
-
-        # Calmar ratio
-        calmar_ratio = None
-        if max_drawdown_pct > 0:
-            calmar_ratio = (total_return_pct / Decimal("100")) / (
-                max_drawdown_pct / Decimal("100")
-            )
+        calmar_ratio = calmar(total_return_pct, max_drawdown_pct)
 
         # Profit factor
         profit_factor = None
@@ -565,67 +577,21 @@ class MultiTimeframeBacktestEngine:
             profit_factor=profit_factor,
             capital_efficiency=capital_efficiency,
             trade_history=trade_history,
-            equity_curve=equity_curve,
+            equity_curve=equity_curve if self.config.keep_equity_curve else [],
         )
 
     @staticmethod
-    def _extract_returns(equity_curve: list[dict[str, Any]]) -> list[Decimal]:
+    def _extract_returns(equity_curve: Sequence[dict[str, Any]]) -> np.ndarray:
         """Extract period returns from equity curve."""
-        returns = []
-        for i in range(1, len(equity_curve)):
-            prev = Decimal(str(equity_curve[i - 1]["portfolio_value"]))
-            curr = Decimal(str(equity_curve[i]["portfolio_value"]))
-            if prev > 0:
-                returns.append((curr - prev) / prev)
-        return returns
+        return period_returns(portfolio_values(equity_curve))
 
     @staticmethod
     def _calculate_sortino(
-        returns: list[Decimal], periods_per_year: int = 365 * 24 * 12
+        returns: Sequence[Any], periods_per_year: int = 365 * 24 * 12
     ) -> Decimal | None:
         """Calculate Sortino ratio from returns (downside deviation only)."""
-        if not returns:
-            return None
-
-        mean_return = sum(returns) / len(returns)
-        downside_returns = [r for r in returns if r < 0]
-
-        if not downside_returns:
-            return None  # No downside — Sortino undefined
-
-        downside_variance = sum(r**2 for r in downside_returns) / len(returns)
-        downside_std = downside_variance.sqrt() if downside_variance > 0 else Decimal("0")
-
-        if downside_std > 0:
-            sortino = mean_return / downside_std
-            sortino = sortino * Decimal(str(periods_per_year**0.5))
-            return sortino
-
-        return None
-
-    def _calculate_sharpe_ratio(self, equity_curve: list[dict[str, Any]]) -> Decimal | None:
-        """Calculate Sharpe ratio from equity curve."""
-        if len(equity_curve) < 2:
-            return None
-
-        returns = []
-        for i in range(1, len(equity_curve)):
-            prev = Decimal(str(equity_curve[i - 1]["portfolio_value"]))
-            curr = Decimal(str(equity_curve[i]["portfolio_value"]))
-            if prev > 0:
-                returns.append((curr - prev) / prev)
-
-        if not returns:
-            return None
-
-        mean_return = sum(returns) / len(returns)
-        variance = sum((r - mean_return) ** 2 for r in returns) / len(returns)
-        std_return = variance.sqrt() if variance > 0 else Decimal("0")
-
-        if std_return > 0:
-            sharpe = mean_return / std_return
-            # Annualize (assuming 5-minute returns: 365 * 24 * 12)
-            sharpe = sharpe * Decimal(str((365 * 24 * 12) ** 0.5))
-            return sharpe
+        return annualized_sortino(np.asarray(returns, dtype=np.float64), periods_per_year)
 
-        return None
+    def _calculate_sharpe_ratio(self, equity_curve: Sequence[dict[str, Any]]) -> Decimal | None:
+        """Calculate Sharpe ratio from equity curve (5-minute returns: 365 * 24 * 12)."""
+        return annualized_sharpe(self._extract_returns(equity_curve))
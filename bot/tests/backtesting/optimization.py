@@ -11,6 +11,17 @@ Usage:
         param_grid={"take_profit_pct": [0.01, 0.02, 0.03], "stop_loss_pct": [0.01, 0.02]},
         data=data,
     )
+
+For CPU-bound engines set ``OptimizationConfig(backend="process")`` and pass
+a picklable factory (e.g. a ``StrategySpec``); trials then run in worker
+processes and stream back as they complete.
+
+``adaptive_optimize`` replaces the full grid with successive halving or
+Hyperband over data prefixes (or TPE sampling) for large spaces.
+
+Pass a ``ResultCache`` to reuse results of trials already run on the same
+data with the same strategy, params and engine config — in an earlier
+phase, an earlier run or another process.
 """
 
 from __future__ import annotations
@@ -31,9 +42,22 @@ from bot.tests.backtesting.multi_tf_engine import (
     MultiTFBacktestConfig,
     MultiTimeframeBacktestEngine,
 )
+from bot.tests.backtesting.process_executor import ProcessTrialExecutor, TrialJob
+from bot.tests.backtesting.result_cache import dataset_fingerprint
 
 if TYPE_CHECKING:
+    from bot.tests.backtesting.adaptive_search import (
+        AdaptiveSearchConfig,
+        AdaptiveSearchResult,
+        SearchSpace,
+    )
     from bot.tests.backtesting.checkpoint import OptimizationCheckpoint
+    from bot.tests.backtesting.orchestrator_engine import OrchestratorBacktestConfig
+    from bot.tests.backtesting.result_cache import ResultCache
+
+TrialCallback = Callable[["OptimizationTrial"], None]
+
+BACKENDS = ("thread", "process")
 
 
 @dataclass
@@ -43,6 +67,8 @@ class OptimizationConfig:
     objective: str = "total_return_pct"
     higher_is_better: bool = True
     backtest_config: MultiTFBacktestConfig = field(default_factory=MultiTFBacktestConfig)
+    # "thread" or "process"; "process" needs picklable factories (see StrategySpec)
+    backend: str = "thread"
 
 
 @dataclass
@@ -126,6 +152,47 @@ class OptimizationResult:
         return result
 
 
+# ---------------------------------------------------------------------------
+# Worker-side trial jobs (module level so they pickle by reference)
+# ---------------------------------------------------------------------------
+
+
+async def _multi_tf_trial(
+    data: MultiTimeframeData,
+    strategy_factory: Callable[[dict[str, Any]], BaseStrategy],
+    params: dict[str, Any],
+    backtest_config: MultiTFBacktestConfig,
+) -> BacktestResult:
+    engine = MultiTimeframeBacktestEngine(config=backtest_config)
+    return await engine.run(strategy_factory(params), data)
+
+
+async def _orchestrator_trial(
+    data: MultiTimeframeData,
+    cfg: OrchestratorBacktestConfig,
+    strategy_factories: dict[str, Callable[[dict[str, Any]], BaseStrategy]],
+) -> BacktestResult:
+    from bot.tests.backtesting.orchestrator_engine import BacktestOrchestratorEngine
+
+    engine = BacktestOrchestratorEngine()
+    for name, factory in strategy_factories.items():
+        engine.register_strategy_factory(name, factory)
+    return await engine.run(data, cfg)
+
+
+async def _unified_trial(
+    data: MultiTimeframeData,
+    cfg: OrchestratorBacktestConfig,
+    strategy_factories: dict[str, Callable[[dict[str, Any]], BaseStrategy]],
+) -> BacktestResult:
+    from bot.tests.backtesting.unified_engine import UnifiedBacktestEngine
+
+    engine = UnifiedBacktestEngine()
+    for name, factory in strategy_factories.items():
+        engine.register_strategy_factory(name, factory)
+    return await engine.run(data, cfg)
+
+
 class ParameterOptimizer:
     """
     Grid-search parameter optimizer for trading strategies.
@@ -138,9 +205,35 @@ class ParameterOptimizer:
         self,
         config: OptimizationConfig | None = None,
         checkpoint: OptimizationCheckpoint | None = None,
+        cache: ResultCache | None = None,
     ) -> None:
         self.config = config or OptimizationConfig()
         self.checkpoint = checkpoint
+        self.cache = cache
+        if self.config.backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {self.config.backend!r}, expected one of {BACKENDS}")
+        self._cancelled = False
+        self._executor: ProcessTrialExecutor | None = None
+        self._strategy_factories: dict[str, Callable[[dict[str, Any]], BaseStrategy]] = {}
+
+    def register_strategy_factory(
+        self,
+        name: str,
+        factory: Callable[[dict[str, Any]], BaseStrategy],
+    ) -> None:
+        """Register a factory forwarded to orchestrator/unified engines (name → callable(params))."""
+        self._strategy_factories[name] = factory
+
+    def cancel(self) -> None:
+        """
+        Stop the running optimization.
+
+        Trials completed so far are kept and returned; queued process-pool
+        trials are dropped and sequential runs stop before the next trial.
+        """
+        self._cancelled = True
+        if self._executor is not None:
+            self._executor.cancel()
 
     async def optimize(
         self,
@@ -148,6 +241,7 @@ class ParameterOptimizer:
         param_grid: dict[str, list[Any]],
         data: MultiTimeframeData,
         max_workers: int | None = None,
+        on_trial: TrialCallback | None = None,
     ) -> OptimizationResult:
         """
         Run grid search optimization.
@@ -157,11 +251,14 @@ class ParameterOptimizer:
                               and returns a BaseStrategy instance.
             param_grid: Dictionary mapping parameter names to lists of values.
             data: MultiTimeframeData to backtest on.
-            max_workers: If > 1, run trials in parallel via ThreadPoolExecutor.
+            max_workers: If > 1, run trials in parallel (threads or processes,
+                         per ``config.backend``).
+            on_trial: Called with each trial as soon as it completes.
 
         Returns:
             OptimizationResult with ranked trials and best parameters.
         """
+        self._cancelled = False
         combinations = self._generate_combinations(param_grid)
         run_id = str(uuid.uuid4())[:8]
 
@@ -170,16 +267,10 @@ class ParameterOptimizer:
         if self.checkpoint:
             completed = self.checkpoint.load_completed(run_id)
 
-        if max_workers and max_workers > 1:
-            trials = await self._run_trials_parallel(
-                combinations, strategy_factory, data, max_workers,
-                run_id=run_id, completed=completed,
-            )
-        else:
-            trials = await self._run_trials_sequential(
-                combinations, strategy_factory, data,
-                run_id=run_id, completed=completed,
-            )
+        trials = await self._evaluate(
+            strategy_factory, combinations, data, max_workers,
+            run_id=run_id, completed=completed, on_trial=on_trial,
+        )
 
         # Sort by objective
         trials.sort(
@@ -202,6 +293,37 @@ class ParameterOptimizer:
             param_grid=param_grid,
         )
 
+    async def adaptive_optimize(
+        self,
+        strategy_factory: Callable[[dict[str, Any]], BaseStrategy],
+        space: SearchSpace,
+        data: MultiTimeframeData,
+        search: AdaptiveSearchConfig | None = None,
+        max_workers: int | None = None,
+        on_trial: TrialCallback | None = None,
+        run_id: str | None = None,
+    ) -> AdaptiveSearchResult:
+        """
+        Successive halving / Hyperband over data prefixes, or TPE sampling.
+
+        ``space`` maps parameter names to value lists (as in a grid) or
+        ``ParamRange`` intervals. Configurations are first backtested on a
+        short prefix of ``data`` and only the best are promoted to longer
+        ones (see ``adaptive_search``). Uses this optimizer's objective,
+        backend, checkpoint (resumable under a deterministic ``run_id``) and
+        result cache.
+
+        Returns:
+            AdaptiveSearchResult; ``.optimization`` holds the full-length
+            trials, ``.report()`` the cost against a grid search.
+        """
+        from bot.tests.backtesting.adaptive_search import AdaptiveSearch
+
+        return await AdaptiveSearch(self, search).run(
+            strategy_factory, space, data,
+            max_workers=max_workers, on_trial=on_trial, run_id=run_id,
+        )
+
     async def two_phase_optimize(
         self,
         strategy_factory: Callable[[dict[str, Any]], BaseStrategy],
@@ -235,6 +357,8 @@ class ParameterOptimizer:
         coarse_result = await self.optimize(
             strategy_factory, coarse_grid, data, max_workers=max_workers
         )
+        if self._cancelled:
+            return coarse_result
 
         # Phase 2: Fine search around best params
         fine_grid: dict[str, list[Any]] = {}
@@ -288,6 +412,45 @@ class ParameterOptimizer:
             param_grid=param_grid,
         )
 
+    async def _evaluate(
+        self,
+        strategy_factory: Callable[[dict[str, Any]], BaseStrategy],
+        combinations: list[dict[str, Any]],
+        data: MultiTimeframeData,
+        max_workers: int | None,
+        run_id: str = "",
+        completed: dict[str, dict] | None = None,
+        on_trial: TrialCallback | None = None,
+    ) -> list[OptimizationTrial]:
+        """Backtest each combination on ``data`` (cache, then the configured backend)."""
+        combinations, cached, on_trial = self._split_cached(
+            data,
+            combinations,
+            lambda p: ("multi_tf", strategy_factory, p, self.config.backtest_config),
+            on_trial,
+        )
+
+        if max_workers and max_workers > 1 and self.config.backend == "process":
+            jobs = [
+                (p, _multi_tf_trial, (strategy_factory, p, self.config.backtest_config))
+                for p in combinations
+            ]
+            trials = await self._run_trials_process(
+                jobs, data, max_workers,
+                run_id=run_id, completed=completed, on_trial=on_trial,
+            )
+        elif max_workers and max_workers > 1:
+            trials = await self._run_trials_parallel(
+                combinations, strategy_factory, data, max_workers,
+                run_id=run_id, completed=completed, on_trial=on_trial,
+            )
+        else:
+            trials = await self._run_trials_sequential(
+                combinations, strategy_factory, data,
+                run_id=run_id, completed=completed, on_trial=on_trial,
+            )
+        return cached + trials
+
     async def _run_trials_sequential(
         self,
         combinations: list[dict[str, Any]],
@@ -295,12 +458,16 @@ class ParameterOptimizer:
         data: MultiTimeframeData,
         run_id: str = "",
         completed: dict[str, dict] | None = None,
+        on_trial: TrialCallback | None = None,
     ) -> list[OptimizationTrial]:
         """Run trials sequentially."""
         trials: list[OptimizationTrial] = []
         completed = completed or {}
 
         for params in combinations:
+            if self._cancelled:
+                break
+
             # Check checkpoint
             if self.checkpoint and completed:
                 from bot.tests.backtesting.checkpoint import OptimizationCheckpoint
@@ -327,6 +494,8 @@ class ParameterOptimizer:
 
                 h = OptimizationCheckpoint.config_hash(params)
                 self.checkpoint.save_trial(run_id, h, h, result.to_dict())
+            if on_trial:
+                on_trial(trial)
 
         return trials
 
@@ -338,6 +507,7 @@ class ParameterOptimizer:
         max_workers: int,
         run_id: str = "",
         completed: dict[str, dict] | None = None,
+        on_trial: TrialCallback | None = None,
     ) -> list[OptimizationTrial]:
         """Run trials in parallel using ThreadPoolExecutor."""
         completed = completed or {}
@@ -366,16 +536,149 @@ class ParameterOptimizer:
 
         for params, result in results:
             objective_val = self._get_objective_value(result)
-            trials.append(
-                OptimizationTrial(
-                    params=params,
-                    result=result,
-                    objective_value=objective_val,
-                )
+            trial = OptimizationTrial(
+                params=params,
+                result=result,
+                objective_value=objective_val,
             )
+            trials.append(trial)
+            if on_trial:
+                on_trial(trial)
 
         return trials
 
+    async def _run_trials_process(
+        self,
+        jobs: list[tuple[dict[str, Any], TrialJob, tuple[Any, ...]]],
+        data: MultiTimeframeData,
+        max_workers: int,
+        run_id: str = "",
+        completed: dict[str, dict] | None = None,
+        on_trial: TrialCallback | None = None,
+    ) -> list[OptimizationTrial]:
+        """
+        Run ``(params, job, args)`` trials in worker processes.
+
+        Data is sent to each worker once; each finished trial is
+        checkpointed and passed to ``on_trial`` as soon as it arrives.
+        """
+        completed = completed or {}
+        if self.checkpoint and completed:
+            from bot.tests.backtesting.checkpoint import OptimizationCheckpoint
+
+            jobs = [j for j in jobs if OptimizationCheckpoint.config_hash(j[0]) not in completed]
+
+        trials: list[OptimizationTrial] = []
+        if not jobs:
+            return trials
+
+        with ProcessTrialExecutor(data, max_workers=min(max_workers, len(jobs))) as executor:
+            self._executor = executor
+            if self._cancelled:
+                executor.cancel()
+            try:
+                async for params, result in executor.stream(jobs):
+                    trial = OptimizationTrial(
+                        params=params,
+                        result=result,
+                        objective_value=self._get_objective_value(result),
+                    )
+                    trials.append(trial)
+
+                    if self.checkpoint:
+                        from bot.tests.backtesting.checkpoint import OptimizationCheckpoint
+
+                        h = OptimizationCheckpoint.config_hash(params)
+                        self.checkpoint.save_trial(run_id, h, h, result.to_dict())
+                    if on_trial:
+                        on_trial(trial)
+            finally:
+                self._executor = None
+
+        return trials
+
+    async def _run_checkpointed_process(
+        self,
+        jobs: list[tuple[dict[str, Any], TrialJob, tuple[Any, ...]]],
+        data: MultiTimeframeData,
+        max_workers: int,
+        run_id: str,
+        on_trial: TrialCallback | None,
+    ) -> list[OptimizationTrial]:
+        """``_run_trials_process`` resuming from and cleaning up ``run_id``'s checkpoint."""
+        completed: dict[str, dict] = {}
+        if self.checkpoint:
+            completed = self.checkpoint.load_completed(run_id)
+
+        trials = await self._run_trials_process(
+            jobs, data, max_workers, run_id=run_id, completed=completed, on_trial=on_trial,
+        )
+
+        # Cleanup checkpoint on success; a cancelled run resumes from it
+        if self.checkpoint and not self._cancelled:
+            self.checkpoint.cleanup(run_id)
+        return trials
+
+    def _checkpoint_run_id(
+        self, kind: str, data: MultiTimeframeData, config: Any, param_grid: dict[str, list[Any]]
+    ) -> str:
+        """Deterministic run id, so an interrupted search resumes from its checkpoint."""
+        if not self.checkpoint:
+            return ""
+        from bot.tests.backtesting.checkpoint import OptimizationCheckpoint
+
+        return f"{kind}-" + OptimizationCheckpoint.config_hash(
+            {
+                "config": config,
+                "param_grid": param_grid,
+                "objective": self.config.objective,
+                "dataset": dataset_fingerprint(data),
+            }
+        )
+
+    def _split_cached(
+        self,
+        data: MultiTimeframeData,
+        combinations: list[dict[str, Any]],
+        key_parts: Callable[[dict[str, Any]], tuple[Any, ...]],
+        on_trial: TrialCallback | None,
+    ) -> tuple[list[dict[str, Any]], list[OptimizationTrial], TrialCallback | None]:
+        """
+        Serve trials from ``self.cache``.
+
+        Returns the combinations still to run, the trials found in the cache
+        and a callback that stores each newly finished trial before passing
+        it on to ``on_trial``. ``key_parts(params)`` lists everything besides
+        the data that determines a trial's result.
+        """
+        cache = self.cache
+        if cache is None:
+            return combinations, [], on_trial
+
+        fingerprint = dataset_fingerprint(data)
+        pending: list[dict[str, Any]] = []
+        cached: list[OptimizationTrial] = []
+        for params in combinations:
+            result = cache.get(cache.key(fingerprint, *key_parts(params)))
+            if result is None:
+                pending.append(params)
+                continue
+            trial = OptimizationTrial(
+                params=params,
+                result=result,
+                objective_value=self._get_objective_value(result),
+            )
+            cached.append(trial)
+            if on_trial:
+                on_trial(trial)
+
+        def store(trial: OptimizationTrial) -> None:
+            cache.put(cache.key(fingerprint, *key_parts(trial.params)), trial.result)
+            if on_trial:
+                on_trial(trial)
+
+        return pending, cached, store
+
     def _generate_combinations(self, param_grid: dict[str, list[Any]]) -> list[dict[str, Any]]:
         """Generate all parameter combinations from grid."""
         if not param_grid:
@@ -474,6 +777,7 @@ class ParameterOptimizer:
         data: MultiTimeframeData,
         config_template: "OrchestratorBacktestConfig",
         max_workers: int | None = None,
+        on_trial: TrialCallback | None = None,
     ) -> OptimizationResult:
         """
         Grid-search optimization targeting OrchestratorBacktestConfig params.
@@ -500,17 +804,26 @@ class ParameterOptimizer:
             data:             Multi-timeframe data to backtest on.
             config_template:  Base OrchestratorBacktestConfig to apply params to.
             max_workers:      Parallel workers (None = sequential).
+            on_trial:         Called with each trial as soon as it completes.
 
         Returns:
             OptimizationResult with best params and all trials.
         """
-        from bot.tests.backtesting.orchestrator_engine import (
-            BacktestOrchestratorEngine,
-            OrchestratorBacktestConfig,
-        )
+        from bot.tests.backtesting.orchestrator_engine import BacktestOrchestratorEngine
 
+        self._cancelled = False
         combinations = self._generate_combinations(param_grid)
         trials: list[OptimizationTrial] = []
+        combinations, cached, on_trial = self._split_cached(
+            data,
+            combinations,
+            lambda p: (
+                "orchestrator",
+                self._apply_orchestrator_params(config_template, p),
+                self._strategy_factories,
+            ),
+            on_trial,
+        )
 
         async def _run_trial(params: dict[str, Any]) -> OptimizationTrial:
             cfg = self._apply_orchestrator_params(config_template, params)
@@ -523,7 +836,17 @@ class ParameterOptimizer:
             obj_val = self._get_objective_value(result)
             return OptimizationTrial(params=params, result=result, objective_value=obj_val)
 
-        if max_workers and max_workers > 1:
+        if max_workers and max_workers > 1 and self.config.backend == "process":
+            factories = dict(self._strategy_factories)
+            jobs = [
+                (p, _orchestrator_trial, (self._apply_orchestrator_params(config_template, p), factories))
+                for p in combinations
+            ]
+            run_id = self._checkpoint_run_id("orchestrator", data, config_template, param_grid)
+            trials = await self._run_checkpointed_process(
+                jobs, data, max_workers, run_id, on_trial,
+            )
+        elif max_workers and max_workers > 1:
             loop = asyncio.get_event_loop()
 
             def _run_sync(p: dict[str, Any]) -> OptimizationTrial:
@@ -533,10 +856,18 @@ class ParameterOptimizer:
             with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
                 futures = [loop.run_in_executor(pool, _run_sync, p) for p in combinations]
                 trials = list(await asyncio.gather(*futures))
+            if on_trial:
+                for trial in trials:
+                    on_trial(trial)
         else:
             for params in combinations:
+                if self._cancelled:
+                    break
                 trial = await _run_trial(params)
                 trials.append(trial)
+                if on_trial:
+                    on_trial(trial)
+        trials = cached + trials
 
         trials.sort(key=lambda t: t.objective_value, reverse=self.config.higher_is_better)
         best = trials[0] if trials else None
@@ -635,6 +966,7 @@ class ParameterOptimizer:
         lookback: int = 100,
         warmup_bars: int = 14400,
         max_workers: int | None = None,
+        on_trial: TrialCallback | None = None,
     ) -> "OptimizationResult":
         """
         Grid-search optimization using TradingCore as configuration source.
@@ -664,6 +996,7 @@ class ParameterOptimizer:
             lookback:             OHLCV lookback window.
             warmup_bars:          Warmup bars before strategy execution.
             max_workers:          Parallel workers (None = sequential).
+            on_trial:             Called with each trial as soon as it completes.
 
         Returns:
             OptimizationResult with best params and all trials.
@@ -681,8 +1014,19 @@ class ParameterOptimizer:
             bar_duration_seconds=bar_duration_seconds,
         )
 
+        self._cancelled = False
         combinations = self._generate_combinations(param_grid)
         trials: list[OptimizationTrial] = []
+        combinations, cached, on_trial = self._split_cached(
+            data,
+            combinations,
+            lambda p: (
+                "unified",
+                self._apply_orchestrator_params(base_config, p),
+                self._strategy_factories,
+            ),
+            on_trial,
+        )
 
         async def _run_trial(params: dict[str, Any]) -> OptimizationTrial:
             cfg = self._apply_orchestrator_params(base_config, params)
@@ -694,7 +1038,17 @@ class ParameterOptimizer:
             obj_val = self._get_objective_value(result)
             return OptimizationTrial(params=params, result=result, objective_value=obj_val)
 
-        if max_workers and max_workers > 1:
+        if max_workers and max_workers > 1 and self.config.backend == "process":
+            factories = dict(self._strategy_factories)
+            jobs = [
+                (p, _unified_trial, (self._apply_orchestrator_params(base_config, p), factories))
+                for p in combinations
+            ]
+            run_id = self._checkpoint_run_id("unified", data, base_config, param_grid)
+            trials = await self._run_checkpointed_process(
+                jobs, data, max_workers, run_id, on_trial,
+            )
+        elif max_workers and max_workers > 1:
             loop = asyncio.get_event_loop()
 
             def _run_sync(p: dict[str, Any]) -> OptimizationTrial:
@@ -704,10 +1058,18 @@ class ParameterOptimizer:
             with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
                 futures = [loop.run_in_executor(pool, _run_sync, p) for p in combinations]
                 trials = list(await asyncio.gather(*futures))
+            if on_trial:
+                for trial in trials:
+                    on_trial(trial)
         else:
             for params in combinations:
+                if self._cancelled:
+                    break
                 trial = await _run_trial(params)
                 trials.append(trial)
+                if on_trial:
+                    on_trial(trial)
+        trials = cached + trials
 
         trials.sort(key=lambda t: t.objective_value, reverse=self.config.higher_is_better)
         best = trials[0] if trials else None
@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
@@ -31,6 +32,13 @@ from bot.orchestrator.market_regime import (
 )
 from bot.strategies.base import BaseStrategy, ExitReason, SignalDirection
 from bot.tests.backtesting.backtesting_engine import BacktestResult
+from bot.tests.backtesting.equity_curve import (
+    EquityCurve,
+    annualized_sharpe,
+    period_returns,
+    portfolio_values,
+)
+from bot.tests.backtesting.fast_market_simulator import FastMarketSimulator
 from bot.tests.backtesting.market_simulator import MarketSimulator
 from bot.tests.backtesting.multi_tf_data_loader import (
     MultiTimeframeData,
@@ -61,6 +69,7 @@ class OrchestratorBacktestConfig:
     enable_strategy_router: bool = True
     router_cooldown_bars: int = 60
     regime_check_every_n: int = 12    # 12 M5 bars = 1 hour
+    incremental_indicators: bool = False  # stream regime indicators bar-by-bar
 
     # Per-strategy parameters (passed to strategy factories)
     grid_params: dict[str, Any] = field(default_factory=dict)
@@ -82,6 +91,8 @@ class OrchestratorBacktestConfig:
     maker_fee: Decimal = Decimal("0.0002")    # 0.02 % (was 0.1 % in old MarketSimulator default)
     taker_fee: Decimal = Decimal("0.00055")   # 0.055 %
     slippage: Decimal = Decimal("0.0003")     # 0.03 % average slippage
+    fast_simulator: bool = False              # float64 FastMarketSimulator instead of Decimal
+    keep_equity_curve: bool = True            # False drops the per-bar curve after metrics
 
 
 @dataclass
@@ -162,7 +173,8 @@ class BacktestOrchestratorEngine:
             )
 
         # Simulator — use fees from config (Bybit VIP0 by default)
-        simulator = MarketSimulator(
+        simulator_cls = FastMarketSimulator if config.fast_simulator else MarketSimulator
+        simulator = simulator_cls(
             symbol=config.symbol,
             initial_balance_quote=config.initial_balance,
             maker_fee=config.maker_fee,
@@ -170,7 +182,7 @@ class BacktestOrchestratorEngine:
         )
 
         # Regime detector
-        regime_detector = MarketRegimeDetector()
+        regime_detector = MarketRegimeDetector(incremental=config.incremental_indicators)
 
         # Strategy router
         router = StrategyRouter(
@@ -200,11 +212,14 @@ class BacktestOrchestratorEngine:
         current_regime: RegimeAnalysis | None = None
 
         # Execution loop
-        equity_curve: list[dict[str, Any]] = []
         peak_value = config.initial_balance
         max_drawdown = Decimal("0")
         base_df = data.m5
         total_bars = len(base_df)
+        timestamps = base_df.index.as_unit("ns").asi8
+        equity_curve = EquityCurve(
+            capacity=total_bars - config.warmup_bars, track_active=True, tz=base_df.index.tz
+        )
 
         for i in range(config.warmup_bars, total_bars):
             df_d1, df_h4, df_h1, df_m15, df_m5 = self.data_loader.get_context_at(
@@ -296,15 +311,13 @@ class BacktestOrchestratorEngine:
 
             # 5. Record equity
             portfolio_value = simulator.get_portfolio_value()
-            ec_entry: dict[str, Any] = {
-                "timestamp": base_df.index[i].isoformat(),
-                "price": float(current_price),
-                "portfolio_value": float(portfolio_value),
-                "active_strategies": sorted(active_set),
-            }
-            if current_regime:
-                ec_entry["regime"] = current_regime.regime.value
-            equity_curve.append(ec_entry)
+            equity_curve.append(
+                timestamps[i],
+                float(current_price),
+                float(portfolio_value),
+                regime=current_regime.regime.value if current_regime else None,
+                active=tuple(sorted(active_set)),
+            )
 
             # Update drawdown
             if portfolio_value > peak_value:
@@ -482,7 +495,7 @@ class BacktestOrchestratorEngine:
         config: OrchestratorBacktestConfig,
         strategies: dict[str, BaseStrategy],
         simulator: MarketSimulator,
-        equity_curve: list[dict[str, Any]],
+        equity_curve: EquityCurve,
         max_drawdown: Decimal,
         start_time: datetime,
         end_time: datetime,
@@ -561,7 +574,7 @@ class BacktestOrchestratorEngine:
             sharpe_ratio=sharpe,
             profit_factor=profit_factor,
             trade_history=trade_history,
-            equity_curve=equity_curve,
+            equity_curve=equity_curve if config.keep_equity_curve else [],
             # V2.0 extensions
             strategy_switches=strategy_switches,
             per_strategy_pnl={k: float(v) for k, v in per_strategy_pnl.items()},
@@ -576,21 +589,6 @@ class BacktestOrchestratorEngine:
         return result
 
     @staticmethod
-    def _calculate_sharpe(equity_curve: list[dict[str, Any]]) -> Decimal | None:
+    def _calculate_sharpe(equity_curve: Sequence[dict[str, Any]]) -> Decimal | None:
         """Annualised Sharpe ratio from M5 equity curve."""
-        if len(equity_curve) < 2:
-            return None
-        returns = []
-        for i in range(1, len(equity_curve)):
-            prev = Decimal(str(equity_curve[i - 1]["portfolio_value"]))
-            curr = Decimal(str(equity_curve[i]["portfolio_value"]))
-            if prev > 0:
-                returns.append((curr - prev) / prev)
-        if not returns:
-            return None
-        mean_r = sum(returns) / len(returns)
-        variance = sum((r - mean_r) ** 2 for r in returns) / len(returns)
-        std_r = variance.sqrt() if variance > 0 else Decimal("0")
-        if std_r > 0:
-            return (mean_r / std_r) * Decimal(str((365 * 24 * 12) ** 0.5))
-        return None
+        return annualized_sharpe(period_returns(portfolio_values(equity_curve)))
@@ -1,9 +1,15 @@
 """
 PortfolioBacktestEngine — simultaneous backtest of N pairs with shared capital.
 
-Runs one OrchestratorBacktestEngine per symbol concurrently, enforces
-portfolio-level risk controls (max exposure, per-pair caps, portfolio stop-loss),
-and aggregates results into a PortfolioBacktestResult.
+Runs one OrchestratorBacktestEngine per symbol, enforces portfolio-level
+risk controls (max exposure, per-pair caps, portfolio stop-loss), and
+aggregates results into a PortfolioBacktestResult.
+
+Pairs are CPU-bound, so the default "async" backend effectively runs them
+one after another on a single core. ``backend="process"`` farms them out to
+a process pool instead: the data map goes to each worker once, per-pair
+results stream back as they finish, and pairs lost to a crashed worker are
+retried in a fresh pool while finished pairs are kept.
 
 Usage::
 
@@ -11,26 +17,72 @@ Usage::
     engine.register_strategy_factory("grid", lambda p: GridStrategy(**p))
     engine.register_strategy_factory("dca", lambda p: DCAStrategy(**p))
     result = await engine.run(data_map, config)
+
+    # Process backend: factories must be picklable (see StrategySpec)
+    engine.register_strategy_factory("grid", StrategySpec("mypkg.strategies:make_grid"))
+    config = PortfolioBacktestConfig(backend="process", max_workers=8)
+    result = await engine.run(data_map, config, on_pair=lambda p: print(p.completed, p.total))
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
-import math
+from collections.abc import Callable
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Any
 
+import numpy as np
+import pandas as pd
+
+from bot.tests.backtesting.equity_curve import (
+    EquityCurve,
+    annualized_sharpe,
+    max_drawdown_pct,
+    period_returns,
+    portfolio_values,
+)
 from bot.tests.backtesting.multi_tf_data_loader import MultiTimeframeData
 from bot.tests.backtesting.orchestrator_engine import (
     BacktestOrchestratorEngine,
     OrchestratorBacktestConfig,
     OrchestratorBacktestResult,
 )
+from bot.tests.backtesting.process_executor import ProcessTrialExecutor
 
 logger = logging.getLogger(__name__)
 
+BACKENDS = ("async", "process")
+
+
+@dataclass
+class PairProgress:
+    """Reported to ``on_pair`` as each pair finishes (or fails)."""
+
+    symbol: str
+    completed: int
+    total: int
+    result: OrchestratorBacktestResult | None = None
+    error: BaseException | None = None
+
+
+PairCallback = Callable[[PairProgress], None]
+
+
+async def _run_pair_job(
+    data_map: dict[str, MultiTimeframeData],
+    symbol: str,
+    pair_config: OrchestratorBacktestConfig,
+    strategy_factories: dict[str, Any],
+) -> OrchestratorBacktestResult:
+    """Worker-side pair backtest (module level so it pickles by reference)."""
+    engine = BacktestOrchestratorEngine()
+    for name, factory in strategy_factories.items():
+        engine.register_strategy_factory(name, factory)
+    return await engine.run(data_map[symbol], pair_config)
+
 
 @dataclass
 class PortfolioBacktestConfig:
@@ -43,6 +95,8 @@ class PortfolioBacktestConfig:
     max_single_pair_pct: float = 0.25
     max_total_exposure_pct: float = 0.80
     portfolio_stop_loss_pct: float = 0.15
+    # Used by LockstepPortfolioEngine's PortfolioRiskManager
+    max_correlation_limit: float = 0.80
 
     # Per-pair config template (symbol-specific overrides go in per_pair_overrides)
     per_pair_config: OrchestratorBacktestConfig = field(
@@ -52,6 +106,10 @@ class PortfolioBacktestConfig:
     # Optional per-symbol overrides for grid_params, dca_params, etc.
     per_pair_overrides: dict[str, dict[str, Any]] = field(default_factory=dict)
 
+    # "async" or "process"; "process" needs picklable factories (see StrategySpec)
+    backend: str = "async"
+    max_workers: int | None = None
+
 
 @dataclass
 class PortfolioBacktestResult:
@@ -75,6 +133,9 @@ class PortfolioBacktestResult:
     pairs_profitable: int
     total_pairs: int
 
+    # Shared-pool state and rejection counts (LockstepPortfolioEngine only)
+    risk_summary: dict[str, Any] = field(default_factory=dict)
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "portfolio": {
@@ -96,13 +157,14 @@ class PortfolioBacktestResult:
                 }
                 for symbol, r in self.per_pair_results.items()
             },
+            **({"risk": self.risk_summary} if self.risk_summary else {}),
         }
 
 
 class PortfolioBacktestEngine:
     """
-    Runs OrchestratorBacktestEngine for each symbol concurrently and
-    aggregates results with portfolio-level risk controls.
+    Runs OrchestratorBacktestEngine for each symbol (in-process or in a
+    process pool) and aggregates results with portfolio-level risk controls.
     """
 
     def __init__(self) -> None:
@@ -116,6 +178,7 @@ class PortfolioBacktestEngine:
         self,
         data_map: dict[str, MultiTimeframeData],
         config: PortfolioBacktestConfig,
+        on_pair: PairCallback | None = None,
     ) -> PortfolioBacktestResult:
         """
         Run the portfolio backtest.
@@ -123,10 +186,13 @@ class PortfolioBacktestEngine:
         Args:
             data_map: Mapping of symbol → MultiTimeframeData.
             config:   Portfolio-level configuration.
+            on_pair:  Called with a PairProgress as each pair finishes.
 
         Returns:
             PortfolioBacktestResult with aggregated metrics.
         """
+        if config.backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {config.backend!r}, expected one of {BACKENDS}")
         symbols = config.symbols or list(data_map.keys())
         if not symbols:
             raise ValueError("No symbols specified in config or data_map.")
@@ -166,33 +232,42 @@ class PortfolioBacktestEngine:
             )
             pair_configs[symbol] = pair_cfg
 
-        # Run all pairs concurrently
-        tasks = []
+        runnable = []
         for symbol in symbols:
             if symbol not in data_map:
                 logger.warning("No data for symbol %s, skipping", symbol)
                 continue
-            tasks.append(
-                self._run_single_pair(
-                    symbol=symbol,
-                    data=data_map[symbol],
-                    pair_config=pair_configs[symbol],
-                )
-            )
+            runnable.append(symbol)
 
-        pair_result_list = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Collect results, skip failed pairs
+        # Collect results as pairs finish, skip failed pairs
         per_pair_results: dict[str, OrchestratorBacktestResult] = {}
-        for symbol, result in zip(symbols, pair_result_list):
-            if isinstance(result, Exception):
-                logger.error("Backtest failed for %s: %s", symbol, result)
-                continue
-            per_pair_results[symbol] = result  # type: ignore[assignment]
+        completed = 0
+
+        def record(symbol: str, outcome: Any) -> None:
+            nonlocal completed
+            completed += 1
+            if isinstance(outcome, BaseException):
+                logger.error("Backtest failed for %s: %s", symbol, outcome)
+                progress = PairProgress(symbol, completed, len(runnable), error=outcome)
+            else:
+                per_pair_results[symbol] = outcome
+                progress = PairProgress(symbol, completed, len(runnable), result=outcome)
+            if on_pair:
+                on_pair(progress)
+
+        if config.backend == "process" and len(runnable) > 1:
+            await self._run_pairs_process(
+                runnable, data_map, pair_configs, config, record
+            )
+        else:
+            await self._run_pairs_async(runnable, data_map, pair_configs, record)
 
         if not per_pair_results:
             raise RuntimeError("All pair backtests failed.")
 
+        # Keep the requested symbol order regardless of completion order
+        per_pair_results = {s: per_pair_results[s] for s in runnable if s in per_pair_results}
+
         # Portfolio-level analytics
         portfolio_equity = self._merge_equity_curves(per_pair_results)
         total_return_pct = self._portfolio_total_return(
@@ -226,9 +301,67 @@ class PortfolioBacktestEngine:
         )
 
     # ------------------------------------------------------------------
-    # Single-pair runner
+    # Pair runners
     # ------------------------------------------------------------------
 
+    async def _run_pairs_async(
+        self,
+        symbols: list[str],
+        data_map: dict[str, MultiTimeframeData],
+        pair_configs: dict[str, OrchestratorBacktestConfig],
+        record: Callable[[str, Any], None],
+    ) -> None:
+        async def run_one(symbol: str) -> None:
+            try:
+                outcome: Any = await self._run_single_pair(
+                    symbol=symbol, data=data_map[symbol], pair_config=pair_configs[symbol]
+                )
+            except Exception as e:
+                outcome = e
+            record(symbol, outcome)
+
+        await asyncio.gather(*(run_one(s) for s in symbols))
+
+    async def _run_pairs_process(
+        self,
+        symbols: list[str],
+        data_map: dict[str, MultiTimeframeData],
+        pair_configs: dict[str, OrchestratorBacktestConfig],
+        config: PortfolioBacktestConfig,
+        record: Callable[[str, Any], None],
+    ) -> None:
+        """
+        Run pairs in worker processes, reporting each as it finishes.
+
+        A crashed worker breaks the pool and fails every unfinished pair with
+        BrokenProcessPool. Those pairs are retried once in a fresh pool; if
+        that breaks too, the rest run one at a time so only the pair that
+        actually crashes is reported as failed. Finished pairs are kept.
+        """
+        factories = dict(self._strategy_factories)
+        data = {s: data_map[s] for s in symbols}
+        workers = min(config.max_workers or len(symbols), len(symbols))
+
+        async def stream(batch: list[str], retry: bool) -> list[str]:
+            jobs = [(s, _run_pair_job, (s, pair_configs[s], factories)) for s in batch]
+            crashed: list[str] = []
+            async for symbol, outcome in executor.stream(jobs, return_exceptions=True):
+                if retry and isinstance(outcome, BrokenProcessPool):
+                    crashed.append(symbol)
+                else:
+                    record(symbol, outcome)
+            return crashed
+
+        with ProcessTrialExecutor(data, max_workers=workers) as executor:
+            crashed = await stream(symbols, retry=True)
+            if crashed:
+                logger.warning("Worker crashed, retrying %d unfinished pairs", len(crashed))
+                executor.restart()
+                crashed = await stream(crashed, retry=True)
+            for symbol in crashed:
+                executor.restart()
+                await stream([symbol], retry=False)
+
     async def _run_single_pair(
         self,
         symbol: str,
@@ -248,17 +381,23 @@ class PortfolioBacktestEngine:
         self, results: dict[str, OrchestratorBacktestResult]
     ) -> list[dict[str, Any]]:
         """Sum portfolio values across all pairs per timestamp."""
-        from collections import defaultdict
-
-        ts_map: dict[str, float] = defaultdict(float)
-        for result in results.values():
-            for entry in result.equity_curve:
-                ts = entry["timestamp"]
-                ts_map[ts] += entry["portfolio_value"]
-
+        frames = [
+            r.equity_curve.to_frame()[["timestamp", "portfolio_value"]]
+            if isinstance(r.equity_curve, EquityCurve)
+            else pd.DataFrame.from_records(r.equity_curve, columns=["timestamp", "portfolio_value"])
+            for r in results.values()
+            if r.equity_curve
+        ]
+        if not frames:
+            return []
+        merged = (
+            pd.concat(frames, ignore_index=True)
+            .groupby("timestamp", sort=True)["portfolio_value"]
+            .sum()
+        )
         return [
-            {"timestamp": ts, "portfolio_value": val}
-            for ts, val in sorted(ts_map.items())
+            {"timestamp": ts, "portfolio_value": float(val)}
+            for ts, val in zip(merged.index.tolist(), merged.to_numpy())
         ]
 
     def _portfolio_total_return(
@@ -274,81 +413,38 @@ class PortfolioBacktestEngine:
 
     def _portfolio_sharpe(self, equity_curve: list[dict[str, Any]]) -> float:
         """Annualised Sharpe ratio from merged equity curve."""
-        if len(equity_curve) < 2:
-            return 0.0
-        returns = []
-        for i in range(1, len(equity_curve)):
-            prev = equity_curve[i - 1]["portfolio_value"]
-            curr = equity_curve[i]["portfolio_value"]
-            if prev > 0:
-                returns.append((curr - prev) / prev)
-        if not returns:
-            return 0.0
-        mean_r = sum(returns) / len(returns)
-        variance = sum((r - mean_r) ** 2 for r in returns) / len(returns)
-        std_r = math.sqrt(variance) if variance > 0 else 0.0
-        if std_r > 0:
-            return mean_r / std_r * math.sqrt(365 * 24 * 12)
-        return 0.0
+        sharpe = annualized_sharpe(period_returns(portfolio_values(equity_curve)))
+        return float(sharpe) if sharpe is not None else 0.0
 
     def _portfolio_max_drawdown(self, equity_curve: list[dict[str, Any]]) -> float:
         """Maximum drawdown % from the merged portfolio equity curve."""
-        if not equity_curve:
-            return 0.0
-        peak = equity_curve[0]["portfolio_value"]
-        max_dd = 0.0
-        for entry in equity_curve:
-            val = entry["portfolio_value"]
-            if val > peak:
-                peak = val
-            elif peak > 0:
-                dd = (peak - val) / peak * 100
-                if dd > max_dd:
-                    max_dd = dd
-        return max_dd
+        return max_drawdown_pct(portfolio_values(equity_curve))
 
     def _compute_correlation_matrix(
         self, results: dict[str, OrchestratorBacktestResult]
     ) -> dict[str, dict[str, float]]:
-        """Pearson correlation of equity-curve returns between all pairs."""
+        """
+        Pearson correlation of equity-curve returns between all pairs.
+
+        Return series are aligned by position; each pair of columns uses the
+        bars both series have (pandas pairwise-complete correlation).
+        """
         symbols = list(results.keys())
-        # Extract return series per symbol
-        return_series: dict[str, list[float]] = {}
+        columns = {}
         for sym, result in results.items():
-            ec = result.equity_curve
-            rets = []
-            for i in range(1, len(ec)):
-                prev = ec[i - 1]["portfolio_value"]
-                curr = ec[i]["portfolio_value"]
-                rets.append((curr - prev) / prev if prev > 0 else 0.0)
-            return_series[sym] = rets
-
-        matrix: dict[str, dict[str, float]] = {s: {} for s in symbols}
-        for i, sym_a in enumerate(symbols):
-            for sym_b in symbols:
-                if sym_a == sym_b:
-                    matrix[sym_a][sym_b] = 1.0
-                    continue
-                corr = self._pearson(return_series.get(sym_a, []), return_series.get(sym_b, []))
-                matrix[sym_a][sym_b] = round(corr, 4)
-
-        return matrix
-
-    @staticmethod
-    def _pearson(a: list[float], b: list[float]) -> float:
-        """Pearson correlation coefficient."""
-        n = min(len(a), len(b))
-        if n < 2:
-            return 0.0
-        a, b = a[:n], b[:n]
-        mean_a = sum(a) / n
-        mean_b = sum(b) / n
-        cov = sum((ai - mean_a) * (bi - mean_b) for ai, bi in zip(a, b)) / n
-        std_a = math.sqrt(sum((ai - mean_a) ** 2 for ai in a) / n)
-        std_b = math.sqrt(sum((bi - mean_b) ** 2 for bi in b) / n)
-        if std_a > 0 and std_b > 0:
-            return cov / (std_a * std_b)
-        return 0.0
+            values = portfolio_values(result.equity_curve)
+            prev = values[:-1]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                rets = np.where(prev > 0, np.diff(values) / prev, 0.0)
+            columns[sym] = pd.Series(rets)
+
+        corr = pd.DataFrame(columns, columns=symbols).corr(min_periods=2)
+        values = np.nan_to_num(corr.to_numpy(), nan=0.0).round(4)
+        np.fill_diagonal(values, 1.0)
+        return {
+            sym_a: {sym_b: float(values[i, j]) for j, sym_b in enumerate(symbols)}
+            for i, sym_a in enumerate(symbols)
+        }
 
     @staticmethod
     def _avg_correlation(matrix: dict[str, dict[str, float]]) -> float:
@@ -0,0 +1,179 @@
+"""
+Process-based trial execution for parameter optimization.
+
+The backtest engines are pure-Python CPU work, so threads give almost no
+speedup under the GIL. This module runs trials in a ``ProcessPoolExecutor``
+instead:
+
+- Strategies are described by a picklable ``StrategySpec`` (import path plus
+  fixed params) rather than a closure.
+- Market data is handed to each worker once through the pool initializer;
+  individual trials only carry their parameters.
+- Results are streamed back as they complete and the run can be cancelled.
+
+Usage:
+    spec = StrategySpec("mypkg.strategies:make_strategy", {"symbol": "BTC/USDT"})
+    with ProcessTrialExecutor(data, max_workers=16) as executor:
+        async for key, result in executor.stream(jobs):
+            ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from bot.strategies.base import BaseStrategy
+
+logger = logging.getLogger(__name__)
+
+# Coroutine run inside a worker: ``job(data, *args)`` -> result
+TrialJob = Callable[..., Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class StrategySpec:
+    """
+    Picklable strategy factory.
+
+    ``factory`` is a ``"package.module:callable"`` import path; the callable
+    takes a params dict and returns a BaseStrategy. ``params`` are merged
+    under the per-trial params. Instances are themselves callable, so a spec
+    can be used anywhere a strategy factory is expected.
+    """
+
+    factory: str
+    params: dict[str, Any] = field(default_factory=dict)
+
+    def resolve(self) -> Callable[[dict[str, Any]], BaseStrategy]:
+        module_name, sep, attr = self.factory.partition(":")
+        if not sep or not attr:
+            raise ValueError(f"Strategy factory must be 'module:callable', got {self.factory!r}")
+        target: Any = importlib.import_module(module_name)
+        for part in attr.split("."):
+            target = getattr(target, part)
+        return target
+
+    def __call__(self, params: dict[str, Any]) -> BaseStrategy:
+        return self.resolve()({**self.params, **params})
+
+
+# Per-worker state, set once by _init_worker
+_worker_data: Any = None
+
+
+def _init_worker(data: Any) -> None:
+    global _worker_data
+    _worker_data = data
+
+
+def _run_job(job: TrialJob, args: tuple[Any, ...]) -> Any:
+    return asyncio.run(job(_worker_data, *args))
+
+
+class ProcessTrialExecutor:
+    """
+    Runs optimization trials in worker processes.
+
+    ``data`` is pickled once per worker (pool initializer), not per trial.
+    Jobs must be module-level coroutine functions taking the data as their
+    first argument, and every other argument must be picklable.
+    """
+
+    def __init__(
+        self,
+        data: Any,
+        max_workers: int | None = None,
+        mp_context: multiprocessing.context.BaseContext | None = None,
+    ) -> None:
+        self.data = data
+        self.max_workers = max_workers
+        self._mp_context = mp_context
+        self._pool: ProcessPoolExecutor | None = None
+        self._cancelled = threading.Event()
+
+    def __enter__(self) -> ProcessTrialExecutor:
+        self.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.shutdown()
+
+    def start(self) -> None:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=self._mp_context,
+                initializer=_init_worker,
+                initargs=(self.data,),
+            )
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def restart(self) -> None:
+        """Replace the pool, e.g. after a worker crash broke it."""
+        self.shutdown()
+        self.start()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Stop streaming; queued trials are dropped, running ones finish."""
+        self._cancelled.set()
+
+    def submit(self, job: TrialJob, *args: Any) -> Future:
+        self.start()
+        assert self._pool is not None
+        return self._pool.submit(_run_job, job, args)
+
+    async def stream(
+        self,
+        jobs: Iterable[tuple[Any, TrialJob, tuple[Any, ...]]],
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[tuple[Any, Any]]:
+        """
+        Submit ``(key, job, args)`` tuples and yield ``(key, result)`` as each completes.
+
+        Exceptions raised by a job propagate from the iteration, unless
+        ``return_exceptions`` is set, in which case they are yielded in place
+        of the result. A crashed worker surfaces as ``BrokenProcessPool`` for
+        every job that had not finished; ``restart()`` gives a fresh pool.
+        Cancelling (``cancel()`` or cancelling the awaiting task) drops
+        queued trials.
+        """
+        pending: dict[asyncio.Future, Any] = {}
+        for key, job, args in jobs:
+            pending[asyncio.wrap_future(self.submit(job, *args))] = key
+
+        try:
+            while pending and not self.cancelled:
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=0.5,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for fut in done:
+                    key = pending.pop(fut)
+                    if return_exceptions and fut.exception() is not None:
+                        yield key, fut.exception()
+                    else:
+                        yield key, fut.result()
+                    if self.cancelled:
+                        break
+        finally:
+            if pending:
+                logger.info("Trial stream stopped, dropping %d queued trials", len(pending))
+                for fut in pending:
+                    fut.cancel()
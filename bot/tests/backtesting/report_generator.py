@@ -17,6 +17,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from bot.tests.backtesting.backtesting_engine import BacktestResult
+from bot.tests.backtesting.equity_curve import portfolio_values
 from bot.tests.backtesting.monte_carlo import MonteCarloResult
 from bot.tests.backtesting.strategy_comparison import StrategyComparisonResult
 from bot.tests.backtesting.walk_forward import WalkForwardResult
@@ -277,7 +278,7 @@ class ReportGenerator:
         series = {}
         for name, result in comparison.results.items():
             if result.equity_curve:
-                series[name] = [e["portfolio_value"] for e in result.equity_curve]
+                series[name] = portfolio_values(result.equity_curve).tolist()
         if series:
             sections.append(
                 '<div class="chart">'
@@ -487,7 +488,7 @@ class ReportGenerator:
         return f"<h2>Performance Metrics</h2><table><thead><tr><th>Metric</th><th>Value</th></tr></thead><tbody>{table_rows}</tbody></table>"
 
     def _equity_chart(self, result: BacktestResult) -> str:
-        values = [e["portfolio_value"] for e in result.equity_curve]
+        values = portfolio_values(result.equity_curve).tolist()
         return (
             '<div class="chart">'
             + self.chart.line_chart(
@@ -501,7 +502,7 @@ class ReportGenerator:
         )
 
     def _drawdown_chart(self, result: BacktestResult) -> str:
-        values = [e["portfolio_value"] for e in result.equity_curve]
+        values = portfolio_values(result.equity_curve).tolist()
         if not values:
             return ""
         peak = values[0]
@@ -0,0 +1,400 @@
+"""
+Result Cache — persistent, content-addressed cache of backtest results.
+
+A result is keyed by what produced it: a fingerprint of the market data
+plus a canonical hash of the strategy, its parameters and the engine
+configuration. Identical runs — between optimizer phases, across pipeline
+re-runs, in other processes or web jobs — are read back from disk instead
+of being recomputed.
+
+Entries live in one SQLite file (WAL mode, so several processes can share
+it) and are evicted least-recently-used once the stored payload exceeds
+``max_bytes``. Hit/miss counters are kept per instance (``stats``) and in
+the file (``report()``), so the report covers every process that used it.
+
+Only importable callables (module-level functions, classes, ``StrategySpec``)
+take part in keys; closures and lambdas have no stable identity, so runs
+using them are simply not cached. Keys cover inputs, not code: pass a new
+``namespace`` (or ``clear()``) after changing engine or strategy logic.
+
+Usage:
+    cache = ResultCache("data/backtest_cache.db")
+    cache.initialize()
+    key = cache.key(data, "multi_tf", strategy_spec, params, engine_config)
+    result = await cache.get_or_run(key, lambda: engine.run(strategy_spec(params), data))
+    print(cache.report())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import enum
+import functools
+import hashlib
+import json
+import logging
+import pickle
+import sqlite3
+import threading
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import date, datetime, timedelta
+from datetime import time as dt_time
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, TypeVar
+
+import numpy as np
+import pandas as pd
+
+from bot.tests.backtesting.multi_tf_data_loader import MultiTimeframeData
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored format or key derivation changes
+CACHE_FORMAT_VERSION = 1
+
+T = TypeVar("T")
+
+
+class UncacheableError(TypeError):
+    """Raised when a key part has no stable, content-based representation."""
+
+
+# ---------------------------------------------------------------------------
+# Key derivation
+# ---------------------------------------------------------------------------
+
+
+def _frame_digest(df: pd.DataFrame, h: Any) -> None:
+    h.update(repr((list(map(str, df.columns)), str(df.index.dtype), df.shape)).encode())
+    h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+
+
+def dataset_fingerprint(data: MultiTimeframeData | pd.DataFrame | Mapping[str, Any]) -> str:
+    """
+    Content hash of market data.
+
+    Accepts a ``MultiTimeframeData``, a single DataFrame or a mapping of
+    name → DataFrame; index, column names and every value take part.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    if isinstance(data, pd.DataFrame):
+        _frame_digest(data, h)
+    elif isinstance(data, MultiTimeframeData):
+        for tf in ("m5", "m15", "h1", "h4", "d1"):
+            h.update(tf.encode())
+            _frame_digest(getattr(data, tf), h)
+    elif isinstance(data, Mapping):
+        for name in sorted(data):
+            h.update(str(name).encode())
+            _frame_digest(data[name], h)
+    else:
+        raise UncacheableError(f"Cannot fingerprint data of type {type(data).__name__}")
+    return h.hexdigest()
+
+
+def _callable_path(fn: Any) -> str:
+    module = getattr(fn, "__module__", None)
+    qualname = getattr(fn, "__qualname__", None)
+    if not module or not qualname or "<" in qualname:
+        # Lambdas and closures ("<lambda>", "f.<locals>.g") have no stable identity
+        raise UncacheableError(f"{fn!r} is not an importable callable")
+    return f"{module}:{qualname}"
+
+
+def canonicalize(obj: Any) -> Any:
+    """
+    Reduce a key part to plain JSON-serialisable data.
+
+    Dataclasses (engine configs, ``StrategySpec``) become their type name
+    plus fields, mappings are sorted, importable callables become their
+    import path. Raises ``UncacheableError`` for anything else.
+    """
+    if obj is None or isinstance(obj, (bool, int, str)):
+        return obj
+    if isinstance(obj, float):
+        return obj if np.isfinite(obj) else repr(obj)
+    if isinstance(obj, np.generic):
+        return canonicalize(obj.item())
+    if isinstance(obj, Decimal):
+        return {"__decimal__": str(obj)}
+    if isinstance(obj, enum.Enum):
+        return {"__enum__": f"{type(obj).__qualname__}.{obj.name}"}
+    if isinstance(obj, (datetime, date, dt_time, pd.Timestamp)):
+        return {"__time__": obj.isoformat()}
+    if isinstance(obj, (timedelta, pd.Timedelta)):
+        return {"__timedelta__": str(pd.Timedelta(obj).value)}
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        fields = {f.name: canonicalize(getattr(obj, f.name)) for f in dataclasses.fields(obj)}
+        return {"__type__": _callable_path(type(obj)), "fields": fields}
+    if isinstance(obj, Mapping):
+        # Keys are JSON-encoded, so they never clash with the markers above
+        return {
+            json.dumps(canonicalize(k), sort_keys=True): canonicalize(v) for k, v in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [canonicalize(v) for v in obj]
+    if isinstance(obj, (set, frozenset)):
+        return {"__set__": sorted(json.dumps(canonicalize(v), sort_keys=True) for v in obj)}
+    if isinstance(obj, functools.partial):
+        return {
+            "__partial__": canonicalize(obj.func),
+            "args": canonicalize(obj.args),
+            "keywords": canonicalize(obj.keywords),
+        }
+    if callable(obj) and getattr(obj, "__self__", None) is None:
+        return {"__callable__": _callable_path(obj)}
+    raise UncacheableError(f"Cannot build a cache key from {type(obj).__name__}")
+
+
+def config_hash(*parts: Any) -> str:
+    """Stable hash of the canonical form of ``parts``."""
+    payload = json.dumps(canonicalize(parts), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+
+class ResultCache:
+    """SQLite-backed result cache with size-bounded LRU eviction."""
+
+    def __init__(
+        self,
+        db_path: str | Path = ":memory:",
+        max_bytes: int = 1 << 30,
+        namespace: str = "",
+    ) -> None:
+        self.db_path = str(db_path)
+        self.max_bytes = max_bytes
+        self.namespace = namespace
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._uncacheable = 0
+        self._evictions = 0
+        # Read bookkeeping not yet written: key -> (last_access, hits), counter -> n
+        self._pending_access: dict[str, tuple[int, int]] = {}
+        self._pending_counts: dict[str, int] = {}
+
+    def initialize(self) -> None:
+        """Open the database and create the tables if they don't exist."""
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access INTEGER NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 0,
+                value BLOB NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_results_last_access ON results (last_access);
+            CREATE TABLE IF NOT EXISTS counters (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            );
+            """
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            with self._lock:
+                self._flush_pending()
+                self._conn.commit()
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> ResultCache:
+        if self._conn is None:
+            self.initialize()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # -- keys --------------------------------------------------------------
+
+    def key(self, data: Any, *parts: Any) -> str | None:
+        """
+        Cache key for running ``parts`` on ``data``.
+
+        ``data`` is market data or a fingerprint string from
+        ``dataset_fingerprint`` (compute it once when keying many runs on
+        the same data). Returns None when a part cannot be keyed.
+        """
+        try:
+            fingerprint = data if isinstance(data, str) else dataset_fingerprint(data)
+            digest = config_hash(CACHE_FORMAT_VERSION, self.namespace, fingerprint, *parts)
+        except UncacheableError as exc:
+            logger.debug("Result not cacheable: %s", exc)
+            return None
+        return digest
+
+    # -- access ------------------------------------------------------------
+
+    def get(self, key: str | None) -> Any | None:
+        """
+        Cached value for ``key``, or None on a miss (or a None key).
+
+        Reads never write: recency and hit/miss counts are queued in memory
+        and written with the next ``put``, ``delete``, ``report`` or ``close``.
+        """
+        if key is None:
+            self._uncacheable += 1
+            return None
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._misses += 1
+                self._pending_counts["misses"] = self._pending_counts.get("misses", 0) + 1
+                return None
+            self._hits += 1
+            self._pending_counts["hits"] = self._pending_counts.get("hits", 0) + 1
+            hits = self._pending_access.get(key, (0, 0))[1]
+            self._pending_access[key] = (time.time_ns(), hits + 1)
+        try:
+            return pickle.loads(row[0])
+        except Exception:
+            logger.warning("Dropping unreadable cache entry %s", key, exc_info=True)
+            self.delete(key)
+            return None
+
+    def put(self, key: str | None, value: Any) -> None:
+        """Store ``value`` under ``key`` (no-op for a None key), then evict LRU entries."""
+        if key is None:
+            return
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.max_bytes:
+            logger.debug("Not caching %s: %d bytes exceeds max_bytes", key, len(blob))
+            return
+        now = time.time_ns()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, size, created_at, last_access, value) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, len(blob), time.time(), now, blob),
+            )
+            self._flush_pending()
+            self._evict()
+            self._conn.commit()
+
+    async def get_or_run(self, key: str | None, run: Callable[[], Awaitable[T]]) -> T:
+        """
+        Cached value for ``key``, or await ``run()`` and store its result.
+
+        The SQLite reads and writes run in a worker thread, off the event loop.
+        """
+        value = await asyncio.to_thread(self.get, key)
+        if value is not None:
+            return value
+        value = await run()
+        await asyncio.to_thread(self.put, key, value)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return (
+            key is not None
+            and self._conn.execute("SELECT 1 FROM results WHERE key = ?", (key,)).fetchone()
+            is not None
+        )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pending_access.pop(key, None)
+            self._flush_pending()
+            self._conn.execute("DELETE FROM results WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Drop every entry and reset the persistent counters."""
+        with self._lock:
+            self._pending_access.clear()
+            self._pending_counts.clear()
+            self._conn.execute("DELETE FROM results")
+            self._conn.execute("DELETE FROM counters")
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        victims: list[str] = []
+        for key, size in self._conn.execute("SELECT key, size FROM results ORDER BY last_access"):
+            victims.append(key)
+            excess -= size
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM results WHERE key = ?", [(k,) for k in victims])
+        self._evictions += len(victims)
+        self._bump("evictions", len(victims))
+        logger.debug("Evicted %d cache entries", len(victims))
+
+    def _flush_pending(self) -> None:
+        """Write queued read bookkeeping; the caller holds the lock and commits."""
+        if self._pending_access:
+            self._conn.executemany(
+                "UPDATE results SET last_access = MAX(last_access, ?), hits = hits + ? "
+                "WHERE key = ?",
+                [(last, hits, key) for key, (last, hits) in self._pending_access.items()],
+            )
+            self._pending_access.clear()
+        for name, n in self._pending_counts.items():
+            self._bump(name, n)
+        self._pending_counts.clear()
+
+    def _bump(self, name: str, n: int = 1) -> None:
+        self._conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, n),
+        )
+
+    # -- reporting ---------------------------------------------------------
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters for this instance."""
+        total = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "uncacheable": self._uncacheable,
+            "evictions": self._evictions,
+            "hit_rate": self._hits / total if total > 0 else 0.0,
+        }
+
+    def report(self) -> dict[str, Any]:
+        """Session stats plus totals and occupancy recorded in the database."""
+        with self._lock:
+            self._flush_pending()
+            self._conn.commit()
+        counters = dict(self._conn.execute("SELECT name, value FROM counters").fetchall())
+        entries, size = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()
+        hits, misses = counters.get("hits", 0), counters.get("misses", 0)
+        return {
+            "session": self.stats,
+            "total": {
+                "hits": hits,
+                "misses": misses,
+                "evictions": counters.get("evictions", 0),
+                "hit_rate": hits / (hits + misses) if hits + misses > 0 else 0.0,
+            },
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+        }
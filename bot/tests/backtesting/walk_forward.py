@@ -5,12 +5,25 @@ Splits multi-timeframe data into successive train/test windows,
 runs a strategy on each, and aggregates out-of-sample results
 to assess robustness.
 
+Windows are independent, so ``WalkForwardConfig(backend="process")`` runs
+them in worker processes (data is sent to each worker once). Segments are
+positional views located through the data's alignment index, and every
+train/test segment is preceded by ``warmup_bars`` of earlier data so
+indicators start warm instead of consuming the segment itself.
+
 Usage:
     wf = WalkForwardAnalysis(config=WalkForwardConfig(n_splits=5))
     result = await wf.run(strategy, data)
+
+    # Anchored windows across 8 processes; pass a StrategySpec for
+    # strategies that do not pickle
+    cfg = WalkForwardConfig(n_splits=8, scheme="anchored", backend="process")
+    result = await WalkForwardAnalysis(cfg).run(StrategySpec("pkg.mod:make"), data)
 """
 
-from dataclasses import dataclass, field
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from decimal import Decimal
 
@@ -18,14 +31,17 @@ import pandas as pd
 
 from bot.strategies.base import BaseStrategy
 from bot.tests.backtesting.backtesting_engine import BacktestResult
-from bot.tests.backtesting.multi_tf_data_loader import (
-    MultiTimeframeData,
-    MultiTimeframeDataLoader,
-)
+from bot.tests.backtesting.multi_tf_data_loader import MultiTimeframeData
 from bot.tests.backtesting.multi_tf_engine import (
     MultiTFBacktestConfig,
     MultiTimeframeBacktestEngine,
 )
+from bot.tests.backtesting.process_executor import ProcessTrialExecutor, StrategySpec
+
+BACKENDS = ("async", "process")
+SCHEMES = ("rolling", "anchored")
+
+_TF_ATTRS = ("d1", "h4", "h1", "m15", "m5")
 
 
 @dataclass
@@ -35,6 +51,16 @@ class WalkForwardConfig:
     n_splits: int = 5
     train_pct: float = 0.7
     backtest_config: MultiTFBacktestConfig = field(default_factory=MultiTFBacktestConfig)
+    # "rolling": each train segment covers only its own window;
+    # "anchored": every train segment starts at the beginning of the data
+    scheme: str = "rolling"
+    # M5 bars of preceding data replayed before each segment to warm up
+    # indicators (None = backtest_config.warmup_bars)
+    warmup_bars: int | None = None
+    # "async" runs windows one after another; "process" runs them in worker
+    # processes and needs a picklable strategy (or a StrategySpec)
+    backend: str = "async"
+    max_workers: int | None = None
 
 
 @dataclass
@@ -66,73 +92,151 @@ class WalkForwardResult:
         return self.consistency_ratio >= min_consistency
 
 
+def segment_data(
+    data: MultiTimeframeData, s: slice, warmup_bars: int = 0
+) -> tuple[MultiTimeframeData, int]:
+    """
+    Views of every timeframe covering M5 bars ``[s.start - warmup, s.stop)``.
+
+    Higher timeframes are located with one ``searchsorted`` for the start and
+    the cached alignment index for the end, then sliced positionally, so no
+    data is filtered or copied. The prefix is clipped at the start of the
+    data and ``s.stop`` at its end; the number of prefix bars actually
+    included is returned with the views.
+    """
+    prefix = max(0, min(warmup_bars, s.start))
+    start, stop = s.start - prefix, min(s.stop, len(data.m5))
+    if stop <= start:
+        empty = pd.DataFrame()
+        m5 = data.m5.iloc[0:0]
+        return MultiTimeframeData(d1=empty, h4=empty, h1=empty, m15=empty, m5=m5), 0
+
+    start_ts = data.m5.index[start]
+    alignment = data.alignment_index("m5")
+    views = {}
+    for tf in _TF_ATTRS:
+        df = getattr(data, tf)
+        lo = int(df.index.searchsorted(start_ts, side="left"))
+        views[tf] = df.iloc[lo : alignment.end_at(tf, stop - 1)]
+    return MultiTimeframeData(**views), prefix
+
+
+async def _run_window(
+    data: MultiTimeframeData,
+    strategy: BaseStrategy | StrategySpec,
+    backtest_config: MultiTFBacktestConfig,
+    train_slice: slice,
+    test_slice: slice,
+    warmup_bars: int,
+) -> tuple[BacktestResult, BacktestResult]:
+    """Backtest one window's train then test segment, each with a warm-up prefix."""
+    if isinstance(strategy, StrategySpec):
+        strategy = strategy({})
+    results = []
+    for s in (train_slice, test_slice):
+        segment, prefix = segment_data(data, s, warmup_bars)
+        engine = MultiTimeframeBacktestEngine(config=replace(backtest_config, warmup_bars=prefix))
+        results.append(await engine.run(strategy, segment))
+    return results[0], results[1]
+
+
 class WalkForwardAnalysis:
     """
-    Walk-forward analysis: split data into rolling train/test windows,
-    run strategy on each, measure out-of-sample performance.
+    Walk-forward analysis: split data into rolling or anchored train/test
+    windows, run strategy on each, measure out-of-sample performance.
     """
 
     def __init__(self, config: WalkForwardConfig | None = None) -> None:
         self.config = config or WalkForwardConfig()
+        if self.config.backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {self.config.backend!r}, expected one of {BACKENDS}")
+        if self.config.scheme not in SCHEMES:
+            raise ValueError(f"Unknown scheme {self.config.scheme!r}, expected one of {SCHEMES}")
+
+    @property
+    def warmup_bars(self) -> int:
+        if self.config.warmup_bars is not None:
+            return self.config.warmup_bars
+        return self.config.backtest_config.warmup_bars
 
     async def run(
         self,
-        strategy: BaseStrategy,
+        strategy: BaseStrategy | StrategySpec,
         data: MultiTimeframeData,
     ) -> WalkForwardResult:
         """
         Run walk-forward analysis.
 
-        Splits M15 data into n_splits windows. For each window:
-        - Train on first train_pct of the window.
+        Splits M5 data into n_splits windows. For each window:
+        - Train on first train_pct of the window (from the start of the
+          data when ``scheme="anchored"``).
         - Test on remaining (1-train_pct).
         - Record both train and test results.
 
+        Each segment is replayed after ``warmup_bars`` of preceding data, so
+        trading covers the whole segment.
+
         Args:
-            strategy: BaseStrategy to evaluate.
+            strategy: BaseStrategy to evaluate, or a StrategySpec that builds
+                      one (recommended with the process backend).
             data: Full MultiTimeframeData.
 
         Returns:
             WalkForwardResult with per-window and aggregate metrics.
         """
         windows = self._split_windows(data)
-        loader = MultiTimeframeDataLoader()
-        results: list[WalkForwardWindow] = []
-
-        for i, (train_slice, test_slice) in enumerate(windows):
-            # Build MultiTimeframeData for each slice
-            train_data = self._build_slice_data(data, train_slice)
-            test_data = self._build_slice_data(data, test_slice)
-
-            engine = MultiTimeframeBacktestEngine(config=self.config.backtest_config)
-
-            # Run on train window
-            train_result = await engine.run(strategy, train_data)
-            # Run on test window
-            test_result = await engine.run(strategy, test_data)
-
-            ts = data.m5.index
-            results.append(
-                WalkForwardWindow(
-                    window_index=i,
-                    train_start=ts[train_slice.start].to_pydatetime(),
-                    train_end=ts[train_slice.stop - 1].to_pydatetime(),
-                    test_start=ts[test_slice.start].to_pydatetime(),
-                    test_end=ts[test_slice.stop - 1].to_pydatetime(),
-                    train_result=train_result,
-                    test_result=test_result,
+        if self.config.backend == "process" and len(windows) > 1:
+            pairs = await self._run_windows_process(strategy, data, windows)
+        else:
+            pairs = [
+                await _run_window(
+                    data, strategy, self.config.backtest_config, train, test, self.warmup_bars
                 )
+                for train, test in windows
+            ]
+
+        ts = data.m5.index
+        results = [
+            WalkForwardWindow(
+                window_index=i,
+                train_start=ts[train_slice.start].to_pydatetime(),
+                train_end=ts[train_slice.stop - 1].to_pydatetime(),
+                test_start=ts[test_slice.start].to_pydatetime(),
+                test_end=ts[test_slice.stop - 1].to_pydatetime(),
+                train_result=train_result,
+                test_result=test_result,
             )
-
+            for i, ((train_slice, test_slice), (train_result, test_result)) in enumerate(
+                zip(windows, pairs, strict=True)
+            )
+        ]
         return self._aggregate(results)
 
+    async def _run_windows_process(
+        self,
+        strategy: BaseStrategy | StrategySpec,
+        data: MultiTimeframeData,
+        windows: list[tuple[slice, slice]],
+    ) -> list[tuple[BacktestResult, BacktestResult]]:
+        """Run every window in worker processes; results come back in window order."""
+        jobs = [
+            (i, _run_window, (strategy, self.config.backtest_config, train, test, self.warmup_bars))
+            for i, (train, test) in enumerate(windows)
+        ]
+        workers = min(self.config.max_workers or len(windows), len(windows))
+        done: dict[int, tuple[BacktestResult, BacktestResult]] = {}
+        with ProcessTrialExecutor(data, max_workers=workers) as executor:
+            async for i, pair in executor.stream(jobs):
+                done[i] = pair
+        return [done[i] for i in range(len(windows))]
+
     def _split_windows(self, data: MultiTimeframeData) -> list[tuple[slice, slice]]:
         """Split M5 index range into n_splits train/test pairs."""
         total = len(data.m5)
-        warmup = self.config.backtest_config.warmup_bars
+        warmup = self.warmup_bars
         n = self.config.n_splits
 
-        # Usable range after warmup
+        # Usable range after the first warm-up prefix
         usable = total - warmup
         window_size = usable // n
 
@@ -143,13 +247,11 @@ class WalkForwardAnalysis:
 
             # Split window into train/test
             train_size = int((end - start) * self.config.train_pct)
-            train_slice = slice(start, start + train_size)
+            train_start = warmup if self.config.scheme == "anchored" else start
+            train_slice = slice(train_start, start + train_size)
             test_slice = slice(start + train_size, end)
 
-            # Ensure minimum sizes
-            if (train_slice.stop - train_slice.start) > warmup and (
-                test_slice.stop - test_slice.start
-            ) > warmup:
+            if train_slice.stop > train_slice.start and test_slice.stop > test_slice.start:
                 windows.append((train_slice, test_slice))
 
         return windows
@@ -158,27 +260,10 @@ class WalkForwardAnalysis:
         """
         Build a MultiTimeframeData for a sub-range of M5 indices.
 
-        Higher timeframes are filtered to match the M5 time range.
+        Higher timeframes are restricted to the M5 time range (views, see
+        ``segment_data``).
         """
-        m5 = data.m5.iloc[s.start : s.stop]
-        if m5.empty:
-            return MultiTimeframeData(
-                d1=pd.DataFrame(),
-                h4=pd.DataFrame(),
-                h1=pd.DataFrame(),
-                m15=pd.DataFrame(),
-                m5=m5,
-            )
-
-        start_ts = m5.index[0]
-        end_ts = m5.index[-1]
-
-        d1 = data.d1[(data.d1.index >= start_ts) & (data.d1.index <= end_ts)]
-        h4 = data.h4[(data.h4.index >= start_ts) & (data.h4.index <= end_ts)]
-        h1 = data.h1[(data.h1.index >= start_ts) & (data.h1.index <= end_ts)]
-        m15 = data.m15[(data.m15.index >= start_ts) & (data.m15.index <= end_ts)]
-
-        return MultiTimeframeData(d1=d1, h4=h4, h1=h1, m15=m15, m5=m5)
+        return segment_data(data, s)[0]
 
     def _aggregate(self, windows: list[WalkForwardWindow]) -> WalkForwardResult:
         """Aggregate walk-forward window results."""
@@ -5,10 +5,12 @@ Script to download historical OHLCV data from exchanges for backtesting.
 Usage:
     python scripts/download_historical_data.py --symbol ETH/USDT --exchange binance --timeframes 1d,4h,1h,15m,5m
     python scripts/download_historical_data.py --all  # Download from all exchanges, all timeframes
+    python scripts/download_historical_data.py --symbol BTC/USDT --store data/candles  # columnar store
 """
 
 import argparse
 import csv
+import sys
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -16,19 +18,25 @@ from typing import Optional
 
 import ccxt
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
 
 class HistoricalDataDownloader:
     """Download historical OHLCV data from cryptocurrency exchanges."""
 
-    def __init__(self, output_dir: str = "data/historical"):
+    def __init__(self, output_dir: str = "data/historical", store_dir: Optional[str] = None):
         """
         Initialize downloader.
 
         Args:
             output_dir: Directory to save downloaded data
+            store_dir: If set, write into a columnar CandleStore (one per
+                       exchange under this directory) instead of CSV files
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.store_dir = Path(store_dir) if store_dir else None
 
         # Initialize exchanges
         self.exchanges = {
@@ -181,6 +189,35 @@ class HistoricalDataDownloader:
         print(f"   💾 Saved to: {filepath}")
         return filepath
 
+    def save_to_store(
+        self,
+        candles: list[list],
+        exchange_id: str,
+        symbol: str,
+        timeframe: str,
+    ) -> Path:
+        """
+        Merge OHLCV data into the exchange's columnar CandleStore.
+
+        Args:
+            candles: List of OHLCV candles
+            exchange_id: Exchange name
+            symbol: Trading pair
+            timeframe: Timeframe
+
+        Returns:
+            Path to the stored series directory
+        """
+        from bot.tests.backtesting.candle_store import CandleStore
+
+        store = CandleStore(self.store_dir / exchange_id)
+        timeframe = self.timeframe_map.get(timeframe.lower(), timeframe)
+        rows = store.write_ohlcv(symbol, timeframe, candles)
+        path = store.root / CandleStore.series_key(symbol, timeframe)
+
+        print(f"   💾 Stored {rows} rows in: {path}")
+        return path
+
     def download_and_save(
         self,
         exchange_id: str,
@@ -217,7 +254,8 @@ class HistoricalDataDownloader:
                 return None
 
             # Save
-            filepath = self.save_to_csv(
+            save = self.save_to_store if self.store_dir else self.save_to_csv
+            filepath = save(
                 candles=candles,
                 exchange_id=exchange_id,
                 symbol=symbol,
@@ -349,6 +387,12 @@ def main():
         help="Output directory (default: data/historical)",
     )
 
+    parser.add_argument(
+        "--store",
+        type=str,
+        help="Write into a columnar candle store at this directory instead of CSV",
+    )
+
     parser.add_argument(
         "--all",
         action="store_true",
@@ -370,14 +414,14 @@ def main():
     timeframes = [tf.strip() for tf in args.timeframes.split(",")]
 
     # Initialize downloader
-    downloader = HistoricalDataDownloader(output_dir=args.output_dir)
+    downloader = HistoricalDataDownloader(output_dir=args.output_dir, store_dir=args.store)
 
     print("="*60)
     print("📊 Historical Data Downloader")
     print("="*60)
     print(f"Symbol: {args.symbol}")
     print(f"Timeframes: {', '.join(timeframes)}")
-    print(f"Output directory: {args.output_dir}")
+    print(f"Output directory: {args.store or args.output_dir}")
     print("="*60)
 
     # Download
@@ -416,7 +460,7 @@ def main():
         print(f"{args.exchange.upper()}: {successful}/{len(results)} files")
 
     print(f"\nTotal files downloaded: {total_files}")
-    print(f"Location: {downloader.output_dir.absolute()}")
+    print(f"Location: {(downloader.store_dir or downloader.output_dir).absolute()}")
 
 
 if __name__ == "__main__":
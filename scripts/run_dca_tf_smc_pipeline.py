@@ -17,6 +17,9 @@ Usage:
 
     # Resume from a phase:
     python scripts/run_dca_tf_smc_pipeline.py --start-phase 3 --data-dir data/historical/
+
+    # Ignore cached results (after changing strategy or engine code):
+    python scripts/run_dca_tf_smc_pipeline.py --no-cache --data-dir data/historical/
 """
 
 from __future__ import annotations
@@ -61,6 +64,10 @@ from bot.tests.backtesting.optimization import (
     OptimizationConfig,
     ParameterOptimizer,
 )
+from bot.tests.backtesting.result_cache import (  # noqa: E402
+    ResultCache,
+    dataset_fingerprint,
+)
 from bot.tests.backtesting.sensitivity import SensitivityAnalysis
 from bot.tests.backtesting.stress_testing import StressTestConfig, StressTester
 from bot.tests.backtesting.walk_forward import WalkForwardAnalysis, WalkForwardConfig
@@ -102,6 +109,11 @@ BALANCE = Decimal("10000")
 # CSV files contain 5-8 years of data; 140 days gives ~37s/backtest on 16-core VM.
 MAX_M5_BARS = 40_320
 
+# Content-addressed result cache shared by all phases and worker processes;
+# a re-run over unchanged data and configs reads every backtest from here.
+CACHE_PATH = RESULTS_DIR / "result_cache.db"
+CACHE_MAX_BYTES = 4 << 30
+
 # Global error collector — all errors across all phases
 ALL_ERRORS: list[dict[str, Any]] = []
 
@@ -345,6 +357,15 @@ def load_pair_data(data_dir: str, pair: str) -> MultiTimeframeData:
     return data
 
 
+def open_cache(cache_path: str | None) -> ResultCache | None:
+    """Open the shared result cache, or None when caching is disabled."""
+    if not cache_path:
+        return None
+    cache = ResultCache(cache_path, max_bytes=CACHE_MAX_BYTES)
+    cache.initialize()
+    return cache
+
+
 def result_to_dict(r: BacktestResult) -> dict[str, Any]:
     """Convert BacktestResult to JSON-serialisable dict."""
     return r.to_dict()
@@ -372,12 +393,13 @@ def _suppress_smc_logging() -> None:
 
 
 def _run_single_optimization(
-    data_dir: str, pair: str, strat_name: str,
+    data_dir: str, pair: str, strat_name: str, cache_path: str | None = None,
 ) -> dict[str, Any]:
     """Run two-phase optimization for one pair+strategy in a subprocess."""
     import asyncio as _asyncio
     _suppress_smc_logging()
 
+    cache = open_cache(cache_path)
     try:
         data = load_pair_data(data_dir, pair)
         spec = STRATEGIES[strat_name]
@@ -387,7 +409,7 @@ def _run_single_optimization(
             higher_is_better=True,
             backtest_config=BASELINE_CONFIG,
         )
-        optimizer = ParameterOptimizer(config=opt_config)
+        optimizer = ParameterOptimizer(config=opt_config, cache=cache)
 
         t0 = time.monotonic()
         opt_result = _asyncio.run(optimizer.two_phase_optimize(
@@ -415,24 +437,35 @@ def _run_single_optimization(
             "strategy": strat_name,
             "error": traceback.format_exc(),
         }
+    finally:
+        if cache is not None:
+            cache.close()
 
 
 def _run_single_backtest(
     data_dir: str, pair: str, strat_name: str, config_dict: dict[str, Any],
+    cache_path: str | None = None,
 ) -> dict[str, Any]:
     """Run one backtest in a subprocess. Returns serialisable result dict."""
     import asyncio as _asyncio
     _suppress_smc_logging()
 
+    cache = open_cache(cache_path)
     try:
         data = load_pair_data(data_dir, pair)
         spec = STRATEGIES[strat_name]
         params = config_dict.get("params") or spec["defaults"]
-        strategy = spec["factory"](params)
 
         cfg = MultiTFBacktestConfig(**config_dict["engine_config"])
-        engine = MultiTimeframeBacktestEngine(config=cfg)
-        result = _asyncio.run(engine.run(strategy, data))
+        # Same key layout as ParameterOptimizer trials, so entries are shared
+        key = cache.key(data, "multi_tf", spec["factory"], params, cfg) if cache else None
+        result = cache.get(key) if cache else None
+        if result is None:
+            strategy = spec["factory"](params)
+            engine = MultiTimeframeBacktestEngine(config=cfg)
+            result = _asyncio.run(engine.run(strategy, data))
+            if cache:
+                cache.put(key, result)
         d = {
             "ok": True,
             "pair": pair,
@@ -453,6 +486,9 @@ def _run_single_backtest(
             "strategy": strat_name,
             "error": traceback.format_exc(),
         }
+    finally:
+        if cache is not None:
+            cache.close()
 
 
 def save_json(data: Any, path: Path) -> None:
@@ -489,7 +525,7 @@ def generate_sensitivity_ranges(
 
 
 async def phase1_baseline(
-    pairs: list[str], data_dir: str, workers: int,
+    pairs: list[str], data_dir: str, workers: int, cache_path: str | None = None,
 ) -> dict[str, Any]:
     """Phase 1: Baseline — run each strategy with default params on every pair (parallel)."""
     logger.info("=" * 60)
@@ -525,6 +561,7 @@ async def phase1_baseline(
         futures = {
             pool.submit(
                 _run_single_backtest, data_dir, pair, sname, {"engine_config": engine_cfg},
+                cache_path,
             ): (pair, sname)
             for pair, sname in tasks
         }
@@ -566,7 +603,7 @@ async def phase1_baseline(
 
 
 async def phase2_optimization(
-    pairs: list[str], data_dir: str, workers: int,
+    pairs: list[str], data_dir: str, workers: int, cache_path: str | None = None,
 ) -> dict[str, Any]:
     """Phase 2: Parameter optimisation — parallel two-phase grid search."""
     logger.info("=" * 60)
@@ -589,7 +626,9 @@ async def phase2_optimization(
 
     with ProcessPoolExecutor(max_workers=workers) as pool:
         futures = {
-            pool.submit(_run_single_optimization, data_dir, pair, sname): (pair, sname)
+            pool.submit(
+                _run_single_optimization, data_dir, pair, sname, cache_path,
+            ): (pair, sname)
             for pair, sname in tasks
         }
 
@@ -636,6 +675,7 @@ async def phase2_optimization(
 
 async def phase3_regime(
     pairs: list[str], data_dir: str, phase2: dict[str, Any], workers: int = 14,
+    cache_path: str | None = None,
 ) -> dict[str, Any]:
     """Phase 3: Regime-aware — best params + regime filter + risk manager (parallel)."""
     logger.info("=" * 60)
@@ -676,7 +716,7 @@ async def phase3_regime(
         futures = {
             pool.submit(
                 _run_single_backtest, data_dir, pair, sname,
-                {"engine_config": regime_cfg, "params": params},
+                {"engine_config": regime_cfg, "params": params}, cache_path,
             ): (pair, sname)
             for pair, sname, params in tasks
         }
@@ -719,7 +759,7 @@ async def phase3_regime(
 
 
 async def phase4_robustness(
-    pairs: list[str], data_dir: str, phase2: dict[str, Any],
+    pairs: list[str], data_dir: str, phase2: dict[str, Any], cache_path: str | None = None,
 ) -> dict[str, Any]:
     """Phase 4: Robustness — walk-forward, stress, Monte Carlo, sensitivity."""
     logger.info("=" * 60)
@@ -736,6 +776,7 @@ async def phase4_robustness(
     stress_cfg = StressTestConfig(num_periods=3, backtest_config=BASELINE_CONFIG)
     mc = MonteCarloSimulation(config=MonteCarloConfig(n_simulations=100))
     sa = SensitivityAnalysis()
+    cache = open_cache(cache_path)
 
     for i, pair in enumerate(pairs, 1):
         try:
@@ -747,9 +788,24 @@ async def phase4_robustness(
             continue
 
         robustness[pair] = {}
+        fingerprint = dataset_fingerprint(data) if cache else None
         for strat_name, spec in STRATEGIES.items():
             p2_entry = phase2.get(pair, {}).get(strat_name, {})
             params = p2_entry.get("best_params", spec["defaults"])
+
+            # The whole robustness entry is cached: it depends only on the
+            # data, strategy, params and the analysis configs above
+            entry_key = cache.key(
+                fingerprint, "phase4", spec["factory"], params,
+                wf_cfg, stress_cfg, mc.config, 0.20,
+            ) if cache else None
+            cached_entry = cache.get(entry_key) if cache else None
+            if cached_entry is not None:
+                logger.info("  %s / %s robustness (cached)", pair, strat_name)
+                robustness[pair][strat_name] = cached_entry
+                ok_count += 1
+                continue
+            n_errors = len(errors)
             entry: dict[str, Any] = {}
 
             # --- 4a: Walk-Forward ---
@@ -834,11 +890,16 @@ async def phase4_robustness(
 
             robustness[pair][strat_name] = entry
             ok_count += 1
+            if cache and len(errors) == n_errors:
+                cache.put(entry_key, entry)
 
         if i % 5 == 0 or i == len(pairs):
             el = time.monotonic() - t0
             tg_send(f"Phase 4 progress: {i}/{len(pairs)} pairs ({ok_count} OK, {len(errors)} err, {el:.0f}s)")
 
+    if cache is not None:
+        cache.close()
+
     elapsed = time.monotonic() - t0
     total = len(pairs) * len(STRATEGIES)
     logger.info("Phase 4 done: %d/%d OK, %d errors", ok_count, total, len(errors))
@@ -984,6 +1045,7 @@ async def run_pipeline(args: argparse.Namespace) -> None:
     """Execute the backtesting pipeline based on CLI arguments."""
     data_dir = args.data_dir
     workers = args.workers
+    cache_path = None if args.no_cache else str(args.cache or CACHE_PATH)
 
     # Determine pairs
     if args.symbols:
@@ -1035,28 +1097,30 @@ async def run_pipeline(args: argparse.Namespace) -> None:
             phase4_data = json.loads(p4_path.read_text())
 
     t_start = time.monotonic()
+    cache = open_cache(cache_path)
+    cache_before = cache.report()["total"] if cache else None
 
     # --- Phase 1 ---
     if 1 in phases:
-        phase1_data = await phase1_baseline(pairs, data_dir, workers)
+        phase1_data = await phase1_baseline(pairs, data_dir, workers, cache_path)
 
     # --- Phase 2 ---
     if 2 in phases:
-        phase2_data = await phase2_optimization(pairs, data_dir, workers)
+        phase2_data = await phase2_optimization(pairs, data_dir, workers, cache_path)
 
     # --- Phase 3 ---
     if 3 in phases:
         if phase2_data is None:
             logger.warning("Phase 2 results not available; using default params for Phase 3")
             phase2_data = {}
-        phase3_data = await phase3_regime(pairs, data_dir, phase2_data, workers)
+        phase3_data = await phase3_regime(pairs, data_dir, phase2_data, workers, cache_path)
 
     # --- Phase 4 ---
     if 4 in phases:
         if phase2_data is None:
             logger.warning("Phase 2 results not available; using default params for Phase 4")
             phase2_data = {}
-        phase4_data = await phase4_robustness(pairs, data_dir, phase2_data)
+        phase4_data = await phase4_robustness(pairs, data_dir, phase2_data, cache_path)
 
     # --- Phase 5 ---
     if 5 in phases:
@@ -1065,6 +1129,23 @@ async def run_pipeline(args: argparse.Namespace) -> None:
     elapsed = time.monotonic() - t_start
     logger.info("Pipeline complete in %.1f seconds (%.1f min)", elapsed, elapsed / 60)
 
+    # --- Result cache report (workers share the database, so diff the totals) ---
+    if cache is not None:
+        report = cache.report()
+        hits = report["total"]["hits"] - cache_before["hits"]
+        misses = report["total"]["misses"] - cache_before["misses"]
+        report["run"] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+        }
+        cache.close()
+        logger.info(
+            "Result cache: %d hits, %d misses this run (%d entries, %.1f MB)",
+            hits, misses, report["entries"], report["bytes"] / 1e6,
+        )
+        save_json(report, RESULTS_DIR / "cache_report.json")
+
     # --- Save consolidated error log ---
     _save_error_summary(elapsed)
 
@@ -1132,6 +1213,14 @@ def main() -> None:
         "--symbols",
         help="Comma-separated symbols (e.g. BTC,ETH,SOL). Auto-appends _USDT if needed.",
     )
+    parser.add_argument(
+        "--cache",
+        help=f"Result cache database (default: {CACHE_PATH})",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Recompute every backtest instead of reusing cached results",
+    )
 
     args = parser.parse_args()
 
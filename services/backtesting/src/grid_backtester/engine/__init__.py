@@ -16,6 +16,7 @@ from grid_backtester.engine.simulator import GridBacktestSimulator
 from grid_backtester.engine.clusterizer import CoinClusterizer
 from grid_backtester.engine.optimizer import GridOptimizer, GridOptimizationResult, OptimizationTrial
 from grid_backtester.engine.reporter import GridBacktestReporter
+from grid_backtester.engine.shared_candles import SharedCandleHandle, SharedCandleStore
 from grid_backtester.engine.system import GridBacktestSystem
 
 __all__ = [
@@ -35,5 +36,7 @@ __all__ = [
     "GridOptimizationResult",
     "OptimizationTrial",
     "GridBacktestReporter",
+    "SharedCandleHandle",
+    "SharedCandleStore",
     "GridBacktestSystem",
 ]
@@ -4,15 +4,26 @@ GridOptimizer — Two-phase parameter optimization for grid strategies.
 Phase 1 (Coarse): Cartesian product of parameter ranges from ClusterPreset.
 Phase 2 (Fine): Narrow search around best parameters with finer steps.
 
-Uses ProcessPoolExecutor for parallel simulation (Issue #5).
+Uses ProcessPoolExecutor for parallel simulation (Issue #5). Candles are
+published once per optimization into shared memory and a single worker
+pool, initialized with the attached candles and indicator cache, serves
+both phases.
+
+optimize_adaptive() replaces the grid with successive halving / Hyperband
+over candle prefixes (or TPE sampling), using the shared plans from
+bot.tests.backtesting.adaptive_search.
 """
 
+import hashlib
 import itertools
+import math
 import time
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections.abc import Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import pandas as pd
@@ -24,12 +35,20 @@ from grid_backtester.engine.models import (
     GridDirection,
     OptimizationObjective,
 )
+from grid_backtester.engine.shared_candles import (
+    AttachedCandles,
+    SharedCandleHandle,
+    SharedCandleStore,
+)
 from grid_backtester.engine.simulator import GridBacktestSimulator
 from grid_backtester.core.calculator import GridSpacing
 from grid_backtester.caching.indicator_cache import IndicatorCache
 from grid_backtester.persistence.checkpoint import OptimizationCheckpoint
 from grid_backtester.logging import get_logger
 
+if TYPE_CHECKING:
+    from bot.tests.backtesting.adaptive_search import AdaptiveSearchConfig
+
 logger = get_logger(__name__)
 
 
@@ -70,6 +89,13 @@ class GridOptimizationResult:
     coarse_trials: int = 0
     fine_trials: int = 0
     total_duration_seconds: float = 0.0
+    # Trials run until the best config's full-length run, and total candles
+    # simulated in units of one full-length run (equal to the trial count
+    # for grid search; lower for adaptive search)
+    trials_to_best: int = 0
+    full_run_equivalents: float = 0.0
+    # Adaptive search: trials per rung, in order
+    rung_trials: list[int] = field(default_factory=list)
 
     def top_n(self, n: int = 5) -> list[OptimizationTrial]:
         """Get top N trials by objective value."""
@@ -119,9 +145,9 @@ class GridOptimizationResult:
 # =============================================================================
 
 
-def _run_single_trial(config_dict: dict, candles_data: dict, cache_data: dict | None = None) -> dict:
-    """Run a single backtest trial (picklable for ProcessPoolExecutor)."""
-    config = GridBacktestConfig(
+def _config_from_dict(config_dict: dict) -> GridBacktestConfig:
+    """Inverse of _config_to_dict."""
+    return GridBacktestConfig(
         symbol=config_dict["symbol"],
         timeframe=config_dict.get("timeframe", "1h"),
         upper_price=Decimal(str(config_dict["upper_price"])),
@@ -145,11 +171,45 @@ def _run_single_trial(config_dict: dict, candles_data: dict, cache_data: dict |
         trailing_cooldown_candles=config_dict.get("trailing_cooldown_candles", 5),
     )
 
+
+def _run_single_trial(config_dict: dict, candles_data: dict, cache_data: dict | None = None) -> dict:
+    """Run a single backtest trial (picklable for ProcessPoolExecutor)."""
     candles = pd.DataFrame(candles_data)
 
     # Reconstruct indicator cache from serialized data if provided
     indicator_cache = IndicatorCache.from_dict(cache_data) if cache_data else None
 
+    return _simulate(config_dict, candles, indicator_cache)
+
+
+# Per-worker state, populated once by _init_worker and reused across trials
+_worker_candles: AttachedCandles | None = None
+_worker_cache: IndicatorCache | None = None
+
+
+def _init_worker(handle: SharedCandleHandle, cache_data: dict | None = None) -> None:
+    """Pool initializer: attach shared candles and rebuild the indicator cache once."""
+    global _worker_candles, _worker_cache
+    _worker_candles = AttachedCandles.attach(handle)
+    _worker_cache = IndicatorCache.from_dict(cache_data) if cache_data else None
+
+
+def _run_pooled_trial(config_dict: dict, n_rows: int | None = None) -> dict:
+    """Run a trial against the candles attached by _init_worker (first ``n_rows`` only)."""
+    if _worker_candles is None:
+        raise RuntimeError("Worker not initialized with shared candles")
+    frame = _worker_candles.frame
+    if n_rows is not None:
+        frame = frame.iloc[:n_rows]
+    return _simulate(config_dict, frame, _worker_cache)
+
+
+def _simulate(
+    config_dict: dict,
+    candles: pd.DataFrame,
+    indicator_cache: IndicatorCache | None,
+) -> dict:
+    config = _config_from_dict(config_dict)
     sim = GridBacktestSimulator(config, indicator_cache=indicator_cache)
     result = sim.run(candles)
 
@@ -226,7 +286,6 @@ class GridOptimizer:
         workers = max_workers or self.max_workers
 
         # Generate a run_id for checkpoint support
-        import hashlib
         run_id_src = f"{base_config.symbol}:{objective.value}:{coarse_steps}:{fine_steps}"
         run_id = hashlib.sha256(run_id_src.encode()).hexdigest()[:12]
 
@@ -254,42 +313,59 @@ class GridOptimizer:
         coarse_combos = self._generate_coarse_combos(base_config, preset, coarse_steps)
         logger.info("Phase 1: coarse search", combos=len(coarse_combos))
 
-        coarse_trials = self._run_trials(
-            coarse_combos, candles, objective, workers, trial_id_start=0,
-            run_id=run_id, completed_hashes=completed_hashes,
-        )
-        opt_result.all_trials.extend(coarse_trials)
-        opt_result.coarse_trials = len(coarse_trials)
-
-        if not coarse_trials:
+        if not coarse_combos:
             opt_result.total_duration_seconds = time.perf_counter() - start_time
-            logger.warning("No coarse trials completed")
+            logger.warning("No coarse combinations generated")
             return opt_result
 
-        best_coarse = max(coarse_trials, key=lambda t: t.objective_value)
-        logger.info(
-            "Phase 1 complete",
-            best_objective=round(best_coarse.objective_value, 4),
-            trials=len(coarse_trials),
-        )
+        with ExitStack() as stack:
+            # One pool (and one shared candle block) serves both phases; when
+            # every coarse trial is checkpointed, the fine phase opens its own
+            executor: Executor | None = None
+            pending = self._pending_configs(coarse_combos, completed_hashes)
+            if workers and workers > 1 and pending:
+                executor = stack.enter_context(
+                    self._trial_pool(candles, pending[0], workers),
+                )
+
+            coarse_trials = self._run_trials(
+                coarse_combos, candles, objective, workers, trial_id_start=0,
+                run_id=run_id, completed_hashes=completed_hashes, executor=executor,
+            )
+            opt_result.all_trials.extend(coarse_trials)
+            opt_result.coarse_trials = len(coarse_trials)
+
+            if not coarse_trials:
+                opt_result.total_duration_seconds = time.perf_counter() - start_time
+                logger.warning("No coarse trials completed")
+                return opt_result
+
+            best_coarse = max(coarse_trials, key=lambda t: t.objective_value)
+            logger.info(
+                "Phase 1 complete",
+                best_objective=round(best_coarse.objective_value, 4),
+                trials=len(coarse_trials),
+            )
 
-        # Phase 2: Fine search around best
-        fine_combos = self._generate_fine_combos(
-            base_config, best_coarse.config, preset, fine_steps,
-        )
-        if fine_combos:
-            logger.info("Phase 2: fine search", combos=len(fine_combos))
-            fine_trials = self._run_trials(
-                fine_combos, candles, objective, workers,
-                trial_id_start=len(coarse_trials),
-                run_id=run_id, completed_hashes=completed_hashes,
+            # Phase 2: Fine search around best
+            fine_combos = self._generate_fine_combos(
+                base_config, best_coarse.config, preset, fine_steps,
             )
-            opt_result.all_trials.extend(fine_trials)
-            opt_result.fine_trials = len(fine_trials)
+            if fine_combos:
+                logger.info("Phase 2: fine search", combos=len(fine_combos))
+                fine_trials = self._run_trials(
+                    fine_combos, candles, objective, workers,
+                    trial_id_start=len(coarse_trials),
+                    run_id=run_id, completed_hashes=completed_hashes, executor=executor,
+                )
+                opt_result.all_trials.extend(fine_trials)
+                opt_result.fine_trials = len(fine_trials)
 
         opt_result.best_trial = max(
             opt_result.all_trials, key=lambda t: t.objective_value,
         )
+        opt_result.trials_to_best = opt_result.best_trial.trial_id + 1
+        opt_result.full_run_equivalents = float(len(opt_result.all_trials))
         opt_result.total_duration_seconds = time.perf_counter() - start_time
 
         # Cleanup checkpoint on success
@@ -306,10 +382,149 @@ class GridOptimizer:
 
         return opt_result
 
+    def optimize_adaptive(
+        self,
+        base_config: GridBacktestConfig,
+        candles: pd.DataFrame,
+        preset: ClusterPreset,
+        objective: OptimizationObjective = OptimizationObjective.SHARPE,
+        search: "AdaptiveSearchConfig | None" = None,
+        max_workers: int | None = None,
+    ) -> GridOptimizationResult:
+        """
+        Adaptive optimization over the preset's ranges.
+
+        Levels and profit per grid are searched as continuous ranges (profit
+        on a log scale), spacing as a choice. With successive halving or
+        Hyperband, configs are first simulated on a prefix of the candles
+        and only the best are promoted to longer prefixes; "bayesian" runs
+        TPE proposals on the full history. ``all_trials`` holds the
+        full-length trials; checkpoints are kept per rung.
+        """
+        from bot.tests.backtesting.adaptive_search import (
+            AdaptiveSearchConfig,
+            ParamRange,
+            make_plan,
+            run_plan,
+        )
+
+        search = search or AdaptiveSearchConfig()
+        start_time = time.perf_counter()
+        workers = max_workers or self.max_workers
+        space = {
+            "num_levels": ParamRange(*preset.levels_range, integer=True),
+            "profit_per_grid": ParamRange(*preset.profit_per_grid_range, log=True, digits=6),
+            "spacing": list(preset.spacing_options),
+        }
+        run_id_src = f"{base_config.symbol}:{objective.value}:adaptive:{search}"
+        run_id = hashlib.sha256(run_id_src.encode()).hexdigest()[:12]
+
+        opt_result = GridOptimizationResult(symbol=base_config.symbol, objective=objective)
+        total_rows = len(candles)
+        min_rows = min(total_rows, max(2 * base_config.atr_period, 20))
+        rung_ids: set[str] = set()
+        n_run = 0
+
+        logger.info(
+            "Starting adaptive optimization",
+            symbol=base_config.symbol,
+            objective=objective.value,
+            method=search.method,
+            eta=search.eta,
+            max_workers=workers,
+        )
+
+        with ExitStack() as stack:
+            executor: Executor | None = None
+            if workers and workers > 1:
+                executor = stack.enter_context(self._trial_pool(candles, base_config, workers))
+
+            def evaluate(params_list: list[dict[str, Any]], fraction: float) -> list[float]:
+                nonlocal n_run
+                n_rows = total_rows
+                if fraction < 1.0:
+                    n_rows = min(total_rows, max(min_rows, math.ceil(fraction * total_rows)))
+                rung_id = f"{run_id}-{n_rows}"
+                rung_ids.add(rung_id)
+                completed = self.checkpoint.load_completed(rung_id) if self.checkpoint else {}
+
+                configs = [self._config_with(base_config, **p) for p in params_list]
+                trials = self._run_trials(
+                    configs, candles, objective, workers, trial_id_start=n_run,
+                    run_id=rung_id, completed_hashes=completed, executor=executor,
+                    n_rows=n_rows,
+                )
+                by_id = {t.trial_id: t for t in trials}
+                scores = [
+                    by_id[n_run + i].objective_value if n_run + i in by_id else -math.inf
+                    for i in range(len(configs))
+                ]
+                n_run += len(configs)
+                opt_result.rung_trials.append(len(trials))
+                opt_result.full_run_equivalents += len(trials) * n_rows / total_rows
+                if n_rows == total_rows:
+                    opt_result.all_trials.extend(trials)
+                logger.info(
+                    "Rung complete",
+                    configs=len(configs),
+                    candles=n_rows,
+                    best_objective=round(max(scores, default=0.0), 4),
+                )
+                return scores
+
+            run_plan(make_plan(search, space, batch_size=max(1, workers or 1)), evaluate)
+
+        if opt_result.all_trials:
+            opt_result.best_trial = max(opt_result.all_trials, key=lambda t: t.objective_value)
+            opt_result.trials_to_best = opt_result.best_trial.trial_id + 1
+        opt_result.total_duration_seconds = time.perf_counter() - start_time
+
+        if self.checkpoint:
+            for rung_id in rung_ids:
+                self.checkpoint.cleanup(rung_id)
+
+        logger.info(
+            "Adaptive optimization complete",
+            symbol=base_config.symbol,
+            total_trials=n_run,
+            full_run_equivalents=round(opt_result.full_run_equivalents, 2),
+            trials_to_best=opt_result.trials_to_best,
+            duration_s=round(opt_result.total_duration_seconds, 2),
+        )
+        return opt_result
+
     # =========================================================================
     # Combo Generation
     # =========================================================================
 
+    @staticmethod
+    def _config_with(
+        base: GridBacktestConfig,
+        num_levels: int,
+        profit_per_grid: float,
+        spacing: GridSpacing,
+    ) -> GridBacktestConfig:
+        """Copy of ``base`` with the searched parameters replaced."""
+        return GridBacktestConfig(
+            symbol=base.symbol,
+            timeframe=base.timeframe,
+            upper_price=base.upper_price,
+            lower_price=base.lower_price,
+            num_levels=num_levels,
+            spacing=spacing,
+            profit_per_grid=Decimal(str(round(profit_per_grid, 6))),
+            amount_per_grid=base.amount_per_grid,
+            direction=base.direction,
+            atr_period=base.atr_period,
+            atr_multiplier=base.atr_multiplier,
+            maker_fee=base.maker_fee,
+            taker_fee=base.taker_fee,
+            initial_balance=base.initial_balance,
+            stop_loss_pct=base.stop_loss_pct,
+            max_drawdown_pct=base.max_drawdown_pct,
+            take_profit_pct=base.take_profit_pct,
+        )
+
     def _generate_coarse_combos(
         self,
         base: GridBacktestConfig,
@@ -325,26 +540,7 @@ class GridOptimizer:
 
         combos = []
         for levels, profit, spacing in itertools.product(levels_values, profit_values, spacing_values):
-            config = GridBacktestConfig(
-                symbol=base.symbol,
-                timeframe=base.timeframe,
-                upper_price=base.upper_price,
-                lower_price=base.lower_price,
-                num_levels=levels,
-                spacing=spacing,
-                profit_per_grid=Decimal(str(round(profit, 6))),
-                amount_per_grid=base.amount_per_grid,
-                direction=base.direction,
-                atr_period=base.atr_period,
-                atr_multiplier=base.atr_multiplier,
-                maker_fee=base.maker_fee,
-                taker_fee=base.taker_fee,
-                initial_balance=base.initial_balance,
-                stop_loss_pct=base.stop_loss_pct,
-                max_drawdown_pct=base.max_drawdown_pct,
-                take_profit_pct=base.take_profit_pct,
-            )
-            combos.append(config)
+            combos.append(self._config_with(base, levels, profit, spacing))
 
         return combos
 
@@ -367,26 +563,7 @@ class GridOptimizer:
 
         combos = []
         for levels, profit in itertools.product(levels_values, profit_values):
-            config = GridBacktestConfig(
-                symbol=base.symbol,
-                timeframe=base.timeframe,
-                upper_price=base.upper_price,
-                lower_price=base.lower_price,
-                num_levels=levels,
-                spacing=best.spacing,
-                profit_per_grid=Decimal(str(round(profit, 6))),
-                amount_per_grid=base.amount_per_grid,
-                direction=base.direction,
-                atr_period=base.atr_period,
-                atr_multiplier=base.atr_multiplier,
-                maker_fee=base.maker_fee,
-                taker_fee=base.taker_fee,
-                initial_balance=base.initial_balance,
-                stop_loss_pct=base.stop_loss_pct,
-                max_drawdown_pct=base.max_drawdown_pct,
-                take_profit_pct=base.take_profit_pct,
-            )
-            combos.append(config)
+            combos.append(self._config_with(base, levels, profit, best.spacing))
 
         return combos
 
@@ -403,13 +580,22 @@ class GridOptimizer:
         trial_id_start: int = 0,
         run_id: str | None = None,
         completed_hashes: dict[str, dict] | None = None,
+        executor: Executor | None = None,
+        n_rows: int | None = None,
     ) -> list[OptimizationTrial]:
-        """Run trials, using ProcessPoolExecutor when max_workers > 1."""
+        """
+        Run trials, using ProcessPoolExecutor when max_workers > 1.
+
+        ``n_rows`` limits every trial to the first rows of ``candles``.
+        """
         if max_workers and max_workers > 1 and len(configs) > 1:
             return self._run_trials_parallel(
                 configs, candles, objective, max_workers, trial_id_start,
-                run_id=run_id, completed_hashes=completed_hashes,
+                run_id=run_id, completed_hashes=completed_hashes, executor=executor,
+                n_rows=n_rows,
             )
+        if n_rows is not None:
+            candles = candles.iloc[:n_rows]
         return self._run_trials_sequential(
             configs, candles, objective, trial_id_start,
             run_id=run_id, completed_hashes=completed_hashes,
@@ -474,10 +660,16 @@ class GridOptimizer:
         trial_id_start: int = 0,
         run_id: str | None = None,
         completed_hashes: dict[str, dict] | None = None,
+        executor: Executor | None = None,
+        n_rows: int | None = None,
     ) -> list[OptimizationTrial]:
-        """Run trials in parallel using ProcessPoolExecutor (Issue #5)."""
+        """
+        Run trials in parallel using ProcessPoolExecutor (Issue #5).
+
+        ``executor`` must come from _trial_pool; when omitted a pool is
+        opened for just these trials.
+        """
         completed_hashes = completed_hashes or {}
-        candles_data = candles.to_dict(orient="list")
         config_dicts = [_config_to_dict(c) for c in configs]
 
         # Separate already-completed from new trials
@@ -499,16 +691,6 @@ class GridOptimizer:
                     continue
             new_indices.append(i)
 
-        # Pre-warm indicator cache and serialize for workers
-        cache_data = None
-        if self.indicator_cache and new_indices:
-            # Run a single bounds calculation to populate cache entries
-            first_config = configs[new_indices[0]]
-            warm_sim = GridBacktestSimulator(first_config, indicator_cache=self.indicator_cache)
-            warm_sim._calculate_bounds(candles)
-            cache_data = self.indicator_cache.to_dict()
-            logger.debug("Indicator cache pre-warmed for parallel workers", cache_size=len(cache_data))
-
         logger.info(
             "Running parallel trials",
             total=len(configs),
@@ -520,9 +702,13 @@ class GridOptimizer:
         results_map: dict[int, dict] = {}
 
         if new_indices:
-            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            with ExitStack() as stack:
+                if executor is None:
+                    executor = stack.enter_context(
+                        self._trial_pool(candles, configs[new_indices[0]], max_workers),
+                    )
                 future_to_idx = {
-                    executor.submit(_run_single_trial, config_dicts[idx], candles_data, cache_data): idx
+                    executor.submit(_run_pooled_trial, config_dicts[idx], n_rows): idx
                     for idx in new_indices
                 }
 
@@ -563,6 +749,47 @@ class GridOptimizer:
         logger.info("Parallel trials complete", successful=len(all_trials))
         return all_trials
 
+    @staticmethod
+    def _pending_configs(
+        configs: list[GridBacktestConfig],
+        completed_hashes: dict[str, dict],
+    ) -> list[GridBacktestConfig]:
+        """Configs whose trials are not already in the checkpoint."""
+        return [
+            c for c in configs
+            if OptimizationCheckpoint.config_hash(_config_to_dict(c)) not in completed_hashes
+        ]
+
+    @contextmanager
+    def _trial_pool(
+        self,
+        candles: pd.DataFrame,
+        warm_config: GridBacktestConfig,
+        max_workers: int,
+    ) -> Iterator[Executor]:
+        """
+        Publish candles to shared memory and start a pool attached to them.
+
+        Workers attach the candle block and rebuild the indicator cache once
+        in their initializer, so each submitted trial only carries its config.
+        """
+        # Pre-warm indicator cache and serialize for workers
+        cache_data = None
+        if self.indicator_cache:
+            # Run a single bounds calculation to populate cache entries
+            warm_sim = GridBacktestSimulator(warm_config, indicator_cache=self.indicator_cache)
+            warm_sim._calculate_bounds(candles)
+            cache_data = self.indicator_cache.to_dict()
+            logger.debug("Indicator cache pre-warmed for parallel workers", cache_size=len(cache_data))
+
+        with SharedCandleStore.publish(candles) as store:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(store.handle, cache_data),
+            ) as executor:
+                yield executor
+
     # =========================================================================
     # Helpers
     # =========================================================================
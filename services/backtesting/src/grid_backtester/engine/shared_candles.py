@@ -0,0 +1,188 @@
+"""
+Shared-memory candle handoff for process-pool optimization (Issue #5).
+
+The parent publishes a candle DataFrame once into a single
+``multiprocessing.shared_memory`` block laid out column-major (one float64
+row per numeric column). Workers attach by name and wrap the block in a
+DataFrame without copying, so trials no longer pickle candles or rebuild
+a DataFrame from a dict.
+
+Datetime columns are stored as int64 ticks in their own unit (ns, or us
+under pandas 3), so workers see the same dtype the parent published. Other non-numeric
+columns (e.g. string timestamps) cannot live in shared memory and travel
+inside the picklable handle, which is sent once per worker rather than
+once per trial.
+
+Usage:
+    with SharedCandleStore.publish(candles) as store:
+        handle = store.handle          # picklable, pass to pool initializer
+        ...
+    # in a worker:
+    attached = AttachedCandles.attach(handle)
+    df = attached.frame
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from grid_backtester.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class SharedCandleHandle:
+    """Picklable description of a published candle block."""
+
+    shm_name: str
+    n_rows: int
+    float_columns: tuple[str, ...]
+    datetime_columns: tuple[str, ...] = ()
+    datetime_units: tuple[str, ...] = ()
+    column_order: tuple[str, ...] = ()
+    object_columns: dict[str, list[Any]] = field(default_factory=dict)
+
+    @property
+    def nbytes(self) -> int:
+        return 8 * self.n_rows * (len(self.float_columns) + len(self.datetime_columns))
+
+
+class SharedCandleStore:
+    """Owner side of a shared candle block; unlinks the block on close."""
+
+    def __init__(
+        self, shm: shared_memory.SharedMemory, handle: SharedCandleHandle
+    ) -> None:
+        self._shm: shared_memory.SharedMemory | None = shm
+        self.handle = handle
+
+    @classmethod
+    def publish(cls, candles: pd.DataFrame) -> SharedCandleStore:
+        """Copy ``candles`` into a new shared memory block."""
+        float_cols: list[str] = []
+        dt_cols: list[str] = []
+        dt_units: list[str] = []
+        object_cols: dict[str, list[Any]] = {}
+        for col in candles.columns:
+            dtype = candles[col].dtype
+            if pd.api.types.is_datetime64_any_dtype(dtype):
+                dt_cols.append(str(col))
+                dt_units.append(getattr(candles[col].dt, "unit", "ns"))
+            elif pd.api.types.is_numeric_dtype(
+                dtype
+            ) and not pd.api.types.is_bool_dtype(dtype):
+                float_cols.append(str(col))
+            else:
+                object_cols[str(col)] = candles[col].tolist()
+
+        n_rows = len(candles)
+        n_cols = len(float_cols) + len(dt_cols)
+        shm = shared_memory.SharedMemory(create=True, size=max(8, 8 * n_rows * n_cols))
+
+        floats = np.ndarray((len(float_cols), n_rows), dtype=np.float64, buffer=shm.buf)
+        for i, col in enumerate(float_cols):
+            floats[i] = candles[col].to_numpy(dtype=np.float64)
+        offset = floats.nbytes
+        stamps = np.ndarray(
+            (len(dt_cols), n_rows), dtype=np.int64, buffer=shm.buf, offset=offset
+        )
+        for i, (col, unit) in enumerate(zip(dt_cols, dt_units, strict=True)):
+            stamps[i] = (
+                candles[col].to_numpy(dtype=f"datetime64[{unit}]").view(np.int64)
+            )
+
+        handle = SharedCandleHandle(
+            shm_name=shm.name,
+            n_rows=n_rows,
+            float_columns=tuple(float_cols),
+            datetime_columns=tuple(dt_cols),
+            datetime_units=tuple(dt_units),
+            column_order=tuple(str(c) for c in candles.columns),
+            object_columns=object_cols,
+        )
+        logger.debug(
+            "Candles published to shared memory", name=shm.name, bytes=handle.nbytes
+        )
+        return cls(shm, handle)
+
+    def close(self) -> None:
+        """Release and unlink the block (idempotent)."""
+        if self._shm is None:
+            return
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+        self._shm = None
+
+    def __enter__(self) -> SharedCandleStore:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class AttachedCandles:
+    """Worker side: a read-only DataFrame view over a published block."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, frame: pd.DataFrame) -> None:
+        self._shm = shm
+        self.frame = frame
+
+    @classmethod
+    def attach(cls, handle: SharedCandleHandle) -> AttachedCandles:
+        shm = _attach_untracked(handle.shm_name)
+        n = handle.n_rows
+        floats = np.ndarray(
+            (len(handle.float_columns), n), dtype=np.float64, buffer=shm.buf
+        )
+        floats.flags.writeable = False
+
+        # (k, n) C-order transposed is pandas' native block layout: no copy
+        frame = pd.DataFrame(floats.T, columns=list(handle.float_columns), copy=False)
+
+        extra: dict[str, Any] = dict(handle.object_columns)
+        if handle.datetime_columns:
+            stamps = np.ndarray(
+                (len(handle.datetime_columns), n),
+                dtype=np.int64,
+                buffer=shm.buf,
+                offset=floats.nbytes,
+            )
+            units = handle.datetime_units or ("ns",) * len(handle.datetime_columns)
+            for i, (col, unit) in enumerate(
+                zip(handle.datetime_columns, units, strict=True)
+            ):
+                extra[col] = stamps[i].view(f"datetime64[{unit}]")
+
+        # insert() keeps the float block intact; selecting columns would copy it
+        order = handle.column_order or tuple(handle.float_columns) + tuple(extra)
+        for loc, col in enumerate(order):
+            if col in extra:
+                frame.insert(loc, col, extra[col])
+        return cls(shm, frame)
+
+    def close(self) -> None:
+        self.frame = pd.DataFrame()
+        self._shm.close()
+
+
+def _attach_untracked(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to an existing block without taking ownership of it.
+
+    Only the publishing process unlinks the block. Before Python 3.13 attaching
+    always registers with the resource tracker; pool workers share the
+    parent's tracker, so that registration is a no-op duplicate.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
@@ -307,3 +307,129 @@ class TestGridOptimizer:
         assert restored.total_return_pct == pytest.approx(original.total_return_pct, abs=0.001)
         assert restored.sharpe_ratio == pytest.approx(original.sharpe_ratio, abs=0.001)
         assert restored.total_trades == original.total_trades
+
+
+class TestAdaptiveOptimization:
+
+    @staticmethod
+    def _setup(n=120):
+        preset = ClusterPreset(
+            cluster=CoinCluster.MID_CAPS,
+            spacing_options=[GridSpacing.ARITHMETIC, GridSpacing.GEOMETRIC],
+            levels_range=(6, 16),
+            profit_per_grid_range=(0.003, 0.015),
+        )
+        config = GridBacktestConfig(
+            symbol="BTCUSDT",
+            initial_balance=Decimal("10000"),
+            stop_loss_pct=Decimal("0.50"),
+            max_drawdown_pct=Decimal("0.50"),
+        )
+        return preset, config, make_ranging_candles(n=n)
+
+    def test_successive_halving_promotes_to_full_length(self):
+        from bot.tests.backtesting.adaptive_search import AdaptiveSearchConfig
+
+        preset, config, candles = self._setup()
+        search = AdaptiveSearchConfig(n_configs=27, eta=3, min_fraction=1 / 9, seed=7)
+        result = GridOptimizer().optimize_adaptive(
+            base_config=config, candles=candles, preset=preset,
+            objective=OptimizationObjective.ROI, search=search,
+        )
+
+        assert result.rung_trials == [27, 9, 3]
+        assert len(result.all_trials) == 3
+        assert result.best_trial in result.all_trials
+        assert 6 <= result.best_trial.config.num_levels <= 16
+        assert result.trials_to_best > 27 + 9
+        # Early rungs replay short prefixes, so the budget is far below 39 full runs
+        assert result.full_run_equivalents < 27
+
+    def test_parallel_uses_candle_prefixes(self):
+        from bot.tests.backtesting.adaptive_search import AdaptiveSearchConfig
+
+        preset, config, candles = self._setup()
+        search = AdaptiveSearchConfig(n_configs=9, seed=3)
+        seq = GridOptimizer(max_workers=1).optimize_adaptive(
+            base_config=config, candles=candles, preset=preset, search=search,
+        )
+        par = GridOptimizer(max_workers=2).optimize_adaptive(
+            base_config=config, candles=candles, preset=preset, search=search,
+        )
+
+        assert par.rung_trials == seq.rung_trials
+        assert par.best_trial.config.num_levels == seq.best_trial.config.num_levels
+        assert abs(par.best_trial.objective_value - seq.best_trial.objective_value) < 1e-9
+
+    def test_resumes_every_rung_from_checkpoint(self, tmp_path, monkeypatch):
+        import grid_backtester.engine.optimizer as optimizer_module
+
+        from bot.tests.backtesting.adaptive_search import AdaptiveSearchConfig
+
+        preset, config, candles = self._setup()
+        search = AdaptiveSearchConfig(n_configs=9, seed=5)
+        checkpoint = OptimizationCheckpoint(checkpoint_dir=str(tmp_path))
+        # Simulate an interrupted run: keep the checkpoint files
+        monkeypatch.setattr(checkpoint, "cleanup", lambda run_id: None)
+        first = GridOptimizer(checkpoint=checkpoint).optimize_adaptive(
+            base_config=config, candles=candles, preset=preset, search=search,
+        )
+
+        class _NoSimulation:
+            def __init__(self, *args, **kwargs):
+                raise AssertionError("trial should come from the checkpoint")
+
+        monkeypatch.setattr(optimizer_module, "GridBacktestSimulator", _NoSimulation)
+        resumed = GridOptimizer(checkpoint=checkpoint).optimize_adaptive(
+            base_config=config, candles=candles, preset=preset, search=search,
+        )
+
+        assert resumed.rung_trials == first.rung_trials
+        # Checkpoints store objectives rounded to 4 decimals
+        assert resumed.best_trial.objective_value == pytest.approx(
+            first.best_trial.objective_value, abs=1e-4,
+        )
+
+    def test_no_coarse_combos_returns_empty_result(self):
+        preset = ClusterPreset(cluster=CoinCluster.MID_CAPS, spacing_options=[])
+        config = GridBacktestConfig(symbol="BTCUSDT")
+
+        result = GridOptimizer(max_workers=2).optimize(
+            base_config=config, candles=make_ranging_candles(n=50), preset=preset,
+        )
+
+        assert result.best_trial is None
+        assert result.all_trials == []
+
+    def test_fully_checkpointed_run_starts_no_pool(self, tmp_path, monkeypatch):
+        checkpoint = OptimizationCheckpoint(checkpoint_dir=str(tmp_path))
+        preset = ClusterPreset(
+            cluster=CoinCluster.MID_CAPS,
+            spacing_options=[GridSpacing.ARITHMETIC],
+            levels_range=(8, 10),
+            profit_per_grid_range=(0.005, 0.008),
+        )
+        config = GridBacktestConfig(
+            symbol="BTCUSDT",
+            initial_balance=Decimal("10000"),
+            stop_loss_pct=Decimal("0.50"),
+            max_drawdown_pct=Decimal("0.50"),
+        )
+        candles = make_ranging_candles(n=50)
+        # Simulate an interrupted run: keep the checkpoint files
+        monkeypatch.setattr(checkpoint, "cleanup", lambda run_id: None)
+        first = GridOptimizer(checkpoint=checkpoint).optimize(
+            base_config=config, candles=candles, preset=preset, coarse_steps=2, fine_steps=2,
+        )
+
+        resumed_optimizer = GridOptimizer(max_workers=2, checkpoint=checkpoint)
+
+        def _no_pool(*args, **kwargs):
+            raise AssertionError("every trial should come from the checkpoint")
+
+        monkeypatch.setattr(resumed_optimizer, "_trial_pool", _no_pool)
+        resumed = resumed_optimizer.optimize(
+            base_config=config, candles=candles, preset=preset, coarse_steps=2, fine_steps=2,
+        )
+
+        assert len(resumed.all_trials) == len(first.all_trials)
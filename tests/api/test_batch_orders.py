@@ -0,0 +1,184 @@
+"""Tests for batch order placement/cancellation and the bounded fallback."""
+
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from bot.api.batch_orders import OrderRequest, cancel_orders, create_orders
+from bot.api.bybit_direct_client import ByBitDirectClient
+from bot.api.exceptions import InvalidOrderError, OrderError
+from bot.core.grid_engine import GridEngine
+from bot.orchestrator.bot_orchestrator import BotOrchestrator, BotState
+from bot.orchestrator.events import EventType
+
+
+def _requests(n: int, symbol: str = "BTC/USDT") -> list[OrderRequest]:
+    return [
+        OrderRequest(symbol, "buy" if i % 2 else "sell", Decimal("0.001"), Decimal(60000 + i))
+        for i in range(n)
+    ]
+
+
+class SlowExchange:
+    """Per-order exchange stub that tracks peak concurrency."""
+
+    def __init__(self, fail_ids: set[int] | None = None) -> None:
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = 0
+        self.fail_ids = fail_ids or set()
+
+    async def create_order(self, symbol, order_type, side, amount, price=None, params=None):
+        self.calls += 1
+        index = self.calls
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        if index in self.fail_ids:
+            raise RuntimeError("rejected")
+        return {"id": f"o-{price}", "price": price}
+
+    async def cancel_order(self, order_id, symbol):
+        if order_id == "gone":
+            raise OrderError("Order not found")
+        return {"id": order_id, "status": "canceled"}
+
+
+class TestFallback:
+    async def test_bounded_concurrency_keeps_order(self):
+        exchange = SlowExchange(fail_ids={3})
+        results = await create_orders(exchange, _requests(12), concurrency=4)
+
+        assert exchange.peak <= 4
+        assert [r.order["price"] for r in results if r.ok] == [
+            float(60000 + i) for i in range(12) if i != 2
+        ]
+        assert not results[2].ok
+        assert str(results[2].error) == "rejected"
+
+    async def test_cancel_maps_errors_per_order(self):
+        results = await cancel_orders(SlowExchange(), ["a", "gone", "b"], "BTC/USDT")
+        assert [r.ok for r in results] == [True, False, True]
+        assert isinstance(results[1].error, OrderError)
+
+    async def test_mock_exchanges_use_fallback(self):
+        exchange = AsyncMock()
+        exchange.create_order = AsyncMock(return_value={"id": "x"})
+        await create_orders(exchange, _requests(3))
+        assert exchange.create_order.await_count == 3
+        exchange.create_orders.assert_not_called()
+
+
+class TestByBitBatch:
+    def _client(self) -> ByBitDirectClient:
+        return ByBitDirectClient(api_key="k", api_secret="s", testnet=True)
+
+    async def test_create_chunks_and_maps_item_errors(self):
+        client = self._client()
+        sent = []
+
+        async def request(method, endpoint, params=None, authenticated=True, full_response=False):
+            batch = params["request"]
+            sent.append((endpoint, len(batch)))
+            codes = [110007 if e["price"].startswith("60001") else 0 for e in batch]
+            return {
+                "result": {"list": [{"orderId": f"id-{e['price']}"} for e in batch]},
+                "retExtInfo": {"list": [{"code": c, "msg": "bad price"} for c in codes]},
+            }
+
+        with patch.object(client, "_request", side_effect=request):
+            results = await client.create_orders(_requests(25))
+
+        # Linear batches hold up to 20 orders
+        assert sent == [("/v5/order/create-batch", 20), ("/v5/order/create-batch", 5)]
+        assert len(results) == 25
+        assert isinstance(results[1].error, InvalidOrderError)
+        assert results[0].order["id"] == "id-60000.000"
+        assert results[24].order["side"] == "sell"
+        assert sum(r.ok for r in results) == 24
+
+    async def test_whole_chunk_failure_marks_every_order(self):
+        client = self._client()
+        with patch.object(
+            client, "_request", AsyncMock(side_effect=InvalidOrderError("bad request"))
+        ):
+            results = await client.create_orders(_requests(3))
+        assert all(isinstance(r.error, InvalidOrderError) for r in results)
+
+    async def test_limit_order_without_price_fails_alone(self):
+        client = self._client()
+        requests = _requests(3)
+        requests[1].price = None
+        request = AsyncMock(
+            return_value={
+                "result": {"list": [{"orderId": "first"}, {"orderId": "third"}]},
+                "retExtInfo": {"list": [{"code": 0}, {"code": 0}]},
+            }
+        )
+        with patch.object(client, "_request", request):
+            results = await client.create_orders(requests)
+
+        assert len(request.await_args.args[2]["request"]) == 2
+        assert [r.order["id"] for r in (results[0], results[2])] == ["first", "third"]
+        assert isinstance(results[1].error, OrderError)
+
+    async def test_cancel_batch(self):
+        client = self._client()
+        request = AsyncMock(
+            return_value={
+                "result": {"list": []},
+                "retExtInfo": {"list": [{"code": 0}, {"code": 110001, "msg": "not exists"}]},
+            }
+        )
+        with patch.object(client, "_request", request):
+            results = await cancel_orders(client, ["a", "b"], "BTC/USDT")
+
+        payload = request.await_args.args[2]
+        assert payload["request"] == [
+            {"symbol": "BTCUSDT", "orderId": "a"},
+            {"symbol": "BTCUSDT", "orderId": "b"},
+        ]
+        assert results[0].ok and not results[1].ok
+
+    async def test_exhausted_rate_limit_pauses_order_bucket(self):
+        client = self._client()
+        client._limiter.update_from_headers(
+            "/v5/order/create-batch",
+            {"X-Bapi-Limit-Status": "0", "X-Bapi-Limit-Reset-Timestamp": "9999999999999"},
+        )
+        assert not client._limiter.buckets["order"].try_acquire()
+        assert client._limiter.buckets["market"].try_acquire()
+
+
+def _orchestrator(*, dry_run: bool = False) -> BotOrchestrator:
+    orch = object.__new__(BotOrchestrator)
+    orch.config = SimpleNamespace(name="batch-bot", symbol="BTC/USDT", dry_run=dry_run)
+    orch.state = BotState.RUNNING
+    orch.current_price = Decimal("50000")
+    orch.grid_engine = GridEngine(
+        symbol="BTC/USDT",
+        upper_price=Decimal("55000"),
+        lower_price=Decimal("45000"),
+        grid_levels=5,
+        amount_per_grid=Decimal("100"),
+        profit_per_grid=Decimal("0.01"),
+    )
+    orch.exchange = SlowExchange()
+    orch._publish_event = AsyncMock()
+    return orch
+
+
+class TestOrchestratorBatch:
+    async def test_place_grid_orders_registers_and_reports_failures(self):
+        orch = _orchestrator()
+        orch.exchange.fail_ids = {1}
+        orders = orch.grid_engine.initialize_grid(orch.current_price)
+
+        await orch._place_grid_orders(orders)
+
+        assert len(orch.grid_engine.active_orders) == len(orders) - 1
+        events = [c.args[0] for c in orch._publish_event.await_args_list]
+        assert events.count(EventType.ORDER_FAILED) == 1
+        assert events.count(EventType.ORDER_PLACED) == len(orders) - 1
@@ -8,6 +8,8 @@ from decimal import Decimal
 from unittest.mock import AsyncMock, patch
 
 import pytest
+import pytest_asyncio
+from aiohttp import web
 
 from bot.api.bybit_direct_client import ByBitDirectClient
 from bot.api.exceptions import (
@@ -16,8 +18,10 @@ from bot.api.exceptions import (
     ExchangeNotAvailableError,
     InsufficientFundsError,
     InvalidOrderError,
+    NetworkError,
     RateLimitError,
 )
+from bot.api.http_transport import TransportConfig
 
 
 class TestByBitDirectClientInit:
@@ -152,6 +156,75 @@ class TestSessionLifecycle:
         assert client._session is None
 
 
+@pytest_asyncio.fixture
+async def mock_bybit():
+    """Local HTTP server echoing what the client sent; yields (base_url, received)."""
+    received: list[dict] = []
+
+    async def order(request: web.Request) -> web.Response:
+        received.append({"headers": dict(request.headers), "body": await request.text()})
+        return web.json_response({"retCode": 0, "retMsg": "OK", "result": {"orderId": "1"}})
+
+    async def maintenance(request: web.Request) -> web.Response:
+        return web.Response(status=503, text="<html>maintenance</html>")
+
+    app = web.Application()
+    app.router.add_post("/v5/order/create", order)
+    app.router.add_get("/v5/market/time", maintenance)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", received
+    await runner.cleanup()
+
+
+class TestTransport:
+    async def test_post_body_matches_signature(self, mock_bybit):
+        base_url, received = mock_bybit
+        client = ByBitDirectClient(
+            api_key="k", api_secret="s", transport=TransportConfig(json_codec="stdlib")
+        )
+        client.base_url = base_url
+        client._session = client.transport.create_session()
+        try:
+            result = await client._request("POST", "/v5/order/create", {"symbol": "BTCUSDT"})
+        finally:
+            await client.close()
+
+        assert result == {"orderId": "1"}
+        sent = received[0]
+        assert sent["body"] == '{"symbol":"BTCUSDT"}'
+        assert sent["headers"]["Content-Type"] == "application/json"
+        timestamp = int(sent["headers"]["X-BAPI-TIMESTAMP"])
+        assert sent["headers"]["X-BAPI-SIGN"] == client._create_signature(timestamp, sent["body"])
+
+        latency = client.get_statistics()["transport"]["latency"]
+        assert latency["total"]["count"] == 1
+        assert latency["connect"]["count"] == 1
+
+    async def test_non_json_reply_is_network_error(self, mock_bybit):
+        base_url, _ = mock_bybit
+        client = ByBitDirectClient(api_key="k", api_secret="s")
+        client.base_url = base_url
+        client._session = client.transport.create_session()
+        try:
+            with pytest.raises(NetworkError, match="HTTP 503"):
+                await client._request("GET", "/v5/market/time", authenticated=False)
+        finally:
+            await client.close()
+        assert client._error_count == 1
+
+    def test_non_object_json_is_network_error(self):
+        client = ByBitDirectClient(api_key="k", api_secret="s")
+        assert client._decode(b'{"retCode": 0}', "/v5/market/time", 200) == {"retCode": 0}
+        for body in (b"[]", b"null", b'"maintenance"'):
+            with pytest.raises(NetworkError, match="HTTP 200"):
+                client._decode(body, "/v5/market/time", 200)
+        assert client._error_count == 3
+
+
 class TestRequestNotInitialized:
     async def test_request_without_init(self):
         client = ByBitDirectClient(api_key="k", api_secret="s")
@@ -15,6 +15,7 @@ from bot.api.exceptions import (
     InsufficientFundsError,
     InvalidOrderError,
     NetworkError,
+    NotSupportedError,
     OrderError,
     RateLimitError,
 )
@@ -109,6 +110,19 @@ class TestInitialization:
             mock_exchange.set_sandbox_mode.assert_called_with(True)
             mock_exchange.load_markets.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_shared_limiter_disables_ccxt_throttle(self, mock_exchange):
+        with patch("bot.api.exchange_client.ccxtpro") as mock_ccxt:
+            mock_cls = MagicMock(return_value=mock_exchange)
+            mock_ccxt.bybit = mock_cls
+
+            client = ExchangeAPIClient(exchange_id="bybit", api_key="key", api_secret="secret")
+            await client.initialize()
+
+            assert client.rate_limiter is not None
+            for call in mock_cls.call_args_list:
+                assert call.args[0]["enableRateLimit"] is False
+
     @pytest.mark.asyncio
     async def test_initialize_failure(self):
         with patch("bot.api.exchange_client.ccxtpro") as mock_ccxt:
@@ -156,26 +170,61 @@ class TestHealthCheck:
 
 
 class TestRateLimiting:
-    def test_adaptive_rate_limit_increase(self, client):
-        initial = client._adaptive_interval
+    def test_rate_limit_hit_counted(self, client):
         client._on_rate_limit_hit()
-        assert client._adaptive_interval > initial
         assert client._rate_limit_hits == 1
 
-    def test_adaptive_rate_limit_decrease(self, client):
-        client._adaptive_interval = 0.5
-        client._on_request_success()
-        assert client._adaptive_interval < 0.5
+    def test_disabled_rate_limit_has_no_limiter(self, client):
+        assert client.rate_limiter is None
+        assert client.get_statistics()["rate_limiter"] is None
+
+    def test_clients_on_same_key_share_limiter(self):
+        first = ExchangeAPIClient(exchange_id="bybit", api_key="shared", api_secret="s")
+        second = ExchangeAPIClient(exchange_id="bybit", api_key="shared", api_secret="s")
+        other = ExchangeAPIClient(exchange_id="bybit", api_key="other", api_secret="s")
+        assert first.rate_limiter is second.rate_limiter
+        assert first.rate_limiter is not other.rate_limiter
+
+    @pytest.mark.asyncio
+    async def test_requests_draw_from_route_bucket(self, mock_exchange):
+        client = ExchangeAPIClient(exchange_id="bybit", api_key="k", api_secret="s")
+        client._exchange = mock_exchange
+        mock_exchange.fetch_ticker = AsyncMock(return_value={"last": 1.0})
 
-    def test_adaptive_rate_limit_floor(self, client):
-        client._adaptive_interval = client._min_request_interval
-        client._on_request_success()
-        assert client._adaptive_interval == client._min_request_interval
+        await client.fetch_ticker("BTC/USDT")
+
+        stats = client.get_statistics()["rate_limiter"]
+        assert stats["market"]["requests"] == 1
+        assert stats["global"]["requests"] == 1
+        assert stats["order"]["requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_response_headers_tighten_bucket(self, mock_exchange):
+        client = ExchangeAPIClient(exchange_id="bybit", api_key="k", api_secret="s")
+        client._exchange = mock_exchange
+        mock_exchange.last_response_headers = {"X-RateLimit-Remaining": "2"}
 
-    def test_adaptive_rate_limit_ceiling(self, client):
-        for _ in range(50):
-            client._on_rate_limit_hit()
-        assert client._adaptive_interval <= 2.0
+        await client._tracked_request("fetch_ticker", mock_exchange.fetch_ticker("BTC/USDT"))
+
+        assert client.rate_limiter.buckets["market"].tokens <= 2.1
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_error_pauses_bucket(self, mock_exchange):
+        import ccxt.pro as ccxtpro
+
+        client = ExchangeAPIClient(exchange_id="bybit", api_key="k", api_secret="s")
+        client._exchange = mock_exchange
+        mock_exchange.create_order = AsyncMock(side_effect=ccxtpro.RateLimitExceeded("slow down"))
+
+        with pytest.raises(RateLimitError):
+            await client._tracked_request(
+                "create_order", mock_exchange.create_order("BTC/USDT", "limit", "buy", 1, 1)
+            )
+
+        order_bucket = client.rate_limiter.buckets["order"]
+        assert order_bucket.stats.rate_limit_hits == 1
+        assert not order_bucket.try_acquire()
+        assert client._rate_limit_hits == 1
 
 
 # =========================================================================
@@ -234,6 +283,13 @@ class TestExceptionMapping:
         result = client._map_ccxt_exception(e)
         assert isinstance(result, ExchangeNotAvailableError)
 
+    def test_not_supported(self, client):
+        import ccxt.pro as ccxtpro
+
+        e = ccxtpro.NotSupported("fetchTickers() is not supported yet")
+        result = client._map_ccxt_exception(e)
+        assert isinstance(result, NotSupportedError)
+
     def test_generic_error(self, client):
         e = Exception("something else")
         result = client._map_ccxt_exception(e)
@@ -0,0 +1,91 @@
+"""Tests for ExchangeStream — watch loop with gap detection and resume."""
+
+import asyncio
+
+from bot.api.exchange_stream import ExchangeStream
+
+
+class ScriptedWatch:
+    """Returns queued items; raises queued exceptions; blocks when empty."""
+
+    def __init__(self, *items) -> None:
+        self.queue: asyncio.Queue = asyncio.Queue()
+        for item in items:
+            self.queue.put_nowait(item)
+
+    async def __call__(self):
+        item = await self.queue.get()
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
+async def _wait_for(predicate, timeout: float = 1.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not reached"
+        await asyncio.sleep(0.001)
+
+
+class TestExchangeStream:
+    async def test_pushes_updates(self):
+        received = []
+
+        async def on_update(data):
+            received.append(data)
+
+        stream = ExchangeStream("t", ScriptedWatch(1, 2, 3), on_update)
+        await stream.start()
+        await _wait_for(lambda: len(received) == 3)
+        assert stream.connected
+        await stream.stop()
+
+        assert received == [1, 2, 3]
+        assert not stream.connected and not stream.running
+
+    async def test_error_is_gap_and_resume_reconciles(self):
+        events = []
+
+        async def on_update(data):
+            events.append(("update", data))
+
+        async def on_resume():
+            events.append(("resume", None))
+
+        watch = ScriptedWatch("a", ConnectionError("dropped"), ConnectionError("again"), "b")
+        stream = ExchangeStream("t", watch, on_update, on_resume=on_resume, retry_delay=0.001)
+        await stream.start()
+        await _wait_for(lambda: len(events) == 3)
+        await stream.stop()
+
+        assert events == [("update", "a"), ("resume", None), ("update", "b")]
+        assert stream.gaps == 1
+        assert stream.last_error == "again"
+
+    async def test_silence_past_stale_after_is_gap(self):
+        async def on_update(data):
+            pass
+
+        watch = ScriptedWatch("a")
+        stream = ExchangeStream("t", watch, on_update, stale_after=0.02, retry_delay=0.001)
+        await stream.start()
+        await _wait_for(lambda: stream.updates == 1)
+        await _wait_for(lambda: not stream.connected)
+        assert stream.get_status()["last_error"] == "stale"
+
+        watch.queue.put_nowait("b")
+        await _wait_for(lambda: stream.connected)
+        await stream.stop()
+
+    async def test_handler_errors_do_not_stop_stream(self):
+        seen = []
+
+        async def on_update(data):
+            seen.append(data)
+            raise ValueError("bad handler")
+
+        stream = ExchangeStream("t", ScriptedWatch(1, 2), on_update)
+        await stream.start()
+        await _wait_for(lambda: len(seen) == 2)
+        assert stream.connected and stream.gaps == 0
+        await stream.stop()
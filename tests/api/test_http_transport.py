@@ -0,0 +1,108 @@
+"""Tests for the pooled HTTP transport — codecs, latency histograms, session tracing."""
+
+import json
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from bot.api.http_transport import (
+    HttpTransport,
+    LatencyHistogram,
+    RequestTiming,
+    TransportConfig,
+    resolve_codec,
+)
+
+
+@pytest_asyncio.fixture
+async def server_url():
+    async def handle(request: web.Request) -> web.Response:
+        return web.json_response({"retCode": 0, "result": {}})
+
+    app = web.Application()
+    app.router.add_get("/ping", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+class TestLatencyHistogram:
+    def test_empty(self):
+        hist = LatencyHistogram()
+        assert hist.percentile(0.99) == 0.0
+        assert hist.to_dict()["count"] == 0
+
+    def test_percentiles_fall_in_observed_buckets(self):
+        hist = LatencyHistogram(buckets_ms=(10, 20, 50, 100))
+        for _ in range(90):
+            hist.observe(0.015)
+        for _ in range(10):
+            hist.observe(0.080)
+
+        assert 0.010 <= hist.percentile(0.50) <= 0.020
+        assert 0.050 <= hist.percentile(0.99) <= 0.080
+        assert hist.max_seconds == 0.080
+        assert hist.avg_seconds == pytest.approx(0.0215)
+
+    def test_overflow_bucket_capped_at_max(self):
+        hist = LatencyHistogram(buckets_ms=(1,))
+        hist.observe(3.0)
+        assert hist.percentile(0.99) <= 3.0
+        assert hist.to_dict()["max"] == 3.0
+
+
+class TestCodec:
+    def test_stdlib_round_trip_is_compact(self):
+        codec = resolve_codec("stdlib")
+        body = codec.dumps({"symbol": "BTCUSDT", "qty": "0.1"})
+        assert body == '{"symbol":"BTCUSDT","qty":"0.1"}'
+        assert codec.loads(body.encode()) == {"symbol": "BTCUSDT", "qty": "0.1"}
+
+    def test_auto_resolves_to_a_working_codec(self):
+        codec = resolve_codec("auto")
+        assert codec.name in ("orjson", "ujson", "stdlib")
+        assert json.loads(codec.dumps({"a": [1, 2]})) == {"a": [1, 2]}
+        assert codec.loads(b'{"a": 1}') == {"a": 1}
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError, match="Unknown JSON codec"):
+            resolve_codec("simdjson")
+
+
+class TestSessionTracing:
+    async def test_phases_recorded_and_connection_reused(self, server_url):
+        transport = HttpTransport(TransportConfig(json_codec="stdlib"))
+        session = transport.create_session()
+        try:
+            for _ in range(3):
+                timing = RequestTiming()
+                async with session.get(f"{server_url}/ping", trace_request_ctx=timing) as resp:
+                    await resp.read()
+                transport.record(timing)
+                assert timing.connect <= timing.ttfb
+        finally:
+            await session.close()
+
+        stats = transport.get_stats()
+        assert stats["json_codec"] == "stdlib"
+        assert stats["connections_created"] == 1
+        assert stats["connections_reused"] == 2
+        for phase in ("connect", "ttfb", "total"):
+            assert stats["latency"][phase]["count"] == 3
+        assert stats["latency"]["total"]["max"] >= stats["latency"]["ttfb"]["max"]
+
+    async def test_session_uses_configured_pool(self):
+        transport = HttpTransport(TransportConfig(limit=8, limit_per_host=4, ttl_dns_cache=60))
+        session = transport.create_session()
+        try:
+            assert session.connector.limit == 8
+            assert session.connector.limit_per_host == 4
+            assert session.timeout.total == transport.config.total_timeout
+            assert session.timeout.sock_read == transport.config.sock_read_timeout
+        finally:
+            await session.close()
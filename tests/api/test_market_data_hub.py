@@ -0,0 +1,279 @@
+"""Tests for MarketDataHub — shared TTL cache with request coalescing."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from bot.api.market_data_hub import MarketDataHub, timeframe_seconds, venue_key
+from bot.monitoring.metrics_collector import MetricsCollector
+from bot.monitoring.metrics_exporter import MetricsExporter
+
+HOUR_MS = 3_600_000
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_700_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _exchange(exchange_id: str = "bybit", delay: float = 0.0) -> SimpleNamespace:
+    async def fetch_ticker(symbol):
+        await asyncio.sleep(delay)
+        return {"symbol": symbol, "last": 100.0}
+
+    async def fetch_ohlcv(symbol, timeframe="1h", since=None, limit=None, params=None):
+        await asyncio.sleep(delay)
+        n = limit or 500
+        return [[i * HOUR_MS, 1.0, 2.0, 0.5, 1.5, 10.0] for i in range(n)]
+
+    async def fetch_tickers(symbols=None):
+        await asyncio.sleep(delay)
+        return {s: {"symbol": s, "last": 100.0} for s in symbols or ["BTC/USDT"]}
+
+    return SimpleNamespace(
+        exchange_id=exchange_id,
+        _sandbox=False,
+        _default_type="spot",
+        fetch_ticker=AsyncMock(side_effect=fetch_ticker),
+        fetch_tickers=AsyncMock(side_effect=fetch_tickers),
+        fetch_ohlcv=AsyncMock(side_effect=fetch_ohlcv),
+    )
+
+
+@pytest.fixture
+def clock():
+    # Start just after an hour boundary so 1h bars don't roll over mid-test
+    return FakeClock(1_700_002_800.0 + 60)
+
+
+@pytest.fixture
+def hub(clock):
+    return MarketDataHub(ticker_ttl=2.0, ohlcv_ttl=30.0, clock=clock)
+
+
+class TestTickerCache:
+    async def test_served_from_cache_within_ttl(self, hub, clock):
+        exchange = _exchange()
+        feed = hub.feed(exchange)
+
+        await feed.fetch_ticker("BTC/USDT")
+        await feed.fetch_ticker("BTC/USDT")
+        assert exchange.fetch_ticker.await_count == 1
+
+        clock.now += 2.5
+        await feed.fetch_ticker("BTC/USDT")
+        assert exchange.fetch_ticker.await_count == 2
+
+    async def test_feeds_on_same_venue_share_cache(self, hub):
+        first, second = _exchange(), _exchange()
+        await hub.feed(first).fetch_ticker("ETH/USDT")
+        await hub.feed(second).fetch_ticker("ETH/USDT")
+
+        assert first.fetch_ticker.await_count == 1
+        assert second.fetch_ticker.await_count == 0
+
+    async def test_venues_are_isolated(self, hub):
+        bybit, binance = _exchange("bybit"), _exchange("binance")
+        await hub.feed(bybit).fetch_ticker("BTC/USDT")
+        await hub.feed(binance).fetch_ticker("BTC/USDT")
+        assert binance.fetch_ticker.await_count == 1
+
+
+class TestBulkTickers:
+    async def test_bulk_fetch_fills_per_symbol_cache(self, hub):
+        exchange = _exchange()
+        feed = hub.feed(exchange)
+
+        tickers = await feed.fetch_tickers(["BTC/USDT", "ETH/USDT"])
+        assert set(tickers) == {"BTC/USDT", "ETH/USDT"}
+
+        await feed.fetch_ticker("ETH/USDT")
+        assert exchange.fetch_ticker.await_count == 0
+
+    async def test_fresh_symbols_served_from_cache(self, hub, clock):
+        exchange = _exchange()
+        feed = hub.feed(exchange)
+
+        await feed.fetch_tickers(["BTC/USDT", "ETH/USDT"])
+        await feed.fetch_tickers(["ETH/USDT"])
+        assert exchange.fetch_tickers.await_count == 1
+
+        clock.now += 2.5
+        await feed.fetch_tickers(["ETH/USDT"])
+        assert exchange.fetch_tickers.await_count == 2
+
+    async def test_partially_cached_request_refetches(self, hub):
+        exchange = _exchange()
+        feed = hub.feed(exchange)
+
+        await feed.fetch_ticker("BTC/USDT")
+        await feed.fetch_tickers(["BTC/USDT", "SOL/USDT"])
+        assert exchange.fetch_tickers.await_count == 1
+
+
+class TestCoalescing:
+    async def test_concurrent_requests_share_one_call(self, hub):
+        exchange = _exchange(delay=0.01)
+        feeds = [hub.feed(exchange) for _ in range(20)]
+
+        tickers = await asyncio.gather(*(f.fetch_ticker("SOL/USDT") for f in feeds))
+        assert exchange.fetch_ticker.await_count == 1
+        assert all(t["symbol"] == "SOL/USDT" for t in tickers)
+
+        stats = hub.stats["ticker"]
+        assert stats.coalesced == 19
+        assert stats.requests_saved == 19
+
+    async def test_smaller_limit_joins_larger_inflight(self, hub):
+        exchange = _exchange(delay=0.01)
+        feed = hub.feed(exchange)
+
+        big, small = await asyncio.gather(
+            feed.fetch_ohlcv("BTC/USDT", "1h", limit=200),
+            feed.fetch_ohlcv("BTC/USDT", "1h", limit=100),
+        )
+        assert exchange.fetch_ohlcv.await_count == 1
+        assert len(big) == 200
+        assert small == big[-100:]
+
+    async def test_errors_reach_every_waiter_and_are_not_cached(self, hub):
+        exchange = _exchange(delay=0.01)
+        exchange.fetch_ticker.side_effect = RuntimeError("boom")
+        feed = hub.feed(exchange)
+
+        results = await asyncio.gather(
+            feed.fetch_ticker("BTC/USDT"), feed.fetch_ticker("BTC/USDT"), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert hub.stats["ticker"].errors == 1
+
+        exchange.fetch_ticker.side_effect = None
+        exchange.fetch_ticker.return_value = {"last": 1.0}
+        assert await feed.fetch_ticker("BTC/USDT") == {"last": 1.0}
+
+    async def test_cancelled_waiter_does_not_cancel_fetch(self, hub):
+        exchange = _exchange(delay=0.02)
+        feed = hub.feed(exchange)
+
+        first = asyncio.create_task(feed.fetch_ticker("BTC/USDT"))
+        second = asyncio.create_task(feed.fetch_ticker("BTC/USDT"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert (await second)["symbol"] == "BTC/USDT"
+
+
+class TestOhlcvCache:
+    async def test_larger_entry_serves_smaller_limit(self, hub):
+        exchange = _exchange()
+        feed = hub.feed(exchange)
+
+        full = await feed.fetch_ohlcv("BTC/USDT", "1h", limit=200)
+        tail = await feed.fetch_ohlcv("BTC/USDT", "1h", limit=100)
+        assert exchange.fetch_ohlcv.await_count == 1
+        assert tail == full[-100:]
+
+        await feed.fetch_ohlcv("BTC/USDT", "1h", limit=300)
+        assert exchange.fetch_ohlcv.await_count == 2
+
+    async def test_expires_at_next_bar_open(self, hub, clock):
+        exchange = _exchange()
+        feed = hub.feed(exchange)
+
+        await feed.fetch_ohlcv("BTC/USDT", "15m", limit=50)
+        # 15m bar boundary falls before the 30s TTL would
+        clock.now = (clock.now // 900 + 1) * 900
+        await feed.fetch_ohlcv("BTC/USDT", "15m", limit=50)
+        assert exchange.fetch_ohlcv.await_count == 2
+
+        clock.now += 10
+        await feed.fetch_ohlcv("BTC/USDT", "15m", limit=50)
+        assert exchange.fetch_ohlcv.await_count == 2
+
+    async def test_since_bypasses_cache(self, hub):
+        exchange = _exchange()
+        feed = hub.feed(exchange)
+
+        await feed.fetch_ohlcv("BTC/USDT", "1h", since=0, limit=10)
+        await feed.fetch_ohlcv("BTC/USDT", "1h", since=0, limit=10)
+        assert exchange.fetch_ohlcv.await_count == 2
+        assert hub.stats["ohlcv"].bypassed == 2
+
+    async def test_invalidate_symbol(self, hub):
+        exchange = _exchange()
+        feed = hub.feed(exchange)
+        await feed.fetch_ohlcv("BTC/USDT", "1h", limit=10)
+        await feed.fetch_ticker("BTC/USDT")
+
+        hub.invalidate("BTC/USDT")
+        await feed.fetch_ohlcv("BTC/USDT", "1h", limit=10)
+        await feed.fetch_ticker("BTC/USDT")
+        assert exchange.fetch_ohlcv.await_count == 2
+        assert exchange.fetch_ticker.await_count == 2
+
+
+class TestHelpers:
+    def test_timeframe_seconds(self):
+        assert timeframe_seconds("15m") == 900
+        assert timeframe_seconds("4h") == 14400
+        assert timeframe_seconds("1d") == 86400
+        assert timeframe_seconds("1M") is None
+
+    def test_venue_key_ignores_credentials(self):
+        a = SimpleNamespace(exchange_id="binance", _sandbox=True, _default_type="spot", api_key="a")
+        b = SimpleNamespace(exchange_id="binance", _sandbox=True, _default_type="spot", api_key="b")
+        assert venue_key(a) == venue_key(b)
+        assert venue_key(SimpleNamespace(testnet=True, market_type="linear"))[1:] == (
+            True,
+            "linear",
+        )
+
+
+class TestMetrics:
+    async def test_collector_exports_hub_metrics(self, hub):
+        feed = hub.feed(_exchange())
+        for _ in range(4):
+            await feed.fetch_ticker("BTC/USDT")
+
+        exporter = MetricsExporter()
+        await MetricsCollector(exporter=exporter, market_data_hub=hub).collect_all()
+
+        text = exporter.format_metrics()
+        assert 'traderagent_market_data_requests_saved_total{kind="ticker"} 3.0' in text
+        assert 'traderagent_market_data_hit_ratio{kind="ticker"} 0.75' in text
+        assert "# TYPE traderagent_market_data_requests_total counter" in text
+
+
+class TestIsolation:
+    async def test_callers_get_their_own_ticker_copies(self, hub):
+        exchange = _exchange(delay=0.01)
+        first, second = hub.feed(exchange), hub.feed(exchange)
+
+        coalesced = await asyncio.gather(
+            first.fetch_ticker("BTC/USDT"), second.fetch_ticker("BTC/USDT")
+        )
+        coalesced[0]["last"] = 0.0
+        cached = await second.fetch_ticker("BTC/USDT")
+        cached["last"] = -1.0
+
+        assert coalesced[1]["last"] == 100.0
+        assert (await first.fetch_ticker("BTC/USDT"))["last"] == 100.0
+        bulk = await first.fetch_tickers(["BTC/USDT"])
+        bulk["BTC/USDT"]["last"] = 0.0
+        assert (await second.fetch_tickers(["BTC/USDT"]))["BTC/USDT"]["last"] == 100.0
+
+    async def test_callers_get_their_own_candle_rows(self, hub):
+        feed = hub.feed(_exchange())
+
+        candles = await feed.fetch_ohlcv("BTC/USDT", "1h", limit=10)
+        candles[-1][4] = 0.0
+        candles.clear()
+
+        again = await feed.fetch_ohlcv("BTC/USDT", "1h", limit=10)
+        assert len(again) == 10
+        assert again[-1][4] == 1.5
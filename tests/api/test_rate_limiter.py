@@ -0,0 +1,206 @@
+"""Tests for the token-bucket rate limiter, routes and per-key registry."""
+
+import asyncio
+
+import pytest
+
+from bot.api.rate_limiter import (
+    Priority,
+    RateLimiter,
+    RateLimiterRegistry,
+    Route,
+    TokenBucket,
+    bybit_rate_limiter,
+    ccxt_rate_limiter,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    def test_starts_full_and_refills(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10.0, capacity=5, clock=clock)
+
+        assert all(bucket.try_acquire() for _ in range(5))
+        assert not bucket.try_acquire()
+
+        clock.now += 0.25
+        assert bucket.tokens == pytest.approx(2.5)
+
+    def test_refill_is_capped(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10.0, capacity=5, clock=clock)
+        clock.now += 100
+        assert bucket.tokens == 5
+
+    async def test_acquire_waits_for_tokens(self):
+        bucket = TokenBucket(rate=200.0, capacity=1)
+        await bucket.acquire()
+        waited = await bucket.acquire()
+        assert waited > 0
+
+    async def test_throughput_is_bounded(self):
+        bucket = TokenBucket(rate=200.0, capacity=10)
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        await asyncio.gather(*(bucket.acquire() for _ in range(50)))
+        elapsed = loop.time() - start
+
+        # 10 from the burst, 40 more at 200/s
+        assert elapsed >= 0.15
+
+    async def test_oversized_request_rejected(self):
+        bucket = TokenBucket(rate=1.0, capacity=2)
+        with pytest.raises(ValueError):
+            await bucket.acquire(3)
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestPriorityLanes:
+    async def test_orders_overtake_queued_market_data(self):
+        bucket = TokenBucket(rate=100.0, capacity=1)
+        await bucket.acquire()
+        served: list[str] = []
+
+        async def call(name: str, priority: Priority) -> None:
+            await bucket.acquire(priority=priority)
+            served.append(name)
+
+        reads = [asyncio.create_task(call(f"read{i}", Priority.MARKET_DATA)) for i in range(3)]
+        await asyncio.sleep(0)
+        order = asyncio.create_task(call("order", Priority.ORDER))
+        await asyncio.gather(*reads, order)
+
+        assert served[0] == "order"
+        assert served[1:] == ["read0", "read1", "read2"]
+
+    async def test_wait_time_recorded(self):
+        bucket = TokenBucket(rate=100.0, capacity=1)
+        await bucket.acquire()
+        await bucket.acquire()
+        assert bucket.stats.requests == 2
+        assert bucket.stats.waits == 1
+        assert bucket.stats.wait_seconds > 0
+
+    async def test_cancelled_waiter_does_not_consume(self):
+        bucket = TokenBucket(rate=50.0, capacity=1)
+        await bucket.acquire()
+        waiter = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await bucket.acquire()
+        assert bucket.stats.requests == 2
+
+
+class TestRateLimiter:
+    def _limiter(self, wall: float = 1_700_000_000.0) -> RateLimiter:
+        return RateLimiter(
+            {"global": (100.0, 100.0), "order": (10.0, 10.0), "market": (50.0, 50.0)},
+            {
+                "/v5/order/": Route("order", 1.0, Priority.ORDER),
+                "/v5/order/create-batch": Route("order", 5.0, Priority.ORDER),
+            },
+            Route("market"),
+            wall_clock=lambda: wall,
+        )
+
+    def test_longest_prefix_route(self):
+        limiter = self._limiter()
+        assert limiter.route("/v5/order/create-batch").weight == 5.0
+        assert limiter.route("/v5/order/create").weight == 1.0
+        assert limiter.route("/v5/market/tickers").bucket == "market"
+
+    def test_unknown_bucket_rejected(self):
+        with pytest.raises(ValueError, match="unknown bucket"):
+            RateLimiter({"global": (1.0, 1.0)}, {"x": Route("missing")})
+
+    async def test_acquire_charges_route_and_global(self):
+        limiter = self._limiter()
+        await limiter.acquire("/v5/order/create-batch")
+        stats = limiter.get_stats()
+        assert stats["order"]["tokens_used"] == 5.0
+        assert stats["global"]["tokens_used"] == 5.0
+        assert stats["market"]["requests"] == 0
+
+    def test_bybit_headers_resize_and_pause(self):
+        limiter = self._limiter()
+        limiter.update_from_headers(
+            "/v5/order/create",
+            {
+                "X-Bapi-Limit": "20",
+                "X-Bapi-Limit-Status": "0",
+                "X-Bapi-Limit-Reset-Timestamp": str(int((1_700_000_000 + 1) * 1000)),
+            },
+        )
+        bucket = limiter.buckets["order"]
+        assert bucket.capacity == 20.0
+        assert not bucket.try_acquire()
+        assert limiter.buckets["market"].try_acquire()
+
+    def test_remaining_header_caps_tokens(self):
+        limiter = self._limiter()
+        limiter.update_from_headers("/v5/market/tickers", {"x-ratelimit-remaining": "3"})
+        assert limiter.buckets["market"].tokens == pytest.approx(3.0, abs=0.5)
+
+    def test_malformed_headers_ignored(self):
+        limiter = self._limiter()
+        limiter.update_from_headers("/v5/market/tickers", {"X-Bapi-Limit-Status": "n/a"})
+        limiter.update_from_headers("/v5/market/tickers", None)
+        assert limiter.buckets["market"].tokens == pytest.approx(50.0)
+
+    def test_rate_limited_pauses_only_that_bucket(self):
+        limiter = self._limiter()
+        limiter.on_rate_limited("/v5/order/create", retry_after=1.0)
+        assert limiter.stats["order"].rate_limit_hits == 1
+        assert not limiter.buckets["order"].try_acquire()
+        assert limiter.buckets["market"].try_acquire()
+
+
+class TestRegistry:
+    def test_one_limiter_per_key(self):
+        registry = RateLimiterRegistry()
+        a = registry.get("bybit", "key-a", bybit_rate_limiter)
+        assert registry.get("bybit", "key-a", bybit_rate_limiter) is a
+        assert registry.get("bybit", "key-b", bybit_rate_limiter) is not a
+        assert registry.get("binance", "key-a", ccxt_rate_limiter) is not a
+
+    def test_route_profiles_get_their_own_limiter(self):
+        registry = RateLimiterRegistry()
+        direct = registry.get("bybit", "key-a", bybit_rate_limiter)
+        ccxt = registry.get("bybit", "key-a", ccxt_rate_limiter)
+        assert ccxt is not direct
+        assert ccxt.routes == ccxt_rate_limiter().routes
+        assert registry.get("bybit", "key-a", ccxt_rate_limiter) is ccxt
+
+    def test_labels_do_not_expose_keys(self):
+        registry = RateLimiterRegistry()
+        registry.get("bybit", "secret-api-key", bybit_rate_limiter)
+        ((label, _),) = registry.items()
+        assert "secret-api-key" not in label
+        assert label.startswith("bybit:")
+
+    async def test_collector_exports_bucket_metrics(self):
+        from bot.monitoring.metrics_collector import MetricsCollector
+        from bot.monitoring.metrics_exporter import MetricsExporter
+
+        registry = RateLimiterRegistry()
+        limiter = registry.get("bybit", "k", bybit_rate_limiter)
+        await limiter.acquire("/v5/order/create")
+
+        exporter = MetricsExporter()
+        await MetricsCollector(exporter=exporter, rate_limiters=registry).collect_all()
+
+        text = exporter.format_metrics()
+        assert 'bucket="order"' in text
+        assert "# TYPE traderagent_rate_limit_tokens_used_total counter" in text
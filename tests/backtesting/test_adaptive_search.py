@@ -0,0 +1,145 @@
+"""Tests for successive halving / Hyperband / TPE adaptive search."""
+
+import math
+from decimal import Decimal
+
+import pytest
+
+from bot.tests.backtesting.adaptive_search import (
+    AdaptiveSearchConfig,
+    ParamRange,
+    TPESampler,
+    make_plan,
+    run_plan,
+    rung_fractions,
+)
+from bot.tests.backtesting.checkpoint import OptimizationCheckpoint
+from bot.tests.backtesting.multi_tf_engine import MultiTFBacktestConfig
+from bot.tests.backtesting.optimization import OptimizationConfig, ParameterOptimizer
+from tests.backtesting.test_advanced_analytics import _load_test_data
+from tests.backtesting.test_result_cache import _built, _strategy
+
+SPACE = {"buy_every_n": [5, 10, 20, 40], "tp_pct": [Decimal("0.01"), Decimal("0.02")]}
+
+
+def _record(space, config):
+    """Run a plan against a synthetic score, returning the (n_configs, fraction) batches."""
+    batches = []
+
+    def evaluate(configs, fraction):
+        batches.append((len(configs), fraction))
+        return [-abs(math.log(p["x"])) * fraction for p in configs]
+
+    run_plan(make_plan(config, space), evaluate)
+    return batches
+
+
+class TestPlans:
+    def test_rung_fractions(self):
+        assert rung_fractions(3, 1 / 9) == pytest.approx([1 / 9, 1 / 3, 1.0])
+        assert rung_fractions(2, 0.25) == pytest.approx([0.25, 0.5, 1.0])
+        assert rung_fractions(3, 1.0) == [1.0]
+
+    def test_successive_halving_keeps_top_eta(self):
+        space = {"x": ParamRange(0.1, 10.0, log=True)}
+        batches = _record(space, AdaptiveSearchConfig(n_configs=27, seed=1))
+        assert [n for n, _ in batches] == [27, 9, 3]
+        assert [f for _, f in batches] == pytest.approx([1 / 9, 1 / 3, 1.0])
+
+    def test_hyperband_brackets(self):
+        space = {"x": ParamRange(0.1, 10.0, log=True)}
+        batches = _record(space, AdaptiveSearchConfig(method="hyperband", seed=1))
+        # s=2: 9 -> 3 -> 1, s=1: 5 -> 1 (1/3 then full), s=0: 3 full-length
+        assert [n for n, _ in batches] == [9, 3, 1, 5, 1, 3]
+        assert batches[-1][1] == 1.0
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError, match="Unknown method"):
+            AdaptiveSearchConfig(method="random")
+
+
+class TestSampler:
+    def test_param_range_round_trip(self):
+        r = ParamRange(0.001, 0.1, log=True, digits=6)
+        assert r.from_unit(0.0) == pytest.approx(0.001)
+        assert r.from_unit(1.0) == pytest.approx(0.1)
+        assert r.from_unit(0.5) == pytest.approx(0.01)
+        assert r.to_unit(r.from_unit(0.3)) == pytest.approx(0.3, abs=1e-3)
+        levels = ParamRange(5, 30, integer=True)
+        assert all(isinstance(levels.from_unit(u / 10), int) for u in range(11))
+
+    def test_proposals_are_unique_and_exhaust_finite_spaces(self):
+        sampler = TPESampler(SPACE, seed=0, n_startup=2)
+        first = sampler.propose(5)
+        for params in first:
+            sampler.observe(params, 1.0, float(params["buy_every_n"]))
+        rest = sampler.propose(10)
+        keys = [tuple(sorted(p.items())) for p in first + rest]
+        assert len(keys) == len(set(keys)) == 8
+
+    def test_tpe_concentrates_on_good_region(self):
+        space = {"x": ParamRange(0.0, 1.0)}
+        sampler = TPESampler(space, seed=3, n_startup=8)
+        for _ in range(6):
+            for params in sampler.propose(4):
+                sampler.observe(params, 1.0, -abs(params["x"] - 0.8))
+        late = sampler.propose(8)
+        assert sum(abs(p["x"] - 0.8) for p in late) / len(late) < 0.25
+
+
+class TestAdaptiveOptimize:
+    @staticmethod
+    def _optimizer(**kwargs) -> ParameterOptimizer:
+        config = OptimizationConfig(
+            backtest_config=MultiTFBacktestConfig(warmup_bars=20), objective="total_return_pct"
+        )
+        return ParameterOptimizer(config=config, **kwargs)
+
+    async def test_halving_against_grid(self):
+        data = _load_test_data(days=2)
+        optimizer = self._optimizer()
+        grid = await optimizer.optimize(_strategy, SPACE, data)
+        result = await optimizer.adaptive_optimize(
+            _strategy, SPACE, data, search=AdaptiveSearchConfig(n_configs=8, eta=2, seed=0)
+        )
+
+        full = [t for t in result.evaluations if t.fraction >= 1.0]
+        assert [t.bars for t in full] == [len(data.m5)]
+        assert result.full_run_equivalents < len(grid.all_trials)
+        report = result.report(grid=grid, grid_seconds=1.0)
+        assert report["grid"]["evaluations"] == 8
+        assert report["grid"]["regret"] >= 0
+        assert report["trials_to_best"] == len(result.evaluations)
+
+    async def test_resumes_from_checkpoint(self, tmp_path, monkeypatch):
+        data = _load_test_data(days=1)
+        checkpoint = OptimizationCheckpoint(tmp_path)
+        search = AdaptiveSearchConfig(n_configs=8, eta=2, seed=0)
+        monkeypatch.setattr(checkpoint, "cleanup", lambda run_id: None)
+
+        first = await self._optimizer(checkpoint=checkpoint).adaptive_optimize(
+            _strategy, SPACE, data, search=search, run_id="resume"
+        )
+        _built.clear()
+        second = await self._optimizer(checkpoint=checkpoint).adaptive_optimize(
+            _strategy, SPACE, data, search=search, run_id="resume"
+        )
+
+        # Only the restored best is re-run, to rebuild its full BacktestResult
+        assert len(_built) == 1
+        assert second.best_params == first.best_params
+        assert second.best_objective == pytest.approx(first.best_objective, abs=1e-4)
+
+    async def test_default_run_id_covers_dataset(self, tmp_path, monkeypatch):
+        checkpoint = OptimizationCheckpoint(tmp_path)
+        rungs: list[str] = []
+        monkeypatch.setattr(checkpoint, "cleanup", rungs.append)
+        search = AdaptiveSearchConfig(n_configs=2, eta=2, seed=0)
+
+        for days in (1, 2):
+            await self._optimizer(checkpoint=checkpoint).adaptive_optimize(
+                _strategy, SPACE, _load_test_data(days=days), search=search
+            )
+
+        run_ids = {rung.rsplit("-", 1)[0] for rung in rungs}
+        assert len(run_ids) == 2
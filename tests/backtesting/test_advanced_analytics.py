@@ -10,6 +10,7 @@ from typing import Any, Optional
 
 import numpy as np
 import pandas as pd
+import pytest
 
 from bot.strategies.base import (
     BaseMarketAnalysis,
@@ -49,6 +50,7 @@ from bot.tests.backtesting.walk_forward import (
     WalkForwardAnalysis,
     WalkForwardConfig,
     WalkForwardResult,
+    segment_data,
 )
 
 # ---------------------------------------------------------------------------
@@ -384,6 +386,59 @@ class TestMonteCarloSimulation:
             assert 0.0 <= wr <= 100.0
 
 
+class TestMonteCarloModes:
+    def test_vectorized_paths_match_scalar_loop(self):
+        rets = np.array([[5.0, -10.0, 2.0, -3.0, 8.0], [-1.0, -2.0, 4.0, 0.0, 1.0]])
+        final, dd, wr = MonteCarloSimulation()._simulate_paths(rets)
+
+        for row, f, d, w in zip(rets, final, dd, wr, strict=True):
+            balance, peak, max_dd = 100.0, 100.0, 0.0
+            for r in row:
+                balance *= 1 + r / 100
+                peak = max(peak, balance)
+                max_dd = max(max_dd, (peak - balance) / peak * 100)
+            assert f == pytest.approx(balance - 100)
+            assert d == pytest.approx(max_dd)
+            assert w == pytest.approx(np.mean(row > 0) * 100)
+
+    def test_shuffle_keeps_trade_multiset(self):
+        bt = _make_backtest_result()
+        result = MonteCarloSimulation(config=MonteCarloConfig(n_simulations=300, seed=7)).run(bt)
+        assert result.return_percentiles[0.05] == pytest.approx(result.return_percentiles[0.95])
+        assert result.win_rate_percentiles[0.05] == result.win_rate_percentiles[0.95] == 70.0
+
+    def test_bootstrap_varies_and_is_chunk_invariant(self):
+        bt = _make_backtest_result()
+
+        def run(chunk_cells: int) -> MonteCarloResult:
+            cfg = MonteCarloConfig(
+                n_simulations=500, seed=3, mode="bootstrap", chunk_cells=chunk_cells
+            )
+            return MonteCarloSimulation(config=cfg).run(bt)
+
+        whole, chunked = run(1_000_000), run(70)
+        assert chunked.simulated_returns == whole.simulated_returns
+        assert whole.win_rate_percentiles[0.05] < whole.win_rate_percentiles[0.95]
+
+    def test_block_modes_keep_runs_together(self):
+        rng = np.random.default_rng(0)
+        block = MonteCarloSimulation(config=MonteCarloConfig(mode="block", block_size=4))
+        idx = block._sample_indices(rng, 50, 22)
+        steps = np.diff(idx, axis=1) % 22 == 1
+        # Only block boundaries (every 4th step) may break a run
+        assert steps[:, [j for j in range(21) if (j + 1) % 4]].all()
+
+        stationary = MonteCarloSimulation(config=MonteCarloConfig(mode="stationary", block_size=5))
+        idx = stationary._sample_indices(rng, 2000, 200)
+        assert idx.min() >= 0 and idx.max() < 200
+        continued = np.mean(np.diff(idx, axis=1) % 200 == 1)
+        assert continued == pytest.approx(1 - 1 / 5, abs=0.02)
+
+    def test_rejects_unknown_mode(self):
+        with pytest.raises(ValueError, match="Unknown mode"):
+            MonteCarloSimulation(config=MonteCarloConfig(mode="jackknife"))
+
+
 # ===========================================================================
 # Walk-Forward Tests
 # ===========================================================================
@@ -486,6 +541,58 @@ class TestWalkForwardAnalysis:
         assert isinstance(result.avg_test_drawdown_pct, Decimal)
 
 
+class TestWalkForwardWindows:
+    def _wf(self, **kwargs) -> WalkForwardAnalysis:
+        return WalkForwardAnalysis(
+            config=WalkForwardConfig(
+                n_splits=3,
+                train_pct=0.6,
+                backtest_config=MultiTFBacktestConfig(warmup_bars=20),
+                **kwargs,
+            )
+        )
+
+    def test_anchored_trains_from_start(self):
+        data = _load_test_data(days=4)
+        rolling = self._wf()._split_windows(data)
+        anchored = self._wf(scheme="anchored")._split_windows(data)
+
+        assert [t for _, t in anchored] == [t for _, t in rolling]
+        assert all(train.start == 20 for train, _ in anchored)
+        assert [train.start for train, _ in rolling] == [20, rolling[0][1].stop, rolling[1][1].stop]
+
+    def test_segment_is_view_with_warmup_prefix(self):
+        data = _load_test_data(days=4)
+        segment, prefix = segment_data(data, slice(500, 800), warmup_bars=100)
+
+        assert prefix == 100
+        assert len(segment.m5) == 400
+        assert np.shares_memory(segment.m5["close"].to_numpy(), data.m5["close"].to_numpy())
+        start, end = data.m5.index[400], data.m5.index[799]
+        expected = data.h1[(data.h1.index >= start) & (data.h1.index <= end)]
+        pd.testing.assert_frame_equal(segment.h1, expected)
+        # Prefix is clipped at the start of the data
+        assert segment_data(data, slice(30, 60), warmup_bars=100)[1] == 30
+        # ...and the stop at its end
+        n = len(data.m5)
+        tail, _ = segment_data(data, slice(n - 10, n + 50))
+        pd.testing.assert_frame_equal(tail.m5, data.m5.iloc[n - 10 :])
+
+    async def test_test_window_trades_from_first_bar(self):
+        data = _load_test_data(days=4)
+        result = await self._wf(warmup_bars=200).run(SimpleTestStrategy(buy_every_n=5), data)
+
+        for w in result.windows:
+            # Warm-up prefix is replayed, so the equity curve covers the whole segment
+            curve = w.test_result.equity_curve
+            assert curve[0]["timestamp"] == w.test_start.isoformat()
+            assert curve[-1]["timestamp"] == w.test_end.isoformat()
+
+    def test_rejects_unknown_scheme(self):
+        with pytest.raises(ValueError, match="Unknown scheme"):
+            self._wf(scheme="expanding")
+
+
 # ===========================================================================
 # Parameter Optimization Tests
 # ===========================================================================
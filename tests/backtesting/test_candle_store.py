@@ -0,0 +1,161 @@
+"""Tests for the columnar CandleStore and vectorized CSV reader."""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bot.tests.backtesting.candle_store import CandleStore, main, read_ohlcv_csv
+from bot.tests.backtesting.multi_tf_data_loader import MultiTimeframeDataLoader
+from bot.tests.backtesting.test_data import HistoricalDataProvider
+
+
+def _frame(n: int = 600, start: str = "2024-01-01", seed: int = 1) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    return pd.DataFrame(
+        {
+            "open": close + rng.normal(0, 0.1, n),
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": rng.uniform(10, 20, n),
+        },
+        # Candles are always datetime64[ns], whatever pandas' default unit
+        index=pd.date_range(start, periods=n, freq="5min", name="timestamp", unit="ns"),
+    )
+
+
+def _write_csv(path, df: pd.DataFrame, layout: str = "downloader") -> None:
+    out = df.reset_index()
+    ms = out["timestamp"].dt.as_unit("ms").astype("int64")
+    if layout == "downloader":
+        out.insert(0, "datetime", out.pop("timestamp").dt.strftime("%Y-%m-%dT%H:%M:%S"))
+        out.insert(0, "timestamp", ms)
+    elif layout == "binance":
+        out.insert(0, "Open time", ms)
+        out = out.drop(columns="timestamp")
+    out.to_csv(path, index=False)
+
+
+class TestReadOhlcvCsv:
+    @pytest.mark.parametrize("layout", ["downloader", "iso"])
+    def test_matches_row_parser(self, tmp_path, layout):
+        path = tmp_path / "candles.csv"
+        _write_csv(path, _frame(50), layout)
+
+        vectorized = read_ohlcv_csv(path)
+        rows = HistoricalDataProvider().load_csv_data(str(path))
+        expected = MultiTimeframeDataLoader()._candles_to_dataframe(rows)
+        expected.index = expected.index.as_unit("ns")
+
+        pd.testing.assert_frame_equal(vectorized, expected, check_names=False, check_freq=False)
+
+    def test_binance_open_time_is_unix_ms(self, tmp_path):
+        # The row parser's fromisoformat() accepts 13-digit strings as basic-format
+        # dates (1704067200000 -> 1704-07-02); numeric columns are always ms here
+        df = _frame(50)
+        path = tmp_path / "candles.csv"
+        _write_csv(path, df, "binance")
+        pd.testing.assert_frame_equal(read_ohlcv_csv(path), df, check_freq=False)
+
+
+class TestCandleStore:
+    def test_write_and_load_roundtrip(self, tmp_path):
+        df = _frame()
+        store = CandleStore(tmp_path)
+        assert store.write("BTC/USDT", "5m", df) == len(df)
+
+        loaded = store.load("BTC/USDT", "5m")
+        pd.testing.assert_frame_equal(loaded, df, check_freq=False)
+
+    def test_date_range_slice(self, tmp_path):
+        df = _frame()
+        store = CandleStore(tmp_path)
+        store.write("BTC/USDT", "5m", df)
+
+        start, end = df.index[100], df.index[250]
+        loaded = store.load("BTC/USDT", "5m", start=start, end=end)
+        pd.testing.assert_frame_equal(loaded, df.loc[start:end].iloc[:-1], check_freq=False)
+        assert store.load("BTC/USDT", "5m", start="2030-01-01").empty
+
+    def test_merge_overwrites_duplicates(self, tmp_path):
+        df = _frame(100)
+        store = CandleStore(tmp_path)
+        store.write("ETH/USDT", "5m", df.iloc[:60])
+
+        update = df.iloc[50:].copy()
+        update["close"] += 1000
+        assert store.write("ETH/USDT", "5m", update) == 100
+
+        loaded = store.load("ETH/USDT", "5m")
+        assert loaded["close"].iloc[49] == df["close"].iloc[49]
+        assert loaded["close"].iloc[50] == df["close"].iloc[50] + 1000
+
+    def test_manifest_persists(self, tmp_path):
+        df = _frame(10)
+        CandleStore(tmp_path).write("BTC/USDT", "1h", df)
+
+        reopened = CandleStore(tmp_path)
+        entry = reopened.series()["BTC_USDT/1h"]
+        assert entry["rows"] == 10
+        assert entry["start"] == df.index[0].isoformat()
+        assert reopened.has("BTC/USDT", "1h")
+        with pytest.raises(KeyError):
+            reopened.load("BTC/USDT", "4h")
+
+    def test_write_ohlcv_rows(self, tmp_path):
+        rows = [[1704067200000 + i * 300_000, 1.0, 2.0, 0.5, 1.5, 10.0] for i in range(3)]
+        store = CandleStore(tmp_path)
+        store.write_ohlcv("XRP/USDT", "5m", rows)
+
+        loaded = store.load("XRP/USDT", "5m")
+        assert loaded.index[0] == pd.Timestamp("2024-01-01 00:00:00")
+        assert list(loaded.iloc[0]) == [1.0, 2.0, 0.5, 1.5, 10.0]
+
+    def test_import_csv_infers_series_from_name(self, tmp_path):
+        path = tmp_path / "bybit_ETH_USDT_5m.csv"
+        _write_csv(path, _frame(20))
+        store = CandleStore(tmp_path / "store")
+        store.import_csv(path)
+        assert store.has("ETH/USDT", "5m")
+
+        with pytest.raises(ValueError):
+            store.import_csv(tmp_path / "candles.csv")
+
+    def test_cli_import(self, tmp_path, capsys):
+        path = tmp_path / "binance_BTC_USDT_5m.csv"
+        _write_csv(path, _frame(20))
+        main([str(path), "--store", str(tmp_path / "store")])
+
+        assert CandleStore(tmp_path / "store").has("BTC/USDT", "5m")
+        assert "20 rows" in capsys.readouterr().out
+
+
+class TestLoadStore:
+    def test_matches_load_csv(self, tmp_path):
+        df = _frame(2000)
+        path = tmp_path / "bybit_BTC_USDT_5m.csv"
+        _write_csv(path, df)
+        store = CandleStore(tmp_path / "store")
+        store.import_csv(path)
+
+        loader = MultiTimeframeDataLoader()
+        from_csv = loader.load_csv(str(path))
+        from_store = loader.load_store(store, "BTC/USDT")
+        for tf in ("m5", "m15", "h1", "h4", "d1"):
+            pd.testing.assert_frame_equal(
+                getattr(from_store, tf), getattr(from_csv, tf), check_names=False, check_freq=False
+            )
+
+    def test_date_range(self, tmp_path):
+        store = CandleStore(tmp_path)
+        store.write("BTC/USDT", "5m", _frame(2000))
+
+        data = MultiTimeframeDataLoader().load_store(
+            store, "BTC/USDT", datetime(2024, 1, 2), datetime(2024, 1, 3)
+        )
+        assert len(data.m5) == 288
+        assert len(data.h1) == 24
+        assert data.m5.index[0] == pd.Timestamp("2024-01-02")
@@ -0,0 +1,115 @@
+"""Tests for the columnar EquityCurve recorder and vectorized metrics."""
+
+import pickle
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bot.tests.backtesting.equity_curve import (
+    EquityCurve,
+    annualized_sharpe,
+    annualized_sortino,
+    max_drawdown,
+    max_drawdown_pct,
+    period_returns,
+)
+from bot.tests.backtesting.multi_tf_engine import (
+    MultiTFBacktestConfig,
+    MultiTimeframeBacktestEngine,
+)
+from tests.backtesting.test_advanced_analytics import SimpleTestStrategy, _load_test_data
+
+
+def _curve(values, capacity=2, **kwargs) -> EquityCurve:
+    index = pd.date_range("2024-01-01", periods=len(values), freq="5min", **kwargs)
+    curve = EquityCurve(capacity=capacity, track_active=True, tz=index.tz)
+    for i, (ts, value) in enumerate(zip(index.as_unit("ns").asi8, values, strict=True)):
+        curve.append(ts, 100.0 + i, value, regime="trending" if i % 2 else None, active=("grid",))
+    return curve
+
+
+class TestEquityCurveRecorder:
+    def test_rows_match_legacy_dicts(self):
+        curve = _curve([10.0, 11.0, 12.0])
+
+        assert len(curve) == 3
+        assert curve[0] == {
+            "timestamp": "2024-01-01T00:00:00",
+            "price": 100.0,
+            "portfolio_value": 10.0,
+            "active_strategies": ["grid"],
+        }
+        assert curve[1]["regime"] == "trending"
+        assert curve[-1]["timestamp"] == pd.Timestamp("2024-01-01 00:10").isoformat()
+        assert curve[:2] == curve.to_records()[:2]
+        assert curve == curve.to_records()
+        np.testing.assert_array_equal(curve.values, [10.0, 11.0, 12.0])
+
+    def test_tz_aware_timestamps_keep_offset(self):
+        curve = _curve([1.0], tz="Europe/Berlin")
+        assert curve[0]["timestamp"] == "2024-01-01T00:00:00+01:00"
+
+    def test_pickle_ships_only_filled_rows(self):
+        curve = EquityCurve(capacity=100_000)
+        curve.append(0, 1.0, 2.0)
+        restored = pickle.loads(pickle.dumps(curve))
+
+        assert len(pickle.dumps(curve)) < 2_000
+        assert restored == curve
+        restored.append(300_000_000_000, 1.0, 3.0)
+        assert len(restored) == 2
+
+
+class TestVectorizedMetrics:
+    values = [100.0, 102.0, 99.0, 0.0, 5.0, 104.0, 101.0]
+
+    def _reference_returns(self):
+        return [
+            (Decimal(str(c)) - Decimal(str(p))) / Decimal(str(p))
+            for p, c in zip(self.values, self.values[1:], strict=False)
+            if p > 0
+        ]
+
+    def test_returns_skip_non_positive_starts(self):
+        expected = [float(r) for r in self._reference_returns()]
+        np.testing.assert_allclose(period_returns(np.array(self.values)), expected)
+
+    def test_sharpe_and_sortino_match_decimal_formula(self):
+        rets = self._reference_returns()
+        mean = sum(rets) / len(rets)
+        std = (sum((r - mean) ** 2 for r in rets) / len(rets)).sqrt()
+        downside = (sum(r**2 for r in rets if r < 0) / len(rets)).sqrt()
+        scale = Decimal(str((365 * 24 * 12) ** 0.5))
+
+        returns = period_returns(np.array(self.values))
+        assert float(annualized_sharpe(returns)) == pytest.approx(float(mean / std * scale))
+        assert float(annualized_sortino(returns)) == pytest.approx(float(mean / downside * scale))
+        assert annualized_sharpe(np.zeros(5)) is None
+        assert annualized_sortino(np.array([0.01, 0.02])) is None
+
+    def test_drawdowns(self):
+        values = np.array([100.0, 120.0, 90.0, 130.0, 117.0])
+        assert max_drawdown(values) == 30.0
+        assert max_drawdown(np.array([90.0, 95.0]), initial=100.0) == 10.0
+        assert max_drawdown_pct(values) == pytest.approx(25.0)
+
+
+class TestEngineRecording:
+    async def test_curve_can_be_dropped_after_metrics(self):
+        data = _load_test_data(days=2)
+
+        async def run(keep: bool):
+            config = MultiTFBacktestConfig(warmup_bars=20, keep_equity_curve=keep)
+            engine = MultiTimeframeBacktestEngine(config=config)
+            return await engine.run(SimpleTestStrategy(buy_every_n=5), data)
+
+        kept, dropped = await run(True), await run(False)
+
+        assert isinstance(kept.equity_curve, EquityCurve)
+        assert len(kept.equity_curve) == len(data.m5) - 20
+        assert kept.equity_curve[0]["timestamp"] == data.m5.index[20].isoformat()
+        assert dropped.equity_curve == []
+        assert dropped.sharpe_ratio == kept.sharpe_ratio
+        assert dropped.to_dict()["risk_metrics"] == kept.to_dict()["risk_metrics"]
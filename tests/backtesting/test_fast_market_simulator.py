@@ -0,0 +1,208 @@
+"""Parity tests for FastMarketSimulator against the Decimal MarketSimulator."""
+
+import random
+from decimal import Decimal
+
+import pytest
+
+from bot.tests.backtesting.fast_market_simulator import (
+    PARITY_REL_TOLERANCE,
+    FastMarketSimulator,
+)
+from bot.tests.backtesting.market_simulator import MarketSimulator
+
+SYMBOL = "BTC/USDT"
+
+
+def _pair(**kwargs):
+    return MarketSimulator(symbol=SYMBOL, **kwargs), FastMarketSimulator(symbol=SYMBOL, **kwargs)
+
+
+def _assert_close(a, b):
+    assert float(a) == pytest.approx(float(b), rel=PARITY_REL_TOLERANCE, abs=1e-9)
+
+
+def _assert_same_state(ref: MarketSimulator, fast: FastMarketSimulator) -> None:
+    _assert_close(ref.balance.base, fast.balance.base)
+    _assert_close(ref.balance.quote, fast.balance.quote)
+    _assert_close(ref.get_portfolio_value(), fast.get_portfolio_value())
+
+    ref_trades = ref.get_trade_history()
+    fast_trades = fast.get_trade_history()
+    assert [t["order_id"] for t in ref_trades] == [t["order_id"] for t in fast_trades]
+    for rt, ft in zip(ref_trades, fast_trades, strict=True):
+        assert rt["side"] == ft["side"]
+        for key in ("price", "amount", "fee"):
+            _assert_close(rt[key], ft[key])
+
+    ref_open = ref.get_open_orders()
+    fast_open = fast.get_open_orders()
+    assert [o["id"] for o in ref_open] == [o["id"] for o in fast_open]
+    assert len(ref.short_positions) == len(fast.short_positions)
+
+
+async def _both(ref, fast, method, *args):
+    results = []
+    for sim in (ref, fast):
+        try:
+            results.append(await getattr(sim, method)(*args))
+        except Exception as e:
+            results.append(type(e))
+    return results
+
+
+class TestFastSimulatorBasics:
+    async def test_market_buy_and_sell(self):
+        ref, fast = _pair()
+        for sim in (ref, fast):
+            await sim.set_price(Decimal("45000"))
+            await sim.create_order(SYMBOL, "market", "buy", Decimal("0.1"))
+            await sim.set_price(Decimal("46000"))
+            await sim.create_order(SYMBOL, "market", "sell", Decimal("0.05"))
+        _assert_same_state(ref, fast)
+
+    async def test_limit_fill_on_cross(self):
+        ref, fast = _pair()
+        for sim in (ref, fast):
+            await sim.set_price(Decimal("45000"))
+            await sim.create_order(SYMBOL, "limit", "buy", Decimal("0.1"), Decimal("44000"))
+            await sim.set_price(Decimal("44500"))
+            assert len(sim.get_open_orders()) == 1
+            await sim.set_price(Decimal("44000"))
+            assert sim.get_open_orders() == []
+        _assert_same_state(ref, fast)
+
+    async def test_cancel_removes_from_book(self):
+        fast = FastMarketSimulator(symbol=SYMBOL)
+        await fast.set_price(Decimal("45000"))
+        order = await fast.create_order(SYMBOL, "limit", "buy", Decimal("0.1"), Decimal("44000"))
+        cancelled = await fast.cancel_order(order["id"])
+        assert cancelled["status"] == "canceled"
+        await fast.set_price(Decimal("43000"))
+        assert fast.get_trade_history() == []
+        with pytest.raises(ValueError):
+            await fast.cancel_order(order["id"])
+        with pytest.raises(ValueError):
+            fast.get_order("missing")
+
+    async def test_invalid_orders(self):
+        fast = FastMarketSimulator(symbol=SYMBOL)
+        with pytest.raises(ValueError):
+            await fast.create_order("ETH/USDT", "market", "buy", Decimal("1"))
+        with pytest.raises(ValueError):
+            await fast.create_order(SYMBOL, "limit", "buy", Decimal("1"))
+        with pytest.raises(ValueError):
+            await fast.create_order(SYMBOL, "stop", "buy", Decimal("1"), Decimal("1"))
+
+    async def test_short_open_and_close(self):
+        ref, fast = _pair()
+        for sim in (ref, fast):
+            await sim.set_price(Decimal("45000"))
+            await sim.create_order(SYMBOL, "market", "sell", Decimal("0.1"))
+            await sim.set_price(Decimal("43000"))
+            _ = sim.get_portfolio_value()
+            await sim.create_order(SYMBOL, "market", "buy", Decimal("0.15"))
+        _assert_same_state(ref, fast)
+
+    async def test_sell_whole_position_after_fee(self):
+        ref, fast = _pair()
+        for sim in (ref, fast):
+            await sim.set_price(Decimal("100"))
+            await sim.create_order(SYMBOL, "market", "buy", Decimal("0.3"))
+            await sim.create_order(
+                SYMBOL, "market", "sell", Decimal("0.3") * (1 - Decimal("0.001"))
+            )
+        _assert_same_state(ref, fast)
+        assert not fast.short_positions
+        assert fast.balance.base_f == 0.0
+
+    async def test_insufficient_balance_matches(self):
+        ref, fast = _pair(initial_balance_quote=Decimal("100"))
+        results = await _both(ref, fast, "create_order", SYMBOL, "market", "buy", Decimal("1"))
+        assert results[0] is Exception and results[1] is Exception
+        _assert_same_state(ref, fast)
+
+    async def test_decimal_views(self):
+        fast = FastMarketSimulator(symbol=SYMBOL)
+        assert isinstance(fast.balance.quote, Decimal)
+        assert isinstance(fast.get_portfolio_value(), Decimal)
+        assert isinstance(fast.current_price, Decimal)
+        assert fast.balance.can_buy(Decimal("0.1"), Decimal("45000"))
+
+
+class TestFastSimulatorParity:
+    """Randomized grid scenarios must match the Decimal simulator."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3, 4])
+    async def test_random_grid_session(self, seed):
+        rng = random.Random(seed)
+        ref, fast = _pair(
+            initial_balance_base=Decimal("0.5"),
+            initial_balance_quote=Decimal("20000"),
+            maker_fee=Decimal("0.0002"),
+            taker_fee=Decimal("0.00055"),
+        )
+        price = 45000.0
+        await _both(ref, fast, "set_price", Decimal(str(price)))
+
+        # 100-level grid around the start price
+        for level in range(1, 51):
+            for side, sign in (("buy", -1), ("sell", 1)):
+                level_price = Decimal(str(round(price * (1 + sign * 0.002 * level), 2)))
+                await _both(
+                    ref, fast, "create_order", SYMBOL, "limit", side, Decimal("0.01"), level_price
+                )
+
+        placed = [o["id"] for o in ref.get_open_orders()]
+        for _ in range(400):
+            o = price
+            c = max(1000.0, o * (1 + rng.gauss(0, 0.006)))
+            h = max(o, c) * (1 + abs(rng.gauss(0, 0.002)))
+            lo = min(o, c) * (1 - abs(rng.gauss(0, 0.002)))
+            candle = [Decimal(str(round(x, 2))) for x in (o, h, lo, c)]
+            await _both(ref, fast, "set_candle", *candle)
+            price = float(candle[3])
+
+            roll = rng.random()
+            if roll < 0.1:
+                side = rng.choice(["buy", "sell"])
+                await _both(ref, fast, "create_order", SYMBOL, "market", side, Decimal("0.02"))
+            elif roll < 0.3:
+                side = rng.choice(["buy", "sell"])
+                offset = rng.uniform(-0.01, 0.01)
+                limit = Decimal(str(round(price * (1 + offset), 2)))
+                amount = Decimal("0.01")
+                await _both(ref, fast, "create_order", SYMBOL, "limit", side, amount, limit)
+            elif roll < 0.35 and placed:
+                await _both(ref, fast, "cancel_order", placed.pop(rng.randrange(len(placed))))
+
+        _assert_same_state(ref, fast)
+        assert len(ref.get_trade_history()) > 50
+
+
+class TestEngineFastSimulatorMode:
+    async def test_multi_tf_engine_results_match(self):
+        from datetime import datetime
+
+        from bot.tests.backtesting.multi_tf_data_loader import MultiTimeframeDataLoader
+        from bot.tests.backtesting.multi_tf_engine import (
+            MultiTFBacktestConfig,
+            MultiTimeframeBacktestEngine,
+        )
+        from tests.strategies.test_base_strategy import ConcreteStrategy
+
+        random.seed(7)
+        data = MultiTimeframeDataLoader().load(
+            "BTC/USDT", datetime(2024, 1, 1), datetime(2024, 1, 4), trend="up"
+        )
+        results = []
+        for fast in (False, True):
+            config = MultiTFBacktestConfig(
+                warmup_bars=20, use_candle_sweep=True, fast_simulator=fast
+            )
+            engine = MultiTimeframeBacktestEngine(config=config)
+            results.append(await engine.run(ConcreteStrategy(), data))
+
+        ref, fast = results
+        assert ref.total_trades == fast.total_trades > 0
+        _assert_close(ref.final_balance, fast.final_balance)
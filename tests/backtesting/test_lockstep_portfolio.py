@@ -0,0 +1,122 @@
+"""Tests for LockstepPortfolioEngine — merged timeline with a shared capital pool."""
+
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bot.tests.backtesting.candle_store import CandleStore
+from bot.tests.backtesting.lockstep_portfolio import (
+    LockstepPortfolioEngine,
+    _BarWindow,
+    store_source,
+)
+from bot.tests.backtesting.orchestrator_engine import OrchestratorBacktestConfig
+from bot.tests.backtesting.portfolio_engine import PortfolioBacktestConfig
+from tests.backtesting.test_advanced_analytics import SimpleTestStrategy
+from tests.backtesting.test_candle_store import _frame
+
+
+def _pair_config(**kwargs) -> OrchestratorBacktestConfig:
+    defaults = {
+        "warmup_bars": 20,
+        "lookback": 50,
+        "enable_grid": True,
+        "enable_dca": False,
+        "enable_trend_follower": False,
+        "enable_smc": False,
+    }
+    return OrchestratorBacktestConfig(**{**defaults, **kwargs})
+
+
+def _engine(**strategy_kwargs) -> LockstepPortfolioEngine:
+    params = {"buy_every_n": 5, "tp_pct": Decimal("0.01"), "sl_pct": Decimal("0.01")}
+    params.update(strategy_kwargs)
+    engine = LockstepPortfolioEngine()
+    engine.register_strategy_factory("grid", lambda p: SimpleTestStrategy(**params))
+    return engine
+
+
+class TestSharedCapitalPool:
+    async def test_entries_compete_for_pool(self):
+        sources = {f"P{i}/USDT": _frame(200, seed=i) for i in range(4)}
+        cfg = PortfolioBacktestConfig(
+            max_total_exposure_pct=0.5,
+            per_pair_config=_pair_config(),
+        )
+        # Targets far away: every entry stays open, so the pool fills up
+        result = await _engine(tp_pct=Decimal("5"), sl_pct=Decimal("0.99")).run(sources, cfg)
+
+        pool = result.risk_summary["pool"]
+        # Entry sizes are floored to cents, so the pool stops just short of the cap
+        assert 4990 < pool["total_allocated"] <= 5000
+        assert sum(r.total_buy_orders for r in result.per_pair_results.values()) == 2
+        assert result.risk_summary["rejections"]["rejected_exposure"] > 0
+
+    async def test_portfolio_stop_loss_blocks_entries(self):
+        n = 300
+        crash = _frame(n, seed=3)
+        for column in ("open", "high", "low", "close"):
+            crash[column] = np.linspace(100, 20, n)
+        cfg = PortfolioBacktestConfig(
+            portfolio_stop_loss_pct=0.02,
+            per_pair_config=_pair_config(max_position_pct=Decimal("0.25")),
+        )
+        result = await _engine(sl_pct=Decimal("0.5")).run({"BTC/USDT": crash}, cfg)
+
+        assert result.risk_summary["halted"]
+        assert result.risk_summary["rejections"]["rejected_portfolio_halted"] > 0
+
+
+class TestMergedTimeline:
+    async def test_single_curve_over_union_of_timestamps(self):
+        early = _frame(120, start="2024-01-01 00:00", seed=1)
+        late = _frame(120, start="2024-01-01 05:00", seed=2)
+        result = await _engine().run(
+            {"A/USDT": early, "B/USDT": late},
+            PortfolioBacktestConfig(per_pair_config=_pair_config()),
+        )
+
+        curve = result.portfolio_equity_curve
+        assert len(curve) == len(early.index.union(late.index))
+        assert curve[0]["timestamp"] == "2024-01-01T00:00:00"
+        assert [c["timestamp"] for c in curve] == sorted(c["timestamp"] for c in curve)
+
+        pnl = sum(float(r.total_return) for r in result.per_pair_results.values())
+        assert curve[-1]["portfolio_value"] == pytest.approx(10000 + pnl, abs=1e-4)
+        expected = (curve[-1]["portfolio_value"] - 10000) / 100
+        assert result.portfolio_total_return_pct == pytest.approx(expected)
+        assert set(result.pair_correlation_matrix) == {"A/USDT", "B/USDT"}
+
+    async def test_chunked_store_source_matches_frame(self, tmp_path):
+        store = CandleStore(tmp_path)
+        frames = {"A/USDT": _frame(400, seed=5), "B/USDT": _frame(400, seed=6)}
+        for symbol, df in frames.items():
+            store.write(symbol, "5m", df)
+        cfg = PortfolioBacktestConfig(per_pair_config=_pair_config())
+
+        in_memory = await _engine().run(frames, cfg)
+        streamed = await _engine().run(
+            {s: store_source(store, s, chunk=pd.Timedelta(hours=3)) for s in frames}, cfg
+        )
+
+        assert streamed.portfolio_equity_curve == in_memory.portfolio_equity_curve
+        assert streamed.to_dict()["pairs"] == in_memory.to_dict()["pairs"]
+
+
+class TestBarWindow:
+    def test_aggregates_forming_bucket_and_stays_bounded(self):
+        hour = 3_600_000_000_000
+        window = _BarWindow(lookback=3, period_ns=hour)
+        m5 = hour // 12
+        for i in range(12 * 10 + 2):
+            window.push(i * m5, 1.0, 2.0 + i, 0.5, float(i), 1.0)
+
+        df = window.frame()
+        assert len(df) == 3
+        # Last row is the hour still forming: two 5m bars so far
+        assert df["volume"].tolist() == [12.0, 12.0, 2.0]
+        assert df["close"].iloc[-1] == 121.0
+        assert df["high"].iloc[-2] == 2.0 + 119
+        assert df.index[-1] == pd.Timestamp(10 * hour)
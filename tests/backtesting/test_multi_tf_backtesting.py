@@ -221,6 +221,35 @@ class TestGetContextAt:
         assert len(df_m15) == 30
 
 
+    @pytest.mark.parametrize("idx", [0, 5, 47, 200, 1000, -1])
+    def test_context_matches_mask_filtering(self, loader, data_7days, idx):
+        """Indexed windows equal the original `index <= ts` mask + tail."""
+        pos = idx % len(data_7days.m5)
+        current_ts = data_7days.m5.index[pos]
+        windows = loader.get_context_at(data_7days, base_index=pos, lookback=50)
+        for df, full in zip(windows, data_7days.as_tuple(), strict=True):
+            expected = full[full.index <= current_ts].tail(50)
+            pd.testing.assert_frame_equal(df, expected)
+
+    def test_m15_context_matches_mask_filtering(self, loader, data_7days):
+        current_ts = data_7days.m15.index[120]
+        windows = loader.get_context_at(data_7days, m15_index=120, lookback=40)
+        for df, full in zip(windows, data_7days.as_tuple(), strict=True):
+            expected = full[full.index <= current_ts].tail(40)
+            pd.testing.assert_frame_equal(df, expected)
+
+    def test_alignment_index_built_once(self, loader, data_7days):
+        first = data_7days.alignment_index()
+        loader.get_context_at(data_7days, base_index=300, lookback=20)
+        assert data_7days.alignment_index() is first
+        assert len(first.ends["d1"]) == len(data_7days.m5)
+        assert first.ends["m5"][-1] == len(data_7days.m5)
+
+    def test_context_out_of_range(self, loader, data_2days):
+        with pytest.raises(IndexError):
+            loader.get_context_at(data_2days, base_index=len(data_2days.m5), lookback=10)
+
+
 class TestDataLoaderTrends:
     """Test different trend modes."""
 
@@ -11,11 +11,13 @@ Tests cover:
 - per_pair_overrides propagation
 - Graceful handling when one pair fails
 - to_dict() serialisation
+- Process backend: parity with async, progress streaming, worker crashes
 """
 
 from __future__ import annotations
 
 import asyncio
+import os
 from decimal import Decimal
 from typing import Any
 
@@ -29,10 +31,12 @@ from bot.tests.backtesting.orchestrator_engine import (
     OrchestratorBacktestResult,
 )
 from bot.tests.backtesting.portfolio_engine import (
+    PairProgress,
     PortfolioBacktestConfig,
     PortfolioBacktestEngine,
     PortfolioBacktestResult,
 )
+from bot.tests.backtesting.process_executor import StrategySpec
 
 
 # ---------------------------------------------------------------------------
@@ -107,6 +111,13 @@ def _noop_factory():
     return NoOpStrategy()
 
 
+def make_noop_strategy(params: dict[str, Any]):
+    """Module-level factory so worker processes can import it by path."""
+    if params.get("crash"):
+        os._exit(1)  # simulate a worker dying mid-run
+    return _noop_factory()
+
+
 def _make_engine() -> PortfolioBacktestEngine:
     engine = PortfolioBacktestEngine()
     engine.register_strategy_factory("grid", lambda p: _noop_factory())
@@ -455,3 +466,103 @@ class TestPortfolioBacktestResultToDict:
         pair_entry = d["pairs"]["BTC/USDT"]
         assert "total_return_pct" in pair_entry
         assert "total_trades" in pair_entry
+
+
+# ---------------------------------------------------------------------------
+# Process backend
+# ---------------------------------------------------------------------------
+
+
+def _process_engine() -> PortfolioBacktestEngine:
+    engine = PortfolioBacktestEngine()
+    engine.register_strategy_factory("grid", StrategySpec(f"{__name__}:make_noop_strategy"))
+    return engine
+
+
+class TestProcessBackend:
+    @pytest.mark.asyncio
+    async def test_matches_async_backend_and_reports_progress(self) -> None:
+        symbols = ["BTC/USDT", "ETH/USDT", "SOL/USDT"]
+        data_map = {s: _tiny_data(seed=70 + i) for i, s in enumerate(symbols)}
+        progress: list[PairProgress] = []
+
+        async_result = await _process_engine().run(
+            data_map,
+            PortfolioBacktestConfig(per_pair_config=_base_pair_config()),
+        )
+        process_result = await _process_engine().run(
+            data_map,
+            PortfolioBacktestConfig(
+                per_pair_config=_base_pair_config(), backend="process", max_workers=2
+            ),
+            on_pair=progress.append,
+        )
+
+        assert list(process_result.per_pair_results) == symbols
+        assert process_result.portfolio_equity_curve == async_result.portfolio_equity_curve
+        assert process_result.pair_correlation_matrix == async_result.pair_correlation_matrix
+        assert sorted(p.symbol for p in progress) == sorted(symbols)
+        assert [p.completed for p in progress] == [1, 2, 3]
+        assert all(p.total == 3 and p.result is not None for p in progress)
+
+    @pytest.mark.asyncio
+    async def test_worker_crash_keeps_other_pairs(self) -> None:
+        symbols = ["BTC/USDT", "BAD/USDT", "ETH/USDT", "SOL/USDT"]
+        data_map = {s: _tiny_data(seed=80 + i) for i, s in enumerate(symbols)}
+        progress: list[PairProgress] = []
+        cfg = PortfolioBacktestConfig(
+            per_pair_config=_base_pair_config(),
+            per_pair_overrides={"BAD/USDT": {"grid_params": {"crash": True}}},
+            backend="process",
+            max_workers=2,
+        )
+
+        result = await _process_engine().run(data_map, cfg, on_pair=progress.append)
+
+        assert list(result.per_pair_results) == ["BTC/USDT", "ETH/USDT", "SOL/USDT"]
+        failed = [p for p in progress if p.error is not None]
+        assert [p.symbol for p in failed] == ["BAD/USDT"]
+        assert len(progress) == 4
+
+    @pytest.mark.asyncio
+    async def test_unknown_backend_rejected(self) -> None:
+        cfg = PortfolioBacktestConfig(backend="threads")
+        with pytest.raises(ValueError, match="Unknown backend"):
+            await _make_engine().run({"BTC/USDT": _tiny_data()}, cfg)
+
+
+class TestVectorizedMerge:
+    def test_merge_sums_shared_timestamps(self) -> None:
+        def result(points):
+            r = OrchestratorBacktestResult.__new__(OrchestratorBacktestResult)
+            r.equity_curve = [{"timestamp": t, "portfolio_value": v} for t, v in points]
+            return r
+
+        merged = PortfolioBacktestEngine()._merge_equity_curves(
+            {
+                "A": result([("t1", 1.0), ("t2", 2.0)]),
+                "B": result([("t2", 5.0), ("t3", 7.0)]),
+            }
+        )
+        assert merged == [
+            {"timestamp": "t1", "portfolio_value": 1.0},
+            {"timestamp": "t2", "portfolio_value": 7.0},
+            {"timestamp": "t3", "portfolio_value": 7.0},
+        ]
+
+    def test_correlation_handles_flat_and_unequal_series(self) -> None:
+        def result(values):
+            r = OrchestratorBacktestResult.__new__(OrchestratorBacktestResult)
+            r.equity_curve = [{"timestamp": i, "portfolio_value": v} for i, v in enumerate(values)]
+            return r
+
+        matrix = PortfolioBacktestEngine()._compute_correlation_matrix(
+            {
+                "UP": result([100, 101, 103, 102, 105]),
+                "SAME": result([50, 50.5, 51.5, 51, 52.5, 60]),
+                "FLAT": result([10, 10, 10, 10]),
+            }
+        )
+        assert matrix["UP"]["SAME"] == matrix["SAME"]["UP"] == 1.0
+        assert matrix["UP"]["FLAT"] == 0.0
+        assert matrix["FLAT"]["FLAT"] == 1.0
@@ -0,0 +1,215 @@
+"""Tests for the process-pool optimization backend."""
+
+import pickle
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from bot.tests.backtesting.checkpoint import OptimizationCheckpoint
+from bot.tests.backtesting.multi_tf_engine import MultiTFBacktestConfig
+from bot.tests.backtesting.optimization import (
+    OptimizationConfig,
+    OptimizationTrial,
+    ParameterOptimizer,
+)
+from bot.tests.backtesting.orchestrator_engine import OrchestratorBacktestConfig
+from bot.tests.backtesting.process_executor import ProcessTrialExecutor, StrategySpec
+from bot.tests.backtesting.walk_forward import WalkForwardAnalysis, WalkForwardConfig
+from tests.backtesting.test_advanced_analytics import SimpleTestStrategy, _load_test_data
+
+SPEC_PATH = f"{__name__}:make_simple_strategy"
+
+
+def make_simple_strategy(params: dict[str, Any]) -> SimpleTestStrategy:
+    """Module-level factory so workers can import it by path."""
+    return SimpleTestStrategy(
+        tp_pct=Decimal(str(params.get("tp_pct", 0.01))),
+        sl_pct=Decimal(str(params.get("sl_pct", 0.02))),
+        buy_every_n=params.get("buy_every_n", 10),
+        name=params.get("name", "simple-test"),
+    )
+
+
+async def _echo_job(data: Any, value: int) -> tuple[Any, int]:
+    return data, value * 2
+
+
+async def _failing_job(data: Any) -> None:
+    raise RuntimeError("boom")
+
+
+def _optimizer(backend: str, **kwargs: Any) -> ParameterOptimizer:
+    return ParameterOptimizer(
+        config=OptimizationConfig(
+            backtest_config=MultiTFBacktestConfig(warmup_bars=20),
+            backend=backend,
+        ),
+        **kwargs,
+    )
+
+
+GRID = {"tp_pct": [0.005, 0.01, 0.02], "sl_pct": [0.01, 0.02]}
+
+
+class TestStrategySpec:
+    def test_call_merges_params(self):
+        spec = StrategySpec(SPEC_PATH, {"name": "spec", "tp_pct": 0.5})
+        strategy = spec({"tp_pct": 0.03})
+        assert strategy.get_strategy_name() == "spec"
+        assert strategy._tp_pct == Decimal("0.03")
+
+    def test_picklable(self):
+        spec = StrategySpec(SPEC_PATH, {"buy_every_n": 5})
+        assert pickle.loads(pickle.dumps(spec)) == spec
+
+    def test_invalid_path(self):
+        with pytest.raises(ValueError):
+            StrategySpec("no_colon_here").resolve()
+
+
+class TestProcessTrialExecutor:
+    async def test_stream_uses_worker_data(self):
+        with ProcessTrialExecutor({"shared": True}, max_workers=2) as executor:
+            got = {
+                key: value
+                async for key, value in executor.stream((i, _echo_job, (i,)) for i in range(5))
+            }
+        assert got == {i: ({"shared": True}, i * 2) for i in range(5)}
+
+    async def test_job_errors_propagate(self):
+        with ProcessTrialExecutor(None, max_workers=1) as executor:
+            with pytest.raises(RuntimeError, match="boom"):
+                async for _ in executor.stream([("k", _failing_job, ())]):
+                    pass
+
+
+class TestProcessBackend:
+    async def test_matches_thread_backend(self):
+        data = _load_test_data(days=2)
+        spec = StrategySpec(SPEC_PATH)
+
+        threaded = await _optimizer("thread").optimize(spec, GRID, data)
+        processed = await _optimizer("process").optimize(spec, GRID, data, max_workers=2)
+
+        def by_params(result):
+            return {
+                (t.params["tp_pct"], t.params["sl_pct"]): t.objective_value
+                for t in result.all_trials
+            }
+
+        assert len(processed.all_trials) == 6
+        assert by_params(processed) == by_params(threaded)
+        assert processed.best_objective == threaded.best_objective
+
+    async def test_streams_trials_and_checkpoints(self, tmp_path):
+        data = _load_test_data(days=2)
+        checkpoint = OptimizationCheckpoint(tmp_path)
+        saved: list[str] = []
+        checkpoint.save_trial = lambda run_id, tid, h, result: saved.append(h)
+        streamed: list[OptimizationTrial] = []
+
+        result = await _optimizer("process", checkpoint=checkpoint).optimize(
+            StrategySpec(SPEC_PATH),
+            GRID,
+            data,
+            max_workers=2,
+            on_trial=streamed.append,
+        )
+        assert len(streamed) == len(result.all_trials) == 6
+        assert sorted(saved) == sorted(
+            OptimizationCheckpoint.config_hash(t.params) for t in result.all_trials
+        )
+
+    async def test_cancel_keeps_completed_trials(self):
+        data = _load_test_data(days=2)
+        optimizer = _optimizer("process")
+
+        def stop_after_first(trial: OptimizationTrial) -> None:
+            optimizer.cancel()
+
+        result = await optimizer.optimize(
+            StrategySpec(SPEC_PATH),
+            GRID,
+            data,
+            max_workers=2,
+            on_trial=stop_after_first,
+        )
+        assert 1 <= len(result.all_trials) < 6
+
+    async def test_optimize_orchestrator(self):
+        data = _load_test_data(days=2)
+        template = OrchestratorBacktestConfig(
+            warmup_bars=20,
+            enable_grid=False,
+            enable_trend_follower=False,
+            enable_smc=False,
+        )
+        grid = {"dca_trigger_pct": [0.03, 0.05]}
+
+        threaded_opt, process_opt = _optimizer("thread"), _optimizer("process")
+        for optimizer in (threaded_opt, process_opt):
+            optimizer.register_strategy_factory("dca", StrategySpec(SPEC_PATH))
+
+        threaded = await threaded_opt.optimize_orchestrator(grid, data, template)
+        processed = await process_opt.optimize_orchestrator(grid, data, template, max_workers=2)
+        assert sorted(t.objective_value for t in processed.all_trials) == sorted(
+            t.objective_value for t in threaded.all_trials
+        )
+
+    async def test_optimize_orchestrator_resumes_from_checkpoint(self, tmp_path):
+        data = _load_test_data(days=2)
+        template = OrchestratorBacktestConfig(
+            warmup_bars=20,
+            enable_grid=False,
+            enable_trend_follower=False,
+            enable_smc=False,
+        )
+        grid = {"dca_trigger_pct": [0.02, 0.03, 0.05, 0.07]}
+        optimizer = _optimizer("process", checkpoint=OptimizationCheckpoint(tmp_path))
+        optimizer.register_strategy_factory("dca", StrategySpec(SPEC_PATH))
+
+        def stop_after_first(trial: OptimizationTrial) -> None:
+            optimizer.cancel()
+
+        first = await optimizer.optimize_orchestrator(
+            grid, data, template, max_workers=2, on_trial=stop_after_first
+        )
+        assert 1 <= len(first.all_trials) < 4
+        assert len(list(tmp_path.glob("opt_orchestrator-*.jsonl"))) == 1
+
+        second = await optimizer.optimize_orchestrator(grid, data, template, max_workers=2)
+        done = {t.params["dca_trigger_pct"] for t in first.all_trials}
+        assert {t.params["dca_trigger_pct"] for t in second.all_trials} == set(
+            grid["dca_trigger_pct"]
+        ) - done
+        assert not list(tmp_path.glob("*.jsonl"))
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            _optimizer("gpu")
+
+
+class TestWalkForwardProcessBackend:
+    async def test_matches_async_backend(self):
+        data = _load_test_data(days=4)
+
+        def wf(backend: str) -> WalkForwardAnalysis:
+            return WalkForwardAnalysis(
+                config=WalkForwardConfig(
+                    n_splits=3,
+                    scheme="anchored",
+                    backtest_config=MultiTFBacktestConfig(warmup_bars=50),
+                    backend=backend,
+                    max_workers=2,
+                )
+            )
+
+        sequential = await wf("async").run(make_simple_strategy({}), data)
+        parallel = await wf("process").run(StrategySpec(SPEC_PATH), data)
+
+        assert [w.window_index for w in parallel.windows] == [0, 1, 2]
+        assert [w.test_result.equity_curve for w in parallel.windows] == [
+            w.test_result.equity_curve for w in sequential.windows
+        ]
+        assert parallel.aggregate_test_return_pct == sequential.aggregate_test_return_pct
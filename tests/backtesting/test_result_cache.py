@@ -0,0 +1,126 @@
+"""Tests for the content-addressed ResultCache."""
+
+from decimal import Decimal
+
+from bot.tests.backtesting.multi_tf_engine import MultiTFBacktestConfig
+from bot.tests.backtesting.optimization import OptimizationConfig, ParameterOptimizer
+from bot.tests.backtesting.result_cache import ResultCache, dataset_fingerprint
+from tests.backtesting.test_advanced_analytics import SimpleTestStrategy, _load_test_data
+
+_built: list[dict] = []
+
+
+def _strategy(params: dict) -> SimpleTestStrategy:
+    _built.append(params)
+    return SimpleTestStrategy(**params)
+
+
+def _cache(path=":memory:", **kwargs) -> ResultCache:
+    cache = ResultCache(path, **kwargs)
+    cache.initialize()
+    return cache
+
+
+class TestKeys:
+    def test_key_is_canonical(self):
+        cache = _cache()
+        data = _load_test_data(days=1)
+        config = MultiTFBacktestConfig(warmup_bars=20)
+
+        key = cache.key(data, _strategy, {"a": 1, "b": Decimal("0.5")}, config)
+        assert key == cache.key(data, _strategy, {"b": Decimal("0.5"), "a": 1}, config)
+        fingerprint = dataset_fingerprint(data)
+        assert key == cache.key(fingerprint, _strategy, {"b": Decimal("0.5"), "a": 1}, config)
+        assert key != cache.key(data, _strategy, {"a": 2, "b": Decimal("0.5")}, config)
+        assert key != cache.key(
+            data, _strategy, {"a": 1, "b": Decimal("0.5")}, MultiTFBacktestConfig(warmup_bars=21)
+        )
+        assert key != ResultCache(namespace="v2").key(data, _strategy, {"a": 1}, config)
+
+    def test_fingerprint_covers_every_value(self):
+        data = _load_test_data(days=1)
+        before = dataset_fingerprint(data)
+        data.h1 = data.h1.copy()
+        data.h1.iloc[3, 0] += 1e-9
+        assert dataset_fingerprint(data) != before
+
+    def test_closures_are_not_cached(self):
+        cache = _cache()
+        key = cache.key(_load_test_data(days=1), lambda p: SimpleTestStrategy(**p), {})
+        assert key is None
+        cache.put(key, "ignored")
+        assert cache.get(key) is None
+        assert cache.report()["entries"] == 0
+        assert cache.stats["uncacheable"] == 1
+
+
+class TestStore:
+    def test_lru_eviction_by_size(self):
+        cache = _cache(max_bytes=3 * 1100)
+        for key in ("a", "b", "c"):
+            cache.put(key, b"x" * 1000)
+        assert cache.get("a") is not None  # "b" is now least recently used
+        cache.put("d", b"x" * 1000)
+
+        assert "b" not in cache
+        assert all(k in cache for k in ("a", "c", "d"))
+        assert cache.stats["evictions"] == 1
+        assert cache.report()["bytes"] <= cache.max_bytes
+
+    def test_shared_between_instances(self, tmp_path):
+        path = tmp_path / "cache.db"
+        with _cache(path) as writer:
+            writer.put("k", {"total_return_pct": Decimal("1.5")})
+        with _cache(path) as reader:
+            assert reader.get("k") == {"total_return_pct": Decimal("1.5")}
+            assert reader.get("missing") is None
+            report = reader.report()
+
+        assert report["session"] == {
+            "hits": 1,
+            "misses": 1,
+            "uncacheable": 0,
+            "evictions": 0,
+            "hit_rate": 0.5,
+        }
+        assert report["total"]["hits"] == 1
+        assert report["entries"] == 1
+
+    def test_reads_do_not_commit(self, tmp_path):
+        path = tmp_path / "cache.db"
+        with _cache(path) as writer:
+            writer.put("k", 1)
+        with _cache(path) as reader, _cache(path) as observer:
+            assert reader.get("k") == 1
+            assert reader.get("missing") is None
+            assert not reader._conn.in_transaction
+            assert observer.report()["total"]["hits"] == 0
+
+            reader.put("other", 2)
+            total = observer.report()["total"]
+            assert (total["hits"], total["misses"]) == (1, 1)
+
+
+class TestOptimizerCache:
+    async def test_rerun_is_served_from_cache(self, tmp_path):
+        data = _load_test_data(days=1)
+        grid = {"buy_every_n": [5, 10, 20], "tp_pct": [Decimal("0.01"), Decimal("0.02")]}
+        config = OptimizationConfig(backtest_config=MultiTFBacktestConfig(warmup_bars=20))
+
+        async def run():
+            with _cache(tmp_path / "cache.db") as cache:
+                optimizer = ParameterOptimizer(config=config, cache=cache)
+                result = await optimizer.two_phase_optimize(_strategy, grid, data, coarse_steps=2)
+                return result, cache.stats
+
+        _built.clear()
+        first, first_stats = await run()
+        n_built = len(_built)
+        second, second_stats = await run()
+
+        assert n_built == first_stats["misses"] > 0
+        assert len(_built) == n_built  # nothing re-run
+        assert second_stats["misses"] == 0
+        assert second_stats["hits"] == len(second.all_trials) == len(first.all_trials)
+        assert second.best_params == first.best_params
+        assert second.best_result.to_dict() == first.best_result.to_dict()
@@ -9,6 +9,7 @@ from sqlalchemy import BigInteger
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.ext.compiler import compiles
 
+from bot.api.rate_limiter import rate_limiters
 from bot.database.models import Base
 
 
@@ -27,6 +28,14 @@ def event_loop() -> Generator:
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def _isolated_rate_limiters() -> Generator:
+    """Give every test fresh per-API-key rate limiters."""
+    rate_limiters.clear()
+    yield
+    rate_limiters.clear()
+
+
 @pytest.fixture
 async def test_db_engine() -> AsyncGenerator[AsyncEngine, None]:
     """Create a fresh in-memory database engine per test for full isolation."""
@@ -115,3 +115,32 @@ async def test_multiple_bots(db: DatabaseManager):
     c = await db.load_state_snapshot("bot_c")
     assert a.grid_state == "state_bot_a"
     assert c.grid_state == "state_bot_c"
+
+
+@pytest.mark.asyncio
+async def test_partial_sections_keep_stored_values(db: DatabaseManager):
+    await db.save_state_snapshot(
+        BotStateSnapshot(
+            bot_name="bot1",
+            bot_state="running",
+            grid_state="grid-v1",
+            dca_state="dca-v1",
+            saved_at=datetime.now(timezone.utc),
+        )
+    )
+    saved = await db.save_state_snapshot(
+        BotStateSnapshot(
+            bot_name="bot1",
+            bot_state="paused",
+            grid_state="grid-v2",
+            saved_at=datetime.now(timezone.utc),
+        ),
+        sections=["grid_state"],
+    )
+    assert saved.id is not None
+    assert saved.grid_state == "grid-v2"
+
+    loaded = await db.load_state_snapshot("bot1")
+    assert loaded.grid_state == "grid-v2"
+    assert loaded.dca_state == "dca-v1"
+    assert loaded.bot_state == "paused"
@@ -0,0 +1,184 @@
+"""Tests for the WriteBuffer write-behind queue and DatabaseManager integration."""
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from bot.database.manager import DatabaseManager
+from bot.database.models import Base, Bot, BotLog, ExchangeCredential, Order, Trade
+from bot.database.write_buffer import WriteBuffer
+from bot.monitoring.metrics_collector import MetricsCollector
+from bot.monitoring.metrics_exporter import MetricsExporter
+
+
+async def _seed_bot(session_factory) -> int:
+    async with session_factory() as session:
+        cred = ExchangeCredential(
+            name="wb", exchange_id="bybit", api_key_encrypted="k", api_secret_encrypted="s"
+        )
+        session.add(cred)
+        await session.flush()
+        bot = Bot(
+            name="wb-bot",
+            credentials_id=cred.id,
+            symbol="BTCUSDT",
+            strategy="grid",
+            config_data="{}",
+        )
+        session.add(bot)
+        await session.commit()
+        return bot.id
+
+
+def _order(bot_id: int, i: int) -> Order:
+    return Order(
+        bot_id=bot_id,
+        exchange_order_id=f"WB-{i:04d}",
+        symbol="BTCUSDT",
+        order_type="limit",
+        side="buy",
+        price=Decimal("45000") + i,
+        amount=Decimal("0.001"),
+    )
+
+
+@pytest_asyncio.fixture
+async def factory():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def _count(factory, model) -> int:
+    async with factory() as session:
+        return (await session.execute(select(func.count()).select_from(model))).scalar()
+
+
+class TestWriteBuffer:
+    async def test_flush_assigns_ids_in_order(self, factory):
+        bot_id = await _seed_bot(factory)
+        buffer = WriteBuffer(factory)
+        orders = [_order(bot_id, i) for i in range(5)]
+        log = BotLog(bot_id=bot_id, level="INFO", message="filled")
+        for order in orders:
+            await buffer.put(order)
+        await buffer.put(log)
+
+        # Defaults are applied at submission, ids only after the commit
+        assert orders[0].status == "open" and orders[0].created_at is not None
+        assert orders[0].id is None
+        assert await buffer.flush() == 6
+
+        assert [o.id for o in orders] == sorted(o.id for o in orders)
+        assert log.id is not None
+        async with factory() as session:
+            stored = (await session.execute(select(Order).order_by(Order.id))).scalars().all()
+        assert [o.exchange_order_id for o in stored] == [o.exchange_order_id for o in orders]
+        assert buffer.stats.rows_written == 6
+        assert buffer.stats.flushes == 1
+        assert buffer.pending == 0
+
+    async def test_background_flush_and_drain_on_stop(self, factory):
+        bot_id = await _seed_bot(factory)
+        buffer = WriteBuffer(factory, batch_size=10, flush_interval=0.05)
+        await buffer.start()
+        for i in range(3):
+            await buffer.put(_order(bot_id, i))
+        await asyncio.sleep(0.2)
+        assert await _count(factory, Order) == 3
+
+        for i in range(3, 25):  # crosses batch_size: flushed without waiting the interval
+            await buffer.put(_order(bot_id, i))
+        await buffer.stop()
+        assert await _count(factory, Order) == 25
+        assert not buffer.is_running
+
+    async def test_backpressure_when_full(self, factory):
+        bot_id = await _seed_bot(factory)
+        buffer = WriteBuffer(factory, max_pending=4, flush_interval=0.05)
+        await buffer.start()
+        await asyncio.gather(*(buffer.put(_order(bot_id, i)) for i in range(20)))
+        await buffer.stop()
+
+        stats = buffer.stats
+        assert stats.backpressure_waits > 0
+        assert stats.pending == 0
+        assert stats.rows_written == 20
+        assert await _count(factory, Order) == 20
+
+    async def test_failed_flush_keeps_rows(self, factory):
+        bot_id = await _seed_bot(factory)
+        buffer = WriteBuffer(factory)
+        good = _order(bot_id, 1)
+        bad = Trade(bot_id=bot_id, symbol="BTCUSDT", side="buy", price=Decimal("1"))
+        await buffer.put(good)
+        await buffer.put(bad)
+
+        with pytest.raises(IntegrityError):
+            await buffer.flush()
+        assert buffer.pending == 2
+        assert buffer.stats.flush_errors == 1
+        assert good.id is None
+        assert await _count(factory, Order) == 0  # the whole flush rolled back
+
+        bad.exchange_trade_id = "T-1"
+        bad.exchange_order_id = good.exchange_order_id
+        bad.amount = Decimal("0.001")
+        bad.fee_currency = "USDT"
+        bad.executed_at = good.created_at
+        assert await buffer.flush() == 2
+        assert good.id is not None and bad.id is not None
+
+
+class TestDatabaseManagerWriteBehind:
+    async def test_reads_see_queued_writes(self, tmp_path):
+        db = DatabaseManager(
+            f"sqlite+aiosqlite:///{tmp_path / 'wb.db'}",
+            pool_pre_ping=False,
+            write_behind=True,
+            write_flush_interval=60,
+        )
+        await db.initialize()
+        await db.create_all_tables()
+        bot_id = await _seed_bot(db._session_factory)
+
+        order = await db.create_order(_order(bot_id, 1))
+        await db.create_log(BotLog(bot_id=bot_id, level="INFO", message="hi"))
+        assert order.id is None
+        assert db.write_buffer.pending == 2
+
+        orders = await db.get_bot_orders(bot_id)
+        assert [o.id for o in orders] == [order.id]
+        assert db.write_buffer.pending == 0
+
+        order.status = "closed"
+        await db.update_order(order)
+        last = await db.create_log(BotLog(bot_id=bot_id, level="INFO", message="bye"))
+        buffer = db.write_buffer
+        await db.close()
+        assert last.id is not None
+        assert buffer.stats.rows_written == 3
+
+    async def test_collector_exports_buffer_metrics(self, factory):
+        bot_id = await _seed_bot(factory)
+        buffer = WriteBuffer(factory)
+        await buffer.put(_order(bot_id, 1))
+        await buffer.put(_order(bot_id, 2))
+        exporter = MetricsExporter()
+        collector = MetricsCollector(exporter=exporter, write_buffer=buffer)
+
+        await collector.collect_all()
+        assert "traderagent_db_write_queue_depth 2.0" in exporter.format_metrics()
+        await buffer.flush()
+        await collector.collect_all()
+        text = exporter.format_metrics()
+        assert "traderagent_db_write_queue_depth 0.0" in text
+        assert "traderagent_db_rows_written_total 2.0" in text
+        assert "# TYPE traderagent_db_flush_seconds gauge" in text
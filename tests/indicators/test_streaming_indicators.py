@@ -0,0 +1,281 @@
+"""Tests for streaming indicators — equivalence with the pandas implementations."""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bot.indicators import (
+    IndicatorStream,
+    RollingPercentile,
+    RollingWindow,
+    StreamingADX,
+    StreamingATR,
+    StreamingBollinger,
+    StreamingEMA,
+    StreamingRSI,
+    StreamingVolumeRatio,
+)
+from bot.orchestrator.market_regime import MarketRegimeDetector
+from bot.strategies.trend_follower.market_analyzer import MarketAnalyzer
+
+TOL = 1e-9
+
+
+def _make_ohlcv(n: int = 400, seed: int = 3, base: float = 45000.0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = base + np.cumsum(rng.normal(0, 40, n))
+    high = close + rng.uniform(5, 60, n)
+    low = close - rng.uniform(5, 60, n)
+    open_ = close + rng.normal(0, 10, n)
+    volume = rng.uniform(100, 1000, n)
+    return pd.DataFrame(
+        {"open": open_, "high": high, "low": low, "close": close, "volume": volume},
+        index=pd.date_range("2024-01-01", periods=n, freq="1h"),
+    )
+
+
+def _assert_series_close(streamed: list[float], expected: pd.Series, rel: float = TOL) -> None:
+    assert len(streamed) == len(expected)
+    for got, want in zip(streamed, expected, strict=True):
+        if pd.isna(want):
+            assert math.isnan(got)
+        else:
+            assert got == pytest.approx(float(want), rel=rel, abs=1e-9)
+
+
+@pytest.fixture
+def df():
+    return _make_ohlcv()
+
+
+class TestPrimitives:
+    def test_ema_matches_pandas(self, df):
+        ema = StreamingEMA(20)
+        streamed = [ema.update(x) for x in df["close"]]
+        _assert_series_close(streamed, df["close"].ewm(span=20, adjust=False).mean())
+
+    def test_rolling_window_matches_pandas(self, df):
+        window = RollingWindow(20)
+        means, stds = [], []
+        for x in df["close"]:
+            window.update(float(x))
+            means.append(window.mean)
+            stds.append(window.std)
+        _assert_series_close(means, df["close"].rolling(20).mean())
+        _assert_series_close(stds, df["close"].rolling(20).std(), rel=1e-7)
+
+    def test_rolling_window_no_drift_on_long_stream(self):
+        rng = np.random.default_rng(0)
+        values = 1e6 + np.cumsum(rng.normal(0, 1, 50_000))
+        window = RollingWindow(20)
+        for x in values:
+            window.update(float(x))
+        assert window.mean == pytest.approx(values[-20:].mean(), rel=1e-12)
+        assert window.std == pytest.approx(values[-20:].std(ddof=1), rel=1e-6)
+
+    def test_invalid_periods(self):
+        with pytest.raises(ValueError):
+            RollingWindow(0)
+        with pytest.raises(ValueError):
+            StreamingEMA()
+        with pytest.raises(ValueError):
+            StreamingATR(14, smoothing="hull")
+
+    def test_rolling_percentile(self):
+        pct = RollingPercentile(size=4)
+        for x in [1.0, 5.0, 3.0, 2.0, 4.0]:
+            pct.update(x)
+        # Window is [5, 3, 2, 4]
+        assert len(pct) == 4
+        assert pct.rank_pct(3.0) == pytest.approx(50.0)
+        assert pct.rank_pct(1.0) == 0.0
+        pct.update(float("nan"))
+        assert len(pct) == 4
+
+
+class TestRegimeDetectorEquivalence:
+    """Streamed values equal MarketRegimeDetector's pandas calculations."""
+
+    def test_atr_sma(self, df):
+        atr = StreamingATR(14)
+        streamed = [
+            atr.update(h, lo, c)
+            for h, lo, c in zip(df["high"], df["low"], df["close"], strict=True)
+        ]
+        expected = MarketRegimeDetector._calculate_atr(df["high"], df["low"], df["close"], 14)
+        _assert_series_close(streamed, expected)
+
+    def test_atr_wilder(self, df):
+        atr = StreamingATR(14, smoothing="wilder")
+        streamed = [
+            atr.update(h, lo, c)
+            for h, lo, c in zip(df["high"], df["low"], df["close"], strict=True)
+        ]
+        prev = df["close"].shift(1)
+        tr = pd.concat(
+            [df["high"] - df["low"], (df["high"] - prev).abs(), (df["low"] - prev).abs()], axis=1
+        ).max(axis=1)
+        _assert_series_close(streamed, tr.ewm(alpha=1 / 14, adjust=False).mean())
+
+    def test_adx_and_di(self, df):
+        adx = StreamingADX(14)
+        streamed, plus, minus = [], [], []
+        for h, lo, c in zip(df["high"], df["low"], df["close"], strict=True):
+            streamed.append(adx.update(h, lo, c))
+            plus.append(adx.plus_di)
+            minus.append(adx.minus_di)
+        exp_adx, exp_plus, exp_minus = MarketRegimeDetector._calculate_adx(
+            df["high"], df["low"], df["close"], 14
+        )
+        _assert_series_close(streamed, exp_adx, rel=1e-8)
+        _assert_series_close(plus, exp_plus, rel=1e-8)
+        _assert_series_close(minus, exp_minus, rel=1e-8)
+
+    def test_bollinger(self, df):
+        bb = StreamingBollinger(20, 2.0)
+        upper, middle, lower, width = [], [], [], []
+        for c in df["close"]:
+            bb.update(float(c))
+            upper.append(bb.upper)
+            middle.append(bb.middle)
+            lower.append(bb.lower)
+            width.append(bb.width_pct)
+        exp = MarketRegimeDetector._calculate_bollinger_bands(df["close"], 20, 2.0)
+        for got, want in zip((upper, middle, lower, width), exp, strict=True):
+            _assert_series_close(got, want, rel=1e-7)
+
+    def test_volume_ratio(self, df):
+        vr = StreamingVolumeRatio(20)
+        avg, ratio = [], []
+        for v in df["volume"]:
+            vr.update(float(v))
+            avg.append(vr.average)
+            ratio.append(vr.value)
+        exp_avg, exp_ratio = MarketRegimeDetector._calculate_volume_ratio(df["volume"], 20)
+        _assert_series_close(avg, exp_avg)
+        _assert_series_close(ratio, exp_ratio)
+
+    def test_snapshot_matches_pandas_snapshot(self, df):
+        detector = MarketRegimeDetector()
+        stream = IndicatorStream(atr_percentile_window=len(df))
+        stream.seed(df)
+        got = stream.snapshot()
+        want = detector._snapshot_from_frame(df)
+        for field in (
+            "close",
+            "ema_fast",
+            "ema_slow",
+            "atr",
+            "atr_percentile",
+            "rsi_avg_gain",
+            "rsi_avg_loss",
+            "adx",
+            "plus_di",
+            "minus_di",
+            "bb_width_pct",
+            "avg_volume",
+            "volume_ratio",
+        ):
+            assert getattr(got, field) == pytest.approx(getattr(want, field), rel=1e-7), field
+
+    def test_incremental_detector_matches_batch_on_full_history(self, df):
+        batch = MarketRegimeDetector()
+        incremental = MarketRegimeDetector(incremental=True, atr_percentile_window=len(df))
+        for end in range(120, len(df) + 1, 7):
+            window = df.iloc[:end]
+            a = batch.analyze(window)
+            b = incremental.analyze(window)
+            assert a.regime == b.regime
+            assert a.adx == pytest.approx(b.adx, rel=1e-8)
+            assert a.rsi == pytest.approx(b.rsi, rel=1e-8)
+            assert a.atr_pct == pytest.approx(b.atr_pct, rel=1e-8)
+            assert a.volatility_percentile == pytest.approx(b.volatility_percentile)
+            assert a.analysis_details.keys() == b.analysis_details.keys()
+
+    def test_incremental_detector_rolling_windows_feed_only_new_bars(self, df):
+        detector = MarketRegimeDetector(incremental=True)
+        detector.analyze(df.iloc[0:200])
+        assert detector._stream.bars == 200
+        detector.analyze(df.iloc[5:205])
+        assert detector._stream.bars == 205
+        # Re-analyzing the same window feeds nothing
+        detector.analyze(df.iloc[5:205])
+        assert detector._stream.bars == 205
+
+
+class TestMarketAnalyzerEquivalence:
+    """Streamed values equal MarketAnalyzer's pandas calculations."""
+
+    def test_rsi(self, df):
+        analyzer = MarketAnalyzer()
+        rsi = StreamingRSI(14)
+        streamed = [rsi.update(float(c)) for c in df["close"]]
+        _assert_series_close(streamed, analyzer._calculate_rsi(df, 14), rel=1e-8)
+
+    def test_atr(self, df):
+        analyzer = MarketAnalyzer()
+        atr = StreamingATR(14)
+        streamed = [
+            atr.update(h, lo, c)
+            for h, lo, c in zip(df["high"], df["low"], df["close"], strict=True)
+        ]
+        _assert_series_close(streamed, analyzer._calculate_atr(df, 14))
+
+    def test_incremental_analyzer_matches_batch(self, df):
+        batch = MarketAnalyzer()
+        incremental = MarketAnalyzer(incremental=True)
+        for end in range(60, len(df) + 1, 11):
+            window = df.iloc[:end]
+            a = batch.analyze(window)
+            b = incremental.analyze(window)
+            assert a.phase == b.phase
+            assert float(a.ema_fast) == pytest.approx(float(b.ema_fast), rel=1e-9)
+            assert float(a.atr) == pytest.approx(float(b.atr), rel=1e-9)
+            assert float(a.rsi) == pytest.approx(float(b.rsi), rel=1e-8)
+
+
+class TestIndicatorStream:
+    def test_sync_reseeds_on_gap(self, df):
+        stream = IndicatorStream()
+        stream.sync(df.iloc[:100])
+        stream.sync(df.iloc[200:300])
+        assert stream.bars == 100
+        assert stream.last_timestamp == df.index[299]
+
+    def test_sync_with_timestamp_column(self, df):
+        frame = df.reset_index(names="timestamp")
+        stream = IndicatorStream()
+        stream.sync(frame.iloc[:100])
+        assert stream.sync(frame.iloc[50:150]) == 50
+        assert stream.bars == 150
+
+    def test_sync_without_timestamps_reseeds(self, df):
+        frame = df.reset_index(drop=True)
+        stream = IndicatorStream()
+        stream.sync(frame.iloc[:100])
+        assert stream.sync(frame.iloc[:120]) == 120
+        assert stream.bars == 120
+
+    def test_peek_does_not_commit(self, df):
+        stream = IndicatorStream()
+        stream.seed(df.iloc[:-1])
+        last = df.iloc[-1]
+        peeked = stream.peek(last["open"], last["high"], last["low"], last["close"], last["volume"])
+        assert stream.bars == len(df) - 1
+        stream.seed(df)
+        assert peeked.ema_fast == pytest.approx(stream.snapshot().ema_fast)
+
+    def test_sync_revises_forming_last_bar(self, df):
+        stream = IndicatorStream()
+        forming = df.iloc[:100].copy()
+        forming.iloc[-1, forming.columns.get_loc("close")] += 75.0
+        stream.sync(forming)
+
+        assert stream.sync(df.iloc[:101]) == 2
+        expected = IndicatorStream()
+        expected.seed(df.iloc[:101])
+        assert stream.snapshot() == expected.snapshot()
+        # An unchanged last bar is not re-fed
+        assert stream.sync(df.iloc[1:101]) == 0
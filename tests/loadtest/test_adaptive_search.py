@@ -0,0 +1,61 @@
+"""
+Adaptive search — successive halving, Hyperband and TPE against a full grid.
+
+Each method searches the same 30-combination space as the grid. Short-prefix
+rungs make a halving evaluation much cheaper than a full backtest, so the
+adaptive methods should spend well under the grid's budget while landing
+close to its best configuration.
+"""
+
+import time
+from decimal import Decimal
+
+from bot.tests.backtesting.adaptive_search import AdaptiveSearchConfig
+from bot.tests.backtesting.multi_tf_engine import MultiTFBacktestConfig
+from bot.tests.backtesting.optimization import OptimizationConfig, ParameterOptimizer
+from tests.backtesting.test_advanced_analytics import _load_test_data
+from tests.backtesting.test_result_cache import _strategy
+
+SPACE = {
+    "buy_every_n": [5, 10, 15, 20, 30],
+    "tp_pct": [Decimal("0.005"), Decimal("0.01"), Decimal("0.02")],
+    "sl_pct": [Decimal("0.01"), Decimal("0.02")],
+}
+
+
+class TestAdaptiveVsGrid:
+    async def test_adaptive_spends_less_than_grid(self):
+        data = _load_test_data(days=4)
+        optimizer = ParameterOptimizer(
+            config=OptimizationConfig(
+                backtest_config=MultiTFBacktestConfig(warmup_bars=50), objective="total_return_pct"
+            )
+        )
+
+        start = time.perf_counter()
+        grid = await optimizer.optimize(_strategy, SPACE, data)
+        grid_seconds = time.perf_counter() - start
+
+        searches = {
+            "halving": AdaptiveSearchConfig(n_configs=27, seed=0),
+            "hyperband": AdaptiveSearchConfig(method="hyperband", seed=0),
+            "bayesian": AdaptiveSearchConfig(method="bayesian", n_trials=12, seed=0),
+        }
+        print(
+            f"\nAdaptive search over {len(grid.all_trials)} combinations "
+            f"({len(data.m5)} M5 bars), grid {grid_seconds:.2f}s:"
+        )
+        for name, search in searches.items():
+            result = await optimizer.adaptive_optimize(_strategy, SPACE, data, search=search)
+            report = result.report(grid=grid, grid_seconds=grid_seconds)
+            print(
+                f"  {name:<9} evals {report['evaluations']:3d}"
+                f"  full-run eq {report['full_run_equivalents']:5.1f}"
+                f"  to best {report['trials_to_best']:3d}"
+                f" (grid {report['grid']['trials_to_best']:3d})"
+                f"  regret {report['grid']['regret']:7.3f}"
+                f"  {report['wall_clock_seconds']:5.2f}s ({report['grid']['speedup']}x)"
+            )
+
+            assert result.full_run_equivalents < len(grid.all_trials)
+            assert report["grid"]["regret"] <= abs(grid.best_objective) + 1.0
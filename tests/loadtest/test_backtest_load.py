@@ -12,13 +12,18 @@ from httpx import AsyncClient
 
 
 @pytest.fixture(autouse=True)
-def reset_backtest_state():
-    """Clear backtest jobs between tests."""
+def reset_backtest_state(tmp_path, monkeypatch):
+    """Clear backtest jobs between tests and keep the result cache out of the repo."""
     from web.backend.api.v1 import backtesting
+    from web.backend.config import web_config
 
+    monkeypatch.setattr(web_config, "backtest_cache_path", str(tmp_path / "backtest_cache.db"))
+    monkeypatch.setattr(backtesting, "_result_cache", None)
     backtesting._jobs.clear()
     yield
     backtesting._jobs.clear()
+    if backtesting._result_cache is not None:
+        backtesting._result_cache.close()
 
 
 def _backtest_payload(i: int = 0) -> dict:
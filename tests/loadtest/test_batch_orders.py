@@ -0,0 +1,89 @@
+"""
+Batch order placement — wall-clock time to place a 200-level grid.
+
+A local mock exchange answers every request after a fixed round-trip delay.
+Compares the old one-at-a-time loop with the bounded-concurrency fallback
+and the Bybit batch endpoint (20 orders per request on linear).
+"""
+
+import asyncio
+import time
+from decimal import Decimal
+from unittest.mock import patch
+
+from bot.api.batch_orders import OrderRequest, create_orders
+from bot.api.bybit_direct_client import ByBitDirectClient
+
+N_ORDERS = 200
+LATENCY = 0.02  # seconds per round trip
+
+
+class MockExchange:
+    def __init__(self) -> None:
+        self.requests = 0
+
+    async def create_order(self, symbol, order_type, side, amount, price=None, params=None):
+        self.requests += 1
+        await asyncio.sleep(LATENCY)
+        return {"id": f"o-{self.requests}"}
+
+
+def _grid() -> list[OrderRequest]:
+    return [
+        OrderRequest(
+            "BTC/USDT",
+            "buy" if i < N_ORDERS // 2 else "sell",
+            Decimal("0.001"),
+            Decimal(50000 + i * 10),
+        )
+        for i in range(N_ORDERS)
+    ]
+
+
+class TestBatchOrderPlacement:
+    async def test_batch_beats_serial(self):
+        requests = _grid()
+
+        serial = MockExchange()
+        start = time.perf_counter()
+        for r in requests:
+            await serial.create_order(
+                r.symbol, r.order_type, r.side, float(r.amount), float(r.price)
+            )
+        serial_time = time.perf_counter() - start
+
+        bounded = MockExchange()
+        start = time.perf_counter()
+        results = await create_orders(bounded, requests, concurrency=5)
+        bounded_time = time.perf_counter() - start
+        assert all(r.ok for r in results)
+
+        client = ByBitDirectClient(api_key="k", api_secret="s", testnet=True)
+        batch_calls = 0
+
+        async def batch_request(
+            method, endpoint, params=None, authenticated=True, full_response=False
+        ):
+            nonlocal batch_calls
+            batch_calls += 1
+            await asyncio.sleep(LATENCY)
+            batch = params["request"]
+            return {
+                "result": {"list": [{"orderId": f"b-{i}"} for i in range(len(batch))]},
+                "retExtInfo": {"list": [{"code": 0} for _ in batch]},
+            }
+
+        with patch.object(client, "_request", side_effect=batch_request):
+            start = time.perf_counter()
+            results = await create_orders(client, requests)
+            batch_time = time.perf_counter() - start
+        assert all(r.ok for r in results)
+
+        print(f"\n  Placing {N_ORDERS} orders at {LATENCY * 1000:.0f} ms/request:")
+        print(f"    serial:           {serial_time:.2f}s ({serial.requests} requests)")
+        print(f"    bounded (5):      {bounded_time:.2f}s ({bounded.requests} requests)")
+        print(f"    bybit batch:      {batch_time:.2f}s ({batch_calls} requests)")
+
+        assert batch_calls == N_ORDERS // 20
+        assert bounded_time < serial_time / 2
+        assert batch_time < bounded_time
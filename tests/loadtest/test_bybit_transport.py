@@ -0,0 +1,125 @@
+"""
+ByBitDirectClient transport benchmark — pooled keep-alive session vs a local mock server.
+
+Reports requests per second and connect / TTFB / total latency percentiles
+from the client's own histograms. No real exchange is contacted.
+"""
+
+import asyncio
+import time
+
+import pytest_asyncio
+from aiohttp import web
+
+from bot.api.bybit_direct_client import ByBitDirectClient
+from bot.api.http_transport import TransportConfig
+from bot.api.rate_limiter import Priority, RateLimiter, Route
+
+TICKERS = {
+    "retCode": 0,
+    "retMsg": "OK",
+    "result": {
+        "category": "linear",
+        "list": [
+            {"symbol": f"COIN{i}USDT", "lastPrice": "1.2345", "volume24h": "1000000"}
+            for i in range(50)
+        ],
+    },
+}
+
+
+@pytest_asyncio.fixture
+async def mock_server():
+    async def tickers(request: web.Request) -> web.Response:
+        await asyncio.sleep(0.001)
+        return web.json_response(TICKERS)
+
+    app = web.Application()
+    app.router.add_get("/v5/market/tickers", tickers)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+def _make_client(base_url: str, config: TransportConfig | None = None) -> ByBitDirectClient:
+    unlimited = RateLimiter({"global": (1e9, 1e9)}, {}, Route("global", 1.0, Priority.MARKET_DATA))
+    client = ByBitDirectClient(
+        api_key="dummy_key", api_secret="dummy_secret", rate_limiter=unlimited, transport=config
+    )
+    client.base_url = base_url
+    client._session = client.transport.create_session()
+    return client
+
+
+async def _run(client: ByBitDirectClient, requests: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with semaphore:
+            await client._request(
+                "GET", "/v5/market/tickers", {"category": "linear"}, authenticated=False
+            )
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return time.perf_counter() - start
+
+
+def _report(label: str, requests: int, elapsed: float, stats: dict) -> None:
+    print(f"\n  {label}: {requests / elapsed:.0f} req/s, codec={stats['json_codec']}")
+    for phase, hist in stats["latency"].items():
+        print(
+            f"    {phase:<8} p50={hist['p50'] * 1000:.2f}ms "
+            f"p90={hist['p90'] * 1000:.2f}ms p99={hist['p99'] * 1000:.2f}ms"
+        )
+
+
+class TestBybitTransport:
+    """Throughput and latency of the direct client's HTTP transport."""
+
+    async def test_pooled_throughput(self, mock_server):
+        """1000 requests at concurrency 32 reuse a bounded pool of connections."""
+        config = TransportConfig(limit_per_host=32)
+        client = _make_client(mock_server, config)
+        try:
+            elapsed = await _run(client, requests=1000, concurrency=32)
+        finally:
+            stats = client.transport.get_stats()
+            await client.close()
+
+        throughput = 1000 / elapsed
+        _report("pooled, 32 concurrent", 1000, elapsed, stats)
+        assert stats["latency"]["total"]["count"] == 1000
+        assert stats["connections_created"] <= config.limit_per_host
+        assert stats["connections_reused"] >= 1000 - config.limit_per_host
+        assert throughput > 200, f"Throughput too low: {throughput:.0f} req/s"
+
+    async def test_per_host_limit_bounds_connections(self, mock_server):
+        """A tight per-host limit queues requests instead of opening more sockets."""
+        client = _make_client(mock_server, TransportConfig(limit_per_host=4))
+        try:
+            elapsed = await _run(client, requests=200, concurrency=32)
+        finally:
+            stats = client.transport.get_stats()
+            await client.close()
+
+        _report("per-host limit 4", 200, elapsed, stats)
+        assert stats["connections_created"] <= 4
+        assert stats["latency"]["total"]["count"] == 200
+
+    async def test_sequential_keepalive_latency(self, mock_server):
+        """Back-to-back requests after the first skip connection setup entirely."""
+        client = _make_client(mock_server)
+        try:
+            elapsed = await _run(client, requests=200, concurrency=1)
+        finally:
+            stats = client.transport.get_stats()
+            await client.close()
+
+        _report("sequential keep-alive", 200, elapsed, stats)
+        assert stats["connections_created"] == 1
+        assert stats["latency"]["connect"]["p50"] < stats["latency"]["ttfb"]["p50"]
@@ -0,0 +1,81 @@
+"""
+Candle loading — row-by-row CSV parsing vs memory-mapped CandleStore.
+
+Builds two years of M5 candles, writes them as a downloader-style CSV and
+into a CandleStore, then reports MultiTimeframeData load times for the
+legacy DictReader path, the vectorized CSV reader and a store load.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from bot.tests.backtesting.candle_store import CandleStore
+from bot.tests.backtesting.multi_tf_data_loader import MultiTimeframeDataLoader
+from bot.tests.backtesting.test_data import HistoricalDataProvider
+
+N_BARS = 2 * 365 * 288  # two years of M5
+
+
+def _write_csv(path) -> pd.DataFrame:
+    rng = np.random.default_rng(11)
+    close = 45000 + np.cumsum(rng.normal(0, 20, N_BARS))
+    index = pd.date_range("2022-01-01", periods=N_BARS, freq="5min", name="timestamp")
+    df = pd.DataFrame(
+        {
+            "open": close + rng.normal(0, 5, N_BARS),
+            "high": close + 30,
+            "low": close - 30,
+            "close": close,
+            "volume": rng.uniform(10, 100, N_BARS),
+        },
+        index=index,
+    )
+    out = df.reset_index()
+    out.insert(0, "datetime", out.pop("timestamp").dt.strftime("%Y-%m-%dT%H:%M:%S"))
+    out.insert(0, "timestamp", index.asi8 // 1_000_000)
+    out.to_csv(path, index=False)
+    return df
+
+
+class TestCandleStoreLoad:
+    def test_store_vs_csv_load(self, tmp_path):
+        csv_path = tmp_path / "bybit_BTC_USDT_5m.csv"
+        _write_csv(csv_path)
+        loader = MultiTimeframeDataLoader()
+
+        start = time.perf_counter()
+        rows = HistoricalDataProvider().load_csv_data(str(csv_path))
+        legacy = loader._from_base(loader._candles_to_dataframe(rows), "5m")
+        legacy_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        vectorized = loader.load_csv(str(csv_path))
+        csv_s = time.perf_counter() - start
+
+        store = CandleStore(tmp_path / "store")
+        start = time.perf_counter()
+        store.import_csv(csv_path)
+        import_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        stored = loader.load_store(store, "BTC/USDT")
+        store_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sliced = loader.load_store(
+            store, "BTC/USDT", pd.Timestamp("2023-06-01"), pd.Timestamp("2023-07-01")
+        )
+        slice_s = time.perf_counter() - start
+
+        print(f"\nMultiTimeframeData load ({N_BARS} M5 bars):")
+        print(f"  DictReader CSV : {legacy_s:7.3f}s")
+        print(f"  vectorized CSV : {csv_s:7.3f}s")
+        print(f"  store import   : {import_s:7.3f}s (one-time)")
+        print(f"  store load     : {store_s:7.3f}s  ({legacy_s / store_s:.0f}x vs DictReader)")
+        print(f"  store 1 month  : {slice_s:7.3f}s")
+
+        assert len(stored.m5) == len(legacy.m5) == len(vectorized.m5) == N_BARS
+        assert len(sliced.m5) == 30 * 288
+        assert store_s < legacy_s
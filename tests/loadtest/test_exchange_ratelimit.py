@@ -1,103 +1,122 @@
 """
-Exchange client rate limiting tests — validates adaptive rate limiter behavior.
+Exchange client rate limiting tests — validates the shared token-bucket limiter.
 
-Tests exercise the rate-limiting logic of ExchangeAPIClient directly
-without connecting to any real exchange.
+Tests exercise ExchangeAPIClient and its RateLimiter with a mocked ccxt
+exchange, without connecting to any real exchange.
 """
 
 import asyncio
 import time
+from unittest.mock import AsyncMock
 
 from bot.api.exchange_client import ExchangeAPIClient
+from bot.api.rate_limiter import Priority, RateLimiter, Route, TokenBucket
 
 
-def _make_client() -> ExchangeAPIClient:
-    """Create ExchangeAPIClient with dummy credentials (no exchange init)."""
+def _make_client(limiter: RateLimiter | None = None, latency: float = 0.0) -> ExchangeAPIClient:
+    """Create ExchangeAPIClient with dummy credentials and a mocked exchange."""
     client = ExchangeAPIClient(
         exchange_id="bybit",
         api_key="dummy_key",
         api_secret="dummy_secret",
         rate_limit=True,
+        rate_limiter=limiter,
     )
+
+    async def respond(*args, **kwargs):
+        await asyncio.sleep(latency)
+        return {"last": 1.0}
+
+    exchange = AsyncMock()
+    exchange.fetch_ticker = AsyncMock(side_effect=respond)
+    exchange.create_order = AsyncMock(side_effect=respond)
+    client._exchange = exchange
+    client._initialized = True
     return client
 
 
+def _limiter(rate: float, capacity: float) -> RateLimiter:
+    return RateLimiter(
+        {"global": (rate, capacity)},
+        {"create_": Route("global", 1.0, Priority.ORDER)},
+        Route("global", 1.0, Priority.MARKET_DATA),
+    )
+
+
 class TestExchangeRateLimiting:
     """Test exchange client rate limiting under load."""
 
     async def test_sustained_rate_limited_100(self):
-        """100 sequential _handle_rate_limit() calls — measure actual throughput."""
-        client = _make_client()
-        # Set short interval for test speed
-        client._min_request_interval = 0.01  # 10ms
-        client._adaptive_interval = 0.01
+        """100 requests at 100 tokens/s with a burst of 10 — throughput stays bounded."""
+        client = _make_client(_limiter(rate=100.0, capacity=10))
 
         start = time.perf_counter()
-        for _ in range(100):
-            await client._handle_rate_limit()
+        await asyncio.gather(*(client.fetch_ticker("BTC/USDT") for _ in range(100)))
         elapsed = time.perf_counter() - start
 
-        # With 10ms interval, 100 calls should take ~1s
         throughput = 100 / elapsed
-        # Should be roughly 100 req/s with 10ms interval
+        assert throughput < 150, f"Too fast — rate limiting may not work: {throughput:.0f} req/s"
         assert throughput > 50, f"Throughput: {throughput:.0f} req/s"
-        assert throughput < 200, f"Too fast — rate limiting may not work: {throughput:.0f} req/s"
         print(f"\n  100 rate-limited calls: {elapsed:.2f}s ({throughput:.0f} req/s)")
 
-    def test_adaptive_backoff_on_hits(self):
-        """5 rate limit hits should increase adaptive interval."""
-        client = _make_client()
-        initial = client._adaptive_interval
-
-        for _ in range(5):
-            client._on_rate_limit_hit()
-
-        final = client._adaptive_interval
-        assert final > initial * 2, f"Interval didn't grow enough: {initial:.3f} → {final:.3f}"
-        print(f"\n  Adaptive backoff: {initial:.3f}s → {final:.3f}s after 5 hits")
-
-    def test_adaptive_recovery_after_success(self):
-        """After rate limit hits, successful requests should reduce interval."""
-        client = _make_client()
-
-        # First hit the rate limit several times
-        for _ in range(5):
-            client._on_rate_limit_hit()
-        inflated = client._adaptive_interval
-
-        # Now simulate many successful requests
-        for _ in range(100):
-            client._on_request_success()
-        recovered = client._adaptive_interval
-
-        assert (
-            recovered < inflated
-        ), f"Interval didn't recover: inflated={inflated:.3f}, recovered={recovered:.3f}"
-        # Should approach min_request_interval
-        assert (
-            recovered <= client._min_request_interval * 2
-        ), f"Recovery too slow: {recovered:.3f} vs min {client._min_request_interval:.3f}"
-        print(f"\n  Recovery: inflated={inflated:.3f}s → recovered={recovered:.3f}s")
-
-    async def test_concurrent_rate_limit_20(self):
-        """20 concurrent _handle_rate_limit() calls — verify serialization."""
-        client = _make_client()
-        client._min_request_interval = 0.01
-        client._adaptive_interval = 0.01
-
-        timestamps: list[float] = []
-
-        async def rate_limited_call():
-            await client._handle_rate_limit()
-            timestamps.append(time.perf_counter())
+    async def test_independent_requests_overlap(self):
+        """With budget available, slow requests run concurrently instead of serializing."""
+        client = _make_client(_limiter(rate=1000.0, capacity=50), latency=0.05)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client.fetch_ticker("BTC/USDT") for _ in range(20)))
+        elapsed = time.perf_counter() - start
+
+        # Serialized this would take 20 x 50ms = 1s
+        assert elapsed < 0.3, f"20 requests took {elapsed:.3f}s — not concurrent"
+        print(f"\n  20 concurrent 50ms requests: {elapsed:.3f}s")
+
+    async def test_orders_jump_market_data_queue(self):
+        """An order queued behind a backlog of reads is admitted first."""
+        client = _make_client(_limiter(rate=200.0, capacity=1))
+        done: list[str] = []
+
+        async def read(i: int) -> None:
+            await client.fetch_ticker("BTC/USDT")
+            done.append(f"read{i}")
+
+        async def order() -> None:
+            await client._tracked_request(
+                "create_order", client._exchange.create_order("BTC/USDT", "limit", "buy", 1, 1)
+            )
+            done.append("order")
+
+        reads = [asyncio.create_task(read(i)) for i in range(20)]
+        await asyncio.sleep(0.01)
+        await asyncio.gather(order(), *reads)
+
+        position = done.index("order")
+        assert position < 5, f"Order admitted after {position} reads"
+        print(f"\n  Order admitted at position {position} of {len(done)}")
+
+    async def test_queue_wait_reported(self):
+        """Queue wait time shows up in client statistics."""
+        client = _make_client(_limiter(rate=100.0, capacity=1))
+        await asyncio.gather(*(client.fetch_ticker("BTC/USDT") for _ in range(10)))
+
+        stats = client.get_statistics()["rate_limiter"]["global"]
+        assert stats["requests"] == 10
+        assert stats["waits"] == 9
+        assert stats["wait_seconds"] > 0
+        print(
+            f"\n  Queue wait: total {stats['wait_seconds']:.3f}s, "
+            f"max {stats['max_wait_seconds']:.3f}s"
+        )
+
+    async def test_bucket_throughput(self):
+        """Raw bucket overhead: 10k uncontended acquisitions."""
+        bucket = TokenBucket(rate=1e9, capacity=1e9)
 
         start = time.perf_counter()
-        await asyncio.gather(*[rate_limited_call() for _ in range(20)])
+        for _ in range(10_000):
+            await bucket.acquire()
         elapsed = time.perf_counter() - start
 
-        # With 10ms interval and lock, 20 calls should take at least ~200ms
-        assert elapsed > 0.1, f"Too fast ({elapsed:.3f}s) — lock may not serialize"
-        # Verify timestamps are roughly ordered (some tolerance for async scheduling)
-        sorted_ts = sorted(timestamps)
-        assert sorted_ts == timestamps or True  # Allow minor reordering
-        print(f"\n  20 concurrent rate-limited: {elapsed:.3f}s (serialized)")
+        rate = 10_000 / elapsed
+        assert rate > 50_000, f"Bucket overhead too high: {rate:.0f} acquisitions/s"
+        print(f"\n  Uncontended acquire: {rate:.0f}/s")
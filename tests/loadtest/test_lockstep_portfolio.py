@@ -0,0 +1,71 @@
+"""
+LockstepPortfolioEngine — throughput and memory on a 50-pair universe.
+
+Bars are generated chunk by chunk, so nothing holds a full history. Reports
+merged events/s and the tracemalloc peak for two history lengths; the peak
+should barely move when the history quadruples (only the equity curve grows
+with it).
+"""
+
+import time
+import tracemalloc
+from collections.abc import Iterator
+
+import numpy as np
+import pandas as pd
+
+from bot.tests.backtesting.portfolio_engine import PortfolioBacktestConfig
+from tests.backtesting.test_lockstep_portfolio import _engine, _pair_config
+
+N_PAIRS = 50
+CHUNK = 100
+
+
+def _generated(n_bars: int, seed: int) -> Iterator[pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    price = 100.0
+    start = pd.Timestamp("2024-01-01")
+    for offset in range(0, n_bars, CHUNK):
+        size = min(CHUNK, n_bars - offset)
+        close = price * np.exp(np.cumsum(rng.normal(0, 0.002, size)))
+        price = float(close[-1])
+        yield pd.DataFrame(
+            {
+                "open": close,
+                "high": close * 1.001,
+                "low": close * 0.999,
+                "close": close,
+                "volume": np.full(size, 1000.0),
+            },
+            index=pd.date_range(
+                start + pd.Timedelta(minutes=5 * offset), periods=size, freq="5min"
+            ),
+        )
+
+
+async def _measure(n_bars: int) -> tuple[float, int]:
+    sources = {f"P{i}/USDT": _generated(n_bars, seed=i) for i in range(N_PAIRS)}
+    cfg = PortfolioBacktestConfig(per_pair_config=_pair_config(analyze_every_n=12))
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = await _engine().run(sources, cfg)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(result.portfolio_equity_curve) == n_bars
+    return elapsed, peak
+
+
+class TestLockstepPortfolio:
+    async def test_throughput_and_bounded_memory(self):
+        print(f"\nLockstep portfolio ({N_PAIRS} pairs, {CHUNK}-bar chunks):")
+        peaks = {}
+        for n_bars in (150, 600):
+            elapsed, peaks[n_bars] = await _measure(n_bars)
+            events = N_PAIRS * n_bars
+            print(
+                f"  {n_bars:>4} bars: {elapsed:6.2f}s  {events / elapsed:8.0f} events/s"
+                f"  peak {peaks[n_bars] / 1e6:6.1f} MB"
+            )
+
+        assert peaks[600] < peaks[150] * 2
@@ -10,11 +10,13 @@ import tracemalloc
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock
 
+import pandas as pd
 from starlette.websockets import WebSocketState
 
 from bot.orchestrator.events import EventType, TradingEvent
 from bot.strategies.base import ExitReason
 from bot.strategies.smc_adapter import SMCStrategyAdapter
+from bot.tests.backtesting.equity_curve import EquityCurve
 from tests.loadtest.conftest import make_ohlcv, make_signal
 from web.backend.ws.manager import ConnectionManager
 
@@ -173,3 +175,44 @@ class TestMemoryProfiling:
         assert peak_mb < 500, f"Peak memory: {peak_mb:.1f}MB for 5K rows"
         assert elapsed < 180.0, f"5K row analysis took {elapsed:.2f}s"
         print(f"\n  5K row analysis: {elapsed:.2f}s, peak = {peak_mb:.2f}MB")
+
+    def test_equity_curve_year_of_m5(self):
+        """One year of M5 equity points — columnar recorder vs a list of dicts."""
+        index = pd.date_range("2024-01-01", periods=365 * 24 * 12, freq="5min")
+        stamps = index.asi8
+
+        def measure(record) -> tuple[float, float]:
+            gc.collect()
+            tracemalloc.start()
+            start = time.perf_counter()
+            curve = record()
+            elapsed = time.perf_counter() - start
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            assert len(curve) == len(index)
+            return size / (1024 * 1024), elapsed
+
+        def dicts():
+            return [
+                {
+                    "timestamp": index[i].isoformat(),
+                    "price": 45000.0,
+                    "portfolio_value": 10000.0 + i,
+                    "regime": "trending",
+                }
+                for i in range(len(index))
+            ]
+
+        def columnar():
+            curve = EquityCurve(capacity=len(index))
+            for i in range(len(index)):
+                curve.append(stamps[i], 45000.0, 10000.0 + i, regime="trending")
+            return curve
+
+        dict_mb, dict_s = measure(dicts)
+        array_mb, array_s = measure(columnar)
+
+        print(f"\n  {len(index)} equity points:")
+        print(f"    list of dicts:  {dict_mb:7.2f}MB  {dict_s:.2f}s")
+        print(f"    EquityCurve:    {array_mb:7.2f}MB  {array_s:.2f}s")
+        assert array_mb < dict_mb / 5
@@ -0,0 +1,89 @@
+"""
+Multi-timeframe context building benchmark — mask filtering vs alignment index.
+
+Compares the original per-bar boolean-mask context building against the
+precomputed MultiTimeframeIndex on a 100k+ bar M5 dataset.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from bot.tests.backtesting.multi_tf_data_loader import (
+    MultiTimeframeData,
+    MultiTimeframeDataLoader,
+)
+
+N_M5_BARS = 105_120  # one year of M5
+LOOKBACK = 100
+
+
+def _make_year_of_m5() -> MultiTimeframeData:
+    rng = np.random.default_rng(7)
+    index = pd.date_range("2024-01-01", periods=N_M5_BARS, freq="5min")
+    close = 45000.0 + np.cumsum(rng.normal(0, 15, N_M5_BARS))
+    df_m5 = pd.DataFrame(
+        {
+            "open": close + rng.normal(0, 5, N_M5_BARS),
+            "high": close + rng.uniform(5, 30, N_M5_BARS),
+            "low": close - rng.uniform(5, 30, N_M5_BARS),
+            "close": close,
+            "volume": rng.uniform(100, 1000, N_M5_BARS),
+        },
+        index=index,
+    )
+    loader = MultiTimeframeDataLoader()
+    return MultiTimeframeData(
+        d1=loader._resample(df_m5, "1D"),
+        h4=loader._resample(df_m5, "4h"),
+        h1=loader._resample(df_m5, "1h"),
+        m15=loader._resample(df_m5, "15min"),
+        m5=df_m5,
+    )
+
+
+def _mask_context_at(data: MultiTimeframeData, idx: int, lookback: int) -> list[pd.DataFrame]:
+    """Reference implementation: boolean mask over every full frame."""
+    current_ts = data.m5.index[idx]
+    return [df[df.index <= current_ts].tail(lookback) for df in data.as_tuple()]
+
+
+class TestMultiTFContextBenchmark:
+    """Per-bar context building cost on a year of M5 data."""
+
+    def test_indexed_context_vs_mask(self):
+        data = _make_year_of_m5()
+        loader = MultiTimeframeDataLoader()
+
+        # The mask path is O(N) per bar, so time a spread-out sample of bars
+        sample = np.linspace(LOOKBACK, N_M5_BARS - 1, 300, dtype=int)
+
+        start = time.perf_counter()
+        for idx in sample:
+            _mask_context_at(data, int(idx), LOOKBACK)
+        mask_per_bar = (time.perf_counter() - start) / len(sample)
+
+        start = time.perf_counter()
+        data.alignment_index()
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for idx in sample:
+            loader.get_context_at(data, base_index=int(idx), lookback=LOOKBACK)
+        indexed_per_bar = (time.perf_counter() - start) / len(sample)
+
+        for idx in sample[::50]:
+            expected = _mask_context_at(data, int(idx), LOOKBACK)
+            actual = loader.get_context_at(data, base_index=int(idx), lookback=LOOKBACK)
+            for got, want in zip(actual, expected, strict=True):
+                pd.testing.assert_frame_equal(got, want)
+
+        speedup = mask_per_bar / indexed_per_bar
+        print(
+            f"\n  {N_M5_BARS} M5 bars: index build {build_time * 1000:.1f}ms, "
+            f"mask {mask_per_bar * 1e6:.0f}us/bar, indexed {indexed_per_bar * 1e6:.0f}us/bar "
+            f"({speedup:.1f}x); full run est. mask {mask_per_bar * N_M5_BARS:.0f}s "
+            f"vs indexed {indexed_per_bar * N_M5_BARS:.0f}s"
+        )
+        assert speedup > 3.0, f"Indexed context only {speedup:.1f}x faster than mask filtering"
@@ -0,0 +1,55 @@
+"""
+ParameterOptimizer scaling — thread backend vs process backend across 1/4/16 workers.
+
+Runs the same 16-combination grid through each configuration and reports
+wall time and speedup over a single worker. Speedup is only asserted when
+the machine has enough cores for it to be meaningful.
+"""
+
+import os
+import time
+
+from bot.tests.backtesting.multi_tf_engine import MultiTFBacktestConfig
+from bot.tests.backtesting.optimization import OptimizationConfig, ParameterOptimizer
+from bot.tests.backtesting.process_executor import StrategySpec
+from tests.backtesting.test_advanced_analytics import _load_test_data
+from tests.backtesting.test_process_executor import SPEC_PATH
+
+GRID = {"tp_pct": [0.005, 0.01, 0.015, 0.02], "sl_pct": [0.01, 0.015, 0.02, 0.03]}
+WORKER_COUNTS = (1, 4, 16)
+
+
+async def _timed(backend: str, workers: int, data) -> tuple[float, dict]:
+    optimizer = ParameterOptimizer(
+        config=OptimizationConfig(
+            backtest_config=MultiTFBacktestConfig(warmup_bars=20),
+            backend=backend,
+        )
+    )
+    start = time.perf_counter()
+    result = await optimizer.optimize(StrategySpec(SPEC_PATH), GRID, data, max_workers=workers)
+    elapsed = time.perf_counter() - start
+    return elapsed, {tuple(t.params.items()): t.objective_value for t in result.all_trials}
+
+
+class TestOptimizerScaling:
+    async def test_process_backend_scaling(self):
+        data = _load_test_data(days=4)
+        cores = os.cpu_count() or 1
+
+        timings: dict[tuple[str, int], float] = {}
+        reference = None
+        for backend in ("thread", "process"):
+            for workers in WORKER_COUNTS:
+                elapsed, objectives = await _timed(backend, workers, data)
+                timings[(backend, workers)] = elapsed
+                reference = reference or objectives
+                assert objectives == reference
+
+        base = timings[("thread", 1)]
+        print(f"\nOptimizer scaling ({len(reference)} trials, {cores} cores):")
+        for (backend, workers), elapsed in timings.items():
+            print(f"  {backend:>7} x{workers:<2}: {elapsed:6.2f}s  speedup {base / elapsed:4.1f}x")
+
+        if cores >= 4:
+            assert timings[("process", 4)] < timings[("thread", 4)]
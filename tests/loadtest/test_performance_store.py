@@ -0,0 +1,115 @@
+"""
+Portfolio history — raw per-minute samples vs precomputed rollups.
+
+Four bots with 30 days of one-minute samples. The raw mode answers a 30d
+equity-curve query the way an append-only sample table would: scan every
+minute row in range and resample to hours in Python. The rollup mode reads
+the 1h buckets PerformanceStore maintains at write time.
+"""
+
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from bot.database.manager import DatabaseManager
+from bot.database.models import PerformanceSnapshot
+from bot.monitoring.performance_store import (
+    PORTFOLIO,
+    PerformanceSample,
+    PerformanceStore,
+    bucket_start,
+)
+
+N_BOTS = 4
+N_DAYS = 30
+N_QUERIES = 5
+NOW = datetime(2026, 4, 1, tzinfo=timezone.utc)
+
+
+def _row(bot_name: str, resolution: str, bucket: datetime, equity: Decimal) -> dict:
+    return {
+        "bot_name": bot_name,
+        "resolution": resolution,
+        "bucket": bucket,
+        "equity": equity,
+        "equity_high": equity,
+        "equity_low": equity,
+        "realized_pnl": 0,
+        "unrealized_pnl": 0,
+        "exposure": 0,
+        "samples": 1,
+        "updated_at": NOW,
+    }
+
+
+def _rows(resolution: str, step: timedelta) -> list[dict]:
+    rows = []
+    start = NOW - timedelta(days=N_DAYS)
+    n = int(timedelta(days=N_DAYS) / step)
+    for i in range(n):
+        bucket = start + i * step
+        equities = [Decimal(1000 + (i * 7 + b * 13) % 200) for b in range(N_BOTS)]
+        rows.extend(_row(f"bot-{b}", resolution, bucket, e) for b, e in enumerate(equities))
+        rows.append(_row(PORTFOLIO, resolution, bucket, sum(equities, Decimal("0"))))
+    return rows
+
+
+class TestPerformanceHistory:
+    async def test_rollups_beat_raw_scan(self, db_engine):
+        db = DatabaseManager.__new__(DatabaseManager)
+        db._engine = db_engine
+        db._session_factory = async_sessionmaker(
+            db_engine, class_=AsyncSession, expire_on_commit=False
+        )
+        store = PerformanceStore(db)
+
+        async with db.session() as session:
+            for resolution, step in (("1m", timedelta(minutes=1)), ("1h", timedelta(hours=1))):
+                rows = _rows(resolution, step)
+                for i in range(0, len(rows), 5_000):
+                    await session.execute(insert(PerformanceSnapshot), rows[i : i + 5_000])
+        n_raw = N_BOTS * N_DAYS * 24 * 60
+
+        async def raw_query() -> int:
+            async with db.session() as session:
+                result = await session.execute(
+                    select(PerformanceSnapshot.bucket, PerformanceSnapshot.equity).where(
+                        PerformanceSnapshot.resolution == "1m",
+                        PerformanceSnapshot.bot_name != PORTFOLIO,
+                        PerformanceSnapshot.bucket >= NOW - timedelta(days=N_DAYS),
+                    )
+                )
+                hourly: dict[datetime, Decimal] = defaultdict(Decimal)
+                for bucket, equity in result.all():
+                    hourly[bucket.replace(minute=0)] = equity  # close per bot-hour, simplified
+                return len(hourly)
+
+        start = time.perf_counter()
+        for _ in range(N_QUERIES):
+            raw_points = await raw_query()
+        raw_s = (time.perf_counter() - start) / N_QUERIES
+
+        start = time.perf_counter()
+        for _ in range(N_QUERIES):
+            points = await store.series("30d", now=NOW)
+        rollup_s = (time.perf_counter() - start) / N_QUERIES
+
+        # Write side: one sampler tick folds all bots into three resolutions
+        samples = [PerformanceSample(f"bot-{b}", Decimal(1000)) for b in range(N_BOTS)]
+        start = time.perf_counter()
+        for i in range(50):
+            await store.record(samples, NOW + timedelta(seconds=i))
+        record_s = (time.perf_counter() - start) / 50
+
+        print(f"\n30d portfolio equity curve over {n_raw} raw one-minute samples:")
+        print(f"  raw scan + resample  {raw_s * 1e3:8.1f} ms/query  ({raw_points} points)")
+        print(f"  1h rollups           {rollup_s * 1e3:8.1f} ms/query  ({len(points)} points)")
+        print(f"  record() per tick    {record_s * 1e3:8.2f} ms ({N_BOTS} bots x 3 resolutions)")
+
+        assert len(points) == N_DAYS * 24
+        assert points[0].timestamp == bucket_start(NOW - timedelta(days=N_DAYS), "1h")
+        assert rollup_s < raw_s / 5
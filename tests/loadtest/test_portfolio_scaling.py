@@ -0,0 +1,50 @@
+"""
+PortfolioBacktestEngine scaling — async backend vs process backend.
+
+Runs the same multi-pair portfolio both ways and reports wall time. The
+async backend shares one core between all pairs; the process backend
+should scale with cores. Speedup is only asserted when the machine has
+enough cores for it to be meaningful.
+"""
+
+import os
+import time
+
+from bot.tests.backtesting.portfolio_engine import PortfolioBacktestConfig
+from tests.backtesting.test_portfolio_engine import (
+    _base_pair_config,
+    _process_engine,
+    _tiny_data,
+)
+
+N_PAIRS = 8
+N_BARS = 1000
+
+
+async def _timed(data_map, backend: str, workers: int | None = None):
+    cfg = PortfolioBacktestConfig(
+        per_pair_config=_base_pair_config(), backend=backend, max_workers=workers
+    )
+    start = time.perf_counter()
+    result = await _process_engine().run(data_map, cfg)
+    return time.perf_counter() - start, result
+
+
+class TestPortfolioScaling:
+    async def test_process_backend_scaling(self):
+        data_map = {f"P{i}/USDT": _tiny_data(n=N_BARS, seed=i) for i in range(N_PAIRS)}
+        cores = os.cpu_count() or 1
+        workers = min(cores, N_PAIRS)
+
+        async_time, async_result = await _timed(data_map, "async")
+        process_time, process_result = await _timed(data_map, "process", workers)
+
+        print(f"\nPortfolio scaling ({N_PAIRS} pairs x {N_BARS} bars, {cores} cores):")
+        print(f"  async:          {async_time:6.2f}s")
+        speedup = async_time / process_time
+        print(f"  process x{workers:<2}:   {process_time:6.2f}s  speedup {speedup:4.1f}x")
+
+        assert process_result.total_pairs == async_result.total_pairs == N_PAIRS
+        assert process_result.portfolio_equity_curve == async_result.portfolio_equity_curve
+        if cores >= 4:
+            assert process_time < async_time / 2
@@ -0,0 +1,59 @@
+"""
+Replay exchange throughput — fetch_ohlcv cost early vs late in a one-year replay.
+
+BotOrchestrator requests four timeframes per cycle. With incremental bar
+buffers the per-cycle cost should not grow with the number of replayed
+candles; the old full re-aggregation is timed at the late position for
+comparison.
+"""
+
+import time
+from decimal import Decimal
+
+from bot.replay.replay_exchange import ReplayExchangeClient
+from bot.replay.simulated_clock import SimulatedClock
+from tests.replay.test_replay_exchange import STEP_MS, _candles, _reference_ohlcv
+
+N_CANDLES = 365 * 288  # one year of 5m candles
+CYCLES = 300
+TIMEFRAMES = {"15m": 3, "1h": 12, "4h": 48, "1d": 288}
+
+
+async def _cycle_cost(
+    exchange: ReplayExchangeClient, clock: SimulatedClock, candles: list[dict], start_idx: int
+) -> float:
+    clock.advance_to(candles[start_idx]["timestamp"] / 1000)
+    # Catch the buffers up first; in a real replay that work is spread over every step
+    for tf in TIMEFRAMES:
+        await exchange.fetch_ohlcv("XRP/USDT", tf, limit=100)
+
+    start = time.perf_counter()
+    for _ in range(CYCLES):
+        clock.advance(STEP_MS / 1000)
+        for tf in TIMEFRAMES:
+            await exchange.fetch_ohlcv("XRP/USDT", tf, limit=100)
+    return (time.perf_counter() - start) / CYCLES
+
+
+class TestReplayThroughput:
+    async def test_fetch_ohlcv_cost_is_flat(self):
+        candles = _candles(N_CANDLES)
+        clock = SimulatedClock(start_time=candles[0]["timestamp"] / 1000)
+        exchange = ReplayExchangeClient(candles, clock, Decimal("10000"))
+
+        early = await _cycle_cost(exchange, clock, candles, 1_000)
+        late = await _cycle_cost(exchange, clock, candles, N_CANDLES - CYCLES - 1)
+
+        idx = exchange.processed_candles - 1
+        start = time.perf_counter()
+        for n in TIMEFRAMES.values():
+            _reference_ohlcv(candles, idx, n, 100)
+        legacy = time.perf_counter() - start
+
+        print(f"\nReplay fetch_ohlcv x{len(TIMEFRAMES)} per cycle ({N_CANDLES} candles):")
+        print(f"  early (1k candles)     : {early * 1e3:8.3f} ms")
+        print(f"  late  ({idx} candles): {late * 1e3:8.3f} ms")
+        print(f"  full re-aggregation    : {legacy * 1e3:8.3f} ms  ({legacy / late:.0f}x)")
+
+        assert late < early * 5
+        assert late < legacy
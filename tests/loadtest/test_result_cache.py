@@ -0,0 +1,53 @@
+"""
+ResultCache — cold vs warm re-run of a two-phase optimization.
+
+The warm run reads every trial from the on-disk cache written by the cold
+run (through a fresh instance, as a separate pipeline run would), so it
+should take a small fraction of the cold time.
+"""
+
+import time
+from decimal import Decimal
+
+from bot.tests.backtesting.multi_tf_engine import MultiTFBacktestConfig
+from bot.tests.backtesting.optimization import OptimizationConfig, ParameterOptimizer
+from bot.tests.backtesting.result_cache import ResultCache
+from tests.backtesting.test_advanced_analytics import _load_test_data
+from tests.backtesting.test_result_cache import _strategy
+
+GRID = {
+    "buy_every_n": [5, 10, 15, 20, 30],
+    "tp_pct": [Decimal("0.005"), Decimal("0.01"), Decimal("0.02")],
+    "sl_pct": [Decimal("0.01"), Decimal("0.02")],
+}
+
+
+class TestResultCacheRerun:
+    async def test_warm_rerun_is_near_instant(self, tmp_path):
+        data = _load_test_data(days=4)
+        config = OptimizationConfig(backtest_config=MultiTFBacktestConfig(warmup_bars=50))
+
+        async def run() -> tuple[float, dict]:
+            cache = ResultCache(tmp_path / "cache.db")
+            cache.initialize()
+            start = time.perf_counter()
+            await ParameterOptimizer(config=config, cache=cache).two_phase_optimize(
+                _strategy, GRID, data, coarse_steps=3
+            )
+            elapsed = time.perf_counter() - start
+            report = cache.report()
+            cache.close()
+            return elapsed, report
+
+        cold, cold_report = await run()
+        warm, warm_report = await run()
+
+        print(f"\nTwo-phase optimization ({len(data.m5)} M5 bars):")
+        print(f"  cold: {cold:6.2f}s  misses {cold_report['session']['misses']}")
+        print(
+            f"  warm: {warm:6.2f}s  hits {warm_report['session']['hits']}"
+            f"  ({cold / warm:.0f}x, {warm_report['bytes'] / 1e6:.1f} MB on disk)"
+        )
+
+        assert warm_report["session"]["misses"] == 0
+        assert warm < cold / 5
@@ -0,0 +1,77 @@
+"""
+Market simulator throughput — Decimal MarketSimulator vs FastMarketSimulator.
+
+Runs the same grid session (200 resting orders, candle sweeps, counter
+orders on every fill) through both simulators and reports candles/second.
+"""
+
+import random
+import time
+from decimal import Decimal
+
+from bot.tests.backtesting.fast_market_simulator import FastMarketSimulator
+from bot.tests.backtesting.market_simulator import MarketSimulator
+
+SYMBOL = "BTC/USDT"
+N_CANDLES = 3_000
+LEVELS = 100  # per side
+
+
+async def _grid_session(simulator) -> float:
+    rng = random.Random(5)
+    price = 45000.0
+    await simulator.set_price(Decimal(str(price)))
+    step = 0.001
+    for level in range(1, LEVELS + 1):
+        buy = Decimal(str(round(price * (1 - step * level), 2)))
+        sell = Decimal(str(round(price * (1 + step * level), 2)))
+        await simulator.create_order(SYMBOL, "limit", "buy", Decimal("0.001"), buy)
+        await simulator.create_order(SYMBOL, "limit", "sell", Decimal("0.001"), sell)
+
+    start = time.perf_counter()
+    seen_trades = 0
+    for _ in range(N_CANDLES):
+        o = price
+        c = o * (1 + rng.gauss(0, 0.003))
+        h = max(o, c) * (1 + abs(rng.gauss(0, 0.001)))
+        lo = min(o, c) * (1 - abs(rng.gauss(0, 0.001)))
+        candle = [Decimal(str(round(x, 2))) for x in (o, h, lo, c)]
+        await simulator.set_candle(*candle)
+        price = float(candle[3])
+
+        # Counter-order for every new fill, keeping the book populated
+        trades = simulator.trade_history
+        for trade in trades[seen_trades:]:
+            if trade["side"] == "buy":
+                side, target = "sell", trade["price"] * (1 + step)
+            else:
+                side, target = "buy", trade["price"] * (1 - step)
+            try:
+                await simulator.create_order(
+                    SYMBOL, "limit", side, Decimal("0.001"), Decimal(str(round(target, 2)))
+                )
+            except Exception:
+                pass
+        seen_trades = len(trades)
+        simulator.get_portfolio_value()
+    return time.perf_counter() - start
+
+
+class TestSimulatorThroughput:
+    async def test_fast_simulator_speedup(self):
+        reference = MarketSimulator(symbol=SYMBOL, initial_balance_base=Decimal("1"))
+        fast = FastMarketSimulator(symbol=SYMBOL, initial_balance_base=Decimal("1"))
+
+        ref_elapsed = await _grid_session(reference)
+        fast_elapsed = await _grid_session(fast)
+
+        speedup = ref_elapsed / fast_elapsed
+        print(
+            f"\n  {N_CANDLES} candles, {2 * LEVELS} resting orders: "
+            f"Decimal {N_CANDLES / ref_elapsed:.0f} candles/s, "
+            f"fast {N_CANDLES / fast_elapsed:.0f} candles/s ({speedup:.1f}x), "
+            f"{len(fast.get_trade_history())} fills"
+        )
+        ref_value = float(reference.get_portfolio_value())
+        assert abs(ref_value - float(fast.get_portfolio_value())) < 1e-6 * ref_value
+        assert speedup > 3.0, f"FastMarketSimulator only {speedup:.1f}x faster"
@@ -0,0 +1,71 @@
+"""
+SMC structure benchmark — batch smartmoneyconcepts passes vs the incremental engine.
+
+Replays the backtest access pattern: a 200-bar window re-analyzed every few
+bars. The batch analyzers recompute swings, breaks, order blocks, FVGs and
+liquidity over the whole window each time; the incremental ones only confirm
+what the appended bars made eligible.
+"""
+
+import time
+
+from bot.strategies.smc.confluence_zones import ConfluenceZoneAnalyzer
+from bot.strategies.smc.market_structure import MarketStructureAnalyzer
+from bot.strategies.smc.structure_engine import StructureEngine
+from tests.strategies.smc.test_candle_patterns import make_ohlcv
+
+WINDOW = 200
+STEP = 4
+SWING_LENGTH = 10
+
+
+def _analyzers(incremental: bool) -> tuple[MarketStructureAnalyzer, ConfluenceZoneAnalyzer]:
+    ms = MarketStructureAnalyzer(swing_length=SWING_LENGTH, incremental=incremental)
+    return ms, ConfluenceZoneAnalyzer(ms, incremental=incremental)
+
+
+def _replay(analyzers, windows) -> float:
+    structure, zones = analyzers
+    start = time.perf_counter()
+    for window in windows:
+        structure.analyze(window)
+        zones.analyze(window)
+    return time.perf_counter() - start
+
+
+class TestSMCStructureThroughput:
+    """Structure and zone tracking cost per analyzed window."""
+
+    def test_engine_per_bar_cost(self):
+        """Sliding windows through the engine cost only the appended bars."""
+        df = make_ohlcv(5000)
+        windows = [df.iloc[end - WINDOW : end] for end in range(WINDOW, len(df) + 1, STEP)]
+        engine = StructureEngine(swing_length=SWING_LENGTH)
+
+        start = time.perf_counter()
+        for window in windows:
+            engine.update(window)
+        elapsed = time.perf_counter() - start
+
+        assert engine.bars_processed == len(df)
+        per_bar = elapsed / engine.bars_processed * 1e6
+        print(
+            f"\n  {len(windows)} windows: {elapsed * 1000:.1f}ms, "
+            f"{per_bar:.1f}us per bar over {engine.bars_processed} bars"
+        )
+        assert per_bar < 200, f"Engine costs {per_bar:.0f}us per bar"
+
+    def test_sliding_window_backtest(self):
+        """Backtest replay: incremental analyzers are at least 3x the batch passes."""
+        df = make_ohlcv(1400)
+        windows = [df.iloc[end - WINDOW : end] for end in range(WINDOW, len(df) + 1, STEP)]
+
+        batch_elapsed = _replay(_analyzers(incremental=False), windows)
+        incremental_elapsed = _replay(_analyzers(incremental=True), windows)
+
+        speedup = batch_elapsed / incremental_elapsed
+        print(
+            f"\n  {len(windows)} windows: batch {batch_elapsed * 1000:.1f}ms, "
+            f"incremental {incremental_elapsed * 1000:.1f}ms ({speedup:.1f}x)"
+        )
+        assert speedup > 3, f"Incremental analysis only {speedup:.1f}x faster"
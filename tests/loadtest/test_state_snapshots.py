@@ -0,0 +1,97 @@
+"""
+State snapshots — full re-serialization vs incremental saves.
+
+20 bots with 400-order grids save state on every tick, while only one of
+them sees a fill per tick. The full mode re-serializes and rewrites every
+section each time (the previous behavior); incremental saves skip
+unchanged sections via StateTracker probes, optionally zlib-compressed.
+"""
+
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from bot.core.grid_engine import GridEngine, GridOrder
+from bot.database.manager import DatabaseManager
+from bot.database.models import BotStateSnapshot
+from bot.orchestrator.state_persistence import StateTracker
+
+N_BOTS = 20
+N_ORDERS = 400
+N_TICKS = 40
+
+
+def _grid(n: int) -> GridEngine:
+    engine = GridEngine(
+        symbol="BTC/USDT",
+        upper_price=Decimal("50000"),
+        lower_price=Decimal("40000"),
+        grid_levels=5,
+        amount_per_grid=Decimal("100"),
+        profit_per_grid=Decimal("0.01"),
+    )
+    for i in range(n):
+        engine.active_orders[f"ord-{i:05d}"] = GridOrder(
+            level=i,
+            price=Decimal("40000") + Decimal(i) * Decimal("12.5"),
+            amount=Decimal("0.00250000"),
+            side="buy" if i % 2 else "sell",
+            order_id=f"ord-{i:05d}",
+        )
+    return engine
+
+
+class TestIncrementalSnapshots:
+    async def test_incremental_saves_cut_latency_and_bytes(self, db_engine):
+        db = DatabaseManager.__new__(DatabaseManager)
+        db._engine = db_engine
+        db._session_factory = async_sessionmaker(
+            db_engine, class_=AsyncSession, expire_on_commit=False
+        )
+
+        async def run(mode: str) -> tuple[float, int]:
+            grids = [_grid(N_ORDERS) for _ in range(N_BOTS)]
+            trackers = [StateTracker("zlib" if mode == "zlib" else "json") for _ in grids]
+            total_bytes = 0
+            start = time.perf_counter()
+            for tick in range(N_TICKS):
+                filled = grids[tick % N_BOTS]
+                filled.handle_order_filled(f"ord-{tick:05d}", Decimal("40000"), Decimal("0.0025"))
+                for b, (grid, tracker) in enumerate(zip(grids, trackers, strict=True)):
+                    if mode == "full":
+                        tracker = StateTracker()
+                    changes = tracker.collect({"grid_state": grid, "dca_state": None})
+                    if changes:
+                        await db.save_state_snapshot(
+                            BotStateSnapshot(
+                                bot_name=f"{mode}-{b}",
+                                bot_state="running",
+                                saved_at=datetime.now(timezone.utc),
+                                **changes,
+                            ),
+                            sections=list(changes),
+                        )
+                    tracker.commit(0.0)
+                    total_bytes += tracker.stats.last_bytes
+            return time.perf_counter() - start, total_bytes
+
+        results = {mode: await run(mode) for mode in ("full", "incremental", "zlib")}
+        saves = N_BOTS * N_TICKS
+
+        print(
+            f"\n{saves} state saves ({N_BOTS} bots x {N_TICKS} ticks, "
+            f"{N_ORDERS}-order grids, one fill per tick):"
+        )
+        for mode, (elapsed, nbytes) in results.items():
+            print(
+                f"  {mode:<12} {elapsed / saves * 1e3:7.3f} ms/save"
+                f"  {nbytes / N_BOTS / 1e3:9.1f} kB written per bot"
+            )
+
+        full_s, full_bytes = results["full"]
+        inc_s, inc_bytes = results["incremental"]
+        assert inc_s < full_s / 3
+        assert inc_bytes < full_bytes / 5
+        assert results["zlib"][1] < inc_bytes / 3
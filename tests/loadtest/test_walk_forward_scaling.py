@@ -0,0 +1,55 @@
+"""
+WalkForwardAnalysis scaling — sequential windows vs process backend.
+
+Runs the same walk-forward both ways and reports wall time per window.
+Windows are independent, so the process backend should scale with
+min(windows, cores). Speedup is only asserted when the machine has enough
+cores for it to be meaningful.
+"""
+
+import os
+import time
+
+from bot.tests.backtesting.multi_tf_engine import MultiTFBacktestConfig
+from bot.tests.backtesting.process_executor import StrategySpec
+from bot.tests.backtesting.walk_forward import WalkForwardAnalysis, WalkForwardConfig
+from tests.backtesting.test_advanced_analytics import _load_test_data
+from tests.backtesting.test_process_executor import SPEC_PATH
+
+N_SPLITS = 4
+DAYS = 30
+
+
+async def _timed(data, backend: str, workers: int | None = None):
+    wf = WalkForwardAnalysis(
+        config=WalkForwardConfig(
+            n_splits=N_SPLITS,
+            backtest_config=MultiTFBacktestConfig(warmup_bars=200),
+            backend=backend,
+            max_workers=workers,
+        )
+    )
+    start = time.perf_counter()
+    result = await wf.run(StrategySpec(SPEC_PATH), data)
+    return time.perf_counter() - start, result
+
+
+class TestWalkForwardScaling:
+    async def test_process_backend_scaling(self):
+        data = _load_test_data(days=DAYS)
+        cores = os.cpu_count() or 1
+        workers = min(cores, N_SPLITS)
+
+        async_time, async_result = await _timed(data, "async")
+        process_time, process_result = await _timed(data, "process", workers)
+
+        bars = len(data.m5)
+        print(f"\nWalk-forward scaling ({N_SPLITS} windows, {bars} M5 bars, {cores} cores):")
+        print(f"  async:          {async_time:6.2f}s")
+        speedup = async_time / process_time
+        print(f"  process x{workers:<2}:   {process_time:6.2f}s  speedup {speedup:4.1f}x")
+
+        assert len(process_result.windows) == len(async_result.windows) == N_SPLITS
+        assert process_result.aggregate_test_return_pct == async_result.aggregate_test_return_pct
+        if cores >= 4:
+            assert process_time < async_time / 2
@@ -2,6 +2,7 @@
 
 import numpy as np
 import pandas as pd
+import pytest
 
 from bot.orchestrator.market_regime import (
     MarketRegime,
@@ -716,3 +717,39 @@ class TestADXHysteresis:
             current_regime=MarketRegime.WIDE_RANGE,
         )
         assert regime == MarketRegime.BULL_TREND
+
+
+class TestSnapshotBatch:
+    """snapshot_batch computes many windows at once with per-window parity."""
+
+    def test_matches_per_frame_snapshots(self):
+        np.random.seed(7)
+        frames = [_make_trending_up(120), _make_trending_down(120), _make_sideways(120)]
+        detector = MarketRegimeDetector()
+
+        batch = detector.snapshot_batch(frames)
+
+        assert len(batch) == len(frames)
+        for df, snap in zip(frames, batch, strict=True):
+            # Recompute the single-window path with Series inputs
+            atr = MarketRegimeDetector._calculate_atr(df["high"], df["low"], df["close"], 14)
+            adx, _, _ = MarketRegimeDetector._calculate_adx(
+                df["high"], df["low"], df["close"], 14
+            )
+            ema_fast = df["close"].ewm(span=20, adjust=False).mean()
+            assert snap.bars == len(df)
+            assert snap.close == df["close"].iloc[-1]
+            assert np.isclose(snap.atr, atr.iloc[-1])
+            assert np.isclose(snap.adx, adx.iloc[-1])
+            assert np.isclose(snap.ema_fast, ema_fast.iloc[-1])
+            atr_values = atr.dropna().values
+            expected_pctile = np.sum(atr_values <= atr.iloc[-1]) / len(atr_values) * 100
+            assert np.isclose(snap.atr_percentile, expected_pctile)
+
+    def test_unequal_lengths_rejected(self):
+        detector = MarketRegimeDetector()
+        with pytest.raises(ValueError, match="equal length"):
+            detector.snapshot_batch([_make_sideways(100), _make_sideways(110)])
+
+    def test_empty_batch(self):
+        assert MarketRegimeDetector().snapshot_batch([]) == []
@@ -0,0 +1,137 @@
+"""Tests for event-driven grid fills and price updates in BotOrchestrator."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from bot.core.grid_engine import GridEngine, GridOrder
+from bot.orchestrator.bot_orchestrator import BotOrchestrator, BotState
+from bot.orchestrator.state_persistence import StateTracker
+
+
+def _make_orchestrator(*, use_websocket: bool = True) -> BotOrchestrator:
+    orch = object.__new__(BotOrchestrator)
+    orch.config = SimpleNamespace(
+        name="ws-bot",
+        symbol="BTC/USDT",
+        dry_run=False,
+        exchange=SimpleNamespace(use_websocket=use_websocket),
+    )
+    orch.state = BotState.RUNNING
+    orch.current_price = Decimal("50000")
+    orch.grid_engine = GridEngine(
+        symbol="BTC/USDT",
+        upper_price=Decimal("55000"),
+        lower_price=Decimal("45000"),
+        grid_levels=5,
+        amount_per_grid=Decimal("100"),
+        profit_per_grid=Decimal("0.01"),
+    )
+    orch.grid_engine.register_order(
+        GridOrder(level=1, price=Decimal("49000"), amount=Decimal("0.002"), side="buy"), "o-1"
+    )
+    orch.risk_manager = None
+
+    orch.exchange = AsyncMock()
+    orch.exchange.create_order = AsyncMock(return_value={"id": "counter-1"})
+    orch.exchange.fetch_open_orders = AsyncMock(return_value=[])
+    orch.exchange.fetch_order = AsyncMock(return_value={"id": "o-1", "status": "closed"})
+    orch.market_data = orch.exchange
+
+    orch._ticker_stream = None
+    orch._order_stream = None
+    orch._fill_latencies = deque(maxlen=100)
+    orch._state_tracker = StateTracker()
+    orch._state_save_requested = asyncio.Event()
+    orch._publish_event = AsyncMock()
+    return orch
+
+
+class TestOrderStreamFills:
+    async def test_fill_places_counter_order_and_records_latency(self):
+        orch = _make_orchestrator()
+        filled_at = int(time.time() * 1000) - 250
+
+        await orch._on_order_updates(
+            [
+                {
+                    "id": "o-1",
+                    "symbol": "BTC/USDT",
+                    "status": "closed",
+                    "lastTradeTimestamp": filled_at,
+                }
+            ]
+        )
+
+        orch.exchange.create_order.assert_awaited_once()
+        assert orch.exchange.create_order.await_args.kwargs["side"] == "sell"
+        assert "o-1" not in orch.grid_engine.active_orders
+        assert "counter-1" in orch.grid_engine.active_orders
+        assert 0.25 <= orch._fill_latencies[-1] < 5
+
+    async def test_duplicate_and_foreign_updates_ignored(self):
+        orch = _make_orchestrator()
+        update = {"id": "o-1", "symbol": "BTC/USDT", "status": "closed"}
+
+        await orch._on_order_updates([update, update, {"id": "other", "status": "closed"}])
+        assert orch.exchange.create_order.await_count == 1
+
+    async def test_cancelled_order_untracked(self):
+        orch = _make_orchestrator()
+        await orch._on_order_updates([{"id": "o-1", "status": "canceled"}])
+
+        assert "o-1" not in orch.grid_engine.active_orders
+        orch.exchange.create_order.assert_not_awaited()
+
+    async def test_polling_skipped_while_stream_connected(self):
+        orch = _make_orchestrator()
+        orch._order_stream = SimpleNamespace(connected=True)
+        await orch._process_grid_orders()
+        orch.exchange.fetch_open_orders.assert_not_awaited()
+
+        orch._order_stream.connected = False
+        await orch._process_grid_orders()
+        orch.exchange.fetch_open_orders.assert_awaited_once()
+        assert orch.exchange.create_order.await_count == 1
+
+
+class TestStreamLifecycle:
+    async def test_streams_drive_price_and_fills(self):
+        orch = _make_orchestrator()
+        tickers: asyncio.Queue = asyncio.Queue()
+        orders: asyncio.Queue = asyncio.Queue()
+
+        async def watch_ticker(symbol):
+            return await tickers.get()
+
+        async def watch_orders(symbol):
+            return await orders.get()
+
+        orch.exchange.watch_ticker = watch_ticker
+        orch.exchange.watch_orders = watch_orders
+
+        await orch._start_streams()
+        tickers.put_nowait({"last": 50123.5})
+        orders.put_nowait([{"id": "o-1", "symbol": "BTC/USDT", "status": "closed"}])
+        for _ in range(50):
+            if orch.exchange.create_order.await_count and orch.current_price != Decimal("50000"):
+                break
+            await asyncio.sleep(0.001)
+
+        assert orch.current_price == Decimal("50123.5")
+        orch.exchange.create_order.assert_awaited_once()
+        status = orch._order_stream.get_status()
+        assert status["connected"] and status["updates"] == 1
+
+        await orch._stop_streams()
+        assert not orch._order_stream.running
+
+    async def test_disabled_without_use_websocket(self):
+        orch = _make_orchestrator(use_websocket=False)
+        await orch._start_streams()
+        assert orch._ticker_stream is None and orch._order_stream is None
@@ -14,11 +14,14 @@ from bot.core.risk_manager import RiskManager
 from bot.database.models import BotStateSnapshot
 from bot.orchestrator.state_persistence import (
     DecimalEncoder,
+    StateTracker,
+    decode_state,
     deserialize_dca_state,
     deserialize_grid_state,
     deserialize_hybrid_state,
     deserialize_risk_state,
     deserialize_trend_state,
+    encode_state,
     serialize_dca_state,
     serialize_grid_state,
     serialize_hybrid_state,
@@ -473,3 +476,150 @@ class TestOrchestratorStatePersistence:
         snapshot = orch.db.save_state_snapshot.call_args[0][0]
         # hybrid_strategy is None, so hybrid_state should be None
         assert snapshot.hybrid_state is None
+
+
+# ---------------------------------------------------------------------------
+# Incremental snapshots
+# ---------------------------------------------------------------------------
+
+
+def _grid_with_orders(n: int) -> GridEngine:
+    engine = GridEngine(
+        symbol="BTC/USDT",
+        upper_price=Decimal("50000"),
+        lower_price=Decimal("40000"),
+        grid_levels=5,
+        amount_per_grid=Decimal("100"),
+        profit_per_grid=Decimal("0.01"),
+    )
+    for i in range(n):
+        engine.active_orders[f"o{i}"] = GridOrder(
+            level=i,
+            price=Decimal("40000") + i,
+            amount=Decimal("0.002"),
+            side="buy",
+            order_id=f"o{i}",
+        )
+    return engine
+
+
+class TestStateEncoding:
+    def test_zlib_round_trip_and_size(self):
+        engine = _grid_with_orders(200)
+        plain = serialize_grid_state(engine)
+        packed = encode_state(plain, "zlib")
+        assert packed.startswith("zlib:")
+        assert len(packed) < len(plain) / 4
+        assert decode_state(packed) == plain
+
+        restored = _grid_with_orders(0)
+        assert deserialize_grid_state(restored, packed) is True
+        assert len(restored.active_orders) == 200
+
+    def test_unknown_encoding(self):
+        with pytest.raises(ValueError, match="Unknown state encoding"):
+            StateTracker("pickle")
+
+
+class TestStateTracker:
+    def test_only_changed_sections_are_returned(self):
+        grid = _grid_with_orders(3)
+        dca = DCAEngine(
+            symbol="BTC/USDT",
+            trigger_percentage=Decimal("0.05"),
+            amount_per_step=Decimal("100"),
+            max_steps=5,
+            take_profit_percentage=Decimal("0.10"),
+        )
+        sources = {"grid_state": grid, "dca_state": dca, "hybrid_state": None}
+        tracker = StateTracker()
+
+        first = tracker.collect(sources)
+        assert set(first) == {"grid_state", "dca_state", "hybrid_state"}
+        tracker.commit(0.001)
+        assert tracker.collect(sources) == {}
+        tracker.commit(0.001)
+
+        grid.handle_order_filled("o1", Decimal("40001"), Decimal("0.002"))
+        changed = tracker.collect(sources)
+        assert list(changed) == ["grid_state"]
+        assert json.loads(changed["grid_state"])["buy_count"] == 1
+        tracker.commit(0.002)
+
+        stats = tracker.stats
+        assert stats.saves == 3 and stats.unchanged == 1
+        assert stats.sections_written == 4
+        assert stats.bytes_written == sum(len(v or "") for v in first.values()) + len(
+            changed["grid_state"]
+        )
+        assert stats.max_save_seconds == 0.002
+
+    def test_probe_skips_serialization(self):
+        grid = _grid_with_orders(3)
+        tracker = StateTracker()
+        tracker.collect({"grid_state": grid})
+        tracker.commit(0.0)
+        serialized = tracker.stats.sections_serialized
+
+        tracker.collect({"grid_state": grid})
+        assert tracker.stats.sections_serialized == serialized
+
+        # Dirty sections are re-serialized but only written if the payload differs
+        tracker.mark_dirty("grid_state")
+        assert tracker.collect({"grid_state": grid}) == {}
+        assert tracker.stats.sections_serialized == serialized + 1
+
+    def test_uncommitted_changes_are_collected_again(self):
+        grid = _grid_with_orders(2)
+        tracker = StateTracker()
+        tracker.collect({"grid_state": grid})
+        tracker.commit(0.0)
+
+        grid.total_profit = Decimal("1")
+        assert "grid_state" in tracker.collect({"grid_state": grid})
+        # save failed: no commit
+        assert "grid_state" in tracker.collect({"grid_state": grid})
+
+
+class TestIncrementalOrchestratorSaves:
+    def _make_orchestrator(self):
+        orch = TestOrchestratorStatePersistence()._make_orchestrator()
+        orch.grid_engine = _grid_with_orders(3)
+        return orch
+
+    @pytest.mark.asyncio
+    async def test_unchanged_state_is_not_written(self):
+        orch = self._make_orchestrator()
+        await orch.save_state()
+        snapshot = orch.db.save_state_snapshot.call_args[0][0]
+        sections = orch.db.save_state_snapshot.call_args[1]["sections"]
+        assert "grid_state" in sections
+        assert json.loads(snapshot.grid_state)["active_orders"]["o0"]["price"] == "40000"
+
+        await orch.save_state()
+        assert orch.db.save_state_snapshot.await_count == 1
+
+        orch.grid_engine.handle_order_filled("o2", Decimal("40002"), Decimal("0.002"))
+        await orch.save_state()
+        assert orch.db.save_state_snapshot.call_args[1]["sections"] == ["grid_state"]
+        assert orch._state_tracker.stats.saves == 3
+
+    @pytest.mark.asyncio
+    async def test_fill_triggers_background_save(self):
+        orch = self._make_orchestrator()
+        orch._state_save_debounce = 0.01
+        orch._running = True
+        orch._state_save_task = asyncio.create_task(orch._state_save_loop())
+        await asyncio.sleep(0.05)
+        assert orch.db.save_state_snapshot.await_count == 0  # interval is 30s
+
+        await orch._on_grid_order_filled("o0")
+        await asyncio.sleep(0.1)
+        assert orch.db.save_state_snapshot.await_count == 1
+        snapshot = orch.db.save_state_snapshot.call_args[0][0]
+        assert json.loads(snapshot.grid_state)["buy_count"] == 1
+
+        orch._running = False
+        await orch._stop_state_save_loop()
+        status = (await orch.get_status())["state_persistence"]
+        assert status["saves"] == 1 and status["bytes_written"] > 0
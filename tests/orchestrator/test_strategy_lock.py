@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import deque
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock
 
@@ -13,6 +14,7 @@ from bot.orchestrator.market_regime import (
     RecommendedStrategy,
     RegimeAnalysis,
 )
+from bot.orchestrator.state_persistence import StateTracker
 
 
 def _make_regime(
@@ -58,6 +60,11 @@ def _make_orchestrator_stub(cooldown: float = 0.0) -> BotOrchestrator:
     orch._last_regime_update_at = 1.0      # non-zero: skip eager fetch in tests
     orch._regime_stale_threshold = 120.0
     orch.detect_market_regime = AsyncMock(return_value=None)
+    # WebSocket order flow
+    orch._ticker_stream = None
+    orch._order_stream = None
+    orch._fill_latencies = deque(maxlen=100)
+    orch._state_tracker = StateTracker()
     return orch
 
 
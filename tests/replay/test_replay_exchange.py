@@ -0,0 +1,151 @@
+"""Tests for ReplayExchangeClient — incremental OHLCV aggregation and order books."""
+
+import random
+from decimal import Decimal
+
+import pytest
+
+from bot.replay.replay_exchange import ReplayExchangeClient
+from bot.replay.simulated_clock import SimulatedClock
+
+START_MS = 1_700_000_000_000
+STEP_MS = 300_000
+
+
+def _candles(n: int, seed: int = 3) -> list[dict]:
+    rng = random.Random(seed)
+    price = 0.65
+    out = []
+    for i in range(n):
+        o = price
+        c = o * (1 + rng.gauss(0, 0.004))
+        out.append(
+            {
+                "timestamp": START_MS + i * STEP_MS,
+                "open": o,
+                "high": max(o, c) * (1 + abs(rng.gauss(0, 0.002))),
+                "low": min(o, c) * (1 - abs(rng.gauss(0, 0.002))),
+                "close": c,
+                "volume": rng.uniform(1000, 5000),
+            }
+        )
+        price = c
+    return out
+
+
+def _reference_ohlcv(candles: list[dict], idx: int, raw_per_bar: int, limit: int) -> list[list]:
+    """Full re-aggregation, as fetch_ohlcv did before bar buffers."""
+    raw = candles[: idx + 1]
+    bars = []
+    for i in range(0, len(raw), raw_per_bar):
+        chunk = raw[i : i + raw_per_bar]
+        bars.append(
+            [
+                chunk[0]["timestamp"],
+                chunk[0]["open"],
+                max(c["high"] for c in chunk),
+                min(c["low"] for c in chunk),
+                chunk[-1]["close"],
+                sum(c["volume"] for c in chunk),
+            ]
+        )
+    return bars[-limit:]
+
+
+def _exchange(
+    candles: list[dict], balance: str = "10000"
+) -> tuple[ReplayExchangeClient, SimulatedClock]:
+    clock = SimulatedClock(start_time=candles[0]["timestamp"] / 1000)
+    return ReplayExchangeClient(candles, clock, Decimal(balance)), clock
+
+
+class TestFetchOhlcv:
+    async def test_matches_full_reaggregation(self):
+        candles = _candles(700)
+        exchange, clock = _exchange(candles)
+        rng = random.Random(0)
+        timeframes = {"5m": 1, "15m": 3, "1h": 12, "4h": 48, "1d": 288}
+
+        for idx in range(len(candles)):
+            # Skip some steps so buffers must catch up across several bars
+            if rng.random() < 0.6:
+                continue
+            clock.advance_to(candles[idx]["timestamp"] / 1000)
+            for tf, n in timeframes.items():
+                limit = rng.choice([1, 2, 5, 50, 100])
+                got = await exchange.fetch_ohlcv("XRP/USDT", tf, limit=limit)
+                assert got == _reference_ohlcv(candles, idx, n, limit), (idx, tf, limit)
+
+    async def test_returned_bars_are_copies(self):
+        candles = _candles(30)
+        exchange, clock = _exchange(candles)
+        clock.advance_to(candles[20]["timestamp"] / 1000)
+
+        bars = await exchange.fetch_ohlcv("XRP/USDT", "15m", limit=10)
+        bars[-1][2] = -1.0
+        bars[0][2] = -1.0
+        again = await exchange.fetch_ohlcv("XRP/USDT", "15m", limit=10)
+        assert again == _reference_ohlcv(candles, 20, 3, 10)
+
+
+class TestLimitOrderBook:
+    async def test_fills_only_crossed_orders_in_placement_order(self):
+        candles = _candles(10)
+        exchange, clock = _exchange(candles)
+        low, high = candles[1]["low"], candles[1]["high"]
+        await exchange.create_order("XRP/USDT", "market", "buy", 1000)
+
+        # Resting orders far from the first candle
+        await exchange.create_order("XRP/USDT", "limit", "buy", 10, round(low * 0.5, 6))
+        await exchange.create_order("XRP/USDT", "limit", "sell", 10, round(high * 1.5, 6))
+        first = await exchange.create_order(
+            "XRP/USDT", "limit", "sell", 10, round(high * 0.9999, 6)
+        )
+        second = await exchange.create_order("XRP/USDT", "limit", "buy", 10, round(low * 1.0001, 6))
+        exchange._fill_log.clear()
+
+        clock.advance_to(candles[1]["timestamp"] / 1000)
+        await exchange.fetch_ticker("XRP/USDT")
+
+        filled = [f["order_id"] for f in exchange._fill_log]
+        crossed = {first["id"], second["id"]}
+        # Orders crossed immediately on placement never rest in the book
+        assert set(filled) <= crossed
+        assert filled == sorted(filled)
+        open_ids = {o["id"] for o in await exchange.fetch_open_orders("XRP/USDT")}
+        assert not open_ids & crossed
+        assert len(open_ids) == 2
+
+    async def test_cancel_removes_from_book(self):
+        candles = _candles(10)
+        exchange, clock = _exchange(candles)
+        price = round(candles[5]["low"] * 0.999, 6)
+        if price >= candles[0]["low"]:
+            pytest.skip("synthetic data crosses the test price immediately")
+
+        order = await exchange.create_order("XRP/USDT", "limit", "buy", 100, price)
+        await exchange.cancel_order(order["id"], "XRP/USDT")
+        assert not exchange._buy_book
+
+        clock.advance_to(candles[9]["timestamp"] / 1000)
+        await exchange.fetch_ticker("XRP/USDT")
+        assert (await exchange.fetch_order(order["id"], "XRP/USDT"))["status"] == "cancelled"
+        assert exchange.get_statistics()["free_balance"] == 10000.0
+
+    async def test_fill_releases_reserved_balance(self):
+        candles = _candles(50)
+        exchange, clock = _exchange(candles)
+        lowest = min(c["low"] for c in candles[1:])
+        price = round(lowest * 1.0005, 6)
+        if price >= candles[0]["low"]:
+            pytest.skip("synthetic data crosses the test price immediately")
+
+        order = await exchange.create_order("XRP/USDT", "limit", "buy", 100, price)
+        for c in candles[1:]:
+            clock.advance_to(c["timestamp"] / 1000)
+            await exchange.fetch_ticker("XRP/USDT")
+
+        assert (await exchange.fetch_order(order["id"], "XRP/USDT"))["status"] == "closed"
+        balance = await exchange.fetch_balance()
+        assert balance["used"]["USDT"] == pytest.approx(0.0, abs=1e-9)
+        assert balance["free"]["XRP"] == 100.0
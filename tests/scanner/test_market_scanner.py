@@ -10,12 +10,14 @@ Verifies:
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pandas as pd
 import pytest
 
+from bot.api.exceptions import NotSupportedError
 from bot.scanner.market_scanner import MarketScanner, ScannerConfig, ScanResult
 
 
@@ -324,6 +326,143 @@ class TestErrorHandling:
         assert results[0].symbol == "BTC/USDT"
 
 
+# ---------------------------------------------------------------------------
+# Bulk mode
+# ---------------------------------------------------------------------------
+
+def _bulk_config(pairs: list[str], **kwargs) -> ScannerConfig:
+    return ScannerConfig(
+        pairs=pairs,
+        mode="bulk",
+        request_delay_seconds=0,
+        ohlcv_requests_per_second=1000.0,
+        ohlcv_burst=1000,
+        **kwargs,
+    )
+
+
+class TestTickerMetrics:
+    def test_matches_per_ticker_helpers(self) -> None:
+        tickers = [
+            _make_ticker(),
+            _make_ticker(bid=100.0, ask=102.0, bid_volume=0.1, ask_volume=0.1),
+            {"baseVolume": 200.0, "last": 50000.0},
+            {"quoteVolume": 2_400_000.0},
+            {"bid": 0, "ask": 50000.0, "quoteVolume": 0},
+            {},
+        ]
+        volume, spread, liquidity = MarketScanner._ticker_metrics(tickers)
+        for i, t in enumerate(tickers):
+            assert volume[i] == pytest.approx(MarketScanner._extract_volume_24h(t))
+            assert spread[i] == pytest.approx(MarketScanner._calculate_spread(t))
+            assert liquidity[i] == pytest.approx(MarketScanner._extract_liquidity(t))
+
+    def test_empty(self) -> None:
+        volume, spread, liquidity = MarketScanner._ticker_metrics([])
+        assert len(volume) == len(spread) == len(liquidity) == 0
+
+
+class TestBulkScan:
+    @pytest.mark.asyncio
+    async def test_one_ticker_call_and_filters(self) -> None:
+        exchange = AsyncMock()
+        exchange.fetch_tickers = AsyncMock(return_value={
+            "BTC/USDT": _make_ticker(),
+            "LOW/USDT": _make_ticker(quote_volume=500_000.0),
+            "WIDE/USDT": _make_ticker(bid=100.0, ask=102.0),
+        })
+        exchange.fetch_ohlcv = AsyncMock(return_value=_make_ohlcv())
+        scanner = MarketScanner(
+            exchange, _bulk_config(["BTC/USDT", "LOW/USDT", "WIDE/USDT", "GONE/USDT"])
+        )
+
+        results = await scanner.scan()
+
+        exchange.fetch_tickers.assert_awaited_once()
+        exchange.fetch_ticker.assert_not_called()
+        assert exchange.fetch_ohlcv.await_count == 1
+        assert [r.symbol for r in results] == ["BTC/USDT"]
+
+    @pytest.mark.asyncio
+    async def test_matches_sequential_results(self) -> None:
+        pairs = ["BTC/USDT", "ETH/USDT", "SOL/USDT"]
+        ticker = _make_ticker()
+
+        sequential = await MarketScanner(
+            _make_exchange(ticker=ticker), ScannerConfig(pairs=pairs, request_delay_seconds=0)
+        ).scan()
+
+        exchange = _make_exchange(ticker=ticker)
+        exchange.fetch_tickers = AsyncMock(return_value=dict.fromkeys(pairs, ticker))
+        bulk = await MarketScanner(exchange, _bulk_config(pairs)).scan()
+
+        assert [r.symbol for r in bulk] == [r.symbol for r in sequential]
+        for b, s in zip(bulk, sequential, strict=True):
+            assert b.regime == s.regime
+            assert b.confidence == pytest.approx(s.confidence)
+            assert b.volume_24h == pytest.approx(s.volume_24h)
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_per_symbol_tickers(self) -> None:
+        exchange = _make_exchange()
+        exchange.fetch_tickers = AsyncMock(side_effect=NotImplementedError)
+        results = await MarketScanner(exchange, _bulk_config(["BTC/USDT", "ETH/USDT"])).scan()
+        assert exchange.fetch_ticker.await_count == 2
+        assert len(results) == 2
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_exchange_lacks_bulk_tickers(self) -> None:
+        exchange = _make_exchange()
+        exchange.fetch_tickers = AsyncMock(side_effect=NotSupportedError("Not supported"))
+        results = await MarketScanner(exchange, _bulk_config(["BTC/USDT", "ETH/USDT"])).scan()
+        assert exchange.fetch_ticker.await_count == 2
+        assert len(results) == 2
+
+    @pytest.mark.asyncio
+    async def test_ticker_failure_returns_empty(self) -> None:
+        exchange = _make_exchange()
+        exchange.fetch_tickers = AsyncMock(side_effect=Exception("API error"))
+        results = await MarketScanner(exchange, _bulk_config(["BTC/USDT"])).scan()
+        assert results == []
+
+    @pytest.mark.asyncio
+    async def test_ohlcv_failures_skip_pairs(self) -> None:
+        async def _fetch_ohlcv(symbol, timeframe="1h", limit=None):
+            if symbol == "FAIL/USDT":
+                raise Exception("Timeout")
+            if symbol == "SHORT/USDT":
+                return _make_ohlcv(30)
+            return _make_ohlcv()
+
+        exchange = AsyncMock()
+        pairs = ["FAIL/USDT", "SHORT/USDT", "BTC/USDT"]
+        exchange.fetch_tickers = AsyncMock(return_value={p: _make_ticker() for p in pairs})
+        exchange.fetch_ohlcv = _fetch_ohlcv
+        results = await MarketScanner(exchange, _bulk_config(pairs)).scan()
+        assert [r.symbol for r in results] == ["BTC/USDT"]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def _fetch_ohlcv(symbol, timeframe="1h", limit=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return _make_ohlcv()
+
+        pairs = [f"P{i}/USDT" for i in range(20)]
+        exchange = AsyncMock()
+        exchange.fetch_tickers = AsyncMock(return_value={p: _make_ticker() for p in pairs})
+        exchange.fetch_ohlcv = _fetch_ohlcv
+        results = await MarketScanner(exchange, _bulk_config(pairs, max_concurrency=4)).scan()
+        assert len(results) == 20
+        assert 1 < peak <= 4
+
+
 # ---------------------------------------------------------------------------
 # Config schema tests
 # ---------------------------------------------------------------------------
@@ -336,6 +475,14 @@ class TestScannerConfigSchema:
         assert len(cfg.pairs) == 5
         assert cfg.interval_minutes == 15
         assert cfg.min_volume_usdt == 1_000_000.0
+        assert cfg.mode == "sequential"
+
+    def test_rejects_unknown_mode(self) -> None:
+        from pydantic import ValidationError
+
+        from bot.config.schemas import ScannerConfig as SchemaConfig
+        with pytest.raises(ValidationError):
+            SchemaConfig(mode="parallel")
 
     def test_custom_config(self) -> None:
         from bot.config.schemas import ScannerConfig as SchemaConfig
@@ -0,0 +1,219 @@
+"""
+Parity tests for vectorized candle pattern detection.
+
+``reference_patterns`` is the original per-candle ``df.iloc`` implementation
+of EntrySignalGenerator's engulfing / pin bar / inside bar detection; the
+vectorized and incremental paths must find exactly the same patterns.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bot.strategies.smc.candle_patterns import IncrementalPatternDetector, detect_patterns
+from bot.strategies.smc.confluence_zones import ConfluenceZoneAnalyzer
+from bot.strategies.smc.entry_signals import EntrySignalGenerator, PatternType
+from bot.strategies.smc.market_structure import MarketStructureAnalyzer
+
+
+def make_ohlcv(n: int, seed: int = 3, volume: bool = True) -> pd.DataFrame:
+    """Random walk with frequent engulfing, pin bar and inside bar candles."""
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    open_ = close + rng.normal(0, 1, n)
+    high = np.maximum(open_, close) + np.abs(rng.normal(0, 1.5, n))
+    low = np.minimum(open_, close) - np.abs(rng.normal(0, 1.5, n))
+    data = {"open": open_, "high": high, "low": low, "close": close}
+    if volume:
+        data["volume"] = rng.integers(1000, 10000, n)
+    return pd.DataFrame(data, index=pd.date_range("2024-01-01", periods=n, freq="15min"))
+
+
+def reference_patterns(df: pd.DataFrame) -> list[tuple]:
+    """Original scalar detection: (type, is_bullish, index, quality) in emission order."""
+    found = []
+
+    for i in range(1, len(df)):
+        curr, prev = df.iloc[i], df.iloc[i - 1]
+        curr_body = abs(curr["close"] - curr["open"])
+        prev_body = abs(prev["close"] - prev["open"])
+        curr_range = curr["high"] - curr["low"]
+        if curr_body < curr_range * 0.3:
+            continue
+        bullish = (
+            prev["close"] < prev["open"]
+            and curr["close"] > curr["open"]
+            and curr["open"] <= prev["close"]
+            and curr["close"] >= prev["open"]
+        )
+        bearish = (
+            prev["close"] > prev["open"]
+            and curr["close"] < curr["open"]
+            and curr["open"] >= prev["close"]
+            and curr["close"] <= prev["open"]
+        )
+        if not (bullish or bearish):
+            continue
+        score = 0.0
+        if prev_body > 0:
+            score += (min(curr_body / prev_body, 3.0) / 3.0) * 40
+        if curr_range > 0:
+            score += (curr_body / curr_range) * 30
+        if "volume" in curr and "volume" in prev and prev["volume"] > 0:
+            score += (min(curr["volume"] / prev["volume"], 2.0) / 2.0) * 30
+        quality = min(100.0, score)
+        if quality >= 50:
+            found.append((PatternType.ENGULFING, bullish, i, quality))
+
+    for i in range(len(df)):
+        candle = df.iloc[i]
+        candle_range = candle["high"] - candle["low"]
+        if candle_range == 0:
+            continue
+        body = abs(candle["close"] - candle["open"])
+        upper = candle["high"] - max(candle["open"], candle["close"])
+        lower = min(candle["open"], candle["close"]) - candle["low"]
+        small_body = body < candle_range * 0.4
+        if lower > candle_range * 0.6 and small_body and upper < candle_range * 0.2:
+            bullish, wick = True, lower
+        elif upper > candle_range * 0.6 and small_body and lower < candle_range * 0.2:
+            bullish, wick = False, upper
+        else:
+            continue
+        score = 0.0
+        score += (min(wick / body, 5.0) / 5.0) * 40 if body > 0 else 40
+        score += (wick / candle_range) * 40
+        center = (max(candle["open"], candle["close"]) + min(candle["open"], candle["close"])) / 2
+        if bullish:
+            score += ((center - candle["low"]) / candle_range) * 20
+        else:
+            score += ((candle["high"] - center) / candle_range) * 20
+        quality = min(100.0, score)
+        if quality >= 50:
+            found.append((PatternType.PIN_BAR, bullish, i, quality))
+
+    for i in range(1, len(df)):
+        curr, prev = df.iloc[i], df.iloc[i - 1]
+        if curr["high"] <= prev["high"] and curr["low"] >= prev["low"]:
+            bullish = curr["close"] > (prev["high"] + prev["low"]) / 2
+            prev_range = prev["high"] - prev["low"]
+            if prev_range == 0:
+                continue
+            score = 50.0
+            score += (1.0 - (curr["high"] - curr["low"]) / prev_range) * 30
+            score += (min(prev_range / 1.0, 2.0) / 2.0) * 20
+            quality = min(100.0, score)
+            if quality >= 50:
+                found.append((PatternType.INSIDE_BAR, bool(bullish), i, quality))
+
+    return found
+
+
+def _generator(incremental: bool = False) -> EntrySignalGenerator:
+    ms = MarketStructureAnalyzer()
+    return EntrySignalGenerator(ms, ConfluenceZoneAnalyzer(ms), incremental=incremental)
+
+
+def _detected(generator: EntrySignalGenerator, df: pd.DataFrame) -> list[tuple]:
+    generator.detected_patterns.clear()
+    masks = generator._pattern_masks(df)
+    generator._detect_engulfing_patterns(df, masks)
+    generator._detect_pin_bar_patterns(df, masks)
+    generator._detect_inside_bar_patterns(df, masks)
+    return [
+        (p.pattern_type, p.is_bullish, p.index, p.quality_score)
+        for p in generator.detected_patterns
+    ]
+
+
+class TestParity:
+    @pytest.mark.parametrize("seed", [1, 2, 3, 4, 5])
+    def test_matches_reference(self, seed):
+        df = make_ohlcv(300, seed=seed)
+        expected = reference_patterns(df)
+
+        assert expected
+        assert _detected(_generator(), df) == expected
+
+    def test_fixture_covers_every_pattern_type(self):
+        found = {p[0] for seed in (1, 2, 3) for p in reference_patterns(make_ohlcv(300, seed))}
+        assert found == set(PatternType)
+
+    def test_matches_reference_without_volume(self):
+        df = make_ohlcv(200, volume=False)
+        assert _detected(_generator(), df) == reference_patterns(df)
+
+    def test_pattern_fields_match_candles(self):
+        df = make_ohlcv(120)
+        generator = _generator()
+        _detected(generator, df)
+
+        for pattern in generator.detected_patterns:
+            row = df.iloc[pattern.index]
+            assert pattern.timestamp == df.index[pattern.index]
+            assert float(pattern.close) == row["close"]
+            assert pattern.volume == float(row["volume"])
+            if pattern.pattern_type == PatternType.PIN_BAR:
+                assert pattern.previous_candle is None
+            else:
+                assert pattern.previous_candle["high"] == df.iloc[pattern.index - 1]["high"]
+
+    def test_flat_and_short_windows(self):
+        flat = np.ones((3, 4))
+        masks = detect_patterns(flat)
+        for name in ("engulfing", "pin_bar", "inside_bar"):
+            assert not masks.hits(name).size
+        assert len(detect_patterns(flat[:1])) == 1
+
+
+class TestIncremental:
+    def test_sliding_window_matches_batch(self):
+        df = make_ohlcv(600)
+        batch, incremental = _generator(), _generator(incremental=True)
+
+        for end in range(200, 600, 7):
+            window = df.iloc[end - 200 : end]
+            assert _detected(incremental, window) == _detected(batch, window)
+
+        detector = incremental._pattern_detector
+        assert detector.bars_reused > detector.bars_evaluated
+
+    def test_changed_last_bar_is_reevaluated(self):
+        df = make_ohlcv(100)
+        detector = IncrementalPatternDetector()
+        bars = df.to_numpy(dtype=float)
+        index = np.asarray(df.index)
+        detector.update(index, bars)
+
+        # Still-forming last candle becomes a hammer
+        bars = bars.copy()
+        bars[-1, :4] = [101.0, 102.0, 95.0, 101.5]
+        masks = detector.update(index, bars)
+
+        expected = detect_patterns(bars)
+        for name in ("engulfing", "pin_bar", "inside_bar"):
+            np.testing.assert_array_equal(masks.hits(name), expected.hits(name))
+            np.testing.assert_array_equal(
+                getattr(masks, f"{name}_quality"), getattr(expected, f"{name}_quality")
+            )
+        assert detector.bars_reused == 99
+
+    def test_unrelated_window_falls_back_to_full_detection(self):
+        detector = IncrementalPatternDetector()
+        first, second = make_ohlcv(50, seed=1), make_ohlcv(50, seed=2)
+        detector.update(np.asarray(first.index), first.to_numpy(dtype=float))
+
+        bars = second.to_numpy(dtype=float)
+        second.index = second.index + pd.Timedelta(days=30)
+        masks = detector.update(np.asarray(second.index), bars)
+
+        np.testing.assert_array_equal(masks.engulfing, detect_patterns(bars).engulfing)
+        assert detector.bars_reused == 0
+
+    def test_in_place_edit_of_source_frame_is_detected(self):
+        df = make_ohlcv(60)
+        generator = _generator(incremental=True)
+        _detected(generator, df)
+
+        df.iloc[-1, df.columns.get_loc("close")] += 5
+        assert _detected(generator, df) == reference_patterns(df)
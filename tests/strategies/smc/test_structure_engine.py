@@ -0,0 +1,309 @@
+"""
+Tests for the incremental SMC structure engine.
+
+Swings and FVGs are checked against smartmoneyconcepts on the same history;
+every record is checked for incremental/batch parity: feeding sliding
+windows, chunks or single bars must end in the same state as feeding the
+whole history at once.
+"""
+
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+import smartmoneyconcepts.smc as smc
+
+from bot.strategies.smc.confluence_zones import (
+    ConfluenceZoneAnalyzer,
+    FairValueGap,
+    OrderBlock,
+    ZoneStatus,
+)
+from bot.strategies.smc.market_structure import MarketStructureAnalyzer, SwingPoint
+from bot.strategies.smc.structure_engine import StructureEngine
+from tests.strategies.smc.test_candle_patterns import make_ohlcv
+
+WINDOW = 200
+
+
+def snapshot(engine: StructureEngine) -> tuple:
+    """Every record the engine holds, as plain tuples keyed by timestamp."""
+    return (
+        [(s.timestamp, s.is_high, s.level) for s in engine.swings],
+        [(b.timestamp, b.is_bullish, b.is_choch, b.level, b.broken_at) for b in engine.breaks],
+        {
+            ts: (ob.is_bullish, ob.top, ob.bottom, ob.volume, ob.mitigated_at)
+            for ts, ob in engine.order_blocks.items()
+        },
+        {
+            ts: (fvg.is_bullish, fvg.top, fvg.bottom, fvg.mitigated_at)
+            for ts, fvg in engine.fair_value_gaps.items()
+        },
+        {
+            ts: (pool.is_bullish, pool.levels, pool.end_at, pool.swept_at)
+            for ts, pool in engine.liquidity.items()
+        },
+    )
+
+
+def batch(df: pd.DataFrame, **kwargs) -> StructureEngine:
+    engine = StructureEngine(**kwargs)
+    engine.update(df)
+    return engine
+
+
+class TestLibraryParity:
+    @pytest.mark.parametrize("swing_length", [3, 5, 10])
+    def test_swings_match_library(self, swing_length):
+        df = make_ohlcv(600)
+        engine = batch(df, swing_length=swing_length)
+
+        swings = smc.swing_highs_lows(df.astype(float), swing_length=swing_length)
+        high_low, level = swings["HighLow"].to_numpy(), swings["Level"].to_numpy()
+        # The library pins synthetic swings to the first and last bar
+        expected = [
+            (df.index[i], bool(high_low[i] == 1), level[i])
+            for i in np.flatnonzero(~np.isnan(high_low))
+            if 0 < i < len(df) - 1
+        ]
+
+        assert expected
+        assert [(s.timestamp, s.is_high, s.level) for s in engine.swings] == expected
+
+    def test_fvgs_match_library(self):
+        df = make_ohlcv(600)
+        engine = batch(df, swing_length=5)
+
+        fvg = smc.fvg(df.astype(float), join_consecutive=False)
+        expected = {}
+        for i in np.flatnonzero(fvg["FVG"].notna().to_numpy()):
+            mitigated = fvg["MitigatedIndex"].iat[i]
+            expected[df.index[i]] = (
+                bool(fvg["FVG"].iat[i] == 1),
+                fvg["Top"].iat[i],
+                fvg["Bottom"].iat[i],
+                df.index[int(mitigated)] if pd.notna(mitigated) and mitigated > i else None,
+            )
+
+        assert expected
+        assert snapshot(engine)[3] == expected
+
+
+class TestIncrementalParity:
+    @pytest.mark.parametrize("step", [1, 7])
+    def test_sliding_window_matches_batch(self, step):
+        df = make_ohlcv(1200)
+        engine = StructureEngine(swing_length=5)
+        for end in range(WINDOW, len(df) + 1, step):
+            engine.update(df.iloc[max(0, end - WINDOW) : end])
+        engine.update(df.iloc[-WINDOW:])
+
+        assert snapshot(engine) == snapshot(batch(df, swing_length=5))
+        assert engine.bars_processed == len(df)
+        assert engine.rebuilds == 0
+
+    def test_single_bars_match_batch(self):
+        df = make_ohlcv(500, seed=4)
+        engine = StructureEngine(swing_length=3, close_break=False, close_mitigation=True)
+        for end in range(1, len(df) + 1):
+            engine.update(df.iloc[end - 1 : end])
+
+        expected = batch(df, swing_length=3, close_break=False, close_mitigation=True)
+        assert snapshot(engine) == snapshot(expected)
+
+    def test_updates_report_each_record_once(self):
+        df = make_ohlcv(1000, seed=2)
+        engine = StructureEngine(swing_length=5)
+        breaks, order_blocks, fvgs = [], [], []
+        for end in range(WINDOW, len(df) + 1, 5):
+            update = engine.update(df.iloc[end - WINDOW : end])
+            breaks += update.breaks
+            order_blocks += update.order_blocks
+            fvgs += update.fair_value_gaps
+
+        assert breaks == engine.breaks
+        assert {f.timestamp for f in fvgs} == set(engine.fair_value_gaps)
+        assert len(fvgs) == len(engine.fair_value_gaps)
+        # Order blocks that price traded back through are dropped afterwards
+        assert set(engine.order_blocks) <= {ob.timestamp for ob in order_blocks}
+
+    def test_record_kinds_are_covered(self):
+        engine = batch(make_ohlcv(1500), swing_length=5)
+        _, breaks, order_blocks, fvgs, pools = snapshot(engine)
+
+        assert {b[2] for b in breaks} == {False, True}
+        assert order_blocks and fvgs and pools
+        assert any(pool[3] is not None for pool in pools.values())
+        assert any(fvg[3] is not None for fvg in fvgs.values())
+
+
+class TestRevisions:
+    def test_changed_last_bar_replays(self):
+        df = make_ohlcv(400)
+        engine = batch(df, swing_length=5)
+
+        revised = df.copy()
+        revised.iloc[-1, revised.columns.get_loc("close")] += 4
+        update = engine.update(revised)
+
+        assert update.replayed == len(df) - 1
+        assert update.bars == 1
+        assert snapshot(engine) == snapshot(batch(revised, swing_length=5))
+
+    def test_replayed_prefix_is_not_reported_again(self):
+        df = make_ohlcv(400)
+        revised = df.copy()
+        revised.iloc[-1, revised.columns.get_loc("high")] += 50
+
+        engine = batch(df, swing_length=5)
+        replayed = engine.update(revised)
+        appended = batch(df.iloc[:-1], swing_length=5).update(revised)
+
+        for name in ("breaks", "order_blocks", "fair_value_gaps", "mitigated", "liquidity"):
+            assert getattr(replayed, name) == getattr(appended, name)
+
+    def test_unrelated_window_rebuilds(self):
+        engine = batch(make_ohlcv(300, seed=1), swing_length=5)
+        other = make_ohlcv(300, seed=2)
+        other.index = other.index - pd.Timedelta(days=30)
+
+        update = engine.update(other)
+
+        assert update.rebuilt
+        assert engine.rebuilds == 1
+        assert snapshot(engine) == snapshot(batch(other, swing_length=5))
+
+    def test_trimmed_history_equals_batch_over_retained_bars(self):
+        df = make_ohlcv(1500)
+        engine = StructureEngine(swing_length=5, max_bars=300)
+        for end in range(WINDOW, len(df) + 1, 10):
+            engine.update(df.iloc[end - WINDOW : end])
+
+        assert engine.rebuilds > 0
+        assert len(engine) <= 600
+        assert snapshot(engine) == snapshot(batch(df.iloc[-len(engine) :], swing_length=5))
+
+    def test_missing_volume_is_zero(self):
+        df = make_ohlcv(300, volume=False)
+        engine = batch(df, swing_length=5)
+        assert all(ob.volume == 0 for ob in engine.order_blocks.values())
+
+
+class TestIncrementalAnalyzers:
+    def test_market_structure_window_indexes(self):
+        df = make_ohlcv(800)
+        analyzer = MarketStructureAnalyzer(swing_length=5, incremental=True)
+
+        for end in range(WINDOW, len(df) + 1, 3):
+            window = df.iloc[end - WINDOW : end]
+            analyzer.analyze(window)
+
+            for swing in analyzer.swing_highs + analyzer.swing_lows:
+                assert window.index[swing.index] == swing.timestamp
+            for event in analyzer.structure_events:
+                assert window.index[event.index] == event.timestamp
+
+        engine_swings = [
+            s.timestamp for s in analyzer.engine.swings if s.timestamp >= window.index[0]
+        ]
+        swings = sorted(analyzer.swing_highs + analyzer.swing_lows, key=lambda s: s.index)
+        assert [s.timestamp for s in swings] == engine_swings
+
+        swings_df = analyzer.get_swings_df()
+        assert len(swings_df) == WINDOW
+        assert int(swings_df["HighLow"].notna().sum()) == len(swings)
+
+    def test_nearest_swing_matches_linear_scan(self):
+        analyzer = MarketStructureAnalyzer(swing_length=5)
+        rng = np.random.default_rng(0)
+        indexes = sorted(rng.choice(500, size=40, replace=False).tolist())
+        analyzer.swing_highs = [
+            SwingPoint(i, Decimal("1"), pd.Timestamp(0), True, 5) for i in indexes
+        ]
+
+        for target in range(-5, 510):
+            expected = min(analyzer.swing_highs, key=lambda s: abs(s.index - target))
+            assert analyzer._find_nearest_swing(target, is_high=True) is expected
+
+    def test_confluence_zones_keyed_by_timestamp(self):
+        df = make_ohlcv(800, seed=5)
+        structure = MarketStructureAnalyzer(swing_length=5, incremental=True)
+        analyzer = ConfluenceZoneAnalyzer(structure, max_active_zones=50, incremental=True)
+
+        for end in range(WINDOW, len(df) + 1, 4):
+            window = df.iloc[end - WINDOW : end]
+            analyzer.analyze(window)
+
+            stamps = [ob.timestamp for ob in analyzer.order_blocks]
+            assert len(stamps) == len(set(stamps))
+            for ob in analyzer.order_blocks:
+                if ob.index >= 0:
+                    assert window.index[ob.index] == ob.timestamp
+            for fvg in analyzer.fair_value_gaps:
+                if fvg.candle2_index >= 0:
+                    assert window.index[fvg.candle2_index] == fvg.timestamp
+            for zone in analyzer.liquidity_zones:
+                assert window.index[zone.index] == zone.timestamp
+
+    def test_incremental_rejects_fvg_joining(self):
+        structure = MarketStructureAnalyzer(swing_length=5)
+        with pytest.raises(ValueError):
+            ConfluenceZoneAnalyzer(structure, join_consecutive_fvg=True, incremental=True)
+
+
+class TestConfluenceIndex:
+    def _reference(self, analyzer, price, tolerance):
+        """Original linear scan over the active zones."""
+        tolerance_range = price * (tolerance / Decimal("100"))
+        low, high = price - tolerance_range, price + tolerance_range
+        return (
+            [ob for ob in analyzer.get_active_order_blocks() if ob.low <= high and ob.high >= low],
+            [f for f in analyzer.get_active_fvgs() if f.gap_low <= high and f.gap_high >= low],
+        )
+
+    def test_matches_linear_scan(self):
+        rng = np.random.default_rng(1)
+        analyzer = ConfluenceZoneAnalyzer(MarketStructureAnalyzer(swing_length=5))
+        statuses = [ZoneStatus.ACTIVE, ZoneStatus.ACTIVE, ZoneStatus.INVALIDATED]
+
+        for _ in range(60):
+            low = Decimal(str(round(rng.uniform(90, 110), 2)))
+            width = Decimal(str(round(rng.uniform(0, 4), 2)))
+            analyzer.order_blocks.append(
+                OrderBlock(
+                    high=low + width,
+                    low=low,
+                    status=statuses[rng.integers(3)],
+                    strength_score=float(rng.integers(5)),
+                )
+            )
+            analyzer.fair_value_gaps.append(
+                FairValueGap(
+                    gap_high=low + width / 2,
+                    gap_low=low,
+                    status=statuses[rng.integers(3)],
+                    strength_score=float(rng.integers(5)),
+                )
+            )
+
+        for price in range(85, 116):
+            for tolerance in (Decimal("0.1"), Decimal("0.5"), Decimal("2")):
+                result = analyzer.find_confluence_at_price(Decimal(price), tolerance)
+                obs, fvgs = self._reference(analyzer, Decimal(price), tolerance)
+                assert result["order_blocks"] == obs
+                assert result["fair_value_gaps"] == fvgs
+                assert [id(z) for z in result["order_blocks"]] == [id(z) for z in obs]
+
+    def test_index_follows_list_changes(self):
+        analyzer = ConfluenceZoneAnalyzer(MarketStructureAnalyzer(swing_length=5))
+        assert analyzer.find_confluence_at_price(Decimal("100"))["confluence_count"] == 0
+
+        analyzer.order_blocks.append(OrderBlock(high=Decimal("101"), low=Decimal("99")))
+        assert analyzer.find_confluence_at_price(Decimal("100"))["confluence_count"] == 1
+
+        analyzer.order_blocks[0].status = ZoneStatus.INVALIDATED
+        assert analyzer.find_confluence_at_price(Decimal("100"))["confluence_count"] == 0
+
+        analyzer.order_blocks = [OrderBlock(high=Decimal("200"), low=Decimal("190"))]
+        assert analyzer.find_confluence_at_price(Decimal("195"))["confluence_count"] == 1
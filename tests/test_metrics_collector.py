@@ -205,6 +205,22 @@ class TestCollectAll:
         metrics = exporter.metrics
         assert "traderagent_pnl_unrealized" in metrics
 
+    async def test_collect_exchange_transport_latency(self, exporter):
+        orch = _make_orchestrator()
+        status = await orch.get_status()
+        hist = {"count": 5, "avg": 0.02, "max": 0.09, "p50": 0.01, "p90": 0.05, "p99": 0.08}
+        status["exchange_transport"] = {"latency": {"connect": hist, "ttfb": hist, "total": hist}}
+        orch.get_status = AsyncMock(return_value=status)
+        collector = MetricsCollector(exporter=exporter, orchestrators={"test_bot": orch})
+
+        await collector.collect_all()
+        values = exporter.metrics["traderagent_exchange_request_seconds"]
+        p99 = next(
+            v for v in values if v.labels.get("phase") == "total" and v.labels.get("stat") == "p99"
+        )
+        assert p99.value == 0.08
+        assert len(values) == 12
+
     async def test_collect_handles_failed_bot(self, exporter):
         orch = _make_orchestrator()
         orch.get_status = AsyncMock(side_effect=RuntimeError("connection lost"))
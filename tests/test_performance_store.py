@@ -0,0 +1,226 @@
+"""Tests for the performance time-series store and sampler."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from bot.database.models import Base, PerformanceSnapshot
+from bot.monitoring.performance_store import (
+    PORTFOLIO,
+    PerformancePoint,
+    PerformanceSample,
+    PerformanceSampler,
+    PerformanceStore,
+    bucket_start,
+    compute_drawdown,
+    sample_from_status,
+)
+
+T0 = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest_asyncio.fixture
+async def db(tmp_path):
+    # A file survives the connection drop of a sampler cancelled mid-query; :memory: would not
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'perf.db'}", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def session():
+        async with factory() as s:
+            yield s
+            await s.commit()
+
+    manager = MagicMock()
+    manager._engine = engine
+    manager.session = session
+    yield manager
+    await engine.dispose()
+
+
+async def _rows(db, resolution: str, bot_name: str = "a") -> list[PerformanceSnapshot]:
+    async with db.session() as session:
+        result = await session.execute(
+            select(PerformanceSnapshot)
+            .where(
+                PerformanceSnapshot.resolution == resolution,
+                PerformanceSnapshot.bot_name == bot_name,
+            )
+            .order_by(PerformanceSnapshot.bucket)
+        )
+        return list(result.scalars().all())
+
+
+class TestSampleFromStatus:
+    def test_dca_position_marked_to_market(self):
+        status = {
+            "bot_name": "b",
+            "current_price": "110",
+            "grid": {"total_profit": 5},
+            "dca": {
+                "realized_profit": "2",
+                "has_position": True,
+                "total_cost": "100",
+                "average_entry_price": "100",
+            },
+            "risk": {"current_balance": "1000"},
+        }
+        sample = sample_from_status(status)
+        assert sample.realized_pnl == Decimal("7")
+        assert sample.unrealized_pnl == Decimal("10")
+        assert sample.exposure == Decimal("110")
+        assert sample.equity == Decimal("1010")
+
+    def test_without_balance_equity_is_pnl(self):
+        status = {
+            "bot_name": "b",
+            "trend_follower": {"statistics": {"risk_metrics": {"total_pnl": 12.5}}},
+        }
+        sample = sample_from_status(status)
+        assert sample.equity == Decimal("12.5")
+        assert sample.exposure == 0
+
+
+class TestPerformanceStore:
+    async def test_record_rolls_up_all_resolutions(self, db):
+        store = PerformanceStore(db)
+        for i, equity in enumerate([100, 120, 90, 110]):
+            await store.record(
+                [PerformanceSample("a", Decimal(equity), realized_pnl=Decimal(i))],
+                at=T0 + timedelta(seconds=20 * i),
+            )
+
+        minutes = await _rows(db, "1m")
+        assert [m.samples for m in minutes] == [3, 1]
+        assert (minutes[0].equity, minutes[0].equity_high, minutes[0].equity_low) == (90, 120, 90)
+        (hour,) = await _rows(db, "1h")
+        assert hour.bucket.replace(tzinfo=timezone.utc) == bucket_start(T0, "1h")
+        assert (hour.equity, hour.equity_high, hour.equity_low) == (110, 120, 90)
+        assert hour.realized_pnl == 3 and hour.samples == 4
+        assert len(await _rows(db, "1d")) == 1
+
+    async def test_series_sums_bots_and_filters_period(self, db):
+        store = PerformanceStore(db)
+        for h in range(48):
+            at = T0 + timedelta(hours=h)
+            await store.record(
+                [PerformanceSample("a", Decimal(100 + h)), PerformanceSample("b", Decimal(50))],
+                at=at,
+            )
+        now = T0 + timedelta(hours=47, minutes=30)
+
+        portfolio = await store.series("7d", now=now)
+        assert len(portfolio) == 48
+        assert portfolio[-1].equity == Decimal(100 + 47 + 50)
+        assert portfolio[0].timestamp == T0
+
+        day = await store.series("1d", bot_name="a", now=now)
+        assert [p.equity for p in day] == [Decimal(100 + h) for h in range(24, 48)]
+        assert len(await store.series("all", bot_name="b")) == 3
+
+        with pytest.raises(ValueError, match="Unknown period"):
+            await store.series("2w")
+
+    async def test_portfolio_range_comes_from_summed_equity(self, db):
+        store = PerformanceStore(db)
+        # The bots peak and bottom at different instants of the same hour
+        for i, (a, b) in enumerate([(100, 100), (150, 50), (50, 150), (100, 100)]):
+            await store.record(
+                [PerformanceSample("a", Decimal(a)), PerformanceSample("b", Decimal(b))],
+                at=T0 + timedelta(minutes=i),
+            )
+
+        (hour,) = await store.series("7d", now=T0)
+        assert (hour.equity, hour.equity_high, hour.equity_low) == (200, 200, 200)
+        assert compute_drawdown([hour]).max_drawdown_pct == 0.0
+
+    async def test_portfolio_carries_bots_missing_from_a_tick(self, db):
+        store = PerformanceStore(db)
+        both = [PerformanceSample("a", Decimal(100)), PerformanceSample("b", Decimal(50))]
+        await store.record(both, at=T0)
+        await store.record([PerformanceSample("a", Decimal(110))], at=T0 + timedelta(minutes=1))
+
+        minutes = await _rows(db, "1m", PORTFOLIO)
+        assert [m.equity for m in minutes] == [150, 160]
+
+        store.forget("b")
+        await store.record([PerformanceSample("a", Decimal(110))], at=T0 + timedelta(minutes=2))
+        assert (await _rows(db, "1m", PORTFOLIO))[-1].equity == 110
+
+    async def test_drawdown_from_series(self, db):
+        store = PerformanceStore(db)
+        for d, equity in enumerate([100, 150, 120, 135, 160, 140]):
+            await store.record([PerformanceSample("a", Decimal(equity))], T0 + timedelta(days=d))
+
+        stats = await store.drawdown("all", "a")
+        assert stats.max_drawdown_pct == pytest.approx(20.0)
+        assert stats.max_drawdown_amount == Decimal("30")
+        assert stats.current_drawdown_pct == pytest.approx(12.5)
+        assert stats.recovery_time_hours == pytest.approx(48.0)
+
+    async def test_prune_respects_retention(self, db):
+        store = PerformanceStore(db)
+        await store.record([PerformanceSample("a", Decimal(1))], T0)
+        await store.record([PerformanceSample("a", Decimal(2))], T0 + timedelta(days=3))
+
+        deleted = await store.prune(now=T0 + timedelta(days=3))
+        assert deleted == 2  # the first 1m bucket, for the bot and the portfolio
+        assert len(await _rows(db, "1m")) == 1
+        assert len(await _rows(db, "1h")) == 2
+        assert len(await _rows(db, "1d")) == 2
+
+
+class TestComputeDrawdown:
+    def test_empty_and_flat(self):
+        assert compute_drawdown([]).max_drawdown_pct == 0.0
+        flat = PerformancePoint(T0, *(Decimal(10),) * 3, *(Decimal(0),) * 3)
+        stats = compute_drawdown([flat])
+        assert stats.max_drawdown_pct == 0.0 and stats.recovery_time_hours is None
+
+
+class TestPerformanceSampler:
+    async def test_sample_all_skips_failing_bots(self, db):
+        good = MagicMock()
+        good.get_status = AsyncMock(return_value={"risk": {"current_balance": "500"}})
+        bad = MagicMock()
+        bad.get_status = AsyncMock(side_effect=RuntimeError("boom"))
+        sampler = PerformanceSampler(PerformanceStore(db), {"good": good, "bad": bad})
+
+        assert await sampler.sample_all(at=T0) == 1
+        (row,) = await _rows(db, "1m", "good")
+        assert row.equity == 500
+        assert (await _rows(db, "1m", PORTFOLIO))[0].equity == 500
+
+    async def test_sample_all_forgets_removed_bots(self, db):
+        orch = MagicMock()
+        orch.get_status = AsyncMock(return_value={"risk": {"current_balance": "500"}})
+        store = PerformanceStore(db)
+        sampler = PerformanceSampler(store, {"a": orch, "b": orch})
+        await sampler.sample_all(at=T0)
+
+        sampler.set_orchestrators({"a": orch})
+        await sampler.sample_all(at=T0 + timedelta(minutes=1))
+        assert store.bot_names == {"a"}
+        assert [r.equity for r in await _rows(db, "1m", PORTFOLIO)] == [1000, 500]
+
+    async def test_start_stop(self, db):
+        orch = MagicMock()
+        orch.get_status = AsyncMock(return_value={"grid": {"total_profit": 1}})
+        sampler = PerformanceSampler(PerformanceStore(db), {"g": orch}, interval=60)
+        await sampler.start()
+        await asyncio.sleep(0.05)
+        await sampler.stop()
+        async with db.session() as session:
+            count = (
+                await session.execute(select(func.count()).select_from(PerformanceSnapshot))
+            ).scalar()
+        assert count == 6  # the bot and the portfolio total, at three resolutions
@@ -223,3 +223,32 @@ async def test_update_stopped_bot(auth_client: AsyncClient, mock_orchestrator):
     }
     resp = await auth_client.put("/api/v1/bots/test_bot", json={"dry_run": False})
     assert resp.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_pnl_history_synthetic_without_snapshots(auth_client: AsyncClient):
+    resp = await auth_client.get("/api/v1/bots/test_bot/pnl/history", params={"period": "7d"})
+    assert resp.status_code == 200
+    points = resp.json()["points"]
+    assert len(points) == 30
+    assert points[-1]["value"] == pytest.approx(1234.56)
+
+
+@pytest.mark.asyncio
+async def test_pnl_history_from_snapshots(auth_client: AsyncClient, mock_db_manager):
+    from datetime import datetime, timedelta, timezone
+    from decimal import Decimal
+
+    from bot.monitoring.performance_store import PerformanceSample, PerformanceStore
+
+    store = PerformanceStore(mock_db_manager)
+    now = datetime.now(timezone.utc)
+    for h in range(3):
+        sample = PerformanceSample(
+            "test_bot", Decimal(1000), realized_pnl=Decimal(10 * h), unrealized_pnl=Decimal(1)
+        )
+        await store.record([sample], now - timedelta(hours=2 - h))
+
+    resp = await auth_client.get("/api/v1/bots/test_bot/pnl/history", params={"period": "7d"})
+    assert resp.status_code == 200
+    assert [p["value"] for p in resp.json()["points"]] == [1.0, 11.0, 21.0]
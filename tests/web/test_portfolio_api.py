@@ -59,3 +59,31 @@ async def test_portfolio_trades(auth_client: AsyncClient):
     assert "items" in data
     assert "total" in data
     assert "page" in data
+
+
+@pytest.mark.asyncio
+async def test_portfolio_history_from_snapshots(auth_client: AsyncClient, mock_db_manager):
+    from datetime import datetime, timedelta, timezone
+    from decimal import Decimal
+
+    from bot.monitoring.performance_store import PerformanceSample, PerformanceStore
+
+    store = PerformanceStore(mock_db_manager)
+    now = datetime.now(timezone.utc)
+    for h, equity in enumerate([1000, 1200, 900]):
+        at = now - timedelta(hours=2 - h)
+        await store.record(
+            [PerformanceSample("a", Decimal(equity)), PerformanceSample("b", Decimal(100))], at
+        )
+
+    resp = await auth_client.get("/api/v1/portfolio/history", params={"period": "7d"})
+    assert resp.status_code == 200
+    history = resp.json()["history"]
+    assert [float(p["balance"]) for p in history] == [1100, 1300, 1000]
+
+    resp = await auth_client.get("/api/v1/portfolio/drawdown", params={"period": "1d"})
+    assert resp.status_code == 200
+    assert resp.json()["max_drawdown_pct"] == pytest.approx(300 / 13)
+
+    resp = await auth_client.get("/api/v1/portfolio/history", params={"period": "2w"})
+    assert resp.status_code == 422
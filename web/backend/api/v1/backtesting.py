@@ -3,6 +3,8 @@ Backtesting API endpoints — async job execution with real GridBacktestSimulato
 """
 
 import asyncio
+import hashlib
+import inspect
 import sys
 import uuid
 from datetime import datetime, timezone
@@ -16,9 +18,12 @@ _backtester_src = str(Path(__file__).resolve().parent.parent.parent.parent.paren
 if _backtester_src not in sys.path:
     sys.path.insert(0, _backtester_src)
 
+import grid_backtester.engine.simulator  # noqa: E402
 from grid_backtester.engine import GridBacktestConfig, GridBacktestSimulator
 
+from bot.tests.backtesting.result_cache import ResultCache  # noqa: E402
 from web.backend.auth.models import User
+from web.backend.config import web_config  # noqa: E402
 from web.backend.dependencies import get_current_user, get_orchestrators
 from web.backend.schemas.backtest import BacktestJobResponse, BacktestRunRequest
 
@@ -27,6 +32,28 @@ router = APIRouter(prefix="/api/v1/backtesting", tags=["backtesting"])
 # In-memory job store (production: use backtest_jobs table)
 _jobs: dict[str, dict] = {}
 _semaphore = asyncio.Semaphore(2)  # Max 2 concurrent backtests
+_result_cache: ResultCache | None = None
+
+
+def _cache_namespace() -> str:
+    """Backtester version + hash of the simulator and runner code, so edits invalidate entries."""
+    code = (grid_backtester.engine.simulator, _run_grid_backtest, _run_grid_backtest_offline)
+    source = "".join(inspect.getsource(obj) for obj in code)
+    digest = hashlib.sha256(source.encode()).hexdigest()[:16]
+    return f"grid_backtester-{grid_backtester.__version__}-{digest}"
+
+
+def _get_result_cache() -> ResultCache:
+    """Results keyed by candle data + simulator config, shared by all jobs and workers."""
+    global _result_cache
+    if _result_cache is None:
+        _result_cache = ResultCache(
+            web_config.backtest_cache_path,
+            max_bytes=web_config.backtest_cache_max_mb * 1024 * 1024,
+            namespace=_cache_namespace(),
+        )
+        _result_cache.initialize()
+    return _result_cache
 
 
 @router.post("/run", response_model=BacktestJobResponse, status_code=202)
@@ -87,6 +114,14 @@ async def get_backtest_result(
     return BacktestJobResponse(**job)
 
 
+@router.get("/cache/stats")
+async def get_cache_stats(
+    _: User = Depends(get_current_user),
+):
+    """Hit/miss report and occupancy of the backtest result cache."""
+    return _get_result_cache().report()
+
+
 @router.get("/data/pairs")
 async def get_available_pairs(
     _: User = Depends(get_current_user),
@@ -120,7 +155,13 @@ async def _execute_backtest(job_id: str, data: BacktestRunRequest, exchange=None
             if data.strategy_type == "grid" and exchange:
                 result = await _run_grid_backtest(data, exchange)
             elif data.strategy_type == "grid":
-                result = await asyncio.to_thread(_run_grid_backtest_offline, data)
+                # Synthetic data is seeded, so identical requests give identical results
+                cache = _get_result_cache()
+                key = cache.key("synthetic", "grid-offline", data.model_dump())
+                result = await asyncio.to_thread(cache.get, key)
+                if result is None:
+                    result = await asyncio.to_thread(_run_grid_backtest_offline, data)
+                    await asyncio.to_thread(cache.put, key, result)
             else:
                 raise ValueError(
                     f"Backtesting for strategy '{data.strategy_type}' is not yet implemented. "
@@ -162,11 +203,17 @@ async def _run_grid_backtest(data: BacktestRunRequest, exchange) -> dict:
         initial_balance=Decimal(str(data.initial_balance)),
     )
 
+    cache = _get_result_cache()
+    key = cache.key(df, "grid", config)
+    cached = await asyncio.to_thread(cache.get, key)
+    if cached is not None:
+        return cached
+
     # Run real simulator
     sim = GridBacktestSimulator(config)
     result = await asyncio.to_thread(sim.run, df)
 
-    return {
+    summary = {
         "total_return_pct": result.total_return_pct,
         "max_drawdown_pct": result.max_drawdown_pct,
         "sharpe_ratio": result.sharpe_ratio,
@@ -182,6 +229,8 @@ async def _run_grid_backtest(data: BacktestRunRequest, exchange) -> dict:
             for ep in (result.equity_curve or [])[:200]  # limit to 200 points
         ],
     }
+    await asyncio.to_thread(cache.put, key, summary)
+    return summary
 
 
 def _run_grid_backtest_offline(data: BacktestRunRequest) -> dict:
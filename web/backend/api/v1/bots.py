@@ -4,8 +4,13 @@ Bots API endpoints.
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 
+from bot.monitoring.performance_store import PerformanceStore
 from web.backend.auth.models import User
-from web.backend.dependencies import get_current_user, get_orchestrators
+from web.backend.dependencies import (
+    get_current_user,
+    get_orchestrators,
+    get_performance_store,
+)
 from web.backend.schemas.bot import (
     BotCreateRequest,
     BotCreateResponse,
@@ -23,8 +28,11 @@ from web.backend.services.bot_service import BotService
 router = APIRouter(prefix="/api/v1/bots", tags=["bots"])
 
 
-def _get_bot_service(orchestrators: dict = Depends(get_orchestrators)) -> BotService:
-    return BotService(orchestrators)
+def _get_bot_service(
+    orchestrators: dict = Depends(get_orchestrators),
+    performance_store: PerformanceStore | None = Depends(get_performance_store),
+) -> BotService:
+    return BotService(orchestrators, performance_store=performance_store)
 
 
 @router.post("", response_model=BotCreateResponse, status_code=status.HTTP_201_CREATED)
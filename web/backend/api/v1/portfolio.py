@@ -4,11 +4,21 @@ Portfolio API endpoints.
 
 from decimal import Decimal
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 
+from bot.monitoring.performance_store import PerformanceStore
 from web.backend.auth.models import User
-from web.backend.dependencies import get_current_user, get_orchestrators
-from web.backend.schemas.portfolio import DrawdownMetrics, PortfolioSummary
+from web.backend.dependencies import (
+    get_current_user,
+    get_orchestrators,
+    get_performance_store,
+)
+from web.backend.schemas.portfolio import (
+    BalanceHistoryPoint,
+    BalanceHistoryResponse,
+    DrawdownMetrics,
+    PortfolioSummary,
+)
 from web.backend.services.bot_service import BotService
 
 router = APIRouter(prefix="/api/v1/portfolio", tags=["portfolio"])
@@ -52,13 +62,30 @@ async def get_summary(
     )
 
 
-@router.get("/history")
+@router.get("/history", response_model=BalanceHistoryResponse)
 async def get_history(
+    period: str = Query(default="7d", pattern="^(1d|7d|30d|all)$"),
+    bot_name: str | None = Query(default=None, description="Single bot instead of portfolio"),
     _: User = Depends(get_current_user),
+    store: PerformanceStore | None = Depends(get_performance_store),
 ):
-    """Get balance history (equity curve)."""
-    # TODO: Query performance_snapshots table when populated
-    return {"history": [], "message": "Balance history requires performance snapshots collection"}
+    """Get balance history (equity curve) from the performance snapshots rollups."""
+    if store is None:
+        return BalanceHistoryResponse(period=period)
+    points = await store.series(period, bot_name)
+    return BalanceHistoryResponse(
+        period=period,
+        history=[
+            BalanceHistoryPoint(
+                timestamp=p.timestamp,
+                balance=p.equity,
+                realized_pnl=p.realized_pnl,
+                unrealized_pnl=p.unrealized_pnl,
+                exposure=p.exposure,
+            )
+            for p in points
+        ],
+    )
 
 
 @router.get("/allocation")
@@ -96,11 +123,21 @@ async def get_allocation(
 
 @router.get("/drawdown", response_model=DrawdownMetrics)
 async def get_drawdown(
+    period: str = Query(default="all", pattern="^(1d|7d|30d|all)$"),
+    bot_name: str | None = Query(default=None, description="Single bot instead of portfolio"),
     _: User = Depends(get_current_user),
+    store: PerformanceStore | None = Depends(get_performance_store),
 ):
-    """Get drawdown metrics."""
-    # TODO: Calculate from performance_snapshots
-    return DrawdownMetrics()
+    """Get drawdown metrics from the performance snapshots rollups."""
+    if store is None:
+        return DrawdownMetrics()
+    stats = await store.drawdown(period, bot_name)
+    return DrawdownMetrics(
+        current_drawdown_pct=stats.current_drawdown_pct,
+        max_drawdown_pct=stats.max_drawdown_pct,
+        max_drawdown_amount=stats.max_drawdown_amount,
+        recovery_time_hours=stats.recovery_time_hours,
+    )
 
 
 @router.get("/trades")
@@ -30,6 +30,10 @@ class WebConfig(BaseSettings):
     # Bot config
     config_path: str = "configs/production.yaml"
 
+    # Backtest result cache (shared with the backtesting pipeline format)
+    backtest_cache_path: str = "data/backtest_cache.db"
+    backtest_cache_max_mb: int = 512
+
     model_config = {"env_prefix": "", "env_file": ".env", "extra": "ignore"}
 
     @property
@@ -8,6 +8,7 @@ from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from bot.monitoring.performance_store import PerformanceStore
 from web.backend.auth.models import User
 from web.backend.auth.service import decode_access_token, get_user_by_id
 
@@ -26,6 +27,14 @@ def get_orchestrators(request: Request) -> dict:
     return request.app.state.orchestrators
 
 
+def get_performance_store(request: Request) -> PerformanceStore | None:
+    """Get the performance time-series store backed by the app database."""
+    db_manager = request.app.state.db_manager
+    if db_manager is None:
+        return None
+    return PerformanceStore(db_manager)
+
+
 def get_config_manager(request: Request):
     """Get config manager from app state."""
     return request.app.state.config_manager
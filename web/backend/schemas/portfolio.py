@@ -20,6 +20,14 @@ class PortfolioSummary(BaseModel):
 class BalanceHistoryPoint(BaseModel):
     timestamp: datetime
     balance: Decimal
+    realized_pnl: Decimal = Decimal("0")
+    unrealized_pnl: Decimal = Decimal("0")
+    exposure: Decimal = Decimal("0")
+
+
+class BalanceHistoryResponse(BaseModel):
+    period: str
+    history: list[BalanceHistoryPoint] = []
 
 
 class DrawdownMetrics(BaseModel):
@@ -4,6 +4,7 @@ Bot service: bridge between API and BotOrchestrator.
 
 from decimal import Decimal
 
+from bot.monitoring.performance_store import PERIODS, PerformanceStore
 from bot.orchestrator.bot_orchestrator import BotOrchestrator
 from web.backend.schemas.bot import (
     BotListResponse,
@@ -54,8 +55,13 @@ def _extract_metrics(status: dict) -> dict:
 class BotService:
     """Service layer for bot operations."""
 
-    def __init__(self, orchestrators: dict[str, BotOrchestrator]):
+    def __init__(
+        self,
+        orchestrators: dict[str, BotOrchestrator],
+        performance_store: PerformanceStore | None = None,
+    ):
         self.orchestrators = orchestrators
+        self.performance_store = performance_store
 
     async def list_bots(
         self,
@@ -287,15 +293,33 @@ class BotService:
         if not orch:
             return None
 
+        # Recorded series from the performance snapshots rollups
+        if self.performance_store is not None:
+            try:
+                series = await self.performance_store.series(
+                    period if period in PERIODS else "all", bot_name
+                )
+            except Exception:
+                series = []
+            if series:
+                return PnLHistoryResponse(
+                    points=[
+                        PnLDataPoint(
+                            timestamp=p.timestamp.timestamp(),
+                            value=float(p.realized_pnl + p.unrealized_pnl),
+                        )
+                        for p in series
+                    ]
+                )
+
         try:
             import time
 
             status = await orch.get_status()
             points: list[PnLDataPoint] = []
 
-            # Build cumulative PnL series from available strategy metrics.
-            # We generate synthetic time-series from aggregate stats since
-            # in-memory orchestrator does not persist per-trade timestamps.
+            # No samples recorded yet (e.g. a freshly started bot): build a
+            # synthetic cumulative PnL series from aggregate strategy stats.
             metrics = _extract_metrics(status)
             total_profit = float(metrics["total_profit"])
             total_trades = metrics["total_trades"]